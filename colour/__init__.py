@@ -34,7 +34,11 @@ Subpackages
 
 from __future__ import absolute_import
 
+import ast
+import importlib
+import os
 import sys
+import types
 
 if sys.version_info[0] >= 3:
     # Python 3 compatibility hacks.
@@ -47,41 +51,6 @@ if sys.version_info[0] >= 3:
     builtins.reduce = functools.reduce
     itertools.izip = zip
 
-from .adaptation import *  # noqa
-from . import adaptation  # noqa
-from .algebra import *  # noqa
-from . import algebra  # noqa
-from .colorimetry import *  # noqa
-from . import colorimetry  # noqa
-from .appearance import *  # noqa
-from . import appearance  # noqa
-from .constants import *  # noqa
-from . import constants  # noqa
-from .difference import *  # noqa
-from . import difference  # noqa
-from .characterisation import *  # noqa
-from . import characterisation  # noqa
-from .io import *  # noqa
-from . import io  # noqa
-from .models import *  # noqa
-from . import models  # noqa
-from .corresponding import *  # noqa
-from . import corresponding  # noqa
-from .phenomenons import *  # noqa
-from . import phenomenons  # noqa
-from .notation import *  # noqa
-from . import notation  # noqa
-from .quality import *  # noqa
-from . import quality  # noqa
-from .recovery import *  # noqa
-from . import recovery  # noqa
-from .temperature import *  # noqa
-from . import temperature  # noqa
-from .volume import *  # noqa
-from . import volume  # noqa
-from .utilities import *  # noqa
-from . import utilities  # noqa
-
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
 __license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
@@ -89,23 +58,208 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = []
-__all__ += adaptation.__all__
-__all__ += algebra.__all__
-__all__ += colorimetry.__all__
-__all__ += appearance.__all__
-__all__ += constants.__all__
-__all__ += difference.__all__
-__all__ += characterisation.__all__
-__all__ += io.__all__
-__all__ += models.__all__
-__all__ += corresponding.__all__
-__all__ += phenomenons.__all__
-__all__ += notation.__all__
-__all__ += quality.__all__
-__all__ += recovery.__all__
-__all__ += temperature.__all__
-__all__ += volume.__all__
+SUBPACKAGES = ('adaptation',
+               'algebra',
+               'colorimetry',
+               'appearance',
+               'constants',
+               'difference',
+               'characterisation',
+               'io',
+               'models',
+               'corresponding',
+               'phenomenons',
+               'notation',
+               'quality',
+               'recovery',
+               'temperature',
+               'volume',
+               'utilities')
+"""
+Subpackages whose public objects are exposed in the top-level namespace, the
+objects of the latter subpackages override the objects of the former ones.
+
+SUBPACKAGES : tuple
+"""
+
+_NAMES_INDEX_CACHE = None
+
+
+def _module_names(path):
+    """
+    Returns the public objects names of given module by statically evaluating
+    its *__all__* attribute, the module is not imported.
+
+    Parameters
+    ----------
+    path : unicode
+        Module path.
+
+    Returns
+    -------
+    list
+        Module public objects names.
+
+    Raises
+    ------
+    ValueError
+        If the *__all__* attribute cannot be statically evaluated.
+    """
+
+    with open(path, 'rb') as module:
+        tree = ast.parse(module.read(), path)
+
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        elif isinstance(node, ast.AugAssign):
+            targets, value = [node.target], node.value
+        else:
+            continue
+
+        if not any(isinstance(target, ast.Name) and target.id == '__all__'
+                   for target in targets):
+            continue
+
+        if isinstance(value, (ast.List, ast.Tuple)):
+            names += [element.s for element in value.elts]
+        elif (isinstance(value, ast.Attribute) and
+              value.attr == '__all__' and
+              isinstance(value.value, ast.Name)):
+            module = os.path.join(os.path.dirname(path), value.value.id)
+            names += _module_names(
+                os.path.join(module, '__init__.py')
+                if os.path.isdir(module) else '{0}.py'.format(module))
+        else:
+            raise ValueError(
+                '"{0}" module "__all__" attribute cannot be statically '
+                'evaluated!'.format(path))
+
+    return names
+
+
+def _subpackage_names(subpackage):
+    """
+    Returns the public objects names of given subpackage, the subpackage is
+    only imported if its *__all__* attribute cannot be statically evaluated.
+
+    Parameters
+    ----------
+    subpackage : unicode
+        Subpackage name.
+
+    Returns
+    -------
+    list
+        Subpackage public objects names.
+    """
+
+    try:
+        return _module_names(os.path.join(
+            os.path.dirname(__file__), subpackage, '__init__.py'))
+    except (IOError, OSError, SyntaxError, ValueError):
+        return list(importlib.import_module(
+            '.{0}'.format(subpackage), __name__).__all__)
+
+
+def _names_index():
+    """
+    Returns the index of the top-level namespace public objects names to their
+    subpackage and caches it.
+
+    Returns
+    -------
+    dict
+        Public objects names index.
+    """
+
+    global _NAMES_INDEX_CACHE
+    if _NAMES_INDEX_CACHE is None:
+        _NAMES_INDEX_CACHE = {}
+        for subpackage in SUBPACKAGES:
+            for name in _subpackage_names(subpackage):
+                _NAMES_INDEX_CACHE[name] = subpackage
+
+    return _NAMES_INDEX_CACHE
+
+
+class _LazyModule(types.ModuleType):
+    """
+    Defines the top-level module type importing the subpackages when one of
+    their public objects is first accessed.
+    """
+
+    def __getattr__(self, attribute):
+        """
+        Returns given attribute value, importing the subpackage defining it.
+
+        Parameters
+        ----------
+        attribute : unicode
+            Attribute to retrieve the value.
+
+        Returns
+        -------
+        object
+            Attribute value.
+
+        Raises
+        ------
+        AttributeError
+            If the attribute is not defined.
+        """
+
+        if attribute in SUBPACKAGES:
+            return importlib.import_module(
+                '.{0}'.format(attribute), __name__)
+
+        if attribute == '__all__':
+            value = [name
+                     for subpackage in SUBPACKAGES
+                     if subpackage != 'utilities'
+                     for name in _subpackage_names(subpackage)]
+        elif attribute in _names_index():
+            value = getattr(
+                importlib.import_module(
+                    '.{0}'.format(_names_index()[attribute]), __name__),
+                attribute)
+        else:
+            raise AttributeError(
+                '"{0}" module has no attribute "{1}"'.format(
+                    __name__, attribute))
+
+        setattr(self, attribute, value)
+
+        return value
+
+    def __dir__(self):
+        """
+        Returns the module attributes names, including the not yet imported
+        subpackages public objects names.
+
+        Returns
+        -------
+        list
+            Module attributes names.
+        """
+
+        return sorted(set(self.__dict__) |
+                      set(_names_index()) |
+                      set(SUBPACKAGES))
+
+
+if sys.version_info[:2] >= (3, 5):
+    sys.modules[__name__].__class__ = _LazyModule
+else:
+    __all__ = []
+    for _subpackage in SUBPACKAGES:
+        _module = importlib.import_module('.{0}'.format(_subpackage), __name__)
+        globals().update((name, getattr(_module, name))
+                         for name in _module.__all__)
+        if _subpackage != 'utilities':
+            __all__ += _module.__all__
+    del _subpackage, _module
 
 __application_name__ = 'Colour'
 
@@ -15,9 +15,13 @@ from .geometry import (
 from .interpolation import (LinearInterpolator,
                             SpragueInterpolator,
                             CubicSplineInterpolator,
-                            PchipInterpolator)
+                            PchipInterpolator,
+                            lagrange_coefficients)
 from .matrix import is_identity
-from .random import random_triplet_generator
+from .random import (
+    RANDOM_TRIPLET_CHUNK_SIZE,
+    random_triplet_generator,
+    random_triplet_chunk_generator)
 
 __all__ = []
 __all__ += coordinates.__all__
@@ -30,6 +34,9 @@ __all__ += ['normalise_vector',
 __all__ += ['LinearInterpolator',
             'SpragueInterpolator',
             'CubicSplineInterpolator',
-            'PchipInterpolator']
+            'PchipInterpolator',
+            'lagrange_coefficients']
 __all__ += ['is_identity']
-__all__ += ['random_triplet_generator']
+__all__ += ['RANDOM_TRIPLET_CHUNK_SIZE',
+            'random_triplet_generator',
+            'random_triplet_chunk_generator']
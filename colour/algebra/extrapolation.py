@@ -284,6 +284,11 @@ class Extrapolator(object):
         xi = self.__interpolator.x
         yi = self.__interpolator.y
 
+        # Points lying in the interpolation range only do not need to be
+        # masked and are directly passed to the interpolator.
+        if np.all(np.logical_and(x >= xi[0], x <= xi[-1])):
+            return self.__interpolator(x)
+
         y = np.empty_like(x)
 
         if self.__method == 'linear':
@@ -13,6 +13,7 @@ Defines classes for interpolating variables.
 -   :class:`CubicSplineInterpolator`: 1-D function cubic spline interpolation.
 -   :class:`PchipInterpolator`: 1-D function piecewise cube Hermite
     interpolation.
+-   :func:`lagrange_coefficients`: Computation of *Lagrange Coefficients*.
 """
 
 from __future__ import division, unicode_literals
@@ -32,7 +33,8 @@ __status__ = 'Production'
 __all__ = ['LinearInterpolator',
            'SpragueInterpolator',
            'CubicSplineInterpolator',
-           'PchipInterpolator']
+           'PchipInterpolator',
+           'lagrange_coefficients']
 
 
 class LinearInterpolator(object):
@@ -44,9 +46,10 @@ class LinearInterpolator(object):
     x : ndarray
         Independent :math:`x` variable values corresponding with :math:`y`
         variable.
-    y : ndarray
+    y : ndarray, (W,) or (W, K)
         Dependent and already known :math:`y` variable values to
-        interpolate.
+        interpolate, a 2-D array holds :math:`K` variables interpolated in a
+        single pass.
 
     Methods
     -------
@@ -54,7 +57,10 @@ class LinearInterpolator(object):
 
     Notes
     -----
-    This class is a wrapper around *numpy.interp* definition.
+    This class is a wrapper around *numpy.interp* definition for 1-D
+    :math:`y` dependent variable. For 2-D :math:`y` dependent variable and
+    uniformly spaced :math:`x` independent variable, the intervals
+    containing the points to evaluate are found with index arithmetic.
 
     See Also
     --------
@@ -81,9 +87,18 @@ class LinearInterpolator(object):
 
     >>> f([0.25, 0.75])
     array([ 6.7825,  8.5075])
+
+    Interpolating multiple dependent variables at once:
+
+    >>> f = LinearInterpolator(x, np.transpose([y, y * 2]))
+    >>> f([0.25, 0.75])
+    array([[  6.7825,  13.565 ],
+           [  8.5075,  17.015 ]])
     """
 
     def __init__(self, x=None, y=None):
+        self.__x_steps = None
+
         self.__x = None
         self.x = x
         self.__y = None
@@ -121,6 +136,9 @@ class LinearInterpolator(object):
             assert value.ndim == 1, (
                 '"x" independent variable must have exactly one dimension!')
 
+            value_steps = steps(value)
+            self.__x_steps = value_steps[0] if len(value_steps) == 1 else None
+
         self.__x = value
 
     @property
@@ -150,8 +168,8 @@ class LinearInterpolator(object):
         if value is not None:
             value = np.atleast_1d(value).astype(np.float_)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
         self.__y = value
 
@@ -171,11 +189,12 @@ class LinearInterpolator(object):
             Interpolated value(s).
         """
 
-        x = np.atleast_1d(x).astype(np.float_)
+        xi = self.__evaluate(np.atleast_1d(x).astype(np.float_))
 
-        xi = as_numeric(self.__evaluate(x))
+        if self.__y.ndim == 2:
+            return np.reshape(xi, np.shape(x) + self.__y.shape[1:])
 
-        return xi
+        return as_numeric(xi)
 
     def __evaluate(self, x):
         """
@@ -195,7 +214,21 @@ class LinearInterpolator(object):
         self.__validate_dimensions()
         self.__validate_interpolation_range(x)
 
-        return np.interp(x, self.__x, self.__y)
+        if self.__y.ndim == 1:
+            return np.interp(x, self.__x, self.__y)
+
+        if self.__x_steps is not None:
+            # Uniformly spaced independent variable: the intervals are found
+            # with index arithmetic instead of a binary search.
+            i = np.floor((x - self.__x[0]) / self.__x_steps).astype(np.int_)
+        else:
+            i = np.searchsorted(self.__x, x, side='right') - 1
+
+        i = np.clip(i, 0, len(self.__x) - 2)
+        t = ((x - self.__x[i]) / (self.__x[i + 1] - self.__x[i]))
+        t = t[..., np.newaxis]
+
+        return self.__y[i] * (1 - t) + self.__y[i + 1] * t
 
     def __validate_dimensions(self):
         """
@@ -236,9 +269,10 @@ class SpragueInterpolator(object):
     x : array_like
         Independent :math:`x` variable values corresponding with :math:`y`
         variable.
-    y : array_like
+    y : array_like, (W,) or (W, K)
         Dependent and already known :math:`y` variable values to
-        interpolate.
+        interpolate, a 2-D array holds :math:`K` variables interpolated in a
+        single pass.
 
     Methods
     -------
@@ -251,7 +285,9 @@ class SpragueInterpolator(object):
     Notes
     -----
     The minimum number :math:`k` of data points required along the
-    interpolation axis is :math:`k=6`.
+    interpolation axis is :math:`k=6`. For uniformly spaced :math:`x`
+    independent variable, the intervals containing the points to evaluate
+    are found with index arithmetic.
 
     References
     ----------
@@ -283,6 +319,13 @@ class SpragueInterpolator(object):
 
     >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
     array([ 6.7295161...,  7.8140625...])
+
+    Interpolating multiple dependent variables at once:
+
+    >>> f = SpragueInterpolator(x, np.transpose([y, y * 2]))
+    >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
+    array([[  6.7295161...,  13.4590322...],
+           [  7.8140625...,  15.6281250...]])
     """
 
     SPRAGUE_C_COEFFICIENTS = np.array(
@@ -307,6 +350,7 @@ class SpragueInterpolator(object):
     def __init__(self, x=None, y=None):
         self.__xp = None
         self.__yp = None
+        self.__x_steps = None
 
         self.__x = None
         self.x = x
@@ -345,7 +389,9 @@ class SpragueInterpolator(object):
             assert value.ndim == 1, (
                 '"x" independent variable must have exactly one dimension!')
 
-            value_steps = steps(value)[0]
+            value_steps = steps(value)
+            self.__x_steps = value_steps[0] if len(value_steps) == 1 else None
+            value_steps = value_steps[0]
 
             xp1 = value[0] - value_steps * 2
             xp2 = value[0] - value_steps
@@ -383,26 +429,26 @@ class SpragueInterpolator(object):
         if value is not None:
             value = np.atleast_1d(value).astype(np.float_)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
             assert len(value) >= 6, (
                 '"y" dependent variable values count must be in domain [6:]!')
 
-            yp1 = np.ravel((np.dot(
-                self.SPRAGUE_C_COEFFICIENTS[0],
-                np.array(value[0:6]).reshape((6, 1)))) / 209)[0]
-            yp2 = np.ravel((np.dot(
-                self.SPRAGUE_C_COEFFICIENTS[1],
-                np.array(value[0:6]).reshape((6, 1)))) / 209)[0]
-            yp3 = np.ravel((np.dot(
-                self.SPRAGUE_C_COEFFICIENTS[2],
-                np.array(value[-6:]).reshape((6, 1)))) / 209)[0]
-            yp4 = np.ravel((np.dot(
-                self.SPRAGUE_C_COEFFICIENTS[3],
-                np.array(value[-6:]).reshape((6, 1)))) / 209)[0]
-
-            self.__yp = np.concatenate(((yp1, yp2), value, (yp3, yp4)))
+            # Boundaries extra points of every dependent variable computed
+            # with a single matrix product: the first and last 6 values are
+            # stacked as columns of a (6, 2K) array.
+            k = value[0:6].reshape((6, -1)).shape[-1]
+            boundaries = np.dot(
+                self.SPRAGUE_C_COEFFICIENTS,
+                np.hstack((value[0:6].reshape((6, -1)),
+                           value[-6:].reshape((6, -1))))) / 209
+
+            shape = (2,) + value.shape[1:]
+            self.__yp = np.concatenate(
+                (np.reshape(boundaries[0:2, :k], shape),
+                 value,
+                 np.reshape(boundaries[2:4, k:], shape)))
 
         self.__y = value
 
@@ -443,10 +489,19 @@ class SpragueInterpolator(object):
         self.__validate_dimensions()
         self.__validate_interpolation_range(x)
 
-        i = np.searchsorted(self.__xp, x) - 1
+        if self.__x_steps is not None:
+            # Uniformly spaced independent variable: the intervals are found
+            # with index arithmetic instead of a binary search.
+            i = np.clip(
+                np.ceil((x - self.__xp[0]) / self.__x_steps).astype(np.int_) -
+                1, 0, len(self.__xp) - 2)
+        else:
+            i = np.searchsorted(self.__xp, x) - 1
         X = (x - self.__xp[i]) / (self.__xp[i + 1] - self.__xp[i])
 
         r = self.__yp
+        if r.ndim == 2:
+            X = X[..., np.newaxis]
 
         a0p = r[i]
         a1p = ((2 * r[i - 2] - 16 * r[i - 1] + 16 * r[i + 1] - 2 *
@@ -517,6 +572,11 @@ class PchipInterpolator(scipy.interpolate.PchipInterpolator):
     """
 
     def __init__(self, x=None, y=None, *args, **kwargs):
+        # Ensuring writeable arrays as *scipy* memory views do not support
+        # read only buffers.
+        x = np.array(x, dtype=np.float_)
+        y = np.array(y, dtype=np.float_)
+
         super(PchipInterpolator, self).__init__(x, y, *args, **kwargs)
 
         self.__y = y
@@ -546,3 +606,44 @@ class PchipInterpolator(scipy.interpolate.PchipInterpolator):
         """
 
         raise AttributeError('"{0}" attribute is read only!'.format('y'))
+
+
+def lagrange_coefficients(r, n=4):
+    """
+    Computes the *Lagrange Coefficients* at given point :math:`r` for degree
+    :math:`n`.
+
+    Parameters
+    ----------
+    r : numeric
+        Point to get the *Lagrange Coefficients* at.
+    n : int, optional
+        Degree of the *Lagrange Coefficients* being calculated.
+
+    Returns
+    -------
+    ndarray
+
+    References
+    ----------
+    .. [4]  Fairman, H. S. (1985). The calculation of weight factors for
+            tristimulus integration. Color Research & Application, 10(4),
+            199–203. doi:10.1002/col.5080100407
+    .. [5]  Wikipedia. (n.d.). Lagrange polynomial - Definition. Retrieved
+            from https://en.wikipedia.org/wiki/Lagrange_polynomial#Definition
+
+    Examples
+    --------
+    >>> lagrange_coefficients(0.1)
+    array([ 0.8265,  0.2755, -0.1305,  0.0285])
+    """
+
+    r_i = np.arange(n)
+
+    L_n = []
+    for j in range(n):
+        basis = [(r - r_i[i]) / (r_i[j] - r_i[i])
+                 for i in range(n) if i != j]
+        L_n.append(np.prod(basis))
+
+    return np.array(L_n)
@@ -8,6 +8,7 @@ Random Numbers Utilities
 Defines random numbers generator objects:
 
 -   :func:`random_triplet_generator`
+-   :func:`random_triplet_chunk_generator`
 """
 
 from __future__ import division, unicode_literals
@@ -24,10 +25,19 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = ['RANDOM_STATE',
-           'random_triplet_generator']
+           'RANDOM_TRIPLET_CHUNK_SIZE',
+           'random_triplet_generator',
+           'random_triplet_chunk_generator']
 
 RANDOM_STATE = np.random.RandomState()
 
+RANDOM_TRIPLET_CHUNK_SIZE = 2 ** 16
+"""
+Default number of random triplets drawn at once.
+
+RANDOM_TRIPLET_CHUNK_SIZE : int
+"""
+
 
 def random_triplet_generator(size,
                              limits=np.array([[0, 1], [0, 1], [0, 1]]),
@@ -78,12 +88,62 @@ across-systems-and-versions
      array([ 0.1679721...,  0.7333801...,  0.4084438...]))
     """
 
+    for chunk in random_triplet_chunk_generator(size, limits, random_state):
+        for triplet in chunk:
+            yield triplet
+
+
+def random_triplet_chunk_generator(size,
+                                   limits=np.array([[0, 1], [0, 1], [0, 1]]),
+                                   random_state=RANDOM_STATE,
+                                   chunk_size=RANDOM_TRIPLET_CHUNK_SIZE):
+    """
+    Returns a generator yielding random triplets in chunks.
+
+    Parameters
+    ----------
+    size : integer
+        Generated random triplets count.
+    limits : array_like, (3, 2)
+        Random values limits on each triplet axis.
+    random_state : RandomState
+         Mersenne Twister pseudo-random number generator.
+    chunk_size : integer, optional
+        Random triplets count of each chunk, the last chunk holds the
+        remaining random triplets.
+
+    Returns
+    -------
+    generator
+        Random triplets chunks generator yielding arrays of shape
+        (chunk_size, 3).
+
+    Notes
+    -----
+    -   The random triplets are drawn in the same sequence as
+        :func:`random_triplet_generator` definition.
+
+    Examples
+    --------
+    >>> prng = np.random.RandomState(4)
+    >>> for chunk in random_triplet_chunk_generator(  # doctest: +ELLIPSIS
+    ...         5, random_state=prng, chunk_size=3):
+    ...     print(chunk)
+    [[ 0.9670298...  0.5472322...  0.9726843...]
+     [ 0.7148159...  0.6977288...  0.2160895...]
+     [ 0.9762744...  0.0062302...  0.2529823...]]
+    [[ 0.4347915...  0.7793829...  0.1976850...]
+     [ 0.8629932...  0.9834006...  0.1638422...]]
+    """
+
     integer_size = int(size)
     if integer_size != size:
         warning(('"size" has been cast to integer: {0}'.format(
             integer_size)))
 
-    for _ in range(integer_size):
-        yield np.array([random_state.uniform(*limits[0]),
-                        random_state.uniform(*limits[1]),
-                        random_state.uniform(*limits[2])])
+    limits = np.asarray(limits)
+
+    for i in range(0, integer_size, chunk_size):
+        yield random_state.uniform(limits[..., 0],
+                                   limits[..., 1],
+                                   (min(chunk_size, integer_size - i), 3))
@@ -14,7 +14,8 @@ from itertools import permutations
 from colour.algebra import (
     LinearInterpolator,
     SpragueInterpolator,
-    PchipInterpolator)
+    PchipInterpolator,
+    lagrange_coefficients)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -29,7 +30,8 @@ __all__ = ['POINTS_DATA_A',
            'SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES',
            'TestLinearInterpolator',
            'TestSpragueInterpolator',
-           'TestPchipInterpolator']
+           'TestPchipInterpolator',
+           'TestLagrangeCoefficients']
 
 POINTS_DATA_A = (
     9.3700,
@@ -405,6 +407,41 @@ class TestLinearInterpolator(unittest.TestCase):
                 np.arange(0, len(POINTS_DATA_A) - 1 + steps, steps)),
             LINEAR_INTERPOLATED_POINTS_DATA_A_10_SAMPLES)
 
+    def test_n_dimensional__call__(self):
+        """
+        Tests :func:`colour.algebra.interpolation.LinearInterpolator.__call__`
+        method n-dimensional support.
+        """
+
+        steps = 0.1
+        x = np.arange(len(POINTS_DATA_A))
+        y = np.transpose([POINTS_DATA_A, np.asarray(POINTS_DATA_A) * 2])
+        linear_interpolator = LinearInterpolator(x, y)
+
+        samples = np.arange(0, len(POINTS_DATA_A) - 1 + steps, steps)
+        interpolated = np.asarray(LINEAR_INTERPOLATED_POINTS_DATA_A_10_SAMPLES)
+        np.testing.assert_almost_equal(
+            linear_interpolator(samples),
+            np.transpose([interpolated, interpolated * 2]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            linear_interpolator(samples[1]),
+            [interpolated[1], interpolated[1] * 2],
+            decimal=7)
+
+        self.assertTupleEqual(
+            linear_interpolator(samples[0:6].reshape(2, 3)).shape, (2, 3, 2))
+
+        x = np.cumsum(np.arange(len(POINTS_DATA_A)))
+        linear_interpolator = LinearInterpolator(x, y)
+        samples = np.linspace(0, x[-1], 100)
+        np.testing.assert_almost_equal(
+            linear_interpolator(samples),
+            np.transpose([np.interp(samples, x, y[..., 0]),
+                          np.interp(samples, x, y[..., 1])]),
+            decimal=7)
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -475,6 +512,33 @@ class TestSpragueInterpolator(unittest.TestCase):
                 np.arange(0, len(POINTS_DATA_A) - 1 + steps, steps)),
             SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES)
 
+    def test_n_dimensional__call__(self):
+        """
+        Tests :func:`colour.algebra.interpolation.SpragueInterpolator.__call__`
+        method n-dimensional support.
+        """
+
+        steps = 0.1
+        x = np.arange(len(POINTS_DATA_A))
+        y = np.transpose([POINTS_DATA_A, np.asarray(POINTS_DATA_A) * 2])
+        sprague_interpolator = SpragueInterpolator(x, y)
+
+        samples = np.arange(0, len(POINTS_DATA_A) - 1 + steps, steps)
+        interpolated = np.asarray(
+            SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES)
+        np.testing.assert_almost_equal(
+            sprague_interpolator(samples),
+            np.transpose([interpolated, interpolated * 2]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            sprague_interpolator(samples[1]),
+            [interpolated[1], interpolated[1] * 2],
+            decimal=7)
+
+        self.assertTupleEqual(
+            sprague_interpolator(samples[0:6].reshape(2, 3)).shape, (2, 3, 2))
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -524,5 +588,38 @@ class TestPchipInterpolator(unittest.TestCase):
             self.assertIn(method, dir(PchipInterpolator))
 
 
+
+class TestLagrangeCoefficients(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.interpolation.lagrange_coefficients`
+    definition unit tests methods.
+    """
+
+    def test_lagrange_coefficients(self):
+        """
+        Tests :func:`colour.algebra.interpolation.lagrange_coefficients`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            lagrange_coefficients(0.1),
+            np.array([0.8265, 0.2755, -0.1305, 0.0285]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            lagrange_coefficients(1.5),
+            np.array([-0.0625, 0.5625, 0.5625, -0.0625]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            lagrange_coefficients(0.2, 3),
+            np.array([0.72, 0.36, -0.08]),
+            decimal=7)
+
+        for r in np.linspace(0, 3, 7):
+            self.assertAlmostEqual(np.sum(lagrange_coefficients(r)),
+                                   1,
+                                   places=7)
+
 if __name__ == '__main__':
     unittest.main()
@@ -10,7 +10,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.algebra import random_triplet_generator
+from colour.algebra import (
+    random_triplet_generator,
+    random_triplet_chunk_generator)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2014 - Colour Developers'
@@ -20,7 +22,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = ['RANDOM_TRIPLETS',
-           'TestRandomTripletGenerator']
+           'TestRandomTripletGenerator',
+           'TestRandomTripletChunkGenerator']
 
 RANDOM_TRIPLETS = (
     (0.96702984, 0.54723225, 0.97268436),
@@ -65,5 +68,41 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
             decimal=7)
 
 
+
+class TestRandomTripletChunkGenerator(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.random.random_triplet_chunk_generator`
+    definition unit tests methods.
+    """
+
+    def test_random_triplet_chunk_generator(self):
+        """
+        Tests :func:`colour.algebra.random.random_triplet_chunk_generator`
+        definition.
+        """
+
+        prng = np.random.RandomState(4)
+        chunks = list(random_triplet_chunk_generator(
+            10, random_state=prng, chunk_size=4))
+        self.assertListEqual([chunk.shape for chunk in chunks],
+                             [(4, 3), (4, 3), (2, 3)])
+        np.testing.assert_almost_equal(
+            RANDOM_TRIPLETS,
+            np.vstack(chunks),
+            decimal=7)
+
+        limits = np.array([[0, 100], [-150, 150], [-150, 150]])
+        prng = np.random.RandomState(4)
+        triplets = [(prng.uniform(*limits[0]),
+                     prng.uniform(*limits[1]),
+                     prng.uniform(*limits[2])) for _ in range(10)]
+        np.testing.assert_equal(
+            np.vstack(random_triplet_chunk_generator(
+                10, limits, np.random.RandomState(4), 3)),
+            np.array(triplets))
+
+        self.assertListEqual(list(random_triplet_chunk_generator(0)), [])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,10 +9,15 @@ from .spectrum import (
     SpectralShape,
     SpectralPowerDistribution,
     TriSpectralPowerDistribution,
+    SpectralArray,
     DEFAULT_SPECTRAL_SHAPE,
     constant_spd,
     zeros_spd,
-    ones_spd)
+    ones_spd,
+    spds_to_spectral_array,
+    spectral_array_to_spds,
+    SPECTRAL_RESAMPLING_OPERATORS_CACHE_SIZE,
+    spectral_resampling_operator)
 from .blackbody import (
     blackbody_spd,
     blackbody_spectral_radiance,
@@ -55,7 +60,18 @@ from .transformations import RGB_2_degree_cmfs_to_XYZ_2_degree_cmfs
 from .transformations import RGB_10_degree_cmfs_to_XYZ_10_degree_cmfs
 from .transformations import LMS_2_degree_cmfs_to_XYZ_2_degree_cmfs
 from .transformations import LMS_10_degree_cmfs_to_XYZ_10_degree_cmfs
-from .tristimulus import spectral_to_XYZ, wavelength_to_XYZ
+from .tristimulus import (
+    SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE_SIZE,
+    TRISTIMULUS_WEIGHTING_TABLES_INTERVALS,
+    TRISTIMULUS_WEIGHTING_TABLES_CACHE_SIZE,
+    TristimulusWeightingTable,
+    spectral_to_XYZ,
+    wavelength_to_XYZ,
+    lagrange_coefficients_ASTME2022,
+    tristimulus_weighting_factors_ASTME2022,
+    adjust_tristimulus_weighting_factors_ASTME308,
+    tristimulus_weighting_table,
+    spectral_to_XYZ_ASTME308)
 from .whiteness import WHITENESS_METHODS
 from .whiteness import whiteness
 from .whiteness import (
@@ -71,10 +87,15 @@ __all__ = ['DEFAULT_WAVELENGTH_DECIMALS',
            'SpectralShape',
            'SpectralPowerDistribution',
            'TriSpectralPowerDistribution',
+           'SpectralArray',
            'DEFAULT_SPECTRAL_SHAPE',
            'constant_spd',
            'zeros_spd',
-           'ones_spd']
+           'ones_spd',
+           'spds_to_spectral_array',
+           'spectral_array_to_spds',
+           'SPECTRAL_RESAMPLING_OPERATORS_CACHE_SIZE',
+           'spectral_resampling_operator']
 __all__ += ['blackbody_spd',
             'blackbody_spectral_radiance',
             'planck_law']
@@ -109,7 +130,17 @@ __all__ += ['RGB_2_degree_cmfs_to_XYZ_2_degree_cmfs']
 __all__ += ['RGB_10_degree_cmfs_to_XYZ_10_degree_cmfs']
 __all__ += ['LMS_2_degree_cmfs_to_XYZ_2_degree_cmfs']
 __all__ += ['LMS_10_degree_cmfs_to_XYZ_10_degree_cmfs']
-__all__ += ['spectral_to_XYZ', 'wavelength_to_XYZ']
+__all__ += ['SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE_SIZE',
+            'TRISTIMULUS_WEIGHTING_TABLES_INTERVALS',
+            'TRISTIMULUS_WEIGHTING_TABLES_CACHE_SIZE',
+            'TristimulusWeightingTable',
+            'spectral_to_XYZ',
+            'wavelength_to_XYZ',
+            'lagrange_coefficients_ASTME2022',
+            'tristimulus_weighting_factors_ASTME2022',
+            'adjust_tristimulus_weighting_factors_ASTME308',
+            'tristimulus_weighting_table',
+            'spectral_to_XYZ_ASTME308']
 __all__ += ['WHITENESS_METHODS']
 __all__ += ['whiteness']
 __all__ += ['whiteness_Berger1959',
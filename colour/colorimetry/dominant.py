@@ -38,7 +38,6 @@ from colour.algebra import (
     extend_line_segment,
     intersect_line_segments)
 from colour.colorimetry import CMFS
-from colour.models import XYZ_to_xy
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -86,6 +85,7 @@ def closest_spectral_locus_wavelength(xy, xy_n, xy_s, reverse=False):
 
     Examples
     --------
+    >>> from colour.models import XYZ_to_xy
     >>> xy = np.array([0.26415, 0.37770])
     >>> xy_n = np.array([0.31271, 0.32902])
     >>> xy_s = XYZ_to_xy(CMFS['CIE 1931 2 Degree Standard Observer'].values)
@@ -186,6 +186,10 @@ def dominant_wavelength(xy,
      array([ 0.0744965...,  0.8338102...]))
     """
 
+    # Importing locally as :mod:`colour.models` subpackage depends on
+    # :mod:`colour.colorimetry` subpackage.
+    from colour.models import XYZ_to_xy
+
     xy = np.asarray(xy)
     xy_n = np.resize(xy_n, xy.shape)
 
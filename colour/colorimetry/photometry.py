@@ -50,8 +50,8 @@ def luminous_flux(spd,
 
     Parameters
     ----------
-    spd : SpectralPowerDistribution
-        test spectral power distribution
+    spd : SpectralPowerDistribution or SpectralArray
+        test spectral power distribution or spectral array.
     lef : SpectralPowerDistribution, optional
         :math:`V(\lambda)` luminous efficiency function.
     K_m : numeric, optional
@@ -59,7 +59,7 @@ def luminous_flux(spd,
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Luminous flux
 
     Examples
@@ -87,14 +87,14 @@ def luminous_efficacy(spd,
 
     Parameters
     ----------
-    spd : SpectralPowerDistribution
-        test spectral power distribution
+    spd : SpectralPowerDistribution or SpectralArray
+        test spectral power distribution or spectral array.
     lef : SpectralPowerDistribution, optional
         :math:`V(\lambda)` luminous efficiency function.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Luminous efficacy
 
     Examples
@@ -11,6 +11,7 @@ Defines the classes handling spectral data computation:
 -   :class:`SpectralShape`
 -   :class:`SpectralPowerDistribution`
 -   :class:`TriSpectralPowerDistribution`
+-   :class:`SpectralArray`
 
 See Also
 --------
@@ -25,6 +26,7 @@ import copy
 import itertools
 import numpy as np
 import operator
+import scipy.sparse
 
 from colour.algebra import (
     Extrapolator,
@@ -34,10 +36,10 @@ from colour.algebra import (
     PchipInterpolator)
 from colour.utilities import (
     ArbitraryPrecisionMapping,
+    LRUCache,
     is_iterable,
     is_numeric,
     is_string,
-    is_uniform,
     steps,
     tstack,
     warning)
@@ -54,10 +56,30 @@ __all__ = ['DEFAULT_WAVELENGTH_DECIMALS',
            'SpectralShape',
            'SpectralPowerDistribution',
            'TriSpectralPowerDistribution',
+           'SpectralArray',
            'DEFAULT_SPECTRAL_SHAPE',
            'constant_spd',
            'zeros_spd',
-           'ones_spd']
+           'ones_spd',
+           'spds_to_spectral_array',
+           'spectral_array_to_spds',
+           'SPECTRAL_RESAMPLING_OPERATORS_CACHE_SIZE',
+           'spectral_resampling_operator']
+
+SPECTRAL_RESAMPLING_OPERATORS_CACHE_SIZE = 64
+"""
+Maximum number of spectral resampling operators kept in cache.
+
+SPECTRAL_RESAMPLING_OPERATORS_CACHE_SIZE : int
+"""
+
+_SPECTRAL_RESAMPLING_OPERATORS_CACHE = LRUCache(
+    SPECTRAL_RESAMPLING_OPERATORS_CACHE_SIZE)
+
+_RESAMPLING_OPERATORS_METHODS = {
+    SpragueInterpolator: 'Sprague',
+    LinearInterpolator: 'Linear',
+    CubicSplineInterpolator: 'Cubic Spline'}
 
 DEFAULT_WAVELENGTH_DECIMALS = 10
 """
@@ -551,20 +573,32 @@ class SpectralPowerDistribution(object):
     ----------
     name : unicode
         Spectral power distribution name.
-    data : dict or SpectralMapping
+    data : dict or SpectralMapping or tuple
         Spectral power distribution data in a *dict* or
         *SpectralMapping* as follows:
         {wavelength :math:`\lambda_{i}`: value,
         wavelength :math:`\lambda_{i+1}`: value,
         ...,
         wavelength :math:`\lambda_{i+n}`: value}
+        or in a *tuple* of wavelengths :math:`\lambda_n` and values
+        *array_like* as follows: (wavelengths, values).
     title : unicode, optional
         Spectral power distribution title for figures.
 
     Notes
     -----
-    -   Underlying spectral data is stored within a `colour.SpectralMapping`
-        class mapping which implies that wavelengths keys will be rounded.
+    -   Underlying spectral data is stored within two contiguous sorted
+        :class:`numpy.ndarray`, one for the wavelengths :math:`\lambda_n` and
+        one for their values, which are kept in sync. Wavelengths are rounded
+        at :attr:`DEFAULT_WAVELENGTH_DECIMALS` decimals similarly to the
+        `colour.SpectralMapping` class mapping keys.
+    -   :attr:`SpectralPowerDistribution.data` returns a
+        `colour.SpectralMapping` class mapping built from the underlying
+        arrays, mutating it does not affect the spectral power distribution.
+    -   Read only sorted wavelengths :math:`\lambda_n` and values *ndarray*
+        given in a *tuple* are used without being copied, allowing to share
+        the memory-mapped tables of the datasets archive, see
+        :mod:`colour.utilities.archive` module.
 
     Attributes
     ----------
@@ -621,7 +655,10 @@ class SpectralPowerDistribution(object):
     def __init__(self, name, data, title=None):
         self.__name = None
         self.name = name
-        self.__data = None
+        self.__wavelengths = None
+        self.__values = None
+        self.__pending = None
+        self.__version = 0
         self.data = data
         self.__title = None
         self.title = title
@@ -659,32 +696,56 @@ class SpectralPowerDistribution(object):
     @property
     def data(self):
         """
-        Property for **self.__data** private attribute.
+        Property for **self.data** attribute.
 
         Returns
         -------
         SpectralMapping
-            self.__data.
+            Spectral power distribution data.
         """
 
-        return self.__data
+        return SpectralMapping(zip(self.__wavelengths, self.__values))
 
     @data.setter
     def data(self, value):
         """
-        Setter for **self.__data** private attribute.
+        Setter for **self.data** attribute.
 
         Parameters
         ----------
-        value : dict or SpectralMapping
+        value : dict or SpectralMapping or tuple
             Attribute value.
         """
 
         if value is not None:
-            assert isinstance(value, (dict, SpectralMapping)), (
-                '"{0}" attribute: "{1}" is not a "dict" or "SpectralMapping" '
-                'instance!'.format('data', value))
-        self.__data = SpectralMapping(value)
+            assert isinstance(value, (dict, SpectralMapping, tuple)), (
+                '"{0}" attribute: "{1}" is not a "dict", "SpectralMapping" '
+                'or "tuple" instance!'.format('data', value))
+
+        if isinstance(value, tuple):
+            wavelengths = np.asarray(value[0], dtype=np.float_)
+            values = np.asarray(value[1], dtype=np.float_)
+            # Only read only values are shared, the other ones are copied as
+            # the underlying arrays are flagged as read only.
+            if values.flags.writeable:
+                values = np.copy(values)
+
+            assert wavelengths.shape == values.shape, (
+                '"{0}" attribute: wavelengths and values shapes are '
+                'different!'.format('data'))
+
+            if np.any(np.diff(wavelengths) <= 0):
+                wavelengths, indexes = np.unique(wavelengths,
+                                                 return_index=True)
+                values = values[indexes]
+        else:
+            data = SpectralMapping(value)
+            wavelengths = np.array(sorted(data.keys()), dtype=np.float_)
+            values = np.array(
+                [data[wavelength] for wavelength in wavelengths],
+                dtype=np.float_)
+
+        self.__set_arrays(wavelengths, values)
 
     @property
     def title(self):
@@ -732,9 +793,13 @@ class SpectralPowerDistribution(object):
         Warning
         -------
         :attr:`SpectralPowerDistribution.wavelengths` is read only.
+
+        Notes
+        -----
+        -   The returned array is a read only view on the underlying data.
         """
 
-        return np.array(sorted(self.__data.keys()))
+        return self.__wavelengths.view()
 
     @wavelengths.setter
     def wavelengths(self, value):
@@ -763,10 +828,13 @@ class SpectralPowerDistribution(object):
         Warning
         -------
         :attr:`SpectralPowerDistribution.values` is read only.
+
+        Notes
+        -----
+        -   The returned array is a read only view on the underlying data.
         """
 
-        return np.array([self.get(wavelength)
-                         for wavelength in self.wavelengths])
+        return self.__values.view()
 
     @values.setter
     def values(self, value):
@@ -836,6 +904,10 @@ class SpectralPowerDistribution(object):
         -------
         :attr:`SpectralPowerDistribution.shape` is read only.
 
+        The shape is cached until the spectral power distribution is mutated,
+        the returned :class:`SpectralShape` class instance must not be
+        modified.
+
         Examples
         --------
         Uniform spectral power distribution:
@@ -852,9 +924,14 @@ class SpectralPowerDistribution(object):
         SpectralShape(512.3, 545.7, 7...)
         """
 
-        return SpectralShape(min(self.data.keys()),
-                             max(self.data.keys()),
-                             min(steps(self.wavelengths)))
+        if self.__shape is None:
+            wavelengths = self.__wavelengths
+
+            self.__shape = SpectralShape(wavelengths[0],
+                                         wavelengths[-1],
+                                         np.min(np.diff(wavelengths)))
+
+        return self.__shape
 
     @shape.setter
     def shape(self, value):
@@ -869,6 +946,103 @@ class SpectralPowerDistribution(object):
 
         raise AttributeError('"{0}" attribute is read only!'.format('shape'))
 
+    @property
+    def version(self):
+        """
+        Property for **self.version** attribute.
+
+        Returns the spectral power distribution version: a counter incremented
+        every time the spectral power distribution is mutated. It provides a
+        cheap way for downstream caches to detect changes.
+
+        Returns
+        -------
+        int
+            Spectral power distribution version.
+
+        Warning
+        -------
+        :attr:`SpectralPowerDistribution.version` is read only.
+
+        Examples
+        --------
+        >>> data = {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19}
+        >>> spd = SpectralPowerDistribution('Spd', data)
+        >>> spd.version
+        1
+        >>> spd[550] = 86.26
+        >>> spd.version
+        2
+        """
+
+        return self.__version
+
+    @version.setter
+    def version(self, value):
+        """
+        Setter for **self.version** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError(
+            '"{0}" attribute is read only!'.format('version'))
+
+    @property
+    def content_hash(self):
+        """
+        Property for **self.content_hash** attribute.
+
+        Returns the spectral power distribution content hash value built from
+        both its wavelengths :math:`\lambda_n` and values. It is cached until
+        the spectral power distribution is mutated.
+
+        Returns
+        -------
+        int
+            Spectral power distribution content hash value.
+
+        See Also
+        --------
+        SpectralPowerDistribution.__hash__
+
+        Warning
+        -------
+        :attr:`SpectralPowerDistribution.content_hash` is read only.
+
+        Examples
+        --------
+        >>> data = {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19}
+        >>> spd = SpectralPowerDistribution('Spd', data)
+        >>> spd.content_hash == spd.clone().content_hash
+        True
+        >>> spd.content_hash == (spd * 2).content_hash
+        False
+        """
+
+        if self.__content_hash is None:
+            self.__content_hash = hash((self.__wavelengths.tobytes(),
+                                        self.__values.tobytes()))
+
+        return self.__content_hash
+
+    @content_hash.setter
+    def content_hash(self, value):
+        """
+        Setter for **self.content_hash** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError(
+            '"{0}" attribute is read only!'.format('content_hash'))
+
     def __hash__(self):
         """
         Returns the spectral power distribution hash value.
@@ -895,7 +1069,175 @@ class SpectralPowerDistribution(object):
                 08, 2014, from http://stackoverflow.com/a/16162138/931625
         """
 
-        return hash(frozenset(self.__data))
+        if self.__hash is None:
+            self.__hash = hash(self.__wavelengths.tobytes())
+
+        return self.__hash
+
+    def __set_arrays(self, wavelengths, values):
+        """
+        Sets the underlying wavelengths :math:`\lambda_n` and values arrays.
+
+        Parameters
+        ----------
+        wavelengths : ndarray
+            Sorted wavelengths :math:`\lambda_n`.
+        values : ndarray
+            Wavelengths :math:`\lambda_n` values.
+
+        Notes
+        -----
+        -   The arrays are flagged as read only: the underlying data is never
+            modified in-place but replaced, thus views returned by
+            :attr:`SpectralPowerDistribution.wavelengths` and
+            :attr:`SpectralPowerDistribution.values` attributes are never
+            altered by subsequent mutations.
+        -   Every mutation goes through this method which invalidates the
+            cached shape and hash values and increments the version.
+        """
+
+        wavelengths = np.asarray(wavelengths, dtype=np.float_)
+        # Read only arrays, e.g. shared memory-mapped arrays, are kept as is
+        # if rounding does not alter them.
+        if (wavelengths.flags.writeable or not np.array_equal(
+                wavelengths,
+                np.around(wavelengths, DEFAULT_WAVELENGTH_DECIMALS))):
+            wavelengths = np.around(wavelengths, DEFAULT_WAVELENGTH_DECIMALS)
+        values = np.asarray(values, dtype=np.float_)
+
+        wavelengths.setflags(write=False)
+        values.setflags(write=False)
+
+        self.__wavelengths = wavelengths
+        self.__values = values
+
+        wavelengths_steps = steps(wavelengths)
+        self.__steps = (wavelengths_steps[0]
+                        if len(wavelengths_steps) == 1 else None)
+
+        self.__shape = None
+        self.__hash = None
+        self.__content_hash = None
+        self.__version += 1
+
+    def __indexes(self, wavelength):
+        """
+        Returns the indexes of given wavelength :math:`\lambda` in the
+        underlying wavelengths :math:`\lambda_n` array using index arithmetic
+        for uniformly spaced wavelengths :math:`\lambda_n` and binary search
+        otherwise.
+
+        Parameters
+        ----------
+        wavelength : numeric or array_like
+            Wavelength :math:`\lambda` to retrieve the indexes.
+
+        Returns
+        -------
+        tuple
+            Rounded wavelength :math:`\lambda`, indexes and a boolean array
+            telling whether the wavelength :math:`\lambda` exists in the
+            spectral power distribution.
+        """
+
+        wavelength = np.around(np.asarray(wavelength, dtype=np.float_),
+                               DEFAULT_WAVELENGTH_DECIMALS)
+
+        wavelengths = self.__wavelengths
+        count = len(wavelengths)
+
+        if self.__steps is not None:
+            steps_count = (wavelength - wavelengths[0]) / self.__steps
+            indexes = np.clip(np.rint(steps_count).astype(np.int_),
+                              0,
+                              count - 1)
+            exists = wavelengths[indexes] == wavelength
+            # Non existing wavelengths indexes are the insertion indexes that
+            # would keep the wavelengths sorted.
+            indexes = np.where(
+                exists,
+                indexes,
+                np.clip(np.ceil(steps_count).astype(np.int_), 0, count))
+        else:
+            indexes = np.searchsorted(wavelengths, wavelength)
+            exists = np.zeros(wavelength.shape, dtype=np.bool_)
+            if count:
+                exists = wavelengths[np.clip(indexes, 0, count - 1)] == (
+                    wavelength)
+
+        return wavelength, indexes, exists
+
+    def __getattr__(self, attribute):
+        """
+        Returns given attribute value, evaluating the pending operation of a
+        lazy view when its underlying arrays are accessed.
+
+        Parameters
+        ----------
+        attribute : unicode
+            Attribute name.
+
+        Returns
+        -------
+        object
+            Attribute value.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__getattr__` method, only called
+            when the attribute is not found through the normal mechanism.
+        """
+
+        if attribute not in ('_SpectralPowerDistribution__wavelengths',
+                             '_SpectralPowerDistribution__values',
+                             '_SpectralPowerDistribution__steps'):
+            raise AttributeError(
+                '"{0}" object has no attribute "{1}"'.format(
+                    self.__class__.__name__, attribute))
+
+        pending = self.__pending
+        wavelengths, values, operation, arguments = pending
+        self.__pending = None
+
+        self.__set_arrays(wavelengths, values)
+        try:
+            getattr(self, operation)(*arguments)
+        except Exception:
+            # The view stays pending so that every subsequent access raises
+            # instead of exposing the source arrays.
+            self.__pending = pending
+            del self.__wavelengths, self.__values, self.__steps
+            self.__shape = self.__hash = self.__content_hash = None
+            raise
+
+        return getattr(self, attribute)
+
+    def __view(self, operation, *arguments):
+        """
+        Returns a lazy view of the spectral power distribution: given
+        operation is only performed when the view underlying arrays are
+        accessed.
+
+        Parameters
+        ----------
+        operation : unicode
+            In-place operation name.
+        \*arguments : \*
+            Operation arguments.
+
+        Returns
+        -------
+        SpectralPowerDistribution
+            Lazy view.
+        """
+
+        view = self.clone()
+        view.__pending = (self.__wavelengths, self.__values, operation,
+                          arguments)
+        del view.__wavelengths, view.__values, view.__steps
+        view.__shape = view.__hash = view.__content_hash = None
+
+        return view
 
     def __getitem__(self, wavelength):
         """
@@ -933,14 +1275,15 @@ class SpectralPowerDistribution(object):
         """
 
         if isinstance(wavelength, slice):
-            return self.values[wavelength]
+            return self.__values[wavelength]
         else:
-            wavelength = np.asarray(wavelength)
+            wavelength, indexes, exists = self.__indexes(wavelength)
 
-            value = [self.data.__getitem__(x) for x in np.ravel(wavelength)]
-            value = np.reshape(value, wavelength.shape)
+            if not np.all(exists):
+                raise KeyError(wavelength[~exists])
 
-            return value
+            return np.reshape(self.__values[np.ravel(indexes)],
+                              wavelength.shape)
 
     def __setitem__(self, wavelength, value):
         """
@@ -981,15 +1324,30 @@ class SpectralPowerDistribution(object):
         if is_numeric(wavelength) or is_iterable(wavelength):
             wavelengths = np.ravel(wavelength)
         elif isinstance(wavelength, slice):
-            wavelengths = self.wavelengths[wavelength]
+            wavelengths = self.__wavelengths[wavelength]
         else:
             raise NotImplementedError(
                 '"{0}" type is not supported for indexing!'.format(
                     type(wavelength)))
 
-        values = np.resize(value, wavelengths.shape)
-        for i in range(len(wavelengths)):
-            self.__data.__setitem__(wavelengths[i], values[i])
+        values = np.resize(np.asarray(value, dtype=np.float_),
+                           wavelengths.shape)
+
+        # Keeping the last value of duplicated wavelengths as a *dict* would.
+        wavelengths = np.around(wavelengths.astype(np.float_),
+                                DEFAULT_WAVELENGTH_DECIMALS)[::-1]
+        wavelengths, unique = np.unique(wavelengths, return_index=True)
+        values = values[::-1][unique]
+
+        wavelengths, indexes, exists = self.__indexes(wavelengths)
+
+        data_values = np.copy(self.__values)
+        data_values[indexes[exists]] = values[exists]
+
+        self.__set_arrays(
+            np.insert(self.__wavelengths, indexes[~exists],
+                      wavelengths[~exists]),
+            np.insert(data_values, indexes[~exists], values[~exists]))
 
     def __iter__(self):
         """
@@ -1017,7 +1375,7 @@ class SpectralPowerDistribution(object):
         (540, 88.1...)
         """
 
-        return iter(sorted(self.__data.items()))
+        return iter(zip(self.__wavelengths, self.__values))
 
     def __contains__(self, wavelength):
         """
@@ -1057,7 +1415,7 @@ class SpectralPowerDistribution(object):
         False
         """
 
-        return np.all(np.in1d(wavelength, self.wavelengths))
+        return bool(np.all(self.__indexes(wavelength)[2]))
 
     def __len__(self):
         """
@@ -1081,7 +1439,7 @@ class SpectralPowerDistribution(object):
         4
         """
 
-        return len(self.__data)
+        return len(self.__wavelengths)
 
     def __eq__(self, spd):
         """
@@ -1115,7 +1473,9 @@ class SpectralPowerDistribution(object):
         True
         """
 
-        return isinstance(spd, self.__class__) and spd.data == self.data
+        return (isinstance(spd, self.__class__) and
+                np.array_equal(spd.wavelengths, self.__wavelengths) and
+                np.array_equal(spd.values, self.__values))
 
     def __ne__(self, spd):
         """
@@ -1177,16 +1537,12 @@ class SpectralPowerDistribution(object):
         elif is_iterable(x):
             x = np.atleast_1d(x)
 
-        data = SpectralMapping(
-            zip(self.wavelengths, operation(self.values, x)))
+        values = operation(self.__values, x)
 
-        if in_place:
-            self.__data = data
-            return self
-        else:
-            clone = self.clone()
-            clone.data = data
-            return clone
+        spd = self if in_place else self.clone()
+        spd.__set_arrays(self.__wavelengths, values)
+
+        return spd
 
     def __add__(self, x):
         """
@@ -1615,10 +1971,10 @@ class SpectralPowerDistribution(object):
         array([ 49.67,  69.59])
         """
 
-        wavelength = np.asarray(wavelength)
+        wavelength, indexes, exists = self.__indexes(wavelength)
 
-        value = [self.data.get(x, default) for x in np.ravel(wavelength)]
-        value = np.reshape(value, wavelength.shape)
+        value = np.full(wavelength.shape, default, np.float_)
+        value[exists] = self.__values[indexes[exists]]
 
         return value
 
@@ -1650,7 +2006,7 @@ class SpectralPowerDistribution(object):
         False
         """
 
-        return is_uniform(self.wavelengths)
+        return self.__steps is not None
 
     def extrapolate(self,
                     shape,
@@ -1703,19 +2059,33 @@ class SpectralPowerDistribution(object):
         array(88.1...)
         """
 
+        start, end, steps = (self.shape.start,
+                             self.shape.end,
+                             self.shape.steps)
+
+        left_count = len(np.arange(start, shape.start - steps, -steps)) - 1
+        right_count = len(np.arange(end, shape.end + steps, steps)) - 1
+
+        if left_count == 0 and right_count == 0:
+            return self
+
         extrapolator = Extrapolator(
-            LinearInterpolator(self.wavelengths, self.values),
+            LinearInterpolator(self.__wavelengths, self.__values),
             method=method, left=left, right=right)
 
-        spd_shape = self.shape
-        for i in np.arange(spd_shape.start,
-                           shape.start - spd_shape.steps,
-                           -spd_shape.steps):
-            self[i] = extrapolator(float(i))
-        for i in np.arange(spd_shape.end,
-                           shape.end + spd_shape.steps,
-                           spd_shape.steps):
-            self[i] = extrapolator(float(i))
+        x_l = start - np.arange(left_count, 0, -1) * steps
+        x_r = end + np.arange(1, right_count + 1) * steps
+
+        # The extrapolated wavelengths are all lying outside the current
+        # range, thus the arrays are padded in a single step.
+        wavelengths = np.concatenate((x_l, x_r))
+        values = np.atleast_1d(extrapolator(wavelengths))
+
+        self.__set_arrays(
+            np.concatenate((x_l, self.__wavelengths, x_r)),
+            np.concatenate((values[:left_count],
+                            self.__values,
+                            values[left_count:])))
 
         return self
 
@@ -1839,38 +2209,56 @@ class SpectralPowerDistribution(object):
         wavelengths, values = self.wavelengths, self.values
         uniform = self.is_uniform()
 
-        if is_string(method):
-            method = method.lower()
-
-        if method is None:
-            if uniform:
-                interpolator = SpragueInterpolator
-            else:
-                interpolator = CubicSplineInterpolator
-        elif method == 'cubic spline':
-            interpolator = CubicSplineInterpolator
-        elif method == 'linear':
-            interpolator = LinearInterpolator
-        elif method == 'pchip':
-            interpolator = PchipInterpolator
-        elif method == 'sprague':
-            if not uniform:
-                warning(('"Sprague" interpolator should only be used for '
-                         'interpolating functions having a uniformly spaced '
-                         'independent variable!'))
+        interpolator = _spectral_interpolator(method, uniform)
 
-            interpolator = SpragueInterpolator
+        if uniform and interpolator in _RESAMPLING_OPERATORS_METHODS:
+            values = spectral_resampling_operator(
+                spd_shape,
+                shape,
+                _RESAMPLING_OPERATORS_METHODS[interpolator]).dot(values)
         else:
-            raise ValueError(
-                'Undefined "{0}" interpolator!'.format(method))
+            values = interpolator(wavelengths, values)(shape.range())
 
-        interpolator = interpolator(wavelengths, values)
-        self.__data = SpectralMapping(
-            [(wavelength, float(interpolator(wavelength)))
-             for wavelength in shape])
+        self.__set_arrays(shape.range(), values)
 
         return self
 
+    def interpolated(self, shape=SpectralShape(), method=None):
+        """
+        Returns a lazy interpolated view of the spectral power distribution:
+        the interpolation is only performed when the view values are accessed
+        and the spectral power distribution is left untouched.
+
+        Parameters
+        ----------
+        shape : SpectralShape, optional
+            Spectral shape used for interpolation.
+        method : unicode, optional
+            **{None, 'Cubic Spline', 'Linear', 'Pchip', 'Sprague'}**,
+            Enforce given interpolation method.
+
+        Returns
+        -------
+        SpectralPowerDistribution
+            Lazy interpolated spectral power distribution view.
+
+        See Also
+        --------
+        SpectralPowerDistribution.interpolate
+
+        Examples
+        --------
+        >>> data = {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19}
+        >>> spd = SpectralPowerDistribution('Spd', data)
+        >>> view = spd.interpolated(SpectralShape(steps=5), 'Linear')
+        >>> view.values  # doctest: +ELLIPSIS
+        array([ 49.67,  59.63,  69.59,  75.66,  81.73,  84.96,  88.19])
+        >>> spd.values
+        array([ 49.67,  69.59,  81.73,  88.19])
+        """
+
+        return self.__view('interpolate', shape, method)
+
     def align(self,
               shape,
               method='Constant',
@@ -1944,6 +2332,59 @@ class SpectralPowerDistribution(object):
 
         return self
 
+    def aligned(self,
+                shape,
+                method='Constant',
+                left=None,
+                right=None):
+        """
+        Returns a lazy aligned view of the spectral power distribution: the
+        alignment is only performed when the view values are accessed and the
+        spectral power distribution is left untouched.
+
+        Parameters
+        ----------
+        shape : SpectralShape
+            Spectral shape used for alignment.
+        method : unicode, optional
+            **{'Constant', 'Linear'}**,
+            Extrapolation method.
+        left : numeric, optional
+            Value to return for low extrapolation range.
+        right : numeric, optional
+            Value to return for high extrapolation range.
+
+        Returns
+        -------
+        SpectralPowerDistribution
+            Lazy aligned spectral power distribution view.
+
+        See Also
+        --------
+        SpectralPowerDistribution.align
+
+        Examples
+        --------
+        >>> data = {
+        ...     510: 49.67,
+        ...     520: 69.59,
+        ...     530: 81.73,
+        ...     540: 88.19,
+        ...     550: 86.26,
+        ...     560: 77.18}
+        >>> spd = SpectralPowerDistribution('Spd', data)
+        >>> view = spd.aligned(SpectralShape(500, 570, 5))
+        >>> view.values  # doctest: +ELLIPSIS
+        array([ 49.67     ,  49.67     ,  49.67     ,  60.3121800...,
+                69.59     ,  76.5339542...,  81.73     ,  85.8292968...,
+                88.19     ,  88.3266460...,  86.26     ,  82.2583874...,
+                77.18     ,  77.18     ,  77.18     ])
+        >>> spd.values
+        array([ 49.67,  69.59,  81.73,  88.19,  86.26,  77.18])
+        """
+
+        return self.__view('align', shape, method, left, right)
+
     def zeros(self, shape=SpectralShape()):
         """
         Zeros fills the spectral power distribution: Missing values will be
@@ -1993,21 +2434,26 @@ class SpectralPowerDistribution(object):
         boundaries = [x[0] if x[0] is not None else x[1] for x in boundaries]
         shape = SpectralShape(*boundaries)
 
-        data = SpectralMapping(
-            [(wavelength, self.get(wavelength, 0))
-             for wavelength in shape])
-
-        values_s = max(self.shape.start, shape.start)
-        values_e = min(self.shape.end, shape.end)
-        values = [self[wavelength] for wavelength in self.wavelengths
-                  if values_s <= wavelength <= values_e]
-        if not np.all(np.in1d(values, list(data.values()))):
+        range_ = shape.range()
+        in_range = np.logical_and(self.__wavelengths >= range_[0],
+                                  self.__wavelengths <= range_[-1])
+
+        # Every wavelength in the zeros fill range must be on the new grid,
+        # otherwise its value would be discarded.
+        indexes = np.clip(
+            np.searchsorted(range_, self.__wavelengths[in_range]),
+            0,
+            len(range_) - 1)
+        if not np.all(range_[indexes] == self.__wavelengths[in_range]):
             raise RuntimeError(('"{0}" cannot be zeros filled using "{1}" '
                                 'shape!').format(self, shape))
-        else:
-            self.__data = data
 
-            return self
+        values = np.zeros(range_.shape)
+        values[indexes] = self.__values[in_range]
+
+        self.__set_arrays(range_, values)
+
+        return self
 
     def normalise(self, factor=1):
         """
@@ -2061,9 +2507,19 @@ class SpectralPowerDistribution(object):
         >>> spd_clone = spd.clone()
         >>> print(spd_clone)  # doctest: +ELLIPSIS
         <...SpectralPowerDistribution object at 0x...>
+
+        The underlying arrays are shared until either side is mutated:
+
+        >>> np.may_share_memory(spd_clone.values, spd.values)
+        True
+        >>> spd_clone[510] = 0
+        >>> spd.values
+        array([ 49.67,  69.59,  81.73,  88.19])
         """
 
-        return copy.deepcopy(self)
+        # The underlying arrays are read only and replaced on mutation, thus
+        # they can be shared by the clone: copy-on-write semantics.
+        return copy.copy(self)
 
 
 class TriSpectralPowerDistribution(object):
@@ -3482,12 +3938,9 @@ class TriSpectralPowerDistribution(object):
         wavelength = np.asarray(wavelength)
 
         default = np.resize(default, 3)
-        value = np.array([(self.x.get(x, default[0]),
-                           self.y.get(x, default[1]),
-                           self.z.get(x, default[2]))
-                          for x in np.ravel(wavelength)])
-
-        value = np.reshape(value, wavelength.shape + (3,))
+        value = tstack((self.x.get(wavelength, default[0]),
+                        self.y.get(wavelength, default[1]),
+                        self.z.get(wavelength, default[2])))
 
         return value
 
@@ -3683,15 +4136,43 @@ class TriSpectralPowerDistribution(object):
         array([ 58.8173260...,  89.4355596...,  16.4545683...])
         """
 
-        for i in self.__mapping.keys():
-            getattr(self, i).interpolate(shape, method)
+        spd_shape = self.shape
+        boundaries = zip((shape.start, shape.end, shape.steps),
+                         (spd_shape.start, spd_shape.end, spd_shape.steps))
+        boundaries = [x[0] if x[0] is not None else x[1] for x in boundaries]
+        shape = SpectralShape(*boundaries)
 
-        return self
+        # Defining proper interpolation bounds.
+        shape.start = max(shape.start, np.ceil(spd_shape.start))
+        shape.end = min(shape.end, np.floor(spd_shape.end))
 
-    def align(self,
-              shape,
-              method='Constant',
-              left=None,
+        # The three axes values are interpolated together as a (W, 3) array.
+        wavelengths = self.wavelengths
+        values = tstack((self.x.values, self.y.values, self.z.values))
+        uniform = self.is_uniform()
+
+        interpolator = _spectral_interpolator(method, uniform)
+
+        if uniform and interpolator in _RESAMPLING_OPERATORS_METHODS:
+            values = spectral_resampling_operator(
+                spd_shape,
+                shape,
+                _RESAMPLING_OPERATORS_METHODS[interpolator]).dot(values)
+        elif interpolator is CubicSplineInterpolator:
+            values = interpolator(wavelengths, values, axis=0)(shape.range())
+        else:
+            values = interpolator(wavelengths, values)(shape.range())
+
+        wavelengths = shape.range()
+        for axis, axis_values in zip(('x', 'y', 'z'), np.transpose(values)):
+            getattr(self, axis).data = (wavelengths, axis_values)
+
+        return self
+
+    def align(self,
+              shape,
+              method='Constant',
+              left=None,
               right=None):
         """
         Aligns the tri-spectral power distribution to given shape: Interpolates
@@ -4044,125 +4525,1458 @@ class TriSpectralPowerDistribution(object):
         <...TriSpectralPowerDistribution object at 0x...>
         """
 
-        return copy.deepcopy(self)
-
-
-DEFAULT_SPECTRAL_SHAPE = SpectralShape(360, 830, 1)
-"""
-Default spectral shape using the shape of
-*CIE 1931 2 Degree Standard Observer*.
+        # The axes spectral power distributions are copy-on-write clones
+        # sharing their underlying arrays until mutated.
+        clone = copy.copy(self)
+        clone.__mapping = dict(self.__mapping)
+        clone.__data = dict((axis, spd.clone())
+                            for axis, spd in self.__data.items())
+        if self.__labels is not None:
+            clone.__labels = dict(self.__labels)
 
-DEFAULT_SPECTRAL_SHAPE : SpectralShape
-"""
+        return clone
 
 
-def constant_spd(k,
-                 shape=DEFAULT_SPECTRAL_SHAPE):
+class SpectralArray(object):
     """
-    Returns a spectral power distribution of given spectral shape filled with
-    constant :math:`k` values.
+    Defines the base object for batched spectral data computations.
+
+    A batch of :math:`N` spectral power distributions sharing the same
+    :class:`SpectralShape` class instance is stored as a single
+    :math:`(N, W)` array, :math:`W` being the spectral shape wavelengths
+    :math:`\lambda_n` count.
 
     Parameters
     ----------
-    k : numeric
-        Constant :math:`k` to fill the spectral power distribution with.
-    shape : SpectralShape, optional
-        Spectral shape used to create the spectral power distribution.
+    name : unicode
+        Spectral array name.
+    values : array_like, (N, W)
+        Spectral array values, one spectral power distribution per row.
+    shape : SpectralShape
+        Spectral shape shared by the spectral power distributions.
+    labels : array_like, optional
+        Spectral power distributions names, one per row.
+    title : unicode, optional
+        Spectral array title for figures.
 
-    Returns
+    Attributes
+    ----------
+    name
+    values
+    shape
+    labels
+    title
+    wavelengths
+
+    Methods
     -------
-    SpectralPowerDistribution
-        Constant :math:`k` to filled spectral power distribution.
+    __init__
+    __getitem__
+    __iter__
+    __len__
+    __eq__
+    __ne__
+    __add__
+    __iadd__
+    __sub__
+    __isub__
+    __mul__
+    __imul__
+    __div__
+    __idiv__
+    __pow__
+    __ipow__
+    extrapolate
+    interpolate
+    align
+    zeros
+    normalise
+    clone
 
-    Notes
-    -----
-    -   By default, the spectral power distribution will use the shape given
-        by :attr:`DEFAULT_SPECTRAL_SHAPE` attribute.
+    See Also
+    --------
+    spds_to_spectral_array, spectral_array_to_spds
 
     Examples
     --------
-    >>> spd = constant_spd(100)
-    >>> spd.shape
-    SpectralShape(360.0, 830.0, 1.0)
-    >>> spd[400]
-    array(100.0)
+    >>> values = np.array([[49.67, 69.59, 81.73, 88.19],
+    ...                    [12.43, 23.15, 67.98, 90.28]])
+    >>> spectral_array = SpectralArray(
+    ...     'Spectral Array', values, SpectralShape(510, 540, 10))
+    >>> len(spectral_array)
+    2
+    >>> spectral_array.wavelengths
+    array([ 510.,  520.,  530.,  540.])
+    >>> spectral_array[1].values
+    array([ 12.43,  23.15,  67.98,  90.28])
     """
 
-    wavelengths = shape.range()
-    values = np.full(len(wavelengths), k, np.float_)
+    def __init__(self, name, values, shape, labels=None, title=None):
+        self.__name = None
+        self.name = name
+        self.__shape = None
+        self.shape = shape
+        self.__values = None
+        self.values = values
+        self.__labels = None
+        self.labels = labels
+        self.__title = None
+        self.title = title
 
-    name = '{0} Constant'.format(k)
-    return SpectralPowerDistribution(
-        name, SpectralMapping(zip(wavelengths, values)))
+    @property
+    def name(self):
+        """
+        Property for **self.__name** private attribute.
 
+        Returns
+        -------
+        unicode
+            self.__name.
+        """
 
-def zeros_spd(shape=DEFAULT_SPECTRAL_SHAPE):
-    """
-    Returns a spectral power distribution of given spectral shape filled with
-    zeros.
+        return self.__name
 
-    Parameters
-    ----------
-    shape : SpectralShape, optional
-        Spectral shape used to create the spectral power distribution.
+    @name.setter
+    def name(self, value):
+        """
+        Setter for **self.__name** private attribute.
 
-    Returns
-    -------
-    SpectralPowerDistribution
-        Zeros filled spectral power distribution.
+        Parameters
+        ----------
+        value : unicode
+            Attribute value.
+        """
 
-    See Also
-    --------
-    constant_spd
+        if value is not None:
+            assert isinstance(value, basestring), (  # noqa
+                ('"{0}" attribute: "{1}" is not a '
+                 '"basestring" instance!').format('name', value))
+        self.__name = value
 
-    Notes
-    -----
-    -   By default, the spectral power distribution will use the shape given
-        by :attr:`DEFAULT_SPECTRAL_SHAPE` attribute.
+    @property
+    def shape(self):
+        """
+        Property for **self.__shape** private attribute.
 
-    Examples
-    --------
-    >>> spd = zeros_spd()
-    >>> spd.shape
-    SpectralShape(360.0, 830.0, 1.0)
-    >>> spd[400]
-    array(0.0)
-    """
+        Returns
+        -------
+        SpectralShape
+            self.__shape.
+        """
 
-    return constant_spd(0, shape)
+        return self.__shape
 
+    @shape.setter
+    def shape(self, value):
+        """
+        Setter for **self.__shape** private attribute.
 
-def ones_spd(shape=DEFAULT_SPECTRAL_SHAPE):
-    """
-    Returns a spectral power distribution of given spectral shape filled with
-    ones.
+        Parameters
+        ----------
+        value : SpectralShape
+            Attribute value.
+        """
 
-    Parameters
-    ----------
-    shape : SpectralShape, optional
-        Spectral shape used to create the spectral power distribution.
+        if value is not None:
+            assert isinstance(value, SpectralShape), (
+                '"{0}" attribute: "{1}" is not a "SpectralShape" '
+                'instance!'.format('shape', value))
+        self.__shape = value
 
-    Returns
-    -------
-    SpectralPowerDistribution
-        Ones filled spectral power distribution.
+    @property
+    def values(self):
+        """
+        Property for **self.__values** private attribute.
 
-    See Also
-    --------
-    constant_spd
+        Returns
+        -------
+        ndarray, (N, W)
+            self.__values.
+        """
 
-    Notes
-    -----
-    -   By default, the spectral power distribution will use the shape given
-        by :attr:`DEFAULT_SPECTRAL_SHAPE` attribute.
+        return self.__values
 
-    Examples
-    --------
-    >>> spd = ones_spd()
-    >>> spd.shape
-    SpectralShape(360.0, 830.0, 1.0)
-    >>> spd[400]
-    array(1.0)
-    """
+    @values.setter
+    def values(self, value):
+        """
+        Setter for **self.__values** private attribute.
 
-    return constant_spd(1, shape)
+        Parameters
+        ----------
+        value : array_like, (N, W)
+            Attribute value.
+        """
+
+        if value is not None:
+            value = np.atleast_2d(value).astype(np.float_)
+
+            assert value.ndim == 2, (
+                '"{0}" attribute must have exactly two dimensions!'.format(
+                    'values'))
+
+            assert value.shape[-1] == len(self.__shape), (
+                '"{0}" attribute: "{1}" wavelengths count does not match '
+                '"{2}" shape!'.format('values', value.shape[-1],
+                                      self.__shape))
+
+            # The array is never modified in-place but replaced, allowing
+            # clones to share it.
+            value.setflags(write=False)
+
+        self.__values = value
+
+    @property
+    def labels(self):
+        """
+        Property for **self.__labels** private attribute.
+
+        Returns
+        -------
+        ndarray
+            self.__labels.
+        """
+
+        if self.__labels is not None:
+            return self.__labels
+        else:
+            return np.array(['{0} - {1}'.format(self.__name, i)
+                             for i in range(len(self))])
+
+    @labels.setter
+    def labels(self, value):
+        """
+        Setter for **self.__labels** private attribute.
+
+        Parameters
+        ----------
+        value : array_like
+            Attribute value.
+        """
+
+        if value is not None:
+            value = np.asarray(value)
+
+            assert len(value) == len(self), (
+                '"{0}" attribute: labels count must match spectral power '
+                'distributions count!'.format('labels'))
+
+        self.__labels = value
+
+    @property
+    def title(self):
+        """
+        Property for **self.__title** private attribute.
+
+        Returns
+        -------
+        unicode
+            self.__title.
+        """
+
+        if self.__title is not None:
+            return self.__title
+        else:
+            return self.__name
+
+    @title.setter
+    def title(self, value):
+        """
+        Setter for **self.__title** private attribute.
+
+        Parameters
+        ----------
+        value : unicode
+            Attribute value.
+        """
+
+        if value is not None:
+            assert isinstance(value, basestring), (  # noqa
+                ('"{0}" attribute: "{1}" is not a '
+                 '"basestring" instance!').format('title', value))
+        self.__title = value
+
+    @property
+    def wavelengths(self):
+        """
+        Property for **self.wavelengths** attribute.
+
+        Returns
+        -------
+        ndarray
+            Spectral array wavelengths :math:`\lambda_n`.
+
+        Warning
+        -------
+        :attr:`SpectralArray.wavelengths` is read only.
+        """
+
+        return self.__shape.range()
+
+    @wavelengths.setter
+    def wavelengths(self, value):
+        """
+        Setter for **self.wavelengths** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError(
+            '"{0}" attribute is read only!'.format('wavelengths'))
+
+    def __getitem__(self, index):
+        """
+        Returns the spectral power distribution(s) for given index.
+
+        Parameters
+        ----------
+        index : int, slice or array_like
+            Spectral power distribution(s) index.
+
+        Returns
+        -------
+        SpectralPowerDistribution or SpectralArray
+            Spectral power distribution if given index is an integer, spectral
+            array otherwise.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__getitem__` method.
+
+        Examples
+        --------
+        >>> values = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                    [12.43, 23.15, 67.98, 90.28],
+        ...                    [90.56, 87.34, 45.76, 23.45]])
+        >>> spectral_array = SpectralArray(
+        ...     'Spectral Array', values, SpectralShape(510, 540, 10))
+        >>> spectral_array[0]  # doctest: +ELLIPSIS
+        <...SpectralPowerDistribution object at 0x...>
+        >>> spectral_array[1:].values
+        array([[ 12.43,  23.15,  67.98,  90.28],
+               [ 90.56,  87.34,  45.76,  23.45]])
+        """
+
+        if isinstance(index, (int, np.integer)):
+            return SpectralPowerDistribution(
+                str(self.labels[index]),
+                SpectralMapping(zip(self.wavelengths, self.__values[index])))
+        else:
+            return SpectralArray(self.__name,
+                                 self.__values[index],
+                                 self.__shape,
+                                 self.labels[index],
+                                 self.__title)
+
+    def __iter__(self):
+        """
+        Returns a generator for the spectral array spectral power
+        distributions.
+
+        Returns
+        -------
+        generator
+            Spectral power distributions generator.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__iter__` method.
+        """
+
+        return (self[i] for i in range(len(self)))
+
+    def __len__(self):
+        """
+        Returns the spectral array spectral power distributions count.
+
+        Returns
+        -------
+        int
+            Spectral power distributions count.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__len__` method.
+        """
+
+        return len(self.__values)
+
+    def __eq__(self, spectral_array):
+        """
+        Returns the spectral array equality with given other spectral array.
+
+        Parameters
+        ----------
+        spectral_array : SpectralArray
+            Spectral array to compare for equality.
+
+        Returns
+        -------
+        bool
+            Spectral array equality.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__eq__` method.
+        """
+
+        return (isinstance(spectral_array, self.__class__) and
+                spectral_array.shape == self.__shape and
+                np.array_equal(spectral_array.values, self.__values))
+
+    def __ne__(self, spectral_array):
+        """
+        Returns the spectral array inequality with given other spectral array.
+
+        Parameters
+        ----------
+        spectral_array : SpectralArray
+            Spectral array to compare for inequality.
+
+        Returns
+        -------
+        bool
+            Spectral array inequality.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__ne__` method.
+        """
+
+        return not (self == spectral_array)
+
+    def __arithmetical_operation(self, x, operation, in_place=False):
+        """
+        Performs given arithmetical operation on :math:`x` variable, the
+        operation can be either performed on a spectral array clone or
+        in-place.
+
+        Parameters
+        ----------
+        x : numeric or ndarray or SpectralPowerDistribution or SpectralArray
+            Operand, a :class:`SpectralPowerDistribution` class instance is
+            applied to every spectral power distribution of the spectral
+            array.
+        operation : object
+            Operation to perform.
+        in_place : bool, optional
+            Operation happens in place.
+
+        Returns
+        -------
+        SpectralArray
+            Spectral array.
+        """
+
+        if isinstance(x, (SpectralPowerDistribution, SpectralArray)):
+            x = x.values
+        elif is_iterable(x):
+            x = np.atleast_1d(x)
+
+        values = operation(self.__values, x)
+
+        spectral_array = self if in_place else self.clone()
+        spectral_array.values = values
+
+        return spectral_array
+
+    def __add__(self, x):
+        """
+        Implements support for spectral array addition.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+SpectralArray
+            Variable to add.
+
+        Returns
+        -------
+        SpectralArray
+            Variable added spectral array.
+
+        See Also
+        --------
+        SpectralArray.__iadd__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__add__` method.
+
+        Examples
+        --------
+        >>> values = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                    [12.43, 23.15, 67.98, 90.28]])
+        >>> spectral_array = SpectralArray(
+        ...     'Spectral Array', values, SpectralShape(510, 540, 10))
+        >>> (spectral_array + 10).values
+        array([[  59.67,   79.59,   91.73,   98.19],
+               [  22.43,   33.15,   77.98,  100.28]])
+        """
+
+        return self.__arithmetical_operation(x, operator.add)
+
+    def __iadd__(self, x):
+        """
+        Implements support for in-place spectral array addition.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+SpectralArray
+            Variable to in-place add.
+
+        Returns
+        -------
+        SpectralArray
+            Variable in-place added spectral array.
+
+        See Also
+        --------
+        SpectralArray.__add__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__iadd__` method.
+        """
+
+        return self.__arithmetical_operation(x, operator.add, True)
+
+    def __sub__(self, x):
+        """
+        Implements support for spectral array subtraction.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+SpectralArray
+            Variable to subtract.
+
+        Returns
+        -------
+        SpectralArray
+            Variable subtracted spectral array.
+
+        See Also
+        --------
+        SpectralArray.__isub__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__sub__` method.
+        """
+
+        return self.__arithmetical_operation(x, operator.sub)
+
+    def __isub__(self, x):
+        """
+        Implements support for in-place spectral array subtraction.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+SpectralArray
+            Variable to in-place subtract.
+
+        Returns
+        -------
+        SpectralArray
+            Variable in-place subtracted spectral array.
+
+        See Also
+        --------
+        SpectralArray.__sub__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__isub__` method.
+        """
+
+        return self.__arithmetical_operation(x, operator.sub, True)
+
+    def __mul__(self, x):
+        """
+        Implements support for spectral array multiplication.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+SpectralArray
+            Variable to multiply by.
+
+        Returns
+        -------
+        SpectralArray
+            Variable multiplied spectral array.
+
+        See Also
+        --------
+        SpectralArray.__imul__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__mul__` method.
+
+        Examples
+        --------
+        >>> values = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                    [12.43, 23.15, 67.98, 90.28]])
+        >>> spectral_array = SpectralArray(
+        ...     'Spectral Array', values, SpectralShape(510, 540, 10))
+        >>> data = {510: 1, 520: 2, 530: 3, 540: 4}
+        >>> spd = SpectralPowerDistribution('Spd', data)
+        >>> (spectral_array * spd).values
+        array([[  49.67,  139.18,  245.19,  352.76],
+               [  12.43,   46.3 ,  203.94,  361.12]])
+        """
+
+        return self.__arithmetical_operation(x, operator.mul)
+
+    def __imul__(self, x):
+        """
+        Implements support for in-place spectral array multiplication.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+SpectralArray
+            Variable to in-place multiply by.
+
+        Returns
+        -------
+        SpectralArray
+            Variable in-place multiplied spectral array.
+
+        See Also
+        --------
+        SpectralArray.__mul__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__imul__` method.
+        """
+
+        return self.__arithmetical_operation(x, operator.mul, True)
+
+    def __div__(self, x):
+        """
+        Implements support for spectral array division.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+SpectralArray
+            Variable to divide by.
+
+        Returns
+        -------
+        SpectralArray
+            Variable divided spectral array.
+
+        See Also
+        --------
+        SpectralArray.__idiv__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__div__` method.
+        """
+
+        return self.__arithmetical_operation(x, operator.truediv)
+
+    def __idiv__(self, x):
+        """
+        Implements support for in-place spectral array division.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+SpectralArray
+            Variable to in-place divide by.
+
+        Returns
+        -------
+        SpectralArray
+            Variable in-place divided spectral array.
+
+        See Also
+        --------
+        SpectralArray.__div__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__idiv__` method.
+        """
+
+        return self.__arithmetical_operation(x, operator.truediv, True)
+
+    # Python 3 compatibility.
+    __itruediv__ = __idiv__
+    __truediv__ = __div__
+
+    def __pow__(self, x):
+        """
+        Implements support for spectral array exponentiation.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+SpectralArray
+            Variable to exponentiate by.
+
+        Returns
+        -------
+        SpectralArray
+            Spectral array raised by power of x.
+
+        See Also
+        --------
+        SpectralArray.__ipow__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__pow__` method.
+        """
+
+        return self.__arithmetical_operation(x, operator.pow)
+
+    def __ipow__(self, x):
+        """
+        Implements support for in-place spectral array exponentiation.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+SpectralArray
+            Variable to in-place exponentiate by.
+
+        Returns
+        -------
+        SpectralArray
+            Variable in-place exponentiated spectral array.
+
+        See Also
+        --------
+        SpectralArray.__pow__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__ipow__` method.
+        """
+
+        return self.__arithmetical_operation(x, operator.pow, True)
+
+    def extrapolate(self,
+                    shape,
+                    method='Constant',
+                    left=None,
+                    right=None):
+        """
+        Extrapolates the spectral array following *CIE 15:2004*
+        recommendation. [2]_ [3]_
+
+        Parameters
+        ----------
+        shape : SpectralShape
+            Spectral shape used for extrapolation.
+        method : unicode, optional
+            **{'Constant', 'Linear'}**,
+            Extrapolation method.
+        left : numeric, optional
+            Value to return for low extrapolation range.
+        right : numeric, optional
+            Value to return for high extrapolation range.
+
+        Returns
+        -------
+        SpectralArray
+            Extrapolated spectral array.
+
+        See Also
+        --------
+        SpectralArray.align
+
+        Examples
+        --------
+        >>> values = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                    [12.43, 23.15, 67.98, 90.28]])
+        >>> spectral_array = SpectralArray(
+        ...     'Spectral Array', values, SpectralShape(510, 540, 10))
+        >>> spectral_array.extrapolate(  # doctest: +ELLIPSIS
+        ...     SpectralShape(490, 550)).shape
+        SpectralShape(490..., 550..., 10...)
+        >>> spectral_array.values
+        array([[ 49.67,  49.67,  49.67,  69.59,  81.73,  88.19,  88.19],
+               [ 12.43,  12.43,  12.43,  23.15,  67.98,  90.28,  90.28]])
+        """
+
+        start, end, steps = (self.__shape.start,
+                             self.__shape.end,
+                             self.__shape.steps)
+
+        left_count = len(np.arange(start, shape.start - steps, -steps)) - 1
+        right_count = len(np.arange(end, shape.end + steps, steps)) - 1
+
+        if left_count == 0 and right_count == 0:
+            return self
+
+        values = self.__values
+        wavelengths = self.wavelengths
+        shape = SpectralShape(start - left_count * steps,
+                              end + right_count * steps,
+                              steps)
+
+        x_l = (start - np.arange(left_count, 0, -1) * steps)
+        x_r = (end + np.arange(1, right_count + 1) * steps)
+
+        method = method.lower()
+        if method == 'linear':
+            y_l = (values[..., 0:1] + (x_l - wavelengths[0]) *
+                   (values[..., 1:2] - values[..., 0:1]) /
+                   (wavelengths[1] - wavelengths[0]))
+            y_r = (values[..., -1:] + (x_r - wavelengths[-1]) *
+                   (values[..., -1:] - values[..., -2:-1]) /
+                   (wavelengths[-1] - wavelengths[-2]))
+        elif method == 'constant':
+            y_l = np.repeat(values[..., 0:1], left_count, axis=-1)
+            y_r = np.repeat(values[..., -1:], right_count, axis=-1)
+        else:
+            raise ValueError(
+                'Undefined "{0}" extrapolation method!'.format(method))
+
+        if left is not None:
+            y_l = np.full(y_l.shape, left, np.float_)
+        if right is not None:
+            y_r = np.full(y_r.shape, right, np.float_)
+
+        self.__shape = shape
+        self.values = np.hstack((y_l, values, y_r))
+
+        return self
+
+    def interpolate(self, shape=SpectralShape(), method=None):
+        """
+        Interpolates the spectral array following *CIE 167:2005*
+        recommendations: the method developed by Sprague (1880) should be used
+        for interpolating functions having a uniformly spaced independent
+        variable. [4]_
+
+        Parameters
+        ----------
+        shape : SpectralShape, optional
+            Spectral shape used for interpolation.
+        method : unicode, optional
+            **{None, 'Cubic Spline', 'Linear', 'Pchip', 'Sprague'}**,
+            Enforce given interpolation method.
+
+        Returns
+        -------
+        SpectralArray
+            Interpolated spectral array.
+
+        Raises
+        ------
+        ValueError
+            If the interpolation method is not defined.
+
+        See Also
+        --------
+        SpectralArray.align
+
+        Notes
+        -----
+        -   See :meth:`SpectralPowerDistribution.interpolate` method
+            notes section.
+
+        Warning
+        -------
+        See :meth:`SpectralPowerDistribution.interpolate` method warning
+        section.
+
+        Examples
+        --------
+        >>> values = np.array([[49.67, 69.59, 81.73, 88.19, 86.26, 77.18],
+        ...                    [90.56, 87.34, 45.76, 23.45, 15.34, 10.11]])
+        >>> spectral_array = SpectralArray(
+        ...     'Spectral Array', values, SpectralShape(510, 560, 10))
+        >>> spectral_array.interpolate(  # doctest: +ELLIPSIS
+        ...     SpectralShape(steps=1))
+        <...SpectralArray object at 0x...>
+        >>> spectral_array.values[..., 5]  # doctest: +ELLIPSIS
+        array([ 60.3121800...,  93.2716331...])
+        """
+
+        spectral_array_shape = self.__shape
+        boundaries = zip((shape.start, shape.end, shape.steps),
+                         (spectral_array_shape.start,
+                          spectral_array_shape.end,
+                          spectral_array_shape.steps))
+        boundaries = [x[0] if x[0] is not None else x[1] for x in boundaries]
+        shape = SpectralShape(*boundaries)
+
+        # Defining proper interpolation bounds.
+        shape.start = max(shape.start, np.ceil(spectral_array_shape.start))
+        shape.end = min(shape.end, np.floor(spectral_array_shape.end))
+
+        if is_string(method):
+            method = method.lower()
+
+        wavelengths, values = self.wavelengths, self.__values
+        if method is None or method == 'sprague':
+            interpolator = SpragueInterpolator
+        elif method == 'cubic spline':
+            interpolator = CubicSplineInterpolator
+        elif method == 'linear':
+            interpolator = LinearInterpolator
+        elif method == 'pchip':
+            interpolator = PchipInterpolator
+        else:
+            raise ValueError(
+                'Undefined "{0}" interpolator!'.format(method))
+
+        if interpolator in _RESAMPLING_OPERATORS_METHODS:
+            values = spectral_resampling_operator(
+                spectral_array_shape,
+                shape,
+                _RESAMPLING_OPERATORS_METHODS[interpolator]).dot(values.T).T
+        else:
+            values = interpolator(wavelengths, values, axis=-1)(shape.range())
+
+        self.__shape = shape
+        self.values = values
+
+        return self
+
+    def align(self,
+              shape,
+              method='Constant',
+              left=None,
+              right=None):
+        """
+        Aligns the spectral array to given spectral shape: Interpolates first
+        then extrapolates to fit the given range.
+
+        Parameters
+        ----------
+        shape : SpectralShape
+            Spectral shape used for alignment.
+        method : unicode, optional
+            **{'Constant', 'Linear'}**,
+            Extrapolation method.
+        left : numeric, optional
+            Value to return for low extrapolation range.
+        right : numeric, optional
+            Value to return for high extrapolation range.
+
+        Returns
+        -------
+        SpectralArray
+            Aligned spectral array.
+
+        See Also
+        --------
+        SpectralArray.extrapolate, SpectralArray.interpolate
+
+        Examples
+        --------
+        >>> values = np.array([[49.67, 69.59, 81.73, 88.19, 86.26, 77.18],
+        ...                    [90.56, 87.34, 45.76, 23.45, 15.34, 10.11]])
+        >>> spectral_array = SpectralArray(
+        ...     'Spectral Array', values, SpectralShape(510, 560, 10))
+        >>> spectral_array.align(  # doctest: +ELLIPSIS
+        ...     SpectralShape(505, 565, 1)).shape
+        SpectralShape(505..., 565..., 1...)
+        """
+
+        self.interpolate(shape)
+        self.extrapolate(shape, method, left, right)
+
+        return self
+
+    def zeros(self, shape=SpectralShape()):
+        """
+        Zeros fills the spectral array: Missing values will be replaced with
+        zeros to fit the defined range.
+
+        Parameters
+        ----------
+        shape : SpectralShape, optional
+            Spectral shape used for zeros fill.
+
+        Returns
+        -------
+        SpectralArray
+            Zeros filled spectral array.
+
+        Raises
+        ------
+        RuntimeError
+            If the spectral array cannot be zeros filled.
+
+        Examples
+        --------
+        >>> values = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                    [12.43, 23.15, 67.98, 90.28]])
+        >>> spectral_array = SpectralArray(
+        ...     'Spectral Array', values, SpectralShape(510, 540, 10))
+        >>> spectral_array.zeros(  # doctest: +ELLIPSIS
+        ...     SpectralShape(500, 550, 5)).values
+        array([[  0.  ,   0.  ,  49.67,   0.  ,  69.59,   0.  ,  81.73,   0.  ,
+                 88.19,   0.  ,   0.  ],
+               [  0.  ,   0.  ,  12.43,   0.  ,  23.15,   0.  ,  67.98,   0.  ,
+                 90.28,   0.  ,   0.  ]])
+        """
+
+        spectral_array_shape = self.__shape
+        boundaries = zip((shape.start, shape.end, shape.steps),
+                         (spectral_array_shape.start,
+                          spectral_array_shape.end,
+                          spectral_array_shape.steps))
+        boundaries = [x[0] if x[0] is not None else x[1] for x in boundaries]
+        shape = SpectralShape(*boundaries)
+
+        wavelengths = self.wavelengths
+        range_ = shape.range()
+        in_range = np.logical_and(wavelengths >= range_[0],
+                                  wavelengths <= range_[-1])
+
+        indexes = np.searchsorted(range_, wavelengths[in_range])
+        indexes = np.clip(indexes, 0, len(range_) - 1)
+        if not np.all(range_[indexes] == wavelengths[in_range]):
+            raise RuntimeError(('"{0}" cannot be zeros filled using "{1}" '
+                                'shape!').format(self, shape))
+
+        values = np.zeros((len(self), len(range_)))
+        values[..., indexes] = self.__values[..., in_range]
+
+        self.__shape = shape
+        self.values = values
+
+        return self
+
+    def normalise(self, factor=1):
+        """
+        Normalises the spectral array spectral power distributions with given
+        normalization factor.
+
+        Parameters
+        ----------
+        factor : numeric, optional
+            Normalization factor
+
+        Returns
+        -------
+        SpectralArray
+            Normalised spectral array.
+
+        Notes
+        -----
+        -   Each spectral power distribution is normalised independently
+            using its maximum value.
+
+        Examples
+        --------
+        >>> values = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                    [12.43, 23.15, 67.98, 90.28]])
+        >>> spectral_array = SpectralArray(
+        ...     'Spectral Array', values, SpectralShape(510, 540, 10))
+        >>> spectral_array.normalise().values  # doctest: +ELLIPSIS
+        array([[ 0.5632157...,  0.7890917...,  0.9267490...,  1.        ],
+               [ 0.1376827...,  0.2564244...,  0.7529907...,  1.        ]])
+        """
+
+        self *= factor / np.max(self.__values, axis=-1)[..., np.newaxis]
+
+        return self
+
+    def clone(self):
+        """
+        Clones the spectral array.
+
+        Most of the :class:`SpectralArray` class operations are conducted
+        in-place. The :meth:`SpectralArray.clone` method provides a convenient
+        way to copy the spectral array to a new object.
+
+        Returns
+        -------
+        SpectralArray
+            Cloned spectral array.
+        """
+
+        # The values array is read only and replaced on mutation, thus it can
+        # be shared by the clone: copy-on-write semantics.
+        clone = copy.copy(self)
+        clone.__shape = copy.copy(self.__shape)
+        if self.__labels is not None:
+            clone.__labels = copy.copy(self.__labels)
+
+        return clone
+
+
+DEFAULT_SPECTRAL_SHAPE = SpectralShape(360, 830, 1)
+"""
+Default spectral shape using the shape of
+*CIE 1931 2 Degree Standard Observer*.
+
+DEFAULT_SPECTRAL_SHAPE : SpectralShape
+"""
+
+
+def constant_spd(k,
+                 shape=DEFAULT_SPECTRAL_SHAPE):
+    """
+    Returns a spectral power distribution of given spectral shape filled with
+    constant :math:`k` values.
+
+    Parameters
+    ----------
+    k : numeric
+        Constant :math:`k` to fill the spectral power distribution with.
+    shape : SpectralShape, optional
+        Spectral shape used to create the spectral power distribution.
+
+    Returns
+    -------
+    SpectralPowerDistribution
+        Constant :math:`k` to filled spectral power distribution.
+
+    Notes
+    -----
+    -   By default, the spectral power distribution will use the shape given
+        by :attr:`DEFAULT_SPECTRAL_SHAPE` attribute.
+
+    Examples
+    --------
+    >>> spd = constant_spd(100)
+    >>> spd.shape
+    SpectralShape(360.0, 830.0, 1.0)
+    >>> spd[400]
+    array(100.0)
+    """
+
+    wavelengths = shape.range()
+    values = np.full(len(wavelengths), k, np.float_)
+
+    name = '{0} Constant'.format(k)
+    return SpectralPowerDistribution(
+        name, SpectralMapping(zip(wavelengths, values)))
+
+
+def zeros_spd(shape=DEFAULT_SPECTRAL_SHAPE):
+    """
+    Returns a spectral power distribution of given spectral shape filled with
+    zeros.
+
+    Parameters
+    ----------
+    shape : SpectralShape, optional
+        Spectral shape used to create the spectral power distribution.
+
+    Returns
+    -------
+    SpectralPowerDistribution
+        Zeros filled spectral power distribution.
+
+    See Also
+    --------
+    constant_spd
+
+    Notes
+    -----
+    -   By default, the spectral power distribution will use the shape given
+        by :attr:`DEFAULT_SPECTRAL_SHAPE` attribute.
+
+    Examples
+    --------
+    >>> spd = zeros_spd()
+    >>> spd.shape
+    SpectralShape(360.0, 830.0, 1.0)
+    >>> spd[400]
+    array(0.0)
+    """
+
+    return constant_spd(0, shape)
+
+
+def ones_spd(shape=DEFAULT_SPECTRAL_SHAPE):
+    """
+    Returns a spectral power distribution of given spectral shape filled with
+    ones.
+
+    Parameters
+    ----------
+    shape : SpectralShape, optional
+        Spectral shape used to create the spectral power distribution.
+
+    Returns
+    -------
+    SpectralPowerDistribution
+        Ones filled spectral power distribution.
+
+    See Also
+    --------
+    constant_spd
+
+    Notes
+    -----
+    -   By default, the spectral power distribution will use the shape given
+        by :attr:`DEFAULT_SPECTRAL_SHAPE` attribute.
+
+    Examples
+    --------
+    >>> spd = ones_spd()
+    >>> spd.shape
+    SpectralShape(360.0, 830.0, 1.0)
+    >>> spd[400]
+    array(1.0)
+    """
+
+    return constant_spd(1, shape)
+
+
+def spds_to_spectral_array(spds, shape=None, name='Spectral Array'):
+    """
+    Converts given spectral power distributions to a spectral array.
+
+    Parameters
+    ----------
+    spds : array_like
+        Spectral power distributions to convert.
+    shape : SpectralShape, optional
+        Spectral shape the spectral power distributions are aligned to,
+        defaults to the first spectral power distribution shape.
+    name : unicode, optional
+        Spectral array name.
+
+    Returns
+    -------
+    SpectralArray
+        Spectral array.
+
+    See Also
+    --------
+    spectral_array_to_spds
+
+    Notes
+    -----
+    -   Spectral power distributions with a shape different from given
+        spectral shape are aligned on a copy.
+
+    Examples
+    --------
+    >>> spd_1 = SpectralPowerDistribution(
+    ...     'Spd 1', {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19})
+    >>> spd_2 = SpectralPowerDistribution(
+    ...     'Spd 2', {510: 12.43, 520: 23.15, 530: 67.98, 540: 90.28})
+    >>> spectral_array = spds_to_spectral_array([spd_1, spd_2])
+    >>> spectral_array.values
+    array([[ 49.67,  69.59,  81.73,  88.19],
+           [ 12.43,  23.15,  67.98,  90.28]])
+    >>> spectral_array.labels  # doctest: +SKIP
+    array(['Spd 1', 'Spd 2'], dtype='<U5')
+    """
+
+    spds = list(spds)
+
+    if shape is None:
+        shape = spds[0].shape
+
+    values = []
+    for spd in spds:
+        if spd.shape != shape:
+            spd = spd.clone().align(shape)
+        values.append(spd.values)
+
+    return SpectralArray(name,
+                         np.array(values),
+                         shape,
+                         [spd.name for spd in spds])
+
+
+def spectral_array_to_spds(spectral_array):
+    """
+    Converts given spectral array to spectral power distributions.
+
+    Parameters
+    ----------
+    spectral_array : SpectralArray
+        Spectral array to convert.
+
+    Returns
+    -------
+    list
+        Spectral power distributions.
+
+    See Also
+    --------
+    spds_to_spectral_array
+
+    Examples
+    --------
+    >>> values = np.array([[49.67, 69.59, 81.73, 88.19],
+    ...                    [12.43, 23.15, 67.98, 90.28]])
+    >>> spectral_array = SpectralArray(
+    ...     'Spectral Array', values, SpectralShape(510, 540, 10))
+    >>> spds = spectral_array_to_spds(spectral_array)
+    >>> spds[1].values
+    array([ 12.43,  23.15,  67.98,  90.28])
+    """
+
+    return list(spectral_array)
+
+
+def _spectral_interpolator(method=None, uniform=True):
+    """
+    Returns the interpolator class for given interpolation method following
+    *CIE 167:2005* recommendations.
+
+    Parameters
+    ----------
+    method : unicode, optional
+        **{None, 'Cubic Spline', 'Linear', 'Pchip', 'Sprague'}**,
+        Interpolation method, Sprague (1880) method is used for uniformly
+        spaced data and *Cubic Spline* method for non-uniformly spaced data if
+        not given.
+    uniform : bool, optional
+        Whether the data to interpolate is uniformly spaced.
+
+    Returns
+    -------
+    object
+        Interpolator class.
+
+    Raises
+    ------
+    ValueError
+        If the interpolation method is not defined.
+    """
+
+    if is_string(method):
+        method = method.lower()
+
+    if method is None:
+        if uniform:
+            interpolator = SpragueInterpolator
+        else:
+            interpolator = CubicSplineInterpolator
+    elif method == 'cubic spline':
+        interpolator = CubicSplineInterpolator
+    elif method == 'linear':
+        interpolator = LinearInterpolator
+    elif method == 'pchip':
+        interpolator = PchipInterpolator
+    elif method == 'sprague':
+        if not uniform:
+            warning(('"Sprague" interpolator should only be used for '
+                     'interpolating functions having a uniformly spaced '
+                     'independent variable!'))
+
+        interpolator = SpragueInterpolator
+    else:
+        raise ValueError(
+            'Undefined "{0}" interpolator!'.format(method))
+
+    return interpolator
+
+
+def spectral_resampling_operator(source_shape,
+                                 target_shape,
+                                 method='Sprague'):
+    """
+    Returns the linear operator resampling spectral data from given source
+    spectral shape to given target spectral shape and caches it if not
+    existing.
+
+    *Sprague* (1880), *Linear* and *Cubic Spline* interpolations are linear in
+    the dependent variable: the resampled values are given by the product of
+    the operator with the source values, allowing to resample many spectral
+    power distributions at once.
+
+    Parameters
+    ----------
+    source_shape : SpectralShape
+        Source spectral shape.
+    target_shape : SpectralShape
+        Target spectral shape, its wavelengths must be within the source
+        spectral shape range.
+    method : unicode, optional
+        **{'Sprague', 'Linear', 'Cubic Spline'}**,
+        Interpolation method.
+
+    Returns
+    -------
+    csr_matrix, (W_t, W_s)
+        Resampling operator.
+
+    Raises
+    ------
+    ValueError
+        If the interpolation method is not defined or if the target spectral
+        shape wavelengths are not within the source spectral shape range.
+
+    Notes
+    -----
+    -   The maximum number of cached operators is defined by
+        :attr:`SPECTRAL_RESAMPLING_OPERATORS_CACHE_SIZE` attribute.
+    -   *Sprague* (1880) and *Linear* operators are banded, the *Cubic Spline*
+        operator is dense.
+    -   The returned operator is shared with the cache, its underlying arrays
+        are flagged as read only.
+
+    Examples
+    --------
+    >>> operator = spectral_resampling_operator(
+    ...     SpectralShape(510, 560, 10), SpectralShape(510, 560, 5))
+    >>> operator.shape
+    (11, 6)
+    >>> values = np.array([[49.67, 69.59, 81.73, 88.19, 86.26, 77.18],
+    ...                    [90.56, 87.34, 45.76, 23.45, 15.34, 10.11]])
+    >>> operator.dot(values.T).T[..., 1]  # doctest: +ELLIPSIS
+    array([ 60.3121800...,  93.2716331...])
+    """
+
+    method = method.lower()
+    key = (source_shape.start,
+           source_shape.end,
+           source_shape.steps,
+           target_shape.start,
+           target_shape.end,
+           target_shape.steps,
+           method)
+
+    resampling_operator = _SPECTRAL_RESAMPLING_OPERATORS_CACHE.get(key)
+    if resampling_operator is not None:
+        return resampling_operator
+
+    x = source_shape.range()
+    x_i = target_shape.range()
+    if x_i[0] < x[0] or x_i[-1] > x[-1]:
+        raise ValueError(
+            ('"{0}" target shape wavelengths are not within "{1}" source '
+             'shape range!').format(target_shape, source_shape))
+
+    # The operator columns are the interpolated columns of the identity
+    # matrix, i.e. the responses to each source wavelength.
+    identity = np.identity(len(x))
+    if method == 'sprague':
+        resampling_operator = SpragueInterpolator(x, identity)(x_i)
+    elif method == 'linear':
+        resampling_operator = LinearInterpolator(x, identity)(x_i)
+    elif method == 'cubic spline':
+        resampling_operator = CubicSplineInterpolator(
+            x, identity, axis=0)(x_i)
+    else:
+        raise ValueError(
+            'Undefined "{0}" resampling operator!'.format(method))
+
+    resampling_operator = scipy.sparse.csr_matrix(resampling_operator)
+    for array in (resampling_operator.data,
+                  resampling_operator.indices,
+                  resampling_operator.indptr):
+        array.setflags(write=False)
+
+    _SPECTRAL_RESAMPLING_OPERATORS_CACHE[key] = resampling_operator
+
+    return resampling_operator
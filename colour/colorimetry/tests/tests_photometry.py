@@ -7,11 +7,13 @@ Defines unit tests for :mod:`colour.colorimetry.photometry` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
 from colour.colorimetry import (
     ILLUMINANTS_RELATIVE_SPDS,
     LIGHT_SOURCES_RELATIVE_SPDS,
+    spds_to_spectral_array,
     luminous_flux,
     luminous_efficacy)
 
@@ -55,6 +57,18 @@ class TestLuminousFlux(unittest.TestCase):
             13090.067590531509,
             places=7)
 
+    def test_n_dimensional_luminous_flux(self):
+        """
+        Tests :func:`colour.colorimetry.photometry.luminous_flux` definition
+        n-dimensional support.
+        """
+
+        spd = LIGHT_SOURCES_RELATIVE_SPDS.get('Neodimium Incandescent')
+        np.testing.assert_almost_equal(
+            luminous_flux(spds_to_spectral_array([spd, spd * 2])),
+            np.array([23807.655527367198, 47615.311054734396]),
+            decimal=7)
+
 
 class TestLuminousEfficacy(unittest.TestCase):
     """
@@ -86,6 +100,18 @@ class TestLuminousEfficacy(unittest.TestCase):
             0.510809188121,
             places=7)
 
+    def test_n_dimensional_luminous_efficacy(self):
+        """
+        Tests :func:`colour.colorimetry.photometry.luminous_efficacy`
+        definition n-dimensional support.
+        """
+
+        spd = LIGHT_SOURCES_RELATIVE_SPDS.get('Neodimium Incandescent')
+        np.testing.assert_almost_equal(
+            luminous_efficacy(spds_to_spectral_array([spd, spd * 2])),
+            np.array([0.199439356245, 0.199439356245]),
+            decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,9 +16,17 @@ from colour.colorimetry.spectrum import (
     SpectralShape,
     SpectralPowerDistribution,
     TriSpectralPowerDistribution,
+    SpectralArray,
     constant_spd,
     zeros_spd,
-    ones_spd)
+    ones_spd,
+    spds_to_spectral_array,
+    spectral_array_to_spds,
+    spectral_resampling_operator)
+from colour.algebra import (
+    CubicSplineInterpolator,
+    LinearInterpolator,
+    SpragueInterpolator)
 from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
@@ -39,9 +47,13 @@ __all__ = ['SAMPLE_SPD_DATA',
            'TestSpectralShape',
            'TestSpectralPowerDistribution',
            'TestTriSpectralPowerDistribution',
+           'TestSpectralArray',
            'TestConstantSpd',
            'TestZerosSpd',
-           'TestOnes_spd']
+           'TestOnes_spd',
+           'TestSpdsToSpectralArray',
+           'TestSpectralArrayToSpds',
+           'TestSpectralResamplingOperator']
 
 SAMPLE_SPD_DATA = {
     340: 0.0000,
@@ -2060,7 +2072,9 @@ class TestSpectralPowerDistribution(unittest.TestCase):
                                'title',
                                'wavelengths',
                                'values',
-                               'shape')
+                               'shape',
+                               'version',
+                               'content_hash')
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(SpectralPowerDistribution))
@@ -2092,7 +2106,9 @@ class TestSpectralPowerDistribution(unittest.TestCase):
                             'is_uniform',
                             'extrapolate',
                             'interpolate',
+                            'interpolated',
                             'align',
+                            'aligned',
                             'zeros',
                             'normalise',
                             'clone')
@@ -2100,6 +2116,29 @@ class TestSpectralPowerDistribution(unittest.TestCase):
         for method in required_methods:
             self.assertIn(method, dir(SpectralPowerDistribution))
 
+    def test_data(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.\
+SpectralPowerDistribution.data` attribute.
+        """
+
+        wavelengths = self.__spd.wavelengths
+        values = self.__spd.values
+
+        spd = SpectralPowerDistribution('Sample', (wavelengths, values))
+        self.assertEqual(spd, self.__spd)
+        self.assertTrue(np.may_share_memory(spd.wavelengths, wavelengths))
+        self.assertTrue(np.may_share_memory(spd.values, values))
+
+        spd = SpectralPowerDistribution(
+            'Sample', (wavelengths[::-1], values[::-1]))
+        self.assertEqual(spd, self.__spd)
+
+        values = np.copy(values)
+        spd = SpectralPowerDistribution('Sample', (wavelengths, values))
+        self.assertFalse(np.may_share_memory(spd.values, values))
+        self.assertTrue(values.flags.writeable)
+
     def test_wavelengths(self):
         """
         Tests :attr:`colour.colorimetry.spectrum.\
@@ -2117,6 +2156,8 @@ SpectralPowerDistribution.wavelengths` attribute.
         self.assertTrue(
             np.all(np.in1d(non_uniform_spd.wavelengths, spd.wavelengths)))
 
+        self.assertFalse(self.__spd.wavelengths.flags.writeable)
+
     def test_values(self):
         """
         Tests :attr:`colour.colorimetry.spectrum.\
@@ -2127,6 +2168,14 @@ SpectralPowerDistribution.values` attribute.
             self.__spd.values,
             [v for k, v in sorted(SAMPLE_SPD_DATA.items())])
 
+        self.assertFalse(self.__spd.values.flags.writeable)
+
+        spd = self.__spd.clone()
+        values = spd.values
+        spd[400] = 1
+        self.assertEqual(values[3], 0.0641)
+        self.assertFalse(spd.values.flags.writeable)
+
     def test_shape(self):
         """
         Tests :attr:`colour.colorimetry.spectrum.\
@@ -2135,6 +2184,47 @@ SpectralPowerDistribution.shape` attribute.
 
         self.assertEqual(self.__spd.shape, SpectralShape(340, 820, 20))
 
+        spd = self.__spd.clone()
+        self.assertIs(spd.shape, spd.shape)
+        spd[830] = 0
+        self.assertEqual(spd.shape, SpectralShape(340, 830, 10))
+        spd.data = {500: 1, 505: 2}
+        self.assertEqual(spd.shape, SpectralShape(500, 505, 5))
+
+    def test_version(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.\
+SpectralPowerDistribution.version` attribute.
+        """
+
+        spd = self.__spd.clone()
+        version = spd.version
+        spd.name = 'Name'
+        spd.get(340)
+        self.assertEqual(spd.version, version)
+
+        spd[340] = 1
+        self.assertEqual(spd.version, version + 1)
+        spd += 1
+        self.assertEqual(spd.version, version + 2)
+        self.assertEqual(self.__spd.version, version)
+
+    def test_content_hash(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.\
+SpectralPowerDistribution.content_hash` attribute.
+        """
+
+        spd = self.__spd.clone()
+        self.assertEqual(spd.content_hash, self.__spd.content_hash)
+
+        spd[340] = 1
+        self.assertNotEqual(spd.content_hash, self.__spd.content_hash)
+        self.assertEqual(hash(spd), hash(self.__spd))
+
+        spd[340] = 0
+        self.assertEqual(spd.content_hash, self.__spd.content_hash)
+
     def test__getitem__(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2176,6 +2266,14 @@ SpectralPowerDistribution.__setitem__` method.
             spd.values,
             np.array([49.67, 49.67, 49.67, 49.67, 49.67]))
 
+        spd[np.array([505, 560, 505, 530])] = np.array([1, 2, 3, 4])
+        np.testing.assert_almost_equal(
+            spd.wavelengths,
+            np.array([505, 510, 520, 530, 540, 550, 560]))
+        np.testing.assert_almost_equal(
+            spd.values,
+            np.array([3, 49.67, 49.67, 4, 49.67, 49.67, 2]))
+
     def test__iter__(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2285,13 +2383,13 @@ SpectralPowerDistribution.__iadd__`,
             self.assertTrue(operation(spd, 1) is spd)
 
             spd = self.__spd.clone()
-            values = spd.values
+            values = np.copy(spd.values)
             np.testing.assert_almost_equal(
                 operation(spd, 2).values,
                 operation(values, 2))
 
             spd = self.__spd.clone()
-            values = spd.values
+            values = np.copy(spd.values)
             random = np.random.random(len(values))
             np.testing.assert_almost_equal(
                 operation(spd, random).values,
@@ -2301,7 +2399,7 @@ SpectralPowerDistribution.__iadd__`,
             spd2 = self.__spd.clone()
             np.testing.assert_almost_equal(
                 operation(spd1, spd2).values,
-                operation(self.__spd.values, self.__spd.values))
+                operation(np.copy(self.__spd.values), self.__spd.values))
 
     def test_get(self):
         """
@@ -2323,6 +2421,15 @@ SpectralPowerDistribution.get` method.
 
         np.testing.assert_array_equal(self.__spd.get(400.1), np.nan)
 
+        wavelengths = np.around(np.arange(360, 370.05, 0.1), 1)
+        spd = SpectralPowerDistribution(
+            '', dict(zip(wavelengths, np.arange(len(wavelengths)))))
+        np.testing.assert_array_equal(spd.get(wavelengths),
+                                      np.arange(len(wavelengths)))
+        np.testing.assert_array_equal(
+            spd.get(np.array([359.9, 360.05, 370.1]), -1),
+            np.array([-1, -1, -1]))
+
     def test_is_uniform(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2333,6 +2440,16 @@ SpectralPowerDistribution.is_uniform` method.
 
         self.assertTrue(self.__spd.is_uniform())
 
+        spd = self.__spd.clone()
+        spd[1000] = 1
+        self.assertFalse(spd.is_uniform())
+        spd[np.arange(840, 1000, 20)] = 1
+        self.assertTrue(spd.is_uniform())
+        spd[350] = 1
+        np.testing.assert_array_equal(spd.wavelengths[0:4],
+                                      np.array([340, 350, 360, 380]))
+        self.assertFalse(spd.is_uniform())
+
     def test_extrapolate(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2346,6 +2463,15 @@ SpectralPowerDistribution.extrapolate` method.
         self.assertEqual(spd[10], 0)
         self.assertEqual(spd[50], 1)
 
+        spd = SpectralPowerDistribution(
+            '', dict(zip(range(25, 35), np.arange(10) * 2)))
+        spd.extrapolate(SpectralShape(10, 50), method='Linear', right=100)
+
+        np.testing.assert_array_equal(spd.wavelengths, np.arange(10, 51))
+        np.testing.assert_almost_equal(spd[np.array([10, 24, 25, 34])],
+                                       np.array([-30, -2, 0, 18]))
+        np.testing.assert_array_equal(spd[np.arange(35, 51)], 100)
+
     def test_interpolate(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2379,6 +2505,29 @@ SpectralPowerDistribution.interpolate` method.
             np.array(0.06439937984496125),
             decimal=7)
 
+    def test_interpolated(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+SpectralPowerDistribution.interpolated` method.
+        """
+
+        values = self.__spd.values
+        view = self.__spd.interpolated(SpectralShape(steps=1), 'Linear')
+
+        np.testing.assert_array_equal(
+            view.values,
+            self.__spd.clone().interpolate(
+                SpectralShape(steps=1), 'Linear').values)
+        np.testing.assert_array_equal(self.__spd.values, values)
+
+        view = self.__spd.interpolated(SpectralShape(steps=1), 'Undefined')
+        self.assertEqual(view.name, self.__spd.name)
+        self.assertRaises(ValueError, lambda: view.values)
+        self.assertRaises(ValueError, lambda: view.values)
+        self.assertRaises(ValueError, lambda: view.wavelengths)
+        self.assertRaises(ValueError, lambda: view.shape)
+        np.testing.assert_array_equal(self.__spd.values, values)
+
     def test_align(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2391,6 +2540,22 @@ SpectralPowerDistribution.align` method.
         shape = SpectralShape(600, 650, 1)
         self.assertEqual(self.__spd.clone().align(shape).shape, shape)
 
+    def test_aligned(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+SpectralPowerDistribution.aligned` method.
+        """
+
+        shape = SpectralShape(100, 900, 5)
+        view = self.__spd.aligned(shape, 'Linear', right=0)
+        self.assertEqual(view.shape, shape)
+        self.assertEqual(view, self.__spd.clone().align(shape, 'Linear',
+                                                        right=0))
+        self.assertNotEqual(self.__spd.shape, shape)
+
+        view_clone = view.clone()
+        self.assertEqual(view_clone.shape, shape)
+
     def test_zeros(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2406,6 +2571,16 @@ SpectralPowerDistribution.zeros` method.
             lambda: self.__non_uniform_spd.clone().zeros(
                 SpectralShape(360, 830, 1)))
 
+        spd = SpectralPowerDistribution('', {510: 1, 520: 2, 530: 3})
+        np.testing.assert_array_equal(
+            spd.zeros(SpectralShape(515, 540, 5)).values,
+            np.array([0, 2, 0, 3, 0, 0]))
+
+        spd = SpectralPowerDistribution('', {510: 1, 520: 2, 531: 3})
+        self.assertRaises(
+            RuntimeError,
+            lambda: spd.zeros(SpectralShape(500, 540, 5)))
+
     def test_normalise(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2424,6 +2599,14 @@ SpectralPowerDistribution.clone` method.
 
         self.assertFalse(self.__spd is self.__spd.clone())
 
+        spd = self.__spd.clone()
+        self.assertTrue(np.may_share_memory(spd.values, self.__spd.values))
+
+        spd[340] = 1
+        spd *= 2
+        self.assertEqual(self.__spd[340], 0)
+        self.assertNotEqual(spd, self.__spd)
+
 
 class TestTriSpectralPowerDistribution(unittest.TestCase):
     """
@@ -2859,6 +3042,24 @@ TriSpectralPowerDistribution.interpolate` method.
             np.array([0.04895501, 0.00136229, 0.23349933]),
             decimal=7)
 
+    def test_interpolate_axes(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+TriSpectralPowerDistribution.interpolate` method consistency with the axes
+        spectral power distributions interpolation.
+        """
+
+        for tri_spd in (self.__tri_spd, self.__non_uniform_sample_tri_spd):
+            for method in (None, 'Cubic Spline', 'Linear', 'Pchip'):
+                interpolated = tri_spd.clone().interpolate(
+                    SpectralShape(steps=1), method)
+                for i in sorted(self.__mapping.keys()):
+                    np.testing.assert_almost_equal(
+                        getattr(interpolated, i).values,
+                        getattr(tri_spd, i).clone().interpolate(
+                            SpectralShape(steps=1), method).values,
+                        decimal=7)
+
     def test_align(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2911,6 +3112,317 @@ TriSpectralPowerDistribution.clone` method.
 
         self.assertFalse(self.__tri_spd is self.__tri_spd.clone())
 
+        tri_spd = self.__tri_spd.clone()
+        tri_spd[380] = (1, 1, 1)
+        tri_spd.labels['x'] = 'x'
+        np.testing.assert_almost_equal(
+            self.__tri_spd[380],
+            np.array([0.001368, 0.000039, 0.006450]))
+        self.assertNotEqual(self.__tri_spd.labels['x'], 'x')
+
+
+class TestSpectralArray(unittest.TestCase):
+    """
+    Defines :class:`colour.colorimetry.spectrum.SpectralArray` class unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__spds = [
+            SpectralPowerDistribution('Sample', SAMPLE_SPD_DATA),
+            SpectralPowerDistribution('Sample', SAMPLE_SPD_DATA) ** 2,
+            SpectralPowerDistribution('Sample', SAMPLE_SPD_DATA) + 0.5]
+
+        self.__spectral_array = SpectralArray(
+            'Spectral Array',
+            np.array([spd.values for spd in self.__spds]),
+            self.__spds[0].shape,
+            ['Sample 1', 'Sample 2', 'Sample 3'])
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('name',
+                               'values',
+                               'shape',
+                               'labels',
+                               'title',
+                               'wavelengths')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(SpectralArray))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__getitem__',
+                            '__iter__',
+                            '__len__',
+                            '__eq__',
+                            '__ne__',
+                            '__add__',
+                            '__iadd__',
+                            '__sub__',
+                            '__isub__',
+                            '__mul__',
+                            '__imul__',
+                            '__div__',
+                            '__idiv__',
+                            '__pow__',
+                            '__ipow__',
+                            'extrapolate',
+                            'interpolate',
+                            'align',
+                            'zeros',
+                            'normalise',
+                            'clone')
+
+        for method in required_methods:
+            self.assertIn(method, dir(SpectralArray))
+
+    def test_values(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.SpectralArray.values`
+        attribute.
+        """
+
+        self.assertTupleEqual(self.__spectral_array.values.shape, (3, 25))
+
+        self.assertRaises(AssertionError,
+                          lambda: SpectralArray('',
+                                                np.ones((3, 10)),
+                                                SpectralShape(340, 830, 5)))
+
+    def test_wavelengths(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.SpectralArray.wavelengths`
+        attribute.
+        """
+
+        np.testing.assert_almost_equal(self.__spectral_array.wavelengths,
+                                       self.__spds[0].wavelengths)
+
+    def test_labels(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.SpectralArray.labels`
+        attribute.
+        """
+
+        self.assertListEqual(list(self.__spectral_array.labels),
+                             ['Sample 1', 'Sample 2', 'Sample 3'])
+
+        spectral_array = SpectralArray(
+            'Spectral Array', np.ones((2, 3)), SpectralShape(400, 420, 10))
+        self.assertListEqual(list(spectral_array.labels),
+                             ['Spectral Array - 0', 'Spectral Array - 1'])
+
+    def test__getitem__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralArray.__getitem__`
+        method.
+        """
+
+        spd = self.__spectral_array[1]
+        self.assertIsInstance(spd, SpectralPowerDistribution)
+        self.assertEqual(spd.name, 'Sample 2')
+        np.testing.assert_almost_equal(spd.values, self.__spds[1].values)
+
+        spectral_array = self.__spectral_array[1:]
+        self.assertIsInstance(spectral_array, SpectralArray)
+        self.assertEqual(len(spectral_array), 2)
+        self.assertListEqual(list(spectral_array.labels),
+                             ['Sample 2', 'Sample 3'])
+
+    def test__iter__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralArray.__iter__`
+        method.
+        """
+
+        for spd_a, spd_e in zip(self.__spectral_array, self.__spds):
+            np.testing.assert_almost_equal(spd_a.values, spd_e.values)
+
+    def test__len__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralArray.__len__`
+        method.
+        """
+
+        self.assertEqual(len(self.__spectral_array), 3)
+
+    def test__eq__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralArray.__eq__`
+        method.
+        """
+
+        self.assertEqual(self.__spectral_array, self.__spectral_array.clone())
+
+    def test__ne__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralArray.__ne__`
+        method.
+        """
+
+        self.assertNotEqual(self.__spectral_array,
+                            self.__spectral_array.clone() + 1)
+
+    def test_arithmetical_operations(self):
+        """
+        Tests :class:`colour.colorimetry.spectrum.SpectralArray` class
+        arithmetical operations.
+        """
+
+        spd = self.__spds[1]
+        for operation in (operator.add,
+                          operator.sub,
+                          operator.mul,
+                          operator.truediv,
+                          operator.pow):
+            spectral_array = operation(self.__spectral_array, 2)
+            for spd_a, spd_e in zip(spectral_array, self.__spds):
+                np.testing.assert_almost_equal(
+                    spd_a.values, operation(spd_e.clone(), 2).values)
+
+            spectral_array = operation(self.__spectral_array, spd)
+            for spd_a, spd_e in zip(spectral_array, self.__spds):
+                np.testing.assert_almost_equal(
+                    spd_a.values, operation(spd_e.clone(), spd).values)
+
+        np.testing.assert_almost_equal(
+            (self.__spectral_array - self.__spectral_array).values,
+            np.zeros((3, 25)))
+
+        np.testing.assert_almost_equal(
+            (self.__spectral_array * np.array([[1], [2], [3]]))[2].values,
+            self.__spds[2].values * 3)
+
+    def test_arithmetical_ioperation(self):
+        """
+        Tests :class:`colour.colorimetry.spectrum.SpectralArray` class
+        in-place arithmetical operations.
+        """
+
+        spectral_array = self.__spectral_array.clone()
+        spectral_array_i = spectral_array
+        spectral_array += 1
+        spectral_array *= 2
+
+        self.assertIs(spectral_array, spectral_array_i)
+        np.testing.assert_almost_equal(
+            spectral_array.values,
+            (self.__spectral_array.values + 1) * 2)
+
+    def test_extrapolate(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralArray.extrapolate`
+        method.
+        """
+
+        shape = SpectralShape(300, 900, 20)
+        spectral_array = self.__spectral_array.clone().extrapolate(shape)
+        self.assertEqual(spectral_array.shape, shape)
+        for spd_a, spd_e in zip(spectral_array, self.__spds):
+            np.testing.assert_almost_equal(
+                spd_a.values, spd_e.clone().extrapolate(shape).values)
+
+        spectral_array = self.__spectral_array.clone().extrapolate(
+            shape, method='Linear')
+        for spd_a, spd_e in zip(spectral_array, self.__spds):
+            np.testing.assert_almost_equal(
+                spd_a.values,
+                spd_e.clone().extrapolate(shape, method='Linear').values)
+
+        spectral_array = self.__spectral_array.clone().extrapolate(
+            shape, left=0, right=1)
+        np.testing.assert_almost_equal(spectral_array.values[..., 0], 0)
+        np.testing.assert_almost_equal(spectral_array.values[..., -1], 1)
+
+    def test_interpolate(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralArray.interpolate`
+        method.
+        """
+
+        shape = SpectralShape(steps=1)
+        for method in ('Sprague', 'Linear', 'Cubic Spline', 'Pchip'):
+            spectral_array = self.__spectral_array.clone().interpolate(
+                shape, method)
+            for spd_a, spd_e in zip(spectral_array, self.__spds):
+                np.testing.assert_almost_equal(
+                    spd_a.values,
+                    spd_e.clone().interpolate(shape, method).values,
+                    decimal=7)
+
+        np.testing.assert_almost_equal(
+            self.__spectral_array.clone().interpolate(shape)[0].values,
+            INTERPOLATED_SAMPLE_SPD_DATA,
+            decimal=7)
+
+    def test_align(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralArray.align` method.
+        """
+
+        shape = SpectralShape(100, 900, 5)
+        self.assertEqual(
+            self.__spectral_array.clone().align(shape).shape, shape)
+
+        shape = SpectralShape(600, 650, 1)
+        self.assertEqual(
+            self.__spectral_array.clone().align(shape).shape, shape)
+
+    def test_zeros(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralArray.zeros` method.
+        """
+
+        np.testing.assert_almost_equal(
+            self.__spectral_array.clone().zeros(
+                SpectralShape(steps=1))[0].values,
+            ZEROS_SAMPLE_SPD_DATA)
+
+        self.assertRaises(
+            RuntimeError,
+            lambda: self.__spectral_array.clone().zeros(
+                SpectralShape(340, 830, 3)))
+
+    def test_normalise(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralArray.normalise`
+        method.
+        """
+
+        spectral_array = self.__spectral_array.clone().normalise(100)
+        np.testing.assert_almost_equal(spectral_array[0].values,
+                                       NORMALISED_SAMPLE_SPD_DATA)
+        np.testing.assert_almost_equal(
+            np.max(spectral_array.values, axis=-1), np.array([100] * 3))
+
+    def test_clone(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralArray.clone` method.
+        """
+
+        self.assertFalse(self.__spectral_array is
+                         self.__spectral_array.clone())
+
+        spectral_array = self.__spectral_array.clone()
+        self.assertTrue(np.may_share_memory(spectral_array.values,
+                                            self.__spectral_array.values))
+
+        spectral_array *= 2
+        np.testing.assert_array_equal(spectral_array.values,
+                                      self.__spectral_array.values * 2)
+
 
 class TestConstantSpd(unittest.TestCase):
     """
@@ -2977,5 +3489,119 @@ class TestOnes_spd(unittest.TestCase):
         self.assertEqual(spd[830], 1.)
 
 
+class TestSpdsToSpectralArray(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.spectrum.spds_to_spectral_array`
+    definition unit tests methods.
+    """
+
+    def test_spds_to_spectral_array(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.spds_to_spectral_array`
+        definition.
+        """
+
+        spd = SpectralPowerDistribution('Sample', SAMPLE_SPD_DATA)
+        spectral_array = spds_to_spectral_array(
+            [spd, ones_spd(SpectralShape(360, 830, 1))])
+
+        self.assertEqual(spectral_array.shape, spd.shape)
+        self.assertListEqual(list(spectral_array.labels),
+                             ['Sample', '1 Constant'])
+        np.testing.assert_almost_equal(spectral_array.values[0], spd.values)
+        np.testing.assert_almost_equal(spectral_array.values[1], 1)
+
+        spectral_array = spds_to_spectral_array(
+            [spd], SpectralShape(340, 820, 1))
+        np.testing.assert_almost_equal(spectral_array.values[0],
+                                       INTERPOLATED_SAMPLE_SPD_DATA,
+                                       decimal=7)
+
+
+class TestSpectralArrayToSpds(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.spectrum.spectral_array_to_spds`
+    definition unit tests methods.
+    """
+
+    def test_spectral_array_to_spds(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.spectral_array_to_spds`
+        definition.
+        """
+
+        spd = SpectralPowerDistribution('Sample', SAMPLE_SPD_DATA)
+        spds = spectral_array_to_spds(
+            spds_to_spectral_array([spd, spd * 2]))
+
+        self.assertEqual(len(spds), 2)
+        self.assertEqual(spds[0], spd)
+        np.testing.assert_almost_equal(spds[1].values, spd.values * 2)
+
+
+class TestSpectralResamplingOperator(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.spectrum.spectral_resampling_operator`
+    definition unit tests methods.
+    """
+
+    def test_spectral_resampling_operator(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.spectral_resampling_operator`
+        definition.
+        """
+
+        spd = SpectralPowerDistribution('Sample', SAMPLE_SPD_DATA)
+        source_shape = spd.shape
+        target_shape = SpectralShape(340, 820, 1)
+
+        for method, interpolator in (('Sprague', SpragueInterpolator),
+                                     ('Linear', LinearInterpolator),
+                                     ('Cubic Spline',
+                                      CubicSplineInterpolator)):
+            resampling_operator = spectral_resampling_operator(
+                source_shape, target_shape, method)
+            self.assertTupleEqual(resampling_operator.shape,
+                                  (len(target_shape), len(source_shape)))
+            np.testing.assert_almost_equal(
+                resampling_operator.dot(spd.values),
+                interpolator(spd.wavelengths, spd.values)(
+                    target_shape.range()),
+                decimal=7)
+
+        self.assertIs(
+            spectral_resampling_operator(source_shape, target_shape),
+            spectral_resampling_operator(source_shape, target_shape))
+
+        self.assertLessEqual(
+            spectral_resampling_operator(source_shape, target_shape).nnz,
+            len(target_shape) * 6)
+
+        resampling_operator = spectral_resampling_operator(source_shape,
+                                                           target_shape)
+        for array in (resampling_operator.data,
+                      resampling_operator.indices,
+                      resampling_operator.indptr):
+            self.assertFalse(array.flags.writeable)
+
+    def test_raise_exception_spectral_resampling_operator(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.spectral_resampling_operator`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError,
+            lambda: spectral_resampling_operator(
+                SpectralShape(400, 700, 10),
+                SpectralShape(400, 700, 1),
+                'Pchip'))
+
+        self.assertRaises(
+            ValueError,
+            lambda: spectral_resampling_operator(
+                SpectralShape(400, 700, 10),
+                SpectralShape(390, 700, 1)))
+
 if __name__ == '__main__':
     unittest.main()
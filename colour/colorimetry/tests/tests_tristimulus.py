@@ -8,14 +8,28 @@ Defines unit tests for :mod:`colour.colorimetry.tristimulus` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 
 from colour.colorimetry import (
     CMFS,
     ILLUMINANTS_RELATIVE_SPDS,
+    SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE_SIZE,
     SpectralPowerDistribution,
+    SpectralShape,
+    ones_spd,
+    spds_to_spectral_array,
     spectral_to_XYZ,
-    wavelength_to_XYZ)
+    wavelength_to_XYZ,
+    lagrange_coefficients_ASTME2022,
+    tristimulus_weighting_factors_ASTME2022,
+    adjust_tristimulus_weighting_factors_ASTME308,
+    tristimulus_weighting_table,
+    spectral_to_XYZ_ASTME308)
+from colour.colorimetry.tristimulus import (
+    _SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -26,7 +40,12 @@ __status__ = 'Production'
 
 __all__ = ['RELATIVE_SPD_DATA',
            'TestSpectral_to_XYZ',
-           'TestWavelength_to_XYZ']
+           'TestWavelength_to_XYZ',
+           'TestLagrangeCoefficientsASTME2022',
+           'TestTristimulusWeightingFactorsASTME2022',
+           'TestAdjustTristimulusWeightingFactorsASTME308',
+           'TestTristimulusWeightingTable',
+           'TestSpectral_to_XYZ_ASTME308']
 
 RELATIVE_SPD_DATA = SpectralPowerDistribution(
     'Custom', {
@@ -169,6 +188,68 @@ class TestSpectral_to_XYZ(unittest.TestCase):
             np.array([11.57830745, 9.98744967, 3.95396539]),
             decimal=7)
 
+    def test_n_dimensional_spectral_to_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.spectral_to_XYZ`
+        definition n-dimensional support.
+        """
+
+        cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+        illuminant = ILLUMINANTS_RELATIVE_SPDS.get('A')
+        spd = RELATIVE_SPD_DATA.clone().zeros(cmfs.shape)
+        XYZ = spectral_to_XYZ(spd, cmfs, illuminant)
+
+        spectral_array = spds_to_spectral_array([spd, spd * 2, spd])
+        np.testing.assert_almost_equal(
+            spectral_to_XYZ(spectral_array, cmfs, illuminant),
+            np.array([XYZ, XYZ * 2, XYZ]),
+            decimal=7)
+
+        spectral_array = spds_to_spectral_array([RELATIVE_SPD_DATA] * 2)
+        np.testing.assert_almost_equal(
+            spectral_to_XYZ(spectral_array, cmfs, illuminant),
+            np.array([XYZ, XYZ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            spectral_to_XYZ(np.array([spd.values, spd.values * 2]),
+                            cmfs,
+                            illuminant),
+            np.array([XYZ, XYZ * 2]),
+            decimal=7)
+
+        XYZ = spectral_to_XYZ(spd, cmfs)
+        np.testing.assert_almost_equal(
+            spectral_to_XYZ(np.tile(spd.values, (3, 1)), cmfs),
+            np.array([XYZ, XYZ, XYZ]),
+            decimal=7)
+
+        illuminant = illuminant.clone()
+        XYZ = spectral_to_XYZ(spd, cmfs, illuminant)
+        illuminant[560] = 0
+        self.assertFalse(np.allclose(spectral_to_XYZ(spd, cmfs, illuminant),
+                                     XYZ))
+
+    def test_cache_spectral_to_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.spectral_to_XYZ`
+        definition weighting matrices cache size.
+        """
+
+        cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+        illuminant = ILLUMINANTS_RELATIVE_SPDS.get('F2').clone().zeros(
+            cmfs.shape)
+        spd = RELATIVE_SPD_DATA.clone().zeros(cmfs.shape)
+        XYZ = spectral_to_XYZ(spd, cmfs, illuminant)
+        for i in range(SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE_SIZE * 2):
+            np.testing.assert_almost_equal(
+                spectral_to_XYZ(spd, cmfs, illuminant * (i + 1)),
+                XYZ,
+                decimal=7)
+            self.assertLessEqual(
+                len(_SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE),
+                SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE_SIZE)
+
 
 class TestWavelength_to_XYZ(unittest.TestCase):
     """
@@ -263,5 +344,281 @@ class TestWavelength_to_XYZ(unittest.TestCase):
             decimal=7)
 
 
+class TestLagrangeCoefficientsASTME2022(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+lagrange_coefficients_ASTME2022` definition unit tests methods.
+    """
+
+    def test_lagrange_coefficients_ASTME2022(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+lagrange_coefficients_ASTME2022` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            lagrange_coefficients_ASTME2022(5, 'inner'),
+            np.array([[-0.048, 0.864, 0.216, -0.032],
+                      [-0.064, 0.672, 0.448, -0.056],
+                      [-0.056, 0.448, 0.672, -0.064],
+                      [-0.032, 0.216, 0.864, -0.048]]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            lagrange_coefficients_ASTME2022(5, 'boundary'),
+            np.array([[0.72, 0.36, -0.08],
+                      [0.48, 0.64, -0.12],
+                      [0.28, 0.84, -0.12],
+                      [0.12, 0.96, -0.08]]),
+            decimal=7)
+
+
+class TestTristimulusWeightingFactorsASTME2022(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+tristimulus_weighting_factors_ASTME2022` definition unit tests methods.
+    """
+
+    def test_tristimulus_weighting_factors_ASTME2022(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+tristimulus_weighting_factors_ASTME2022` definition.
+        """
+
+        shape = SpectralShape(360, 780, 1)
+        cmfs = CMFS.get(
+            'CIE 1964 10 Degree Standard Observer').clone().align(shape)
+        A = ILLUMINANTS_RELATIVE_SPDS.get('A').clone().align(shape)
+
+        W = tristimulus_weighting_factors_ASTME2022(
+            cmfs, A, SpectralShape(360, 780, 20))
+        self.assertTupleEqual(W.shape, (22, 3))
+        np.testing.assert_almost_equal(
+            W[:3],
+            np.array([[-0.00029817, -0.00003171, -0.00133013],
+                      [-0.00871555, -0.00089155, -0.04074393],
+                      [0.05996841, 0.00502039, 0.25650370]]),
+            decimal=7)
+        self.assertAlmostEqual(np.sum(W[..., 1]), 100, places=7)
+
+        W = tristimulus_weighting_factors_ASTME2022(
+            cmfs, A, SpectralShape(360, 780, 1))
+        np.testing.assert_almost_equal(
+            W,
+            (A.values[..., np.newaxis] * cmfs.values * 100 /
+             np.sum(A.values * cmfs.y_bar.values)),
+            decimal=7)
+
+        self.assertRaises(ValueError,
+                          lambda: tristimulus_weighting_factors_ASTME2022(
+                              cmfs,
+                              ILLUMINANTS_RELATIVE_SPDS.get('A'),
+                              SpectralShape(360, 780, 20)))
+
+    def test_tristimulus_weighting_factors_ASTME2022_accuracy(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+tristimulus_weighting_factors_ASTME2022` definition accuracy against 1 nm
+        integration.
+        """
+
+        cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+        illuminant = ones_spd(cmfs.shape)
+        wavelengths = cmfs.shape.range()
+        values = 0.3 + 0.2 * np.sin(wavelengths / 40)
+        XYZ = spectral_to_XYZ(values, cmfs, illuminant)
+
+        for interval, decimal in ((5, 3), (10, 2), (20, 1)):
+            W = tristimulus_weighting_factors_ASTME2022(
+                cmfs, illuminant, SpectralShape(steps=interval))
+            np.testing.assert_almost_equal(
+                np.dot(values[::interval], W), XYZ, decimal=decimal)
+
+
+class TestAdjustTristimulusWeightingFactorsASTME308(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+adjust_tristimulus_weighting_factors_ASTME308` definition unit tests methods.
+    """
+
+    def test_adjust_tristimulus_weighting_factors_ASTME308(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+adjust_tristimulus_weighting_factors_ASTME308` definition.
+        """
+
+        W = np.reshape(np.arange(18), (6, 3))
+
+        np.testing.assert_almost_equal(
+            adjust_tristimulus_weighting_factors_ASTME308(
+                W, SpectralShape(400, 450, 10), SpectralShape(410, 430, 10)),
+            np.array([[3, 5, 7],
+                      [6, 7, 8],
+                      [36, 39, 42]]))
+
+        np.testing.assert_almost_equal(
+            adjust_tristimulus_weighting_factors_ASTME308(
+                W, SpectralShape(400, 450, 10), SpectralShape(400, 450, 10)),
+            W)
+
+
+class TestTristimulusWeightingTable(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+tristimulus_weighting_table` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self.__temporary_directory)
+
+    def test_tristimulus_weighting_table(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+tristimulus_weighting_table` definition.
+        """
+
+        for interval in (1, 5, 10, 20):
+            table = tristimulus_weighting_table(
+                'CIE 1931 2 Degree Standard Observer', 'D65', interval)
+            self.assertEqual(table.shape, SpectralShape(360, 780, interval))
+            self.assertTupleEqual(table.values.shape,
+                                  (len(table.shape), 3))
+            self.assertAlmostEqual(np.sum(table.values[..., 1]),
+                                   100,
+                                   places=7)
+
+        self.assertIs(tristimulus_weighting_table(interval=10),
+                      tristimulus_weighting_table(interval=10))
+
+        self.assertRaises(ValueError,
+                          lambda: tristimulus_weighting_table(interval=2))
+        self.assertRaises(KeyError,
+                          lambda: tristimulus_weighting_table('Undefined'))
+        self.assertRaises(
+            KeyError,
+            lambda: tristimulus_weighting_table(illuminant='Undefined'))
+
+    def test_tristimulus_weighting_table_persistence(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+tristimulus_weighting_table` definition persistence.
+        """
+
+        table = tristimulus_weighting_table(
+            'CIE 1964 10 Degree Standard Observer',
+            'D50',
+            20,
+            self.__temporary_directory)
+
+        files = os.listdir(self.__temporary_directory)
+        self.assertEqual(len(files), 1)
+
+        with np.load(os.path.join(self.__temporary_directory,
+                                  files[0])) as data:
+            np.testing.assert_almost_equal(data['values'], table.values)
+            np.testing.assert_almost_equal(
+                data['shape'],
+                np.array([table.shape.start,
+                          table.shape.end,
+                          table.shape.steps]))
+
+
+class TestSpectral_to_XYZ_ASTME308(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.spectral_to_XYZ_ASTME308`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        def spd(shape):
+            """
+            Returns a smooth spectral power distribution of given shape.
+            """
+
+            wavelengths = shape.range()
+            return SpectralPowerDistribution(
+                'Sample',
+                dict(zip(wavelengths, 0.3 + 0.2 * np.sin(wavelengths / 40))))
+
+        self.__spd = spd
+
+    def test_spectral_to_XYZ_ASTME308(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.spectral_to_XYZ_ASTME308`
+        definition.
+        """
+
+        shape = SpectralShape(360, 780, 1)
+        XYZ = spectral_to_XYZ(
+            self.__spd(shape),
+            CMFS.get(
+                'CIE 1931 2 Degree Standard Observer').clone().align(shape),
+            ILLUMINANTS_RELATIVE_SPDS.get('D65').clone().align(shape))
+
+        for interval, decimal in ((1, 7), (5, 3), (10, 2), (20, 1)):
+            np.testing.assert_almost_equal(
+                spectral_to_XYZ_ASTME308(
+                    self.__spd(SpectralShape(360, 780, interval))),
+                XYZ,
+                decimal=decimal)
+
+        np.testing.assert_almost_equal(
+            spectral_to_XYZ_ASTME308(
+                self.__spd(SpectralShape(400, 700, 10)),
+                'CIE 1964 10 Degree Standard Observer',
+                'A'),
+            np.array([42.23768060, 41.04550320, 5.25061510]),
+            decimal=7)
+
+    def test_n_dimensional_spectral_to_XYZ_ASTME308(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.spectral_to_XYZ_ASTME308`
+        definition n-dimensional support.
+        """
+
+        spd = self.__spd(SpectralShape(340, 830, 10))
+        XYZ = spectral_to_XYZ_ASTME308(spd)
+
+        np.testing.assert_almost_equal(
+            spectral_to_XYZ_ASTME308(spds_to_spectral_array([spd, spd * 2])),
+            np.array([XYZ, XYZ * 2]),
+            decimal=7)
+
+    def test_raise_exception_spectral_to_XYZ_ASTME308(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.spectral_to_XYZ_ASTME308`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError,
+            lambda: spectral_to_XYZ_ASTME308(
+                self.__spd(SpectralShape(400, 700, 2.5))))
+
+        self.assertRaises(
+            ValueError,
+            lambda: spectral_to_XYZ_ASTME308(
+                self.__spd(SpectralShape(405, 705, 10))))
+
+        self.assertRaises(
+            ValueError,
+            lambda: spectral_to_XYZ_ASTME308(
+                self.__spd(SpectralShape(400, 700, 2))))
+
 if __name__ == '__main__':
     unittest.main()
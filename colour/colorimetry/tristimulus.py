@@ -5,7 +5,15 @@
 Tristimulus Values
 ==================
 
-Defines objects for tristimulus values computation from spectral data.
+Defines objects for tristimulus values computation from spectral data:
+
+-   :func:`spectral_to_XYZ`
+-   :func:`wavelength_to_XYZ`
+-   :func:`lagrange_coefficients_ASTME2022`
+-   :func:`tristimulus_weighting_factors_ASTME2022`
+-   :func:`adjust_tristimulus_weighting_factors_ASTME308`
+-   :func:`tristimulus_weighting_table`
+-   :func:`spectral_to_XYZ_ASTME308`
 
 See Also
 --------
@@ -15,19 +23,37 @@ blob/master/notebooks/colorimetry/cmfs.ipynb>`_
 `Spectrum IPython Notebook
 <http://nbviewer.ipython.org/github/colour-science/colour-ipython/\
 blob/master/notebooks/colorimetry/spectrum.ipynb>`_
+
+References
+----------
+.. [2]  ASTM International. (2011). ASTM E2022-11 - Standard Practice for
+        Calculation of Weighting Factors for Tristimulus Integration.
+        doi:10.1520/E2022-11
+.. [3]  ASTM International. (2015). ASTM E308-15 - Standard Practice for
+        Computing the Colors of Objects by Using the CIE System.
+        doi:10.1520/E0308-15
 """
 
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import re
+from collections import namedtuple
 
 from colour.algebra import (
     CubicSplineInterpolator,
     LinearInterpolator,
     PchipInterpolator,
-    SpragueInterpolator)
-from colour.colorimetry import STANDARD_OBSERVERS_CMFS, ones_spd
-from colour.utilities import is_string
+    SpragueInterpolator,
+    lagrange_coefficients)
+from colour.colorimetry import (
+    ILLUMINANTS_RELATIVE_SPDS,
+    STANDARD_OBSERVERS_CMFS,
+    SpectralArray,
+    SpectralPowerDistribution,
+    SpectralShape)
+from colour.utilities import LRUCache, is_string, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -36,8 +62,120 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['spectral_to_XYZ',
-           'wavelength_to_XYZ']
+__all__ = ['SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE_SIZE',
+           'TRISTIMULUS_WEIGHTING_TABLES_INTERVALS',
+           'TRISTIMULUS_WEIGHTING_TABLES_CACHE_SIZE',
+           'TristimulusWeightingTable',
+           'spectral_to_XYZ',
+           'wavelength_to_XYZ',
+           'lagrange_coefficients_ASTME2022',
+           'tristimulus_weighting_factors_ASTME2022',
+           'adjust_tristimulus_weighting_factors_ASTME308',
+           'tristimulus_weighting_table',
+           'spectral_to_XYZ_ASTME308']
+
+SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE_SIZE = 32
+"""
+Maximum number of weighting matrices converting spectral data to *CIE XYZ*
+tristimulus values kept in cache.
+
+SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE_SIZE : int
+"""
+
+TRISTIMULUS_WEIGHTING_TABLES_INTERVALS = (1, 5, 10, 20)
+"""
+Intervals in nm supported by the tables of tristimulus weighting factors.
+
+TRISTIMULUS_WEIGHTING_TABLES_INTERVALS : tuple
+"""
+
+TRISTIMULUS_WEIGHTING_TABLES_CACHE_SIZE = 32
+"""
+Maximum number of tables of tristimulus weighting factors kept in cache.
+
+TRISTIMULUS_WEIGHTING_TABLES_CACHE_SIZE : int
+"""
+
+_SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE = LRUCache(
+    SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE_SIZE)
+_LAGRANGE_COEFFICIENTS_ASTME2022_CACHE = {}
+_TRISTIMULUS_WEIGHTING_TABLES_CACHE = LRUCache(
+    TRISTIMULUS_WEIGHTING_TABLES_CACHE_SIZE)
+
+
+class TristimulusWeightingTable(
+    namedtuple('TristimulusWeightingTable',
+               ('observer', 'illuminant', 'shape', 'values'))):
+    """
+    Defines a table of tristimulus weighting factors.
+
+    Parameters
+    ----------
+    observer : unicode
+        Standard observer colour matching functions name.
+    illuminant : unicode
+        Illuminant name.
+    shape : SpectralShape
+        Table spectral shape.
+    values : ndarray, (N, 3)
+        Tristimulus weighting factors.
+    """
+
+
+def _spectral_to_XYZ_weighting_matrix(cmfs, illuminant=None):
+    """
+    Returns the weighting matrix converting spectral data sampled on given
+    colour matching functions spectral shape to *CIE XYZ* tristimulus values
+    and caches it if not existing.
+
+    The weighting matrix is the product of given illuminant and colour
+    matching functions, scaled by the normalising factor.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        *Illuminant* spectral power distribution.
+
+    Returns
+    -------
+    ndarray, (W, 3)
+        Weighting matrix.
+    """
+
+    shape = cmfs.shape
+    key = (shape.start,
+           shape.end,
+           shape.steps,
+           cmfs.x_bar.content_hash,
+           cmfs.y_bar.content_hash,
+           cmfs.z_bar.content_hash,
+           illuminant.content_hash if illuminant is not None else None)
+
+    weighting_matrix = _SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE.get(key)
+    if weighting_matrix is None:
+        x_bar, y_bar, z_bar = (cmfs.x_bar.values,
+                               cmfs.y_bar.values,
+                               cmfs.z_bar.values)
+
+        if illuminant is None:
+            illuminant = np.ones(len(shape))
+        else:
+            if illuminant.shape != shape:
+                illuminant = illuminant.clone().zeros(shape)
+            illuminant = illuminant.values
+
+        normalising_factor = 100 / np.sum(y_bar * illuminant)
+
+        weighting_matrix = (normalising_factor *
+                            illuminant[..., np.newaxis] *
+                            tstack((x_bar, y_bar, z_bar)))
+        weighting_matrix.setflags(write=False)
+
+        _SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE[key] = weighting_matrix
+
+    return weighting_matrix
 
 
 def spectral_to_XYZ(spd,
@@ -50,8 +188,10 @@ def spectral_to_XYZ(spd,
 
     Parameters
     ----------
-    spd : SpectralPowerDistribution
-        Spectral power distribution.
+    spd : SpectralPowerDistribution or SpectralArray or array_like
+        Spectral power distribution, spectral array or array of spectral
+        data, the latter being sampled on given colour matching functions
+        spectral shape.
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     illuminant : SpectralPowerDistribution, optional
@@ -59,7 +199,7 @@ def spectral_to_XYZ(spd,
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (3,) or (N, 3)
         *CIE XYZ* tristimulus values.
 
     Warning
@@ -69,6 +209,15 @@ def spectral_to_XYZ(spd,
     Notes
     -----
     -   Output *CIE XYZ* tristimulus values are in domain [0, 100].
+    -   Given a :class:`SpectralArray` class instance or an array of
+        spectral data of shape (N, W), the *CIE XYZ* tristimulus values of
+        all the spectral power distributions are computed with a single
+        matrix product.
+    -   The weighting matrix built from given colour matching functions and
+        illuminant is cached, thus spectral data sharing the same colour
+        matching functions and illuminant is converted without recomputing
+        it. The maximum number of cached weighting matrices is defined by
+        :attr:`SPECTRAL_TO_XYZ_WEIGHTING_MATRICES_CACHE_SIZE` attribute.
 
     References
     ----------
@@ -86,33 +235,26 @@ def spectral_to_XYZ(spd,
     >>> illuminant = ILLUMINANTS_RELATIVE_SPDS.get('D50')
     >>> spectral_to_XYZ(spd, cmfs, illuminant)  # doctest: +ELLIPSIS
     array([  4.5764852...e-04,   1.2964866...e-05,   2.1615807...e-03])
+    >>> from colour import SpectralArray, SpectralShape
+    >>> spectral_array = SpectralArray(
+    ...     'Custom', [[0.0600, 0.0600], [0.0300, 0.0300]],
+    ...     SpectralShape(380, 390, 10))
+    >>> spectral_to_XYZ(  # doctest: +ELLIPSIS
+    ...     spectral_array, cmfs, illuminant)
+    array([[  4.5764852...e-04,   1.2964866...e-05,   2.1615807...e-03],
+           [  2.2882426...e-04,   6.4824334...e-06,   1.0807903...e-03]])
+    >>> spectral_to_XYZ(  # doctest: +ELLIPSIS
+    ...     spectral_array.clone().zeros(cmfs.shape).values, cmfs, illuminant)
+    array([[  4.5764852...e-04,   1.2964866...e-05,   2.1615807...e-03],
+           [  2.2882426...e-04,   6.4824334...e-06,   1.0807903...e-03]])
     """
 
-    shape = cmfs.shape
-    if spd.shape != cmfs.shape:
-        spd = spd.clone().zeros(shape)
-
-    if illuminant is None:
-        illuminant = ones_spd(shape)
-    else:
-        if illuminant.shape != cmfs.shape:
-            illuminant = illuminant.clone().zeros(shape)
-
-    spd = spd.values
-    x_bar, y_bar, z_bar = (cmfs.x_bar.values,
-                           cmfs.y_bar.values,
-                           cmfs.z_bar.values)
-    illuminant = illuminant.values
-
-    x_products = spd * x_bar * illuminant
-    y_products = spd * y_bar * illuminant
-    z_products = spd * z_bar * illuminant
+    if isinstance(spd, (SpectralPowerDistribution, SpectralArray)):
+        if spd.shape != cmfs.shape:
+            spd = spd.clone().zeros(cmfs.shape)
+        spd = spd.values
 
-    normalising_factor = 100 / np.sum(y_bar * illuminant)
-
-    XYZ = np.array([normalising_factor * np.sum(x_products),
-                    normalising_factor * np.sum(y_products),
-                    normalising_factor * np.sum(z_products)])
+    XYZ = np.dot(spd, _spectral_to_XYZ_weighting_matrix(cmfs, illuminant))
 
     return XYZ
 
@@ -242,13 +384,505 @@ def wavelength_to_XYZ(wavelength,
             raise ValueError(
                 'Undefined "{0}" interpolator!'.format(method))
 
-        interpolators = [interpolator(wavelengths, values[..., i])
-                         for i in range(values.shape[-1])]
+        if interpolator in (CubicSplineInterpolator, PchipInterpolator):
+            interpolator = interpolator(wavelengths, values, axis=0)
+        else:
+            interpolator = interpolator(wavelengths, values)
 
-        XYZ = np.dstack([i(np.ravel(wavelength)) for i in interpolators])
+        XYZ = interpolator(np.ravel(wavelength))
     else:
         XYZ = cmfs.get(wavelength)
 
     XYZ = np.reshape(XYZ, np.asarray(wavelength).shape + (3,))
 
     return XYZ
+
+
+def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
+    """
+    Computes the *Lagrange Coefficients* for given interval size using
+    practise *ASTM E2022-11* method. [2]_
+
+    Parameters
+    ----------
+    interval : int
+        Interval size in nm.
+    interval_type : unicode, optional
+        **{'inner', 'boundary'}**,
+        If the interval is an *inner* interval *Lagrange Coefficients* are
+        computed for degree 4. Degree 3 is used for a *boundary* interval.
+
+    Returns
+    -------
+    ndarray
+        *Lagrange Coefficients*.
+
+    See Also
+    --------
+    colour.lagrange_coefficients
+
+    Examples
+    --------
+    >>> lagrange_coefficients_ASTME2022(10, 'inner')
+    array([[-0.0285,  0.9405,  0.1045, -0.0165],
+           [-0.048 ,  0.864 ,  0.216 , -0.032 ],
+           [-0.0595,  0.7735,  0.3315, -0.0455],
+           [-0.064 ,  0.672 ,  0.448 , -0.056 ],
+           [-0.0625,  0.5625,  0.5625, -0.0625],
+           [-0.056 ,  0.448 ,  0.672 , -0.064 ],
+           [-0.0455,  0.3315,  0.7735, -0.0595],
+           [-0.032 ,  0.216 ,  0.864 , -0.048 ],
+           [-0.0165,  0.1045,  0.9405, -0.0285]])
+    """
+
+    key = (interval, interval_type.lower())
+    coefficients = _LAGRANGE_COEFFICIENTS_ASTME2022_CACHE.get(key)
+    if coefficients is None:
+        r_n = np.linspace(1 / interval, 1 - (1 / interval), interval - 1)
+        d = 3
+        if interval_type.lower() == 'inner':
+            r_n += 1
+            d = 4
+
+        coefficients = np.array([lagrange_coefficients(r, d) for r in r_n])
+        coefficients.setflags(write=False)
+
+        _LAGRANGE_COEFFICIENTS_ASTME2022_CACHE[key] = coefficients
+
+    return coefficients
+
+
+def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape):
+    """
+    Returns a table of tristimulus weighting factors for given colour matching
+    functions and illuminant using practise *ASTM E2022-11* method. [2]_
+
+    The computed table of tristimulus weighting factors should be used with
+    spectral data that has been corrected for spectral bandpass dependence.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution
+        Illuminant spectral power distribution.
+    shape : SpectralShape
+        Shape used to build the table, only the interval is needed.
+
+    Returns
+    -------
+    ndarray, (N, 3)
+        Tristimulus weighting factors table.
+
+    Raises
+    ------
+    ValueError
+        If the colour matching functions or illuminant intervals are not equal
+        to 1 nm or if their shapes differ.
+
+    Notes
+    -----
+    -   Input colour matching functions and illuminant intervals are expected
+        to be equal to 1 nm. If the illuminant data is not available at 1 nm
+        interval, it needs to be interpolated using *CIE* recommendations:
+        The method developed by Sprague (1880) should be used for
+        interpolating functions having a uniformly spaced independent
+        variable and a *Cubic Spline* method for non-uniformly spaced
+        independent variable.
+    -   The table rows are sampled at the wavelengths given by the colour
+        matching functions start and the given interval, the wavelengths
+        of an incomplete last interval are accumulated into the last row.
+
+    Examples
+    --------
+    >>> from colour import (
+    ...     CMFS, ILLUMINANTS_RELATIVE_SPDS, SpectralShape)
+    >>> cmfs = CMFS.get('CIE 1964 10 Degree Standard Observer')
+    >>> A = ILLUMINANTS_RELATIVE_SPDS.get('A')
+    >>> A = A.clone().align(SpectralShape(360, 780, 1))
+    >>> cmfs = cmfs.clone().align(SpectralShape(360, 780, 1))
+    >>> tristimulus_weighting_factors_ASTME2022(  # doctest: +ELLIPSIS
+    ...     cmfs, A, SpectralShape(360, 780, 20))[:3]
+    array([[ -2.9817044...e-04,  -3.1709879...e-05,  -1.3301267...e-03],
+           [ -8.7155487...e-03,  -8.9154714...e-04,  -4.0743931...e-02],
+           [  5.9968409...e-02,   5.0203892...e-03,   2.5650370...e-01]])
+    """
+
+    if cmfs.shape.steps != 1:
+        raise ValueError('"{0}" shape "steps" must be 1!'.format(cmfs))
+
+    if illuminant.shape.steps != 1:
+        raise ValueError(
+            '"{0}" shape "steps" must be 1!'.format(illuminant))
+
+    if cmfs.shape != illuminant.shape:
+        raise ValueError(
+            '"{0}" and "{1}" shapes must be equal!'.format(cmfs, illuminant))
+
+    S = illuminant.values
+    W = S[..., np.newaxis] * cmfs.values
+
+    interval_i = np.int_(shape.steps)
+    if interval_i == 1:
+        return W * 100 / np.sum(W, axis=0)[1]
+
+    # Products of the illuminant and the colour matching functions.
+    SY = W
+    W = np.copy(SY[::interval_i, ...])
+
+    # First and last measurement intervals *Lagrange Coefficients*.
+    c_c = lagrange_coefficients_ASTME2022(interval_i, 'boundary')
+    # Intermediate measurement intervals *Lagrange Coefficients*.
+    c_b = lagrange_coefficients_ASTME2022(interval_i, 'inner')
+
+    # Total wavelengths count.
+    w_c = len(SY)
+    # Measurement interval interpolated values count.
+    r_c = c_b.shape[0]
+    # Last measurement wavelength index.
+    w_l = w_c - (w_c - 1) % interval_i - 1
+    # Intervals count.
+    i_c = W.shape[0]
+    i_cm = i_c - 1
+
+    if i_c < 4:
+        raise ValueError(
+            '"{0}" shape must define at least 4 measurements!'.format(shape))
+
+    # First interval.
+    W[0:3] += np.dot(c_c.T, SY[1:1 + r_c])
+
+    # Last interval.
+    W[i_cm - 2:i_cm + 1] += np.dot(c_c[::-1].T, SY[w_l - r_c:w_l])[::-1]
+
+    # Intermediate intervals.
+    j = np.arange(i_c - 3)
+    w_i = (interval_i * (j[..., np.newaxis] + 1) + 1 +
+           np.arange(r_c)[np.newaxis, ...])
+    np.add.at(W,
+              j[..., np.newaxis] + np.arange(4)[np.newaxis, ...],
+              np.einsum('kn,jkc->jnc', c_b, SY[w_i]))
+
+    # Extrapolation of potential incomplete interval.
+    W[i_cm] += np.sum(SY[w_l + 1:], axis=0)
+
+    W *= 100 / np.sum(W, axis=0)[1]
+
+    return W
+
+
+def adjust_tristimulus_weighting_factors_ASTME308(W, shape_r, shape_t):
+    """
+    Adjusts given table of tristimulus weighting factors to account for a
+    shorter wavelengths range of the test spectral shape compared to the
+    reference spectral shape using practise *ASTM E308-15* method: Weights at
+    the wavelengths for which data are not available are added to the weights
+    at the shortest and longest wavelength for which spectral data are
+    available. [3]_
+
+    Parameters
+    ----------
+    W : array_like
+        Tristimulus weighting factors table.
+    shape_r : SpectralShape
+        Reference spectral shape.
+    shape_t : SpectralShape
+        Test spectral shape.
+
+    Returns
+    -------
+    ndarray
+        Adjusted tristimulus weighting factors.
+
+    Examples
+    --------
+    >>> from colour import (
+    ...     CMFS, ILLUMINANTS_RELATIVE_SPDS, SpectralShape)
+    >>> cmfs = CMFS.get('CIE 1964 10 Degree Standard Observer')
+    >>> A = ILLUMINANTS_RELATIVE_SPDS.get('A')
+    >>> A = A.clone().align(SpectralShape(360, 780, 1))
+    >>> cmfs = cmfs.clone().align(SpectralShape(360, 780, 1))
+    >>> W = tristimulus_weighting_factors_ASTME2022(
+    ...     cmfs, A, SpectralShape(360, 780, 20))
+    >>> adjust_tristimulus_weighting_factors_ASTME308(  # doctest: +ELLIPSIS
+    ...     W, SpectralShape(360, 780, 20), SpectralShape(400, 700, 20))[:3]
+    array([[  5.0954690...e-02,   4.0971322...e-03,   2.1442964...e-01],
+           [  7.7342576...e-01,   7.7984292...e-02,   3.6965884...e+00],
+           [  1.9000976...e+00,   3.0370166...e-01,   9.7554559...e+00]])
+    """
+
+    W = np.copy(W)
+
+    start_index = int((shape_t.start - shape_r.start) / shape_r.steps)
+    W[start_index] += np.sum(W[:start_index], axis=0)
+
+    end_index = int((shape_r.end - shape_t.end) / shape_r.steps)
+    W[len(W) - end_index - 1] += np.sum(W[len(W) - end_index:], axis=0)
+
+    return W[start_index:len(W) - end_index, ...]
+
+
+def _tristimulus_weighting_table_path(directory, observer, illuminant,
+                                      interval):
+    """
+    Returns the path of the file persisting the tristimulus weighting factors
+    table for given observer, illuminant and interval.
+
+    Parameters
+    ----------
+    directory : unicode
+        Directory the tristimulus weighting factors tables are persisted into.
+    observer : unicode
+        Standard observer colour matching functions name.
+    illuminant : unicode
+        Illuminant name.
+    interval : int
+        Interval size in nm.
+
+    Returns
+    -------
+    unicode
+        Tristimulus weighting factors table path.
+    """
+
+    name = re.sub(r'[^\w.]+', '_', '{0}_{1}_{2}'.format(
+        observer, illuminant, interval))
+
+    return os.path.join(directory, '{0}.npz'.format(name))
+
+
+def tristimulus_weighting_table(
+        observer='CIE 1931 2 Degree Standard Observer',
+        illuminant='D65',
+        interval=10,
+        directory=None):
+    """
+    Returns the table of tristimulus weighting factors for given standard
+    observer, illuminant and interval using practise *ASTM E2022-11* method.
+    [2]_
+
+    The tables are generated from
+    :attr:`colour.colorimetry.dataset.cmfs.STANDARD_OBSERVERS_CMFS` and
+    :attr:`colour.colorimetry.dataset.illuminants.spds.\
+ILLUMINANTS_RELATIVE_SPDS` attributes data, they are kept in a least recently
+    used cache and can optionally be persisted on disk.
+
+    Parameters
+    ----------
+    observer : unicode, optional
+        {'CIE 1931 2 Degree Standard Observer',
+        'CIE 1964 10 Degree Standard Observer',
+        'CIE 2012 2 Degree Standard Observer',
+        'CIE 2012 10 Degree Standard Observer'},
+        Standard observer colour matching functions name.
+    illuminant : unicode, optional
+        Illuminant name, see
+        :attr:`colour.colorimetry.dataset.illuminants.spds.\
+ILLUMINANTS_RELATIVE_SPDS` attribute for supported illuminants.
+    interval : int, optional
+        **{1, 5, 10, 20}**,
+        Interval size in nm.
+    directory : unicode, optional
+        Directory the tables are persisted into, a table existing in given
+        directory is loaded instead of being generated.
+
+    Returns
+    -------
+    TristimulusWeightingTable
+        Tristimulus weighting factors table.
+
+    Raises
+    ------
+    KeyError
+        If the standard observer or the illuminant is not defined.
+    ValueError
+        If the interval is not supported.
+
+    Notes
+    -----
+    -   The table spectral shape spans the wavelengths range common to the
+        standard observer and the illuminant, the illuminant is interpolated
+        at 1 nm interval beforehand.
+    -   The maximum number of cached tables is defined by
+        :attr:`TRISTIMULUS_WEIGHTING_TABLES_CACHE_SIZE` attribute.
+
+    Examples
+    --------
+    >>> table = tristimulus_weighting_table(interval=20)
+    >>> table.shape
+    SpectralShape(360.0, 780.0, 20.0)
+    >>> table.values[10]  # doctest: +ELLIPSIS
+    array([ 11.3008960...,  18.8634594...,   0.0677522...])
+    """
+
+    if interval not in TRISTIMULUS_WEIGHTING_TABLES_INTERVALS:
+        raise ValueError(
+            ('"{0}" interval is not supported, it must be one of '
+             '"{1}"!').format(interval,
+                              TRISTIMULUS_WEIGHTING_TABLES_INTERVALS))
+
+    cmfs = STANDARD_OBSERVERS_CMFS.get(observer)
+    if cmfs is None:
+        raise KeyError(
+            '"{0}" not found in factory standard observers: "{1}".'.format(
+                observer, sorted(STANDARD_OBSERVERS_CMFS.keys())))
+
+    illuminant_spd = ILLUMINANTS_RELATIVE_SPDS.get(illuminant)
+    if illuminant_spd is None:
+        raise KeyError(
+            '"{0}" not found in factory illuminants: "{1}".'.format(
+                illuminant, sorted(ILLUMINANTS_RELATIVE_SPDS.keys())))
+
+    key = (cmfs.name, illuminant_spd.name, interval)
+    table = _TRISTIMULUS_WEIGHTING_TABLES_CACHE.get(key)
+    if table is not None:
+        return table
+
+    path = (_tristimulus_weighting_table_path(
+        directory, cmfs.name, illuminant_spd.name, interval)
+        if directory is not None else None)
+
+    if path is not None and os.path.exists(path):
+        with np.load(path) as data:
+            shape = SpectralShape(*data['shape'])
+            values = data['values']
+    else:
+        shape = SpectralShape(
+            max(cmfs.shape.start, np.ceil(illuminant_spd.shape.start)),
+            min(cmfs.shape.end, np.floor(illuminant_spd.shape.end)),
+            1)
+        cmfs = cmfs.clone().align(shape)
+        illuminant_spd = illuminant_spd.clone().align(shape)
+
+        values = tristimulus_weighting_factors_ASTME2022(
+            cmfs, illuminant_spd, SpectralShape(steps=interval))
+        shape = SpectralShape(shape.start,
+                              shape.start + (len(values) - 1) * interval,
+                              float(interval))
+
+        if path is not None:
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+
+            np.savez(path,
+                     shape=np.array([shape.start, shape.end, shape.steps]),
+                     values=values)
+
+    values.setflags(write=False)
+    table = TristimulusWeightingTable(key[0], key[1], shape, values)
+    _TRISTIMULUS_WEIGHTING_TABLES_CACHE[key] = table
+
+    return table
+
+
+def spectral_to_XYZ_ASTME308(
+        spd,
+        observer='CIE 1931 2 Degree Standard Observer',
+        illuminant='D65',
+        directory=None):
+    """
+    Converts given spectral power distribution to *CIE XYZ* tristimulus values
+    using given standard observer and illuminant tables of tristimulus
+    weighting factors according to practise *ASTM E308-15* method. [3]_
+
+    The spectral data is not interpolated nor zeros filled, its values are
+    directly weighted using the table matching its interval.
+
+    Parameters
+    ----------
+    spd : SpectralPowerDistribution or SpectralArray
+        Spectral power distribution or spectral array.
+    observer : unicode, optional
+        Standard observer colour matching functions name.
+    illuminant : unicode, optional
+        Illuminant name.
+    directory : unicode, optional
+        Directory the tables of tristimulus weighting factors are persisted
+        into.
+
+    Returns
+    -------
+    ndarray, (3,) or (N, 3)
+        *CIE XYZ* tristimulus values.
+
+    Raises
+    ------
+    ValueError
+        If the spectral data is not uniformly sampled at a supported interval
+        or if its wavelengths are not aligned with the table wavelengths.
+
+    See Also
+    --------
+    spectral_to_XYZ, tristimulus_weighting_table
+
+    Warning
+    -------
+    The output domain of that definition is non standard!
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are in domain [0, 100].
+    -   The spectral data is expected to have been corrected for spectral
+        bandpass dependence.
+    -   Spectral data wavelengths outside the table range are discarded, the
+        table weights outside the spectral data range are accumulated into
+        its first and last wavelengths.
+
+    Examples
+    --------
+    >>> from colour import SpectralPowerDistribution
+    >>> data = {
+    ...     400: 0.0641,
+    ...     420: 0.0645,
+    ...     440: 0.0562,
+    ...     460: 0.0537,
+    ...     480: 0.0559,
+    ...     500: 0.0651,
+    ...     520: 0.0705,
+    ...     540: 0.0772,
+    ...     560: 0.0870,
+    ...     580: 0.1128,
+    ...     600: 0.1360,
+    ...     620: 0.1511,
+    ...     640: 0.1688,
+    ...     660: 0.1996,
+    ...     680: 0.2397,
+    ...     700: 0.2852}
+    >>> spd = SpectralPowerDistribution('Sample', data)
+    >>> spectral_to_XYZ_ASTME308(spd)  # doctest: +ELLIPSIS
+    array([ 10.8402078...,   9.6843312...,   6.2160933...])
+    """
+
+    if isinstance(spd, SpectralPowerDistribution) and not spd.is_uniform():
+        raise ValueError(
+            '"{0}" spectral data must be uniformly sampled!'.format(spd))
+
+    shape = spd.shape
+    interval = int(shape.steps)
+    if interval != shape.steps:
+        raise ValueError(
+            '"{0}" shape "steps" must be an integer!'.format(shape))
+
+    table = tristimulus_weighting_table(
+        observer, illuminant, interval, directory)
+    shape_r = table.shape
+
+    if (shape.start - shape_r.start) % interval != 0:
+        raise ValueError(
+            ('"{0}" shape wavelengths are not aligned with "{1}" table '
+             'shape wavelengths!').format(shape, shape_r))
+
+    start = max(shape.start, shape_r.start)
+    end = min(shape.end, shape_r.end)
+    shape_t = SpectralShape(start, end, interval)
+
+    wavelengths = spd.wavelengths
+    values = spd.values[..., np.logical_and(wavelengths >= start,
+                                            wavelengths <= end)]
+
+    W = adjust_tristimulus_weighting_factors_ASTME308(
+        table.values, shape_r, shape_t)
+
+    XYZ = np.dot(values, W)
+
+    return XYZ
@@ -45,8 +45,9 @@ References
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
 import re
-from collections import OrderedDict
+import warnings
 
 from colour.algebra import (
     Extrapolator,
@@ -62,9 +63,14 @@ from colour.volume import is_within_macadam_limits
 from colour.notation import MUNSELL_COLOURS_ALL
 from colour.utilities import (
     CaseInsensitiveMapping,
+    LRUCache,
     Lookup,
+    dataset_table,
     is_integer,
-    is_numeric)
+    is_numeric,
+    tsplit,
+    tstack,
+    warning)
 
 __author__ = 'Colour Developers, Paul Centore'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -92,14 +98,24 @@ __all__ = ['MUNSELL_GRAY_PATTERN',
            'MUNSELL_VALUE_METHODS',
            'munsell_value',
            'munsell_specification_to_xyY',
+           'munsell_specifications_to_xyY',
            'munsell_colour_to_xyY',
            'xyY_to_munsell_specification',
+           'xyY_to_munsell_specifications',
+           'MUNSELL_INVERSE_GRID_XY_STEP',
+           'MUNSELL_INVERSE_GRID_VALUE_STEP',
+           'MUNSELL_INVERSE_GRIDS_CACHE_SIZE',
+           'MunsellInverseGrid',
+           'munsell_inverse_grid',
            'xyY_to_munsell_colour',
            'parse_munsell_colour',
+           'parse_munsell_colours',
            'is_grey_munsell_colour',
            'normalize_munsell_specification',
            'munsell_colour_to_munsell_specification',
+           'munsell_colours_to_munsell_specifications',
            'munsell_specification_to_munsell_colour',
+           'munsell_specifications_to_munsell_colours',
            'xyY_from_renotation',
            'is_specification_in_renotation',
            'bounding_hues_from_renotation',
@@ -107,10 +123,13 @@ __all__ = ['MUNSELL_GRAY_PATTERN',
            'hue_angle_to_hue',
            'hue_to_ASTM_hue',
            'interpolation_method_from_renotation_ovoid',
+           'interpolation_methods_from_renotation_ovoids',
            'xy_from_renotation_ovoid',
+           'xy_from_renotation_ovoids',
            'LCHab_to_munsell_specification',
            'maximum_chroma_from_renotation',
-           'munsell_specification_to_xy']
+           'munsell_specification_to_xy',
+           'munsell_specifications_to_xy']
 
 MUNSELL_GRAY_PATTERN = 'N(?P<value>{0})'.format(FLOATING_POINT_NUMBER_PATTERN)
 MUNSELL_COLOUR_PATTERN = (
@@ -119,6 +138,13 @@ MUNSELL_COLOUR_PATTERN = (
     '(?P<value>{0})\s*\/\s*(?P<chroma>[-+]?{0})'.format(
         FLOATING_POINT_NUMBER_PATTERN))
 
+_MUNSELL_COLOURS_PATTERN = (
+    '^(?:N(?P<grey>{0})|'
+    '(?P<hue>{0})\s*'
+    '(?P<letter>BG|GY|YR|RP|PB|B|G|Y|R|P)\s*'
+    '(?P<value>{0})\s*\/\s*(?P<chroma>[-+]?{0}))?[^\n]*'.format(
+        FLOATING_POINT_NUMBER_PATTERN.replace('(', '(?:')))
+
 MUNSELL_GRAY_FORMAT = 'N{0}'
 MUNSELL_COLOUR_FORMAT = '{0} {1}/{2}'
 MUNSELL_GRAY_EXTENDED_FORMAT = 'N{0:.{1}f}'
@@ -141,9 +167,36 @@ MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES = ILLUMINANTS.get(
     'CIE 1931 2 Degree Standard Observer').get(
     MUNSELL_DEFAULT_ILLUMINANT)
 
+MUNSELL_INVERSE_GRID_XY_STEP = 0.005
+"""
+Default inverse *Munsell* lookup grid *xy* chromaticity coordinates step.
+
+MUNSELL_INVERSE_GRID_XY_STEP : numeric
+"""
+
+MUNSELL_INVERSE_GRID_VALUE_STEP = 0.25
+"""
+Default inverse *Munsell* lookup grid *Munsell* value step.
+
+MUNSELL_INVERSE_GRID_VALUE_STEP : numeric
+"""
+
+MUNSELL_INVERSE_GRIDS_CACHE_SIZE = 4
+"""
+Maximum number of inverse *Munsell* lookup grids kept in cache.
+
+MUNSELL_INVERSE_GRIDS_CACHE_SIZE : int
+"""
+
+_MUNSELL_INVERSE_GRID_DOMAIN = ((0, 0.75), (0, 0.85), (1, 10))
+_MUNSELL_INVERSE_GRIDS_CACHE = LRUCache(MUNSELL_INVERSE_GRIDS_CACHE_SIZE)
+
 _MUNSELL_SPECIFICATIONS_CACHE = None
+_MUNSELL_SPECIFICATIONS_TO_XYY_CACHE = None
 _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
 _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
+_MUNSELL_RENOTATION_TABLES_CACHE = None
+_MUNSELL_INTERPOLATION_METHODS_TABLE_CACHE = None
 
 
 def _munsell_specifications():
@@ -161,10 +214,14 @@ def _munsell_specifications():
     ...,)
 
     The first column is converted from *Munsell* colour to specification using
-    :func:`munsell_colour_to_munsell_specification` definition:
+    :func:`munsell_colours_to_munsell_specifications` definition:
 
     ('2.5GY', 0.2, 2.0) ---> (2.5, 0.2, 2.0, 4)
 
+    The specifications are read from the datasets archive if it exists and
+    has been built from the current data, see :mod:`colour.utilities.archive`
+    module.
+
     Returns
     -------
     list
@@ -173,13 +230,42 @@ def _munsell_specifications():
 
     global _MUNSELL_SPECIFICATIONS_CACHE
     if _MUNSELL_SPECIFICATIONS_CACHE is None:
-        _MUNSELL_SPECIFICATIONS_CACHE = [
-            munsell_colour_to_munsell_specification(
-                MUNSELL_COLOUR_FORMAT.format(*colour[0]))
-            for colour in MUNSELL_COLOURS_ALL]
+        table = dataset_table('MUNSELL_COLOURS_ALL',
+                              source='colour.notation.dataset.munsell.all')
+        if table is not None:
+            _MUNSELL_SPECIFICATIONS_CACHE = [
+                (hue, value, chroma, int(code))
+                for hue, value, chroma, code in table[:, 0:4].tolist()]
+        else:
+            specifications = munsell_colours_to_munsell_specifications(
+                [MUNSELL_COLOUR_FORMAT.format(*colour[0])
+                 for colour in MUNSELL_COLOURS_ALL])
+            _MUNSELL_SPECIFICATIONS_CACHE = [
+                (hue, value, chroma, int(code))
+                for hue, value, chroma, code in specifications.tolist()]
     return _MUNSELL_SPECIFICATIONS_CACHE
 
 
+def _munsell_specifications_to_xyY():
+    """
+    Returns the *Munsell Renotation System* specifications to *CIE xyY*
+    colourspace vectors hash index and caches it if not existing.
+
+    Returns
+    -------
+    dict
+        *Munsell Renotation System* specifications to *CIE xyY* colourspace
+        vectors.
+    """
+
+    global _MUNSELL_SPECIFICATIONS_TO_XYY_CACHE
+    if _MUNSELL_SPECIFICATIONS_TO_XYY_CACHE is None:
+        _MUNSELL_SPECIFICATIONS_TO_XYY_CACHE = dict(
+            zip(_munsell_specifications(),
+                [colour[1] for colour in MUNSELL_COLOURS_ALL]))
+    return _MUNSELL_SPECIFICATIONS_TO_XYY_CACHE
+
+
 def _munsell_value_ASTMD153508_interpolator():
     """
     Returns the *Munsell* value interpolator for ASTM D1535-08e1 (2008) method
@@ -205,31 +291,105 @@ def _munsell_value_ASTMD153508_interpolator():
 def _munsell_maximum_chromas_from_renotation():
     """
     Returns the maximum *Munsell* chromas from *Munsell Renotation System* data
-    and caches them if not existing.
+    indexed by *Munsell* *Colorlab* specification hue, value and code and
+    caches them if not existing.
 
     Returns
     -------
-    tuple
+    dict
         Maximum *Munsell* chromas.
     """
 
     global _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
     if _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE is None:
-        chromas = OrderedDict()
-        for munsell_colour in MUNSELL_COLOURS_ALL:
-            hue, value, chroma, code = munsell_colour_to_munsell_specification(
-                MUNSELL_COLOUR_FORMAT.format(*munsell_colour[0]))
+        chromas = {}
+        for hue, value, chroma, code in _munsell_specifications():
             index = (hue, value, code)
             if index in chromas:
                 chroma = max(chromas[index], chroma)
 
             chromas[index] = chroma
 
-        _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = tuple(
-            zip(chromas.keys(), chromas.values()))
+        _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = chromas
     return _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
 
 
+def _munsell_renotation_tables():
+    """
+    Returns the *Munsell Renotation System* data integer values *CIE xyY*
+    colourspace vectors and maximum *Munsell* chromas array tables and caches
+    them if not existing.
+
+    The *CIE xyY* colourspace vectors table is indexed by
+    [hue / 2.5 - 1, value, chroma / 2, code] and the maximum *Munsell* chromas
+    table by [hue / 2.5 - 1, value, code], missing entries are set to *nan*.
+
+    Returns
+    -------
+    tuple
+        *CIE xyY* colourspace vectors and maximum *Munsell* chromas tables.
+    """
+
+    global _MUNSELL_RENOTATION_TABLES_CACHE
+    if _MUNSELL_RENOTATION_TABLES_CACHE is None:
+        xyY_table = np.full((4, 11, 26, 11, 3), np.nan)
+        for (hue, value, chroma, code), xyY in (
+                _munsell_specifications_to_xyY().items()):
+            if value % 1 == 0:
+                xyY_table[int(hue / 2.5) - 1,
+                          int(value),
+                          int(chroma / 2),
+                          int(code)] = xyY
+
+        chromas_table = np.full((4, 11, 11), np.nan)
+        for (hue, value, code), chroma in (
+                _munsell_maximum_chromas_from_renotation().items()):
+            if value % 1 == 0:
+                chromas_table[int(hue / 2.5) - 1, int(value), int(code)] = (
+                    chroma)
+
+        _MUNSELL_RENOTATION_TABLES_CACHE = xyY_table, chromas_table
+    return _MUNSELL_RENOTATION_TABLES_CACHE
+
+
+def _munsell_interpolation_methods_table():
+    """
+    Returns the interpolation methods used to draw ovoids through the
+    *Munsell Renotation System* data as an array table and caches it if not
+    existing.
+
+    The table is indexed by [value, chroma / 2, ASTM hue / 1.25] and built with
+    :func:`interpolation_method_from_renotation_ovoid` definition: 0 stands
+    for no interpolation, 1 for linear interpolation and 2 for radial
+    interpolation. Even *ASTM* hue indexes are the standard *ASTM* hues, odd
+    ones the open intervals between them.
+
+    Returns
+    -------
+    ndarray
+        Interpolation methods table.
+    """
+
+    global _MUNSELL_INTERPOLATION_METHODS_TABLE_CACHE
+    if _MUNSELL_INTERPOLATION_METHODS_TABLE_CACHE is None:
+        methods = {None: 0, 'Linear': 1, 'Radial': 2}
+        table = np.zeros((11, 26, 81), dtype=np.int_)
+        for value in range(0, 11):
+            for chroma in range(2, 52, 2):
+                for i in range(81):
+                    # The interpolation method is constant in each open
+                    # interval between two standard *ASTM* hues.
+                    ASTM_hue = 1.25 * i
+                    hue = ASTM_hue % 10
+                    code = (7 - ASTM_hue // 10) % 10
+                    table[value, chroma // 2, i] = methods[
+                        interpolation_method_from_renotation_ovoid(
+                            (hue, value, chroma, code))]
+
+        _MUNSELL_INTERPOLATION_METHODS_TABLE_CACHE = table
+    return _MUNSELL_INTERPOLATION_METHODS_TABLE_CACHE
+
+
 def munsell_value_Priest1920(Y):
     """
     Returns the *Munsell* value :math:`V` of given *luminance* :math:`Y` using
@@ -628,6 +788,58 @@ def munsell_specification_to_xyY(specification):
     return np.array([x, y, Y / 100])
 
 
+def munsell_specifications_to_xyY(specification):
+    """
+    Converts given *Munsell* *Colorlab* specifications arrays to *CIE xyY*
+    colourspace, array counterpart of :func:`munsell_specification_to_xyY`
+    definition.
+
+    Parameters
+    ----------
+    specification : array_like, (..., 4)
+        *Munsell* *Colorlab* specifications arrays with columns
+        (hue, value, chroma, code), grey specifications have a chroma of 0.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE xyY* colourspace arrays, *nan* for specifications that can't be
+        converted.
+
+    Notes
+    -----
+    -   Input *Munsell* *Colorlab* specifications hue must be in domain
+        [0, 10].
+    -   Input *Munsell* *Colorlab* specifications value must be in domain
+        [0, 10].
+    -   Output *CIE xyY* colourspace arrays are in domain [0, 1].
+    -   The specifications are grouped by the interpolation method used to
+        draw the *Munsell Renotation System* ovoids and each group is
+        converted at once.
+
+    Examples
+    --------
+    >>> spc = np.array([[2.1, 8.0, 17.9, 4], [np.nan, 8.9, 0, np.nan]])
+    >>> munsell_specifications_to_xyY(spc)  # doctest: +ELLIPSIS
+    array([[ 0.4400632...,  0.5522428...,  0.5761962...],
+           [ 0.31006  ,  0.31616  ,  0.746134...]])
+    """
+
+    specification = np.asarray(specification)
+    shape = specification.shape[:-1]
+    hue, value, chroma, code = tsplit(np.reshape(specification, (-1, 4)))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xyY = _munsell_specification_to_xyY_array(hue, value, chroma, code)
+
+    with np.errstate(invalid='ignore'):
+        grey = np.logical_and.reduce((chroma == 0, value >= 0, value <= 10))
+    xyY[grey, 0:2] = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+    xyY[grey, 2] = luminance_ASTMD153508(value[grey]) / 100
+
+    return np.reshape(xyY, shape + (3,))
+
+
 def munsell_colour_to_xyY(munsell_colour):
     """
     Converts given *Munsell* colour to *CIE xyY* colourspace.
@@ -658,7 +870,7 @@ def munsell_colour_to_xyY(munsell_colour):
     return munsell_specification_to_xyY(specification)
 
 
-def xyY_to_munsell_specification(xyY):
+def xyY_to_munsell_specification(xyY, grid=None, refinement=0):
     """
     Converts from *CIE xyY* colourspace to *Munsell* *Colorlab* specification.
 
@@ -666,6 +878,13 @@ def xyY_to_munsell_specification(xyY):
     ----------
     xyY : array_like, (3,)
         *CIE xyY* colourspace array.
+    grid : MunsellInverseGrid, optional
+        Inverse *Munsell* lookup grid approximating the specification instead
+        of solving it, e.g. as returned by :func:`munsell_inverse_grid`
+        definition.
+    refinement : int, optional
+        Solver iterations count refining the specification approximated with
+        given grid.
 
     Returns
     -------
@@ -684,6 +903,9 @@ def xyY_to_munsell_specification(xyY):
     Notes
     -----
     -   Input *CIE xyY* colourspace array is in domain [0, 1].
+    -   The specification approximated with an inverse *Munsell* lookup grid
+        deviates from the solved one within the bounds documented by
+        :class:`MunsellInverseGrid` class.
 
     References
     ----------
@@ -703,6 +925,19 @@ def xyY_to_munsell_specification(xyY):
             ('"{0}" is not within "MacAdam" limits for illuminant '
              '"{1}"!').format(xyY, MUNSELL_DEFAULT_ILLUMINANT))
 
+    if grid is not None:
+        hue, value, chroma, code = grid.xyY_to_munsell_specification(
+            np.ravel(xyY), refinement)
+
+        if chroma == 0:
+            return value
+
+        if np.isnan(hue):
+            raise RuntimeError(('"{0}" specification could not be '
+                                'approximated!').format(xyY))
+
+        return hue, value, chroma, int(code)
+
     x, y, Y = np.ravel(xyY)
 
     # Scaling *Y* for algorithm needs.
@@ -901,10 +1136,943 @@ def xyY_to_munsell_specification(xyY):
         'Maximum outside iterations count reached without convergence!')
 
 
+def _xyY_to_munsell_specifications(xyY, iterations=64, specification=None):
+    """
+    Converts from *CIE xyY* colourspace arrays within MacAdam limits to
+    *Munsell* *Colorlab* specifications, all the samples are solved together.
+
+    Parameters
+    ----------
+    xyY : ndarray, (N, 3)
+        *CIE xyY* colourspace arrays.
+    iterations : int, optional
+        Maximum outer iterations count.
+    specification : ndarray, (N, 4), optional
+        Initial *Munsell* *Colorlab* specifications, the initial
+        specifications are approximated from *CIE LCHab* colourspace if not
+        given.
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specifications array (N, 4) and samples
+        convergence status array.
+    """
+
+    x, y, Y = tsplit(xyY)
+
+    # Scaling *Y* for algorithm needs.
+    value = np.reshape(munsell_value_ASTMD153508(Y * 100), Y.shape)
+    value = np.where(np.abs(value - np.around(value)) <= INTEGER_THRESHOLD,
+                     np.around(value),
+                     value)
+
+    x_center, y_center = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    def cylindrical(x_i, y_i):
+        """
+        Returns given *xy* chromaticity coordinates hue angle in degrees and
+        radius around the grey center.
+        """
+
+        _z, theta, rho = tsplit(cartesian_to_cylindrical(
+            tstack((x_i - x_center, y_i - y_center, np.zeros(x_i.shape)))))
+
+        return np.degrees(theta), rho
+
+    def theta_difference(theta_i, theta_j):
+        """
+        Returns the signed hue angle difference in domain [-180, 180].
+        """
+
+        difference = (360 - theta_i + theta_j) % 360
+
+        return np.where(difference > 180, difference - 360, difference)
+
+    theta_input, rho_input = cylindrical(x, y)
+
+    grey_threshold = 0.001
+    grey = rho_input < grey_threshold
+
+    if specification is None:
+        X, Y, Z = tsplit(xyY_to_XYZ(tstack((x, y, Y))))
+        Xr, Yr, Zr = tsplit(xyY_to_XYZ(tstack((
+            np.full(x.shape, x_center), np.full(x.shape, y_center), Y))))
+
+        XYZ = tstack((X, Y, Z))
+        XYZr = tstack(((1 / Yr) * Xr, np.ones(x.shape), (1 / Yr) * Zr))
+
+        Lab = XYZ_to_Lab(XYZ, XYZ_to_xy(XYZr))
+        LCHab = Lab_to_LCHab(Lab)
+        hue, _value, chroma, code = _LCHab_to_munsell_specification_array(
+            LCHab)
+        chroma = (5 / 5.5) * chroma
+    else:
+        hue, _value, chroma, code = [
+            np.array(component) for component in tsplit(specification)]
+
+    solution = np.full(x.shape + (4,), np.nan)
+    solution[grey] = tstack((np.full(np.sum(grey), np.nan),
+                             value[grey],
+                             np.zeros(np.sum(grey)),
+                             np.full(np.sum(grey), np.nan)))
+    solved = np.copy(grey)
+
+    def converge(indexes, hue_i, chroma_i, code_i):
+        """
+        Stores given samples specifications if they are close enough to the
+        input *xy* chromaticity coordinates and retires them.
+        """
+
+        x_i, y_i, _Y_i = tsplit(_munsell_specification_to_xyY_array(
+            hue_i, value[indexes], chroma_i, code_i))
+        difference = euclidean_distance(
+            tstack((x[indexes], y[indexes])), tstack((x_i, y_i)))
+
+        convergence_threshold = 0.0001
+        close = difference < convergence_threshold
+
+        solution[indexes[close]] = tstack((hue_i[close],
+                                           value[indexes[close]],
+                                           chroma_i[close],
+                                           code_i[close]))
+        solved[indexes[close]] = True
+
+        # Samples whose intermediate results are undefined cannot converge.
+        failed = np.isnan(difference)
+        active[indexes[np.logical_or(close, failed)]] = False
+
+        return ~np.logical_or(close, failed)
+
+    active = ~grey
+    for _ in range(iterations + 1):
+        indexes = np.flatnonzero(active)
+        if indexes.size == 0:
+            break
+
+        hue_c, chroma_c, code_c = hue[indexes], chroma[indexes], code[indexes]
+        value_c = value[indexes]
+
+        hue_angle_current = _hue_to_hue_angle_array(hue_c, code_c)
+
+        chroma_maximum = _maximum_chroma_from_renotation_array(
+            hue_c, value_c, code_c)
+        chroma_c = np.where(chroma_c > chroma_maximum,
+                            chroma_maximum,
+                            chroma_c)
+
+        x_current, y_current, _Y_current = tsplit(
+            _munsell_specification_to_xyY_array(
+                hue_c, value_c, chroma_c, code_c))
+        theta_current, _rho_current = cylindrical(x_current, y_current)
+        theta_current_difference = theta_difference(
+            theta_input[indexes], theta_current)
+
+        hue_angle_inner = ((hue_angle_current +
+                            (theta_input[indexes] - theta_current)) % 360)
+        hue_angle_difference_inner = (
+            (theta_input[indexes] - theta_current) % 360)
+        hue_angle_difference_inner = np.where(
+            hue_angle_difference_inner > 180,
+            hue_angle_difference_inner - 360,
+            hue_angle_difference_inner)
+
+        hue_inner, code_inner = _hue_angle_to_hue_array(hue_angle_inner)
+        x_inner, y_inner, _Y_inner = tsplit(
+            _munsell_specification_to_xyY_array(
+                hue_inner, value_c, chroma_c, code_inner))
+        theta_inner, _rho_inner = cylindrical(x_inner, y_inner)
+        theta_inner_difference = theta_difference(
+            theta_input[indexes], theta_inner)
+
+        # :func:`xyY_to_munsell_specification` definition evaluates a second
+        # inner step when the theta differences have the same sign before
+        # extrapolating, samples for which it is undefined are retired for
+        # consistency.
+        same_sign = (np.sign(theta_current_difference) ==
+                     np.sign(theta_inner_difference))
+        hue_outer, code_outer = _hue_angle_to_hue_array(
+            (hue_angle_current[same_sign] +
+             2 * (theta_input[indexes[same_sign]] -
+                  theta_current[same_sign])) % 360)
+        undefined = np.zeros(indexes.shape, dtype=np.bool_)
+        undefined[same_sign] = np.isnan(_munsell_specification_to_xyY_array(
+            hue_outer, value_c[same_sign], chroma_c[same_sign], code_outer)[
+            ..., 0])
+        theta_inner_difference[undefined] = np.nan
+
+        # Linear interpolation or extrapolation at 0 of the hue angle
+        # difference from the two theta differences, the points are sorted
+        # as :class:`colour.Extrapolator` class does.
+        swap = theta_inner_difference < theta_current_difference
+        theta_0 = np.where(swap, theta_inner_difference,
+                           theta_current_difference)
+        theta_1 = np.where(swap, theta_current_difference,
+                           theta_inner_difference)
+        hue_angle_0 = np.where(swap, hue_angle_difference_inner, 0)
+        hue_angle_1 = np.where(swap, 0, hue_angle_difference_inner)
+        hue_angle_difference_new = np.where(
+            theta_0 > 0,
+            hue_angle_0 + (0 - theta_0) * (hue_angle_1 - hue_angle_0) /
+            (theta_1 - theta_0),
+            np.where(
+                theta_1 < 0,
+                hue_angle_1 + (0 - theta_1) *
+                (hue_angle_1 - hue_angle_0) / (theta_1 - theta_0),
+                np.where(theta_1 == 0,
+                         hue_angle_1,
+                         _linear_interpolation(0,
+                                               theta_0,
+                                               theta_1,
+                                               hue_angle_0,
+                                               hue_angle_1)))) % 360
+        hue_angle_new = (hue_angle_current + hue_angle_difference_new) % 360
+
+        hue_new, code_new = _hue_angle_to_hue_array(hue_angle_new)
+
+        remaining = converge(indexes, hue_new, chroma_c, code_new)
+        hue[indexes] = hue_new
+        chroma[indexes] = chroma_c
+        code[indexes] = code_new
+
+        indexes = indexes[remaining]
+        if indexes.size == 0:
+            break
+
+        hue_c, chroma_c, code_c = hue[indexes], chroma[indexes], code[indexes]
+        value_c = value[indexes]
+        rho_input_c = rho_input[indexes]
+
+        chroma_maximum = _maximum_chroma_from_renotation_array(
+            hue_c, value_c, code_c)
+        chroma_c = np.where(chroma_c > chroma_maximum,
+                            chroma_maximum,
+                            chroma_c)
+
+        x_current, y_current, _Y_current = tsplit(
+            _munsell_specification_to_xyY_array(
+                hue_c, value_c, chroma_c, code_c))
+        _theta_current, rho_current = cylindrical(x_current, y_current)
+
+        iterations_maximum_inner = 16
+        rho_bounds = np.full(
+            (indexes.size, iterations_maximum_inner + 1), np.nan)
+        chroma_bounds = np.full(
+            (indexes.size, iterations_maximum_inner + 1), np.nan)
+        rho_bounds[..., 0] = rho_current
+        chroma_bounds[..., 0] = chroma_c
+
+        for i in range(1, iterations_maximum_inner + 2):
+            bounded = np.logical_and(
+                np.fmin.reduce(rho_bounds, axis=-1) < rho_input_c,
+                rho_input_c < np.fmax.reduce(rho_bounds, axis=-1))
+            unbounded = np.flatnonzero(~bounded)
+            if unbounded.size == 0 or i > iterations_maximum_inner:
+                break
+
+            chroma_inner = (((rho_input_c[unbounded] /
+                              rho_current[unbounded]) ** i) *
+                            chroma_c[unbounded])
+            chroma_inner = np.where(chroma_inner > chroma_maximum[unbounded],
+                                    chroma_maximum[unbounded],
+                                    chroma_inner)
+
+            x_inner, y_inner, _Y_inner = tsplit(
+                _munsell_specification_to_xyY_array(
+                    hue_c[unbounded],
+                    value_c[unbounded],
+                    chroma_inner,
+                    code_c[unbounded]))
+
+            _theta_inner, rho_inner = cylindrical(x_inner, y_inner)
+
+            rho_bounds[unbounded, i] = rho_inner
+            chroma_bounds[unbounded, i] = chroma_inner
+
+        # Samples not bounded after the maximum inner iterations count
+        # cannot converge.
+        active[indexes[~bounded]] = False
+        indexes = indexes[bounded]
+        rho_bounds = rho_bounds[bounded]
+        chroma_bounds = chroma_bounds[bounded]
+        rho_input_c = rho_input_c[bounded]
+        if indexes.size == 0:
+            continue
+
+        rows = np.arange(indexes.size)[..., np.newaxis]
+        rhos_bounds_indexes = rho_bounds.argsort(axis=-1)
+        rho_bounds = rho_bounds[rows, rhos_bounds_indexes]
+        chroma_bounds = chroma_bounds[rows, rhos_bounds_indexes]
+
+        j = np.sum(rho_bounds <= rho_input_c[..., np.newaxis],
+                   axis=-1) - 1
+        rows = np.arange(indexes.size)
+        chroma_new = _linear_interpolation(rho_input_c,
+                                           rho_bounds[rows, j],
+                                           rho_bounds[rows, j + 1],
+                                           chroma_bounds[rows, j],
+                                           chroma_bounds[rows, j + 1])
+
+        chroma[indexes] = chroma_new
+        converge(indexes, hue[indexes], chroma_new, code[indexes])
+
+    return solution, solved
+
+
+def xyY_to_munsell_specifications(xyY, iterations=64):
+    """
+    Converts from *CIE xyY* colourspace arrays to *Munsell* *Colorlab*
+    specifications, all the samples are solved together.
+
+    Parameters
+    ----------
+    xyY : array_like, (..., 3)
+        *CIE xyY* colourspace arrays.
+    iterations : int, optional
+        Maximum outer iterations count.
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specifications array (..., 4) with columns
+        (hue, value, chroma, code) and samples convergence status array.
+
+    Warning
+    -------
+    Samples not within MacAdam limits or that did not converge are set to
+    *nan* and a warning reporting their count is issued.
+
+    Notes
+    -----
+    -   Input *CIE xyY* colourspace arrays are in domain [0, 1].
+    -   Grey specifications have *nan* hue and code and a chroma of 0.
+    -   The iterative algorithm is the one of
+        :func:`xyY_to_munsell_specification` definition, unconverged samples
+        are updated together at each step and the converged samples are
+        retired from subsequent steps.
+
+    See Also
+    --------
+    xyY_to_munsell_specification
+
+    Examples
+    --------
+    >>> xyY = np.array([[0.38736945, 0.35751656, 0.59362000],
+    ...                 [0.31006000, 0.31616000, 0.74613400]])
+    >>> specification, converged = xyY_to_munsell_specifications(xyY)
+    >>> specification  # doctest: +ELLIPSIS
+    array([[ 4.174253...,  8.099999...,  5.304436...,  6.        ],
+           [        nan,  8.899997...,  0.        ,         nan]])
+    >>> converged
+    array([ True,  True], dtype=bool)
+    """
+
+    xyY = np.asarray(xyY)
+    shape = xyY.shape[:-1]
+    xyY = np.reshape(xyY, (-1, 3))
+
+    specification = np.full(xyY.shape[:-1] + (4,), np.nan)
+    converged = np.zeros(xyY.shape[:-1], dtype=np.bool_)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        within = is_within_macadam_limits(xyY, MUNSELL_DEFAULT_ILLUMINANT)
+    if not np.all(within):
+        warning(('"{0}" samples are not within "MacAdam" limits for '
+                 'illuminant "{1}"!').format(np.sum(~within),
+                                             MUNSELL_DEFAULT_ILLUMINANT))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        solution, solved = _xyY_to_munsell_specifications(
+            xyY[within], iterations)
+
+    unconverged = np.sum(~solved)
+    if unconverged:
+        warning(('"{0}" samples did not converge within the maximum '
+                 'iterations count!').format(unconverged))
+
+    specification[within] = solution
+    converged[within] = solved
+
+    return (np.reshape(specification, shape + (4,)),
+            np.reshape(converged, shape))
+
+
+def _munsell_value_from_Y(Y):
+    """
+    Returns the *Munsell* value of given *luminance* :math:`Y` in domain
+    [0, 1] as :func:`xyY_to_munsell_specification` definition computes it.
+
+    Parameters
+    ----------
+    Y : ndarray
+        *Luminance* :math:`Y`.
+
+    Returns
+    -------
+    ndarray
+        *Munsell* value.
+    """
+
+    value = np.reshape(munsell_value_ASTMD153508(Y * 100), np.shape(Y))
+
+    return np.where(np.abs(value - np.around(value)) <= INTEGER_THRESHOLD,
+                    np.around(value),
+                    value)
+
+
+def _munsell_inverse_grid_axes(xy_step, value_step):
+    """
+    Returns the inverse *Munsell* lookup grid axes for given steps.
+
+    Parameters
+    ----------
+    xy_step : numeric
+        *xy* chromaticity coordinates step.
+    value_step : numeric
+        *Munsell* value step.
+
+    Returns
+    -------
+    tuple
+        *x*, *y* chromaticity coordinates and *Munsell* value axes.
+    """
+
+    return tuple(
+        np.linspace(start, end, int(round((end - start) / step)) + 1)
+        for (start, end), step in zip(_MUNSELL_INVERSE_GRID_DOMAIN,
+                                      (xy_step, xy_step, value_step)))
+
+
+def _ASTM_hue_to_hue(ASTM_hue):
+    """
+    Converts from *ASTM* hue number in domain [0, 100] to the *Munsell*
+    *Colorlab* specifications hue and code, inverse of
+    :func:`hue_to_ASTM_hue` definition.
+
+    Parameters
+    ----------
+    ASTM_hue : ndarray
+        *ASTM* hue number.
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specifications hue and code.
+    """
+
+    ASTM_hue = np.where(ASTM_hue == 0, 100, ASTM_hue)
+    q = np.floor(ASTM_hue / 10)
+    hue = ASTM_hue - 10 * q
+    q = np.where(hue == 0, q - 1, q)
+    hue = np.where(hue == 0, 10, hue)
+    code = (7 - q) % 10
+
+    return hue, np.where(code == 0, 10, code)
+
+
+def _munsell_inverse_grid_nodes(x, y, value):
+    """
+    Solves the inverse *Munsell* lookup grid nodes defined by given axes.
+
+    Parameters
+    ----------
+    x : ndarray
+        *x* chromaticity coordinates axis.
+    y : ndarray
+        *y* chromaticity coordinates axis.
+    value : ndarray
+        *Munsell* value axis.
+
+    Returns
+    -------
+    ndarray, (x, y, value, 2)
+        Grid nodes *Munsell* *Colorlab* specifications chroma and *ASTM* hue
+        angle cartesian coordinates, *nan* for nodes that cannot be solved.
+    """
+
+    x, y = np.meshgrid(x, y, indexing='ij')
+
+    nodes = np.full(x.shape + value.shape + (2,), np.nan)
+    # The nodes are solved one value at a time to bound memory usage.
+    for i, value_i in enumerate(value):
+        xyY = tstack((x, y, np.full(
+            x.shape, luminance_ASTMD153508(value_i) / 100)))
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            specification, _converged = xyY_to_munsell_specifications(xyY)
+
+        hue, _value, chroma, code = tsplit(specification)
+        phi = np.radians((10 * ((7 - code) % 10) + hue) * 3.6)
+        nodes[..., i, :] = np.where(
+            (chroma == 0)[..., np.newaxis],
+            0,
+            tstack((chroma * np.cos(phi), chroma * np.sin(phi))))
+
+    return nodes
+
+
+class MunsellInverseGrid(object):
+    """
+    Defines an inverse *Munsell* lookup grid approximating
+    :func:`xyY_to_munsell_specification` definition.
+
+    The grid nodes are regularly spaced *xy* chromaticity coordinates and
+    *Munsell* values, each node is solved with
+    :func:`xyY_to_munsell_specifications` definition and its *Munsell*
+    *Colorlab* specification stored as the cartesian coordinates of its chroma
+    and *ASTM* hue angle. Queries are answered by trilinear interpolation of
+    the grid nodes, the value is computed exactly from the *luminance*
+    :math:`Y`.
+
+    Parameters
+    ----------
+    xy_step : numeric, optional
+        *xy* chromaticity coordinates step.
+    value_step : numeric, optional
+        *Munsell* value step.
+    nodes : array_like, optional
+        Grid nodes *Munsell* *Colorlab* specifications chroma and *ASTM* hue
+        angle cartesian coordinates, e.g. read from a persisted grid, they are
+        computed if not given.
+
+    Attributes
+    ----------
+    xy_step
+    value_step
+    x
+    y
+    value
+    nodes
+
+    Methods
+    -------
+    xyY_to_munsell_specification
+
+    Notes
+    -----
+    -   The grid covers *xy* chromaticity coordinates in domain
+        [0, 0.75] x [0, 0.85] and *Munsell* values in domain [1, 10], the
+        queries outside it or in a cell having a node that cannot be solved,
+        i.e. near the *Munsell Renotation System* data gamut boundary, are
+        solved with :func:`xyY_to_munsell_specifications` definition.
+    -   The approximation deviations from the exact solver are empirical:
+        they have been measured with the default steps on 5 independent sets
+        of about 20000 random *CIE xyY* colourspace arrays and are given
+        with a margin over the worst set. Without refinement, 99% of the
+        approximated specifications are within 0.15 *ASTM* hue and 0.15
+        chroma of the exact ones and 99.9% within 0.75 *ASTM* hue and 0.45
+        chroma. There is no hard bound on the remaining deviations: they
+        can exceed 1 chroma and reach several *ASTM* hue at low chromas.
+    -   The refinement only replaces the approximations of the samples the
+        solver converges for within the given iterations count, the samples
+        the grid approximates worst usually need more than one iteration and
+        keep their approximation. One refinement iteration thus brings the
+        99th percentile deviations to 0.05 *ASTM* hue and 0.1 chroma but
+        barely reduces the 99.9th percentile chroma deviation and leaves the
+        worst-case one unchanged. Two refinement iterations bring 99.9% of the
+        specifications within 0.1 *ASTM* hue and 0.03 chroma of the exact
+        ones.
+    -   The `utilities/benchmark_munsell_inverse_grid.py` script measures
+        these deviations for a given samples count and seed.
+
+    See Also
+    --------
+    munsell_inverse_grid
+
+    Examples
+    --------
+    >>> grid = MunsellInverseGrid(0.05, 1)  # doctest: +SKIP
+    >>> xyY = np.array([0.38736945, 0.35751656, 0.59362000])
+    >>> grid.xyY_to_munsell_specification(xyY)  # doctest: +SKIP
+    array([ 4.1...,  8.0999999...,  5.3...,  6.        ])
+    """
+
+    def __init__(self,
+                 xy_step=MUNSELL_INVERSE_GRID_XY_STEP,
+                 value_step=MUNSELL_INVERSE_GRID_VALUE_STEP,
+                 nodes=None):
+        self.__xy_step = xy_step
+        self.__value_step = value_step
+
+        self.__x, self.__y, self.__value = _munsell_inverse_grid_axes(
+            xy_step, value_step)
+        for axis in (self.__x, self.__y, self.__value):
+            axis.setflags(write=False)
+
+        if nodes is None:
+            nodes = _munsell_inverse_grid_nodes(
+                self.__x, self.__y, self.__value)
+
+        self.__nodes = np.array(nodes, dtype=np.float_)
+        self.__nodes.setflags(write=False)
+
+    @property
+    def xy_step(self):
+        """
+        Property for **self.xy_step** attribute.
+
+        Returns
+        -------
+        numeric
+            self.xy_step.
+
+        Warning
+        -------
+        :attr:`MunsellInverseGrid.xy_step` is read only.
+        """
+
+        return self.__xy_step
+
+    @xy_step.setter
+    def xy_step(self, value):
+        """
+        Setter for **self.xy_step** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('xy_step'))
+
+    @property
+    def value_step(self):
+        """
+        Property for **self.value_step** attribute.
+
+        Returns
+        -------
+        numeric
+            self.value_step.
+
+        Warning
+        -------
+        :attr:`MunsellInverseGrid.value_step` is read only.
+        """
+
+        return self.__value_step
+
+    @value_step.setter
+    def value_step(self, value):
+        """
+        Setter for **self.value_step** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError(
+            '"{0}" attribute is read only!'.format('value_step'))
+
+    @property
+    def x(self):
+        """
+        Property for **self.x** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.x.
+
+        Warning
+        -------
+        :attr:`MunsellInverseGrid.x` is read only.
+        """
+
+        return self.__x
+
+    @x.setter
+    def x(self, value):
+        """
+        Setter for **self.x** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('x'))
+
+    @property
+    def y(self):
+        """
+        Property for **self.y** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.y.
+
+        Warning
+        -------
+        :attr:`MunsellInverseGrid.y` is read only.
+        """
+
+        return self.__y
+
+    @y.setter
+    def y(self, value):
+        """
+        Setter for **self.y** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('y'))
+
+    @property
+    def value(self):
+        """
+        Property for **self.value** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.value.
+
+        Warning
+        -------
+        :attr:`MunsellInverseGrid.value` is read only.
+        """
+
+        return self.__value
+
+    @value.setter
+    def value(self, value):
+        """
+        Setter for **self.value** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('value'))
+
+    @property
+    def nodes(self):
+        """
+        Property for **self.nodes** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.nodes.
+
+        Warning
+        -------
+        :attr:`MunsellInverseGrid.nodes` is read only.
+        """
+
+        return self.__nodes
+
+    @nodes.setter
+    def nodes(self, value):
+        """
+        Setter for **self.nodes** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('nodes'))
+
+    def xyY_to_munsell_specification(self, xyY, refinement=0):
+        """
+        Approximates given *CIE xyY* colourspace arrays *Munsell* *Colorlab*
+        specifications by interpolating the grid.
+
+        Parameters
+        ----------
+        xyY : array_like, (..., 3)
+            *CIE xyY* colourspace arrays.
+        refinement : int, optional
+            Solver iterations count run from the approximated specifications,
+            the samples converging within that count are given the solver
+            results.
+
+        Returns
+        -------
+        ndarray, (..., 4)
+            *Munsell* *Colorlab* specifications with columns
+            (hue, value, chroma, code), grey specifications have *nan* hue and
+            code and a chroma of 0.
+
+        Notes
+        -----
+        -   Input *CIE xyY* colourspace arrays are in domain [0, 1].
+        -   Samples outside the grid or in a cell having a node that cannot
+            be solved are solved with :func:`xyY_to_munsell_specifications`
+            definition and set to *nan* if they cannot be.
+        """
+
+        xyY = np.asarray(xyY)
+        shape = xyY.shape[:-1]
+        xyY = np.reshape(xyY, (-1, 3))
+
+        x, y, Y = tsplit(xyY)
+        value = _munsell_value_from_Y(Y)
+
+        x_grey, y_grey = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+        with np.errstate(invalid='ignore'):
+            grey_threshold = 0.001
+            grey = np.hypot(x - x_grey, y - y_grey) < grey_threshold
+
+        ab = 0
+        outside = np.zeros(x.shape, dtype=np.bool_)
+        indexes, weights = [], []
+        for axis, a in zip((self.__x, self.__y, self.__value), (x, y, value)):
+            with np.errstate(invalid='ignore'):
+                outside = np.logical_or.reduce(
+                    (outside, ~(a >= axis[0]), a > axis[-1]))
+            f = (np.where(outside, axis[0], a) - axis[0]) / (
+                axis[1] - axis[0])
+            i = np.clip(np.floor(f), 0, len(axis) - 2).astype(np.int_)
+            indexes.append(i)
+            weights.append(f - i)
+
+        (i, j, k), (t_x, t_y, t_v) = indexes, weights
+        for d_i, d_j, d_k in np.ndindex(2, 2, 2):
+            weight = ((t_x if d_i else 1 - t_x) *
+                      (t_y if d_j else 1 - t_y) *
+                      (t_v if d_k else 1 - t_v))
+            ab = ab + (weight[..., np.newaxis] *
+                       self.__nodes[i + d_i, j + d_j, k + d_k])
+
+        a, b = tsplit(ab)
+        chroma = np.hypot(a, b)
+        hue, code = _ASTM_hue_to_hue(
+            np.degrees(np.arctan2(b, a)) % 360 / 3.6)
+
+        specification = tstack((hue, value, chroma, code))
+        specification[grey, 0] = specification[grey, 3] = np.nan
+        specification[grey, 2] = 0
+
+        undefined = np.logical_and(
+            np.logical_or(np.isnan(chroma), outside), ~grey)
+        if np.any(undefined):
+            specification[undefined] = xyY_to_munsell_specifications(
+                xyY[undefined])[0]
+
+        approximated = ~np.logical_or(grey, undefined)
+        if refinement > 0 and np.any(approximated):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                solution, solved = _xyY_to_munsell_specifications(
+                    xyY[approximated],
+                    refinement - 1,
+                    specification[approximated])
+            refined = np.flatnonzero(approximated)[solved]
+            specification[refined] = solution[solved]
+
+        return np.reshape(specification, shape + (4,))
+
+
+def _munsell_inverse_grid_path(directory, xy_step, value_step):
+    """
+    Returns the path of the file persisting the inverse *Munsell* lookup grid
+    for given steps.
+
+    Parameters
+    ----------
+    directory : unicode
+        Directory the inverse *Munsell* lookup grids are persisted into.
+    xy_step : numeric
+        *xy* chromaticity coordinates step.
+    value_step : numeric
+        *Munsell* value step.
+
+    Returns
+    -------
+    unicode
+        Inverse *Munsell* lookup grid path.
+    """
+
+    name = re.sub(r'[^\w.]+', '_', 'munsell_inverse_grid_{0}_{1}'.format(
+        xy_step, value_step))
+
+    return os.path.join(directory, '{0}.npz'.format(name))
+
+
+def munsell_inverse_grid(xy_step=MUNSELL_INVERSE_GRID_XY_STEP,
+                         value_step=MUNSELL_INVERSE_GRID_VALUE_STEP,
+                         directory=None):
+    """
+    Returns the inverse *Munsell* lookup grid for given steps.
+
+    The grids are kept in a least recently used cache and can optionally be
+    persisted on disk.
+
+    Parameters
+    ----------
+    xy_step : numeric, optional
+        *xy* chromaticity coordinates step.
+    value_step : numeric, optional
+        *Munsell* value step.
+    directory : unicode, optional
+        Directory the grids are persisted into, a grid existing in given
+        directory is loaded instead of being built.
+
+    Returns
+    -------
+    MunsellInverseGrid
+        Inverse *Munsell* lookup grid.
+
+    Notes
+    -----
+    -   The maximum number of cached grids is defined by
+        :attr:`MUNSELL_INVERSE_GRIDS_CACHE_SIZE` attribute.
+    -   Building the grid with the default steps takes a few tens of seconds,
+        persisting it is recommended.
+
+    Examples
+    --------
+    >>> grid = munsell_inverse_grid(0.05, 1)
+    >>> grid is munsell_inverse_grid(0.05, 1)
+    True
+    """
+
+    key = (xy_step, value_step)
+
+    grid = _MUNSELL_INVERSE_GRIDS_CACHE.get(key)
+    if grid is not None:
+        return grid
+
+    path = (_munsell_inverse_grid_path(directory, xy_step, value_step)
+            if directory is not None else None)
+
+    if path is not None and os.path.exists(path):
+        with np.load(path) as data:
+            grid = MunsellInverseGrid(xy_step, value_step, data['nodes'])
+    else:
+        grid = MunsellInverseGrid(xy_step, value_step)
+
+        if path is not None:
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+
+            np.savez(path, nodes=grid.nodes)
+
+    _MUNSELL_INVERSE_GRIDS_CACHE[key] = grid
+
+    return grid
+
+
 def xyY_to_munsell_colour(xyY,
                           hue_decimals=1,
                           value_decimals=1,
-                          chroma_decimals=1):
+                          chroma_decimals=1,
+                          grid=None,
+                          refinement=0):
     """
     Converts from *CIE xyY* colourspace to *Munsell* colour.
 
@@ -918,6 +2086,13 @@ def xyY_to_munsell_colour(xyY,
         Value formatting decimals.
     chroma_decimals : int
         Chroma formatting decimals.
+    grid : MunsellInverseGrid, optional
+        Inverse *Munsell* lookup grid approximating the specification instead
+        of solving it, e.g. as returned by :func:`munsell_inverse_grid`
+        definition.
+    refinement : int, optional
+        Solver iterations count refining the specification approximated with
+        given grid.
 
     Returns
     -------
@@ -936,7 +2111,7 @@ def xyY_to_munsell_colour(xyY,
     '4.2YR 8.1/5.3'
     """
 
-    specification = xyY_to_munsell_specification(xyY)
+    specification = xyY_to_munsell_specification(xyY, grid, refinement)
     return munsell_specification_to_munsell_colour(specification,
                                                    hue_decimals,
                                                    value_decimals,
@@ -991,6 +2166,127 @@ def parse_munsell_colour(munsell_colour):
          'specification!').format(munsell_colour))
 
 
+def parse_munsell_colours(munsell_colours):
+    """
+    Parses given *Munsell* colours arrays and returns intermediate *Munsell*
+    *Colorlab* specifications, array counterpart of
+    :func:`parse_munsell_colour` definition.
+
+    Parameters
+    ----------
+    munsell_colours : array_like
+        *Munsell* colours.
+
+    Returns
+    -------
+    ndarray, (..., 4)
+        Intermediate *Munsell* *Colorlab* specifications with columns
+        (hue, value, chroma, code), grey specifications have *nan* hue and
+        code and a chroma of 0, invalid *Munsell* colours are set to *nan*.
+
+    Notes
+    -----
+    -   The *Munsell* colours are parsed in a single regular expression pass
+        over their line breaks separated concatenation, the *Munsell* colours
+        containing line breaks are thus considered invalid.
+
+    Examples
+    --------
+    >>> parse_munsell_colours(['N5.2', '0YR 2.0/4.0'])
+    array([[ nan,  5.2,  0. ,  nan],
+           [ 0. ,  2. ,  4. ,  6. ]])
+    """
+
+    munsell_colours = np.asarray(munsell_colours)
+    shape = munsell_colours.shape
+    munsell_colours = np.ravel(munsell_colours)
+
+    specification = np.full((munsell_colours.size, 4), np.nan)
+    if munsell_colours.size == 0:
+        return np.reshape(specification, shape + (4,))
+
+    # The *Munsell* colours containing line breaks cannot be told apart in
+    # the concatenation and are left as invalid.
+    parsed = np.char.find(munsell_colours.astype(np.unicode_), '\n') < 0
+
+    if np.any(parsed):
+        # The *Munsell* colours are upper cased so that the pattern can be
+        # matched case sensitively.
+        pattern = re.compile(_MUNSELL_COLOURS_PATTERN, flags=re.MULTILINE)
+        matches = np.array(pattern.findall(
+            '\n'.join(munsell_colours[parsed].tolist()).upper()))
+
+        def group(name):
+            """
+            Returns given group matches, empty matches are set to *nan*.
+            """
+
+            matches_g = matches[..., pattern.groupindex[name] - 1]
+
+            return np.where(matches_g == '', 'nan', matches_g).astype(
+                np.float_)
+
+        letter = matches[..., pattern.groupindex['letter'] - 1]
+        code = np.full(letter.shape, np.nan)
+        for hue_letter, hue_code in MUNSELL_HUE_LETTER_CODES.items():
+            code[letter == hue_letter] = hue_code
+
+        value_grey = group('grey')
+        grey = ~np.isnan(value_grey)
+
+        specification[parsed, 0] = group('hue')
+        specification[parsed, 1] = np.where(grey, value_grey, group('value'))
+        specification[parsed, 2] = np.where(grey, 0, group('chroma'))
+        specification[parsed, 3] = code
+
+    invalid = np.isnan(specification[..., 1])
+    if np.any(invalid):
+        warning(('"{0}" are not valid "Munsell Renotation System" colours '
+                 'specifications!').format(munsell_colours[invalid]))
+
+    return np.reshape(specification, shape + (4,))
+
+
+def munsell_colours_to_munsell_specifications(munsell_colours):
+    """
+    Convenient definition to retrieve normalised *Munsell* *Colorlab*
+    specifications from given *Munsell* colours arrays, array counterpart of
+    :func:`munsell_colour_to_munsell_specification` definition.
+
+    Parameters
+    ----------
+    munsell_colours : array_like
+        *Munsell* colours, colours containing line breaks are invalid.
+
+    Returns
+    -------
+    ndarray, (..., 4)
+        Normalised *Munsell* *Colorlab* specifications with columns
+        (hue, value, chroma, code), grey specifications have *nan* hue and
+        code and a chroma of 0, invalid *Munsell* colours are set to *nan*.
+
+    Examples
+    --------
+    >>> munsell_colours_to_munsell_specifications(['N5.2', '0YR 2.0/4.0'])
+    array([[  nan,   5.2,   0. ,   nan],
+           [ 10. ,   2. ,   4. ,   7. ]])
+    """
+
+    specification = parse_munsell_colours(munsell_colours)
+    hue, value, chroma, code = tsplit(specification)
+
+    # 0YR is equivalent to 10R.
+    zero = hue == 0
+    hue = np.where(zero, 10, hue)
+    code = np.where(zero, code % 10 + 1, code)
+
+    grey = chroma == 0
+    hue = np.where(grey, np.nan, hue)
+    code = np.where(grey, np.nan, code)
+
+    return tstack((hue, value, chroma, code))
+
+
 def is_grey_munsell_colour(specification):
     """
     Returns if given *Munsell* *Colorlab* specification is a single number form
@@ -1146,6 +2442,94 @@ def munsell_specification_to_munsell_colour(specification,
                                                          chroma_decimals)
 
 
+def munsell_specifications_to_munsell_colours(specification,
+                                              hue_decimals=1,
+                                              value_decimals=1,
+                                              chroma_decimals=1):
+    """
+    Converts from *Munsell* *Colorlab* specifications arrays to given
+    *Munsell* colours, array counterpart of
+    :func:`munsell_specification_to_munsell_colour` definition.
+
+    Parameters
+    ----------
+    specification : array_like, (..., 4)
+        *Munsell* *Colorlab* specifications arrays with columns
+        (hue, value, chroma, code), grey specifications have a chroma of 0.
+    hue_decimals : int, optional
+        Hue formatting decimals.
+    value_decimals : int, optional
+        Value formatting decimals.
+    chroma_decimals : int, optional
+        Chroma formatting decimals.
+
+    Returns
+    -------
+    ndarray
+        *Munsell* colours, invalid specifications are set to empty strings.
+
+    Notes
+    -----
+    -   Input *Munsell* *Colorlab* specifications hue must be in domain
+        [0, 10].
+    -   Input *Munsell* *Colorlab* specifications value must be in domain
+        [0, 10].
+    -   Input *Munsell* *Colorlab* specifications chroma must be in domain
+        [2, 50].
+
+    Examples
+    --------
+    >>> spc = np.array([[np.nan, 5.2, 0, np.nan], [10, 2.0, 4.0, 7]])
+    >>> # Doctests skip for Python 2.x compatibility.
+    >>> munsell_specifications_to_munsell_colours(spc)  # doctest: +SKIP
+    array(['N5.2', '10.0R 2.0/4.0'],
+          dtype='<U13')
+    """
+
+    specification = np.asarray(specification)
+    shape = specification.shape[:-1]
+    hue, value, chroma, code = tsplit(np.reshape(specification, (-1, 4)))
+
+    # 0YR is equivalent to 10R.
+    zero = hue == 0
+    hue = np.where(zero, 10, hue)
+    code = np.where(zero, code % 10 + 1, code)
+
+    with np.errstate(invalid='ignore'):
+        value_valid = np.logical_and(value >= 0, value <= 10)
+        grey = np.logical_and(np.logical_or(chroma == 0, value == 0),
+                              value_valid)
+        chromatic = np.logical_and.reduce((
+            ~grey, value_valid,
+            hue >= 0, hue <= 10,
+            chroma >= 2, chroma <= 50,
+            np.in1d(code, list(MUNSELL_HUE_LETTER_CODES.values()))))
+
+    hue_letters = [''] * 11
+    for hue_letter, hue_code in MUNSELL_HUE_LETTER_CODES.items():
+        hue_letters[hue_code] = hue_letter
+
+    grey_format = 'N%.{0}f'.format(value_decimals)
+    colour_format = '%.{0}f%s %.{1}f/%.{2}f'.format(
+        hue_decimals, value_decimals, chroma_decimals)
+
+    munsell_colours = np.full(hue.shape, '', dtype=np.object_)
+    munsell_colours[grey] = [grey_format % value_g
+                             for value_g in value[grey].tolist()]
+    munsell_colours[chromatic] = [
+        colour_format % (hue_c, hue_letters[int(code_c)], value_c, chroma_c)
+        for hue_c, value_c, chroma_c, code_c in
+        zip(*(hue[chromatic].tolist(), value[chromatic].tolist(),
+              chroma[chromatic].tolist(), code[chromatic].tolist()))]
+
+    invalid = ~np.logical_or(grey, chromatic)
+    if np.any(invalid):
+        warning(('"{0}" are not valid "Munsell Renotation System" colours '
+                 'specifications!').format(specification[invalid]))
+
+    return np.reshape(munsell_colours.astype(np.unicode_), shape)
+
+
 def xyY_from_renotation(specification):
     """
     Returns given existing *Munsell* *Colorlab* specification *CIE xyY*
@@ -1173,10 +2557,12 @@ def xyY_from_renotation(specification):
     (0.71..., 1.41..., 0.23...)
     """
 
-    specifications = _munsell_specifications()
+    if isinstance(specification, (list, np.ndarray)):
+        specification = tuple(specification)
+
     try:
-        return MUNSELL_COLOURS_ALL[specifications.index(specification)][1]
-    except ValueError:
+        return _munsell_specifications_to_xyY()[specification]
+    except KeyError:
         # TODO: Should raise KeyError, need to check the tests.
         raise ValueError(
             ('"{0}" specification does not exists in '
@@ -1206,11 +2592,10 @@ def is_specification_in_renotation(specification):
     False
     """
 
-    try:
-        xyY_from_renotation(specification)
-        return True
-    except ValueError:
-        return False
+    if isinstance(specification, (list, np.ndarray)):
+        specification = tuple(specification)
+
+    return specification in _munsell_specifications_to_xyY()
 
 
 def bounding_hues_from_renotation(hue, code):
@@ -1692,6 +3077,54 @@ def interpolation_method_from_renotation_ovoid(specification):
     return interpolation_methods.get(interpolation_method)
 
 
+def interpolation_methods_from_renotation_ovoids(specification):
+    """
+    Returns whether to use linear or radial interpolation when drawing ovoids
+    through data points in the *Munsell Renotation System* data from given
+    specifications arrays, array counterpart of
+    :func:`interpolation_method_from_renotation_ovoid` definition.
+
+    Parameters
+    ----------
+    specification : array_like, (..., 4)
+        *Munsell* *Colorlab* specifications arrays with columns
+        (hue, value, chroma, code), grey specifications have a chroma of 0.
+
+    Returns
+    -------
+    ndarray
+        Interpolation methods ('Linear', 'Radial', None), *None* for grey
+        specifications and specifications outside the domain.
+
+    Notes
+    -----
+    -   Input *Munsell* *Colorlab* specifications value must be an integer in
+        domain [0, 10].
+    -   Input *Munsell* *Colorlab* specifications chroma must be an integer
+        and a multiple of 2 in domain [2, 50].
+
+    Examples
+    --------
+    >>> spc = np.array([[2.5, 5.0, 12.0, 4], [2.5, 5.0, 0.0, 4]])
+    >>> # Doctests skip for Python 2.x compatibility.
+    >>> interpolation_methods_from_renotation_ovoids(spc)  # doctest: +SKIP
+    array(['Radial', None], dtype=object)
+    """
+
+    specification = np.asarray(specification)
+    shape = specification.shape[:-1]
+    hue, value, chroma, code = tsplit(np.reshape(specification, (-1, 4)))
+
+    with np.errstate(invalid='ignore'):
+        interpolation_method, _valid = (
+            _interpolation_method_from_renotation_ovoid_array(
+                hue, value, chroma, code))
+
+    interpolation_methods = np.array([None, 'Linear', 'Radial'])
+
+    return np.reshape(interpolation_methods[interpolation_method], shape)
+
+
 def xy_from_renotation_ovoid(specification):
     """
     Converts given *Munsell* *Colorlab* specification to *xy* chromaticity
@@ -1833,6 +3266,53 @@ def xy_from_renotation_ovoid(specification):
         return x, y
 
 
+def xy_from_renotation_ovoids(specification):
+    """
+    Converts given *Munsell* *Colorlab* specifications arrays to *xy*
+    chromaticity coordinates on *Munsell Renotation System* ovoids, array
+    counterpart of :func:`xy_from_renotation_ovoid` definition.
+
+    Parameters
+    ----------
+    specification : array_like, (..., 4)
+        *Munsell* *Colorlab* specifications arrays with columns
+        (hue, value, chroma, code), grey specifications have a chroma of 0.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        *xy* chromaticity coordinates, *nan* for specifications that can't be
+        converted.
+
+    Notes
+    -----
+    -   Input *Munsell* *Colorlab* specifications value must be an integer in
+        domain [1, 9].
+    -   Input *Munsell* *Colorlab* specifications chroma must be an integer
+        and a multiple of 2 in domain [2, 50].
+    -   The specifications are grouped by the interpolation method used to
+        draw the *Munsell Renotation System* ovoids and each group is
+        converted at once.
+
+    Examples
+    --------
+    >>> spc = np.array([[2.5, 5.0, 12.0, 4], [np.nan, 8.0, 0.0, np.nan]])
+    >>> xy_from_renotation_ovoids(spc)  # doctest: +ELLIPSIS
+    array([[ 0.4333 ,  0.5602 ],
+           [ 0.31006,  0.31616]])
+    """
+
+    specification = np.asarray(specification)
+    shape = specification.shape[:-1]
+    hue, value, chroma, code = tsplit(np.reshape(specification, (-1, 4)))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xy = _xy_from_renotation_ovoid_array(hue, value, chroma, code)
+    xy[chroma == 0] = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    return np.reshape(xy, shape + (2,))
+
+
 def LCHab_to_munsell_specification(LCHab):
     """
     Converts from *CIE LCHab* colourspace to approximate *Munsell* *Colorlab*
@@ -1952,18 +3432,13 @@ def maximum_chroma_from_renotation(hue, value, code):
     hue_ccw, code_ccw = hue_ccw
 
     maximum_chromas = _munsell_maximum_chromas_from_renotation()
-    spc_for_indexes = [chroma[0] for chroma in maximum_chromas]
 
-    ma_limit_mcw = maximum_chromas[
-        spc_for_indexes.index((hue_cw, value_minus, code_cw))][1]
-    ma_limit_mccw = maximum_chromas[
-        spc_for_indexes.index((hue_ccw, value_minus, code_ccw))][1]
+    ma_limit_mcw = maximum_chromas[(hue_cw, value_minus, code_cw)]
+    ma_limit_mccw = maximum_chromas[(hue_ccw, value_minus, code_ccw)]
 
     if value_plus <= 9:
-        ma_limit_pcw = maximum_chromas[
-            spc_for_indexes.index((hue_cw, value_plus, code_cw))][1]
-        ma_limit_pccw = maximum_chromas[
-            spc_for_indexes.index((hue_ccw, value_plus, code_ccw))][1]
+        ma_limit_pcw = maximum_chromas[(hue_cw, value_plus, code_cw)]
+        ma_limit_pccw = maximum_chromas[(hue_ccw, value_plus, code_ccw)]
         max_chroma = min(ma_limit_mcw,
                          ma_limit_mccw,
                          ma_limit_pcw,
@@ -2058,3 +3533,623 @@ def munsell_specification_to_xy(specification):
                                    (y_minus, y_plus))(chroma)
 
         return x, y
+
+
+def munsell_specifications_to_xy(specification):
+    """
+    Converts given *Munsell* *Colorlab* specifications arrays to *xy*
+    chromaticity coordinates by interpolating over *Munsell Renotation System*
+    data, array counterpart of :func:`munsell_specification_to_xy`
+    definition.
+
+    Parameters
+    ----------
+    specification : array_like, (..., 4)
+        *Munsell* *Colorlab* specifications arrays with columns
+        (hue, value, chroma, code), grey specifications have a chroma of 0.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        *xy* chromaticity coordinates, *nan* for specifications that can't be
+        converted.
+
+    Notes
+    -----
+    -   Input *Munsell* *Colorlab* specifications value must be an integer in
+        domain [0, 10].
+    -   Output *xy* chromaticity coordinates are in domain [0, 1].
+
+    Examples
+    --------
+    >>> spc = np.array([[2.1, 8.0, 17.9, 4], [np.nan, 8.0, 0.0, np.nan]])
+    >>> munsell_specifications_to_xy(spc)  # doctest: +ELLIPSIS
+    array([[ 0.440063...,  0.552242...],
+           [ 0.31006  ,  0.31616  ]])
+    """
+
+    specification = np.asarray(specification)
+    shape = specification.shape[:-1]
+    hue, value, chroma, code = tsplit(np.reshape(specification, (-1, 4)))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xy = _munsell_specification_to_xy_array(hue, value, chroma, code)
+    xy[chroma == 0] = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    return np.reshape(xy, shape + (2,))
+
+
+def _linear_interpolation(x, x_0, x_1, y_0, y_1):
+    """
+    Linearly interpolates given points between given independent and dependent
+    variables pairs the same way :func:`np.interp` definition does.
+
+    Parameters
+    ----------
+    x : ndarray
+        Points to interpolate at.
+    x_0 : ndarray
+        Lower independent variable.
+    x_1 : ndarray
+        Upper independent variable.
+    y_0 : ndarray
+        Lower dependent variable.
+    y_1 : ndarray
+        Upper dependent variable.
+
+    Returns
+    -------
+    ndarray
+        Interpolated points.
+    """
+
+    slope = (y_1 - y_0) / (x_1 - x_0)
+
+    return slope * (x - x_0) + y_0
+
+
+def _xyY_from_renotation_array(hue, value, chroma, code):
+    """
+    Returns given *Munsell* *Colorlab* specifications components *CIE xyY*
+    colourspace vectors from *Munsell Renotation System* integer values data.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    value : ndarray
+        *Munsell* *Colorlab* specifications value.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications chroma.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE xyY* colourspace vectors, *nan* for specifications that don't
+        exist in *Munsell Renotation System* data.
+    """
+
+    xyY_table, _chromas_table = _munsell_renotation_tables()
+
+    i_h = np.around(hue / 2.5) - 1
+    i_v = np.around(value)
+    i_c = np.around(chroma / 2)
+    i_k = np.around(code)
+    with np.errstate(invalid='ignore'):
+        exists = np.logical_and.reduce((
+            (i_h + 1) * 2.5 == hue, i_h >= 0, i_h <= 3,
+            i_v == value, i_v >= 0, i_v <= 10,
+            i_c * 2 == chroma, i_c >= 0, i_c <= 25,
+            i_k == code, i_k >= 1, i_k <= 10))
+
+    xyY = np.full(np.shape(hue) + (3,), np.nan)
+    xyY[exists] = xyY_table[i_h[exists].astype(np.int_),
+                            i_v[exists].astype(np.int_),
+                            i_c[exists].astype(np.int_),
+                            i_k[exists].astype(np.int_)]
+
+    return xyY
+
+
+def _bounding_hues_from_renotation_array(hue, code):
+    """
+    Returns for given hues the two bounding hues from
+    *Munsell Renotation System* data, array counterpart of
+    :func:`bounding_hues_from_renotation` definition.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    tuple
+        Clockwise and counter clockwise bounding hues and codes.
+    """
+
+    hue_cw = 2.5 * np.floor(hue / 2.5)
+    hue_ccw = (hue_cw + 2.5) % 10
+    hue_ccw = np.where(hue_ccw == 0, 10, hue_ccw)
+
+    code_next = (code + 1) % 10
+    code_cw = np.where(hue_cw == 0, np.where(code_next == 0, 10, code_next),
+                       code)
+    hue_cw = np.where(hue_cw == 0, 10, hue_cw)
+    code_ccw = code
+
+    standard = hue % 2.5 == 0
+    hue_standard = np.where(hue == 0, 10, hue)
+    code_standard = np.where(hue == 0, code_next, code)
+
+    hue_cw = np.where(standard, hue_standard, hue_cw)
+    code_cw = np.where(standard, code_standard, code_cw)
+    hue_ccw = np.where(standard, hue_standard, hue_ccw)
+    code_ccw = np.where(standard, code_standard, code_ccw)
+
+    return (hue_cw, code_cw), (hue_ccw, code_ccw)
+
+
+def _hue_to_hue_angle_array(hue, code):
+    """
+    Converts from the *Munsell* *Colorlab* specifications hue to hue angle in
+    degrees, array counterpart of :func:`hue_to_hue_angle` definition.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    ndarray
+        Hue angles in degrees.
+    """
+
+    single_hue = ((17 - code) % 10 + (hue / 10) - 0.5) % 10
+
+    return np.interp(single_hue,
+                     (0, 2, 3, 4, 5, 6, 8, 9, 10),
+                     (0, 45, 70, 135, 160, 225, 255, 315, 360))
+
+
+def _hue_angle_to_hue_array(hue_angle):
+    """
+    Converts from hue angle in degrees to the *Munsell* *Colorlab*
+    specifications hue, array counterpart of :func:`hue_angle_to_hue`
+    definition.
+
+    Parameters
+    ----------
+    hue_angle : ndarray
+        Hue angles in degrees.
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specifications hue and code.
+    """
+
+    single_hue = np.interp(hue_angle,
+                           (0, 45, 70, 135, 160, 225, 255, 315, 360),
+                           (0, 2, 3, 4, 5, 6, 8, 9, 10))
+
+    code = np.array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8, 7])[np.searchsorted(
+        (0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5), single_hue)]
+
+    hue = (10 * (single_hue % 1) + 5) % 10
+    hue = np.where(hue == 0, 10, hue)
+
+    return hue, code
+
+
+def _maximum_chroma_from_renotation_array(hue, value, code):
+    """
+    Returns the maximum *Munsell* chromas from *Munsell Renotation System* data
+    using given *Munsell* *Colorlab* specifications hue, value and code, array
+    counterpart of :func:`maximum_chroma_from_renotation` definition.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    value : ndarray
+        *Munsell* *Colorlab* specifications value.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    ndarray
+        Maximum chromas, *nan* for values outside domain [1, 10] or
+        specifications that don't exist in *Munsell Renotation System* data.
+    """
+
+    _xyY_table, chromas_table = _munsell_renotation_tables()
+
+    def maximum_chroma(hue, value, code):
+        """
+        Returns the maximum chromas from the maximum chromas table.
+        """
+
+        i_h = np.around(hue / 2.5) - 1
+        i_k = np.around(code)
+        with np.errstate(invalid='ignore'):
+            exists = np.logical_and.reduce((
+                (i_h + 1) * 2.5 == hue, i_h >= 0, i_h <= 3,
+                value >= 0, value <= 10,
+                i_k == code, i_k >= 1, i_k <= 10))
+
+        chroma = np.full(np.shape(hue), np.nan)
+        chroma[exists] = chromas_table[i_h[exists].astype(np.int_),
+                                       value[exists].astype(np.int_),
+                                       i_k[exists].astype(np.int_)]
+
+        return chroma
+
+    integer = value % 1 == 0
+    value_minus = np.where(integer, value, np.floor(value))
+    value_plus = np.where(integer, value, value_minus + 1)
+
+    (hue_cw, code_cw), (hue_ccw, code_ccw) = (
+        _bounding_hues_from_renotation_array(hue, code))
+
+    ma_limit_mcw = maximum_chroma(hue_cw, value_minus, code_cw)
+    ma_limit_mccw = maximum_chroma(hue_ccw, value_minus, code_ccw)
+
+    ma_limit_pcw = maximum_chroma(hue_cw, value_plus, code_cw)
+    ma_limit_pccw = maximum_chroma(hue_ccw, value_plus, code_ccw)
+
+    L = luminance_ASTMD153508(value)
+    L9 = luminance_ASTMD153508(9)
+    L10 = luminance_ASTMD153508(10)
+
+    max_chroma = np.where(
+        value_plus <= 9,
+        np.minimum(np.minimum(ma_limit_mcw, ma_limit_mccw),
+                   np.minimum(ma_limit_pcw, ma_limit_pccw)),
+        np.minimum(_linear_interpolation(L, L9, L10, ma_limit_mcw, 0),
+                   _linear_interpolation(L, L9, L10, ma_limit_mccw, 0)))
+
+    max_chroma = np.where(value < 1, np.nan, max_chroma)
+
+    return np.where(value >= 9.99, 0, max_chroma)
+
+
+def _interpolation_method_from_renotation_ovoid_array(hue, value, chroma,
+                                                     code):
+    """
+    Returns the interpolation methods to use when drawing ovoids through data
+    points in the *Munsell Renotation System* data from given *Munsell*
+    *Colorlab* specifications components, array counterpart of
+    :func:`interpolation_method_from_renotation_ovoid` definition.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    value : ndarray
+        *Munsell* *Colorlab* specifications value.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications chroma.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    tuple
+        Interpolation methods with 0 standing for no interpolation, 1 for
+        linear interpolation and 2 for radial interpolation, and whether the
+        specifications are valid, i.e. their value is an integer in domain
+        [0, 10] and their chroma an even integer in domain [2, 50].
+    """
+
+    with np.errstate(invalid='ignore'):
+        valid = np.logical_and.reduce((
+            np.isfinite(hue), np.isfinite(code),
+            value >= 0, value <= 10,
+            np.abs(value - np.around(value)) <= INTEGER_THRESHOLD,
+            chroma >= 2, chroma <= 50,
+            np.abs(2 * (chroma / 2 - np.around(chroma / 2))) <=
+            INTEGER_THRESHOLD))
+
+    hue, value, chroma, code = (hue[valid], value[valid], chroma[valid],
+                                code[valid])
+
+    ASTM_hue = 10 * ((7 - code) % 10) + hue
+    ASTM_hue = np.where(ASTM_hue == 0, 100, ASTM_hue)
+    i_h = np.where(ASTM_hue % 2.5 == 0,
+                   2 * np.around(ASTM_hue / 2.5),
+                   2 * np.floor(ASTM_hue / 2.5) + 1)
+
+    method = np.zeros(valid.shape, dtype=np.int_)
+    method[valid] = _munsell_interpolation_methods_table()[
+        np.around(value).astype(np.int_),
+        np.around(chroma / 2).astype(np.int_),
+        np.clip(i_h, 0, 80).astype(np.int_)]
+
+    return method, valid
+
+
+def _xy_from_renotation_ovoid_array(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications components to *xy*
+    chromaticity coordinates on *Munsell Renotation System* ovoids, array
+    counterpart of :func:`xy_from_renotation_ovoid` definition.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    value : ndarray
+        *Munsell* *Colorlab* specifications value.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications chroma.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        *xy* chromaticity coordinates, *nan* for specifications whose value is
+        not an integer in domain [1, 9], whose chroma is not an even integer
+        in domain [2, 50] or whose data is missing.
+    """
+
+    with np.errstate(invalid='ignore'):
+        valid = np.logical_and.reduce((
+            np.isfinite(hue), np.isfinite(code),
+            value >= 1, value <= 9,
+            np.abs(value - np.around(value)) <= INTEGER_THRESHOLD,
+            chroma >= 2, chroma <= 50,
+            np.abs(2 * (chroma / 2 - np.around(chroma / 2))) <=
+            INTEGER_THRESHOLD))
+
+    value = np.where(valid, np.around(value), np.nan)
+    chroma = np.where(valid, 2 * np.around(chroma / 2), np.nan)
+
+    xy = np.full(np.shape(hue) + (2,), np.nan)
+
+    # Checking if renotation data is available without interpolation using
+    # given threshold.
+    threshold = 0.001
+    standard = np.any(
+        np.abs(hue[..., np.newaxis] - np.array([0, 2.5, 5, 7.5, 10])) <
+        threshold, axis=-1)
+
+    xy[standard] = _xyY_from_renotation_array(
+        2.5 * np.around(hue[standard] / 2.5),
+        value[standard],
+        chroma[standard],
+        code[standard])[..., 0:2]
+
+    interpolated = np.logical_and(valid, ~standard)
+    hue = hue[interpolated]
+    value = value[interpolated]
+    chroma = chroma[interpolated]
+    code = code[interpolated]
+
+    (hue_minus, code_minus), (hue_plus, code_plus) = (
+        _bounding_hues_from_renotation_array(hue, code))
+
+    x_grey, y_grey = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    x_minus, y_minus, Y_minus = tsplit(_xyY_from_renotation_array(
+        hue_minus, value, chroma, code_minus))
+    _z_minus, theta_minus, rho_minus = tsplit(cartesian_to_cylindrical(
+        tstack((x_minus - x_grey, y_minus - y_grey, Y_minus))))
+    theta_minus = np.degrees(theta_minus)
+
+    x_plus, y_plus, Y_plus = tsplit(_xyY_from_renotation_array(
+        hue_plus, value, chroma, code_plus))
+    _z_plus, theta_plus, rho_plus = tsplit(cartesian_to_cylindrical(
+        tstack((x_plus - x_grey, y_plus - y_grey, Y_plus))))
+    theta_plus = np.degrees(theta_plus)
+
+    lower_hue_angle = _hue_to_hue_angle_array(hue_minus, code_minus)
+    hue_angle = _hue_to_hue_angle_array(hue, code)
+    upper_hue_angle = _hue_to_hue_angle_array(hue_plus, code_plus)
+
+    theta_plus = np.where(theta_minus - theta_plus > 180,
+                          theta_plus + 360,
+                          theta_plus)
+
+    lower_hue_angle = np.where(lower_hue_angle == 0, 360, lower_hue_angle)
+
+    hue_angle = np.where(np.logical_and(lower_hue_angle > upper_hue_angle,
+                                        lower_hue_angle <= hue_angle),
+                         hue_angle - 360,
+                         hue_angle)
+    lower_hue_angle = np.where(lower_hue_angle > upper_hue_angle,
+                               lower_hue_angle - 360,
+                               lower_hue_angle)
+
+    interpolation_method, _valid = (
+        _interpolation_method_from_renotation_ovoid_array(
+            hue, value, chroma, code))
+
+    xy_interpolated = np.full(np.shape(hue) + (2,), np.nan)
+
+    linear = interpolation_method == 1
+    xy_interpolated[linear] = tstack((
+        _linear_interpolation(hue_angle[linear],
+                              lower_hue_angle[linear],
+                              upper_hue_angle[linear],
+                              x_minus[linear],
+                              x_plus[linear]),
+        _linear_interpolation(hue_angle[linear],
+                              lower_hue_angle[linear],
+                              upper_hue_angle[linear],
+                              y_minus[linear],
+                              y_plus[linear])))
+
+    radial = interpolation_method == 2
+    theta = _linear_interpolation(hue_angle[radial],
+                                  lower_hue_angle[radial],
+                                  upper_hue_angle[radial],
+                                  theta_minus[radial],
+                                  theta_plus[radial])
+    rho = _linear_interpolation(hue_angle[radial],
+                                lower_hue_angle[radial],
+                                upper_hue_angle[radial],
+                                rho_minus[radial],
+                                rho_plus[radial])
+    xy_interpolated[radial] = tstack((
+        rho * np.cos(np.radians(theta)) + x_grey,
+        rho * np.sin(np.radians(theta)) + y_grey))
+
+    xy[interpolated] = xy_interpolated
+
+    return xy
+
+
+def _munsell_specification_to_xy_array(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications components with
+    integer value to *xy* chromaticity coordinates, array counterpart of
+    :func:`munsell_specification_to_xy` definition.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    value : ndarray
+        *Munsell* *Colorlab* specifications value.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications chroma.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        *xy* chromaticity coordinates, *nan* for specifications that can't be
+        converted.
+    """
+
+    with np.errstate(invalid='ignore'):
+        valid = np.logical_and.reduce((
+            value >= 0, value <= 10,
+            np.abs(value - np.around(value)) <= INTEGER_THRESHOLD))
+
+    value = np.where(valid, np.around(value), np.nan)
+
+    even = chroma % 2 == 0
+    chroma_minus = np.where(even, chroma, 2 * np.floor(chroma / 2))
+    chroma_plus = np.where(even, chroma, chroma_minus + 2)
+
+    # Smallest chroma ovoid collapses to illuminant chromaticity coordinates.
+    x_minus, y_minus = tsplit(np.where(
+        (chroma_minus == 0)[..., np.newaxis],
+        MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES,
+        _xy_from_renotation_ovoid_array(hue, value, chroma_minus, code)))
+
+    x_plus, y_plus = tsplit(
+        _xy_from_renotation_ovoid_array(hue, value, chroma_plus, code))
+
+    x = np.where(chroma_minus == chroma_plus,
+                 x_minus,
+                 _linear_interpolation(
+                     chroma, chroma_minus, chroma_plus, x_minus, x_plus))
+    y = np.where(chroma_minus == chroma_plus,
+                 y_minus,
+                 _linear_interpolation(
+                     chroma, chroma_minus, chroma_plus, y_minus, y_plus))
+
+    xy = tstack((x, y))
+    xy[np.isnan(x_plus)] = np.nan
+
+    return xy
+
+
+def _munsell_specification_to_xyY_array(hue, value, chroma, code):
+    """
+    Converts given chromatic *Munsell* *Colorlab* specifications components to
+    *CIE xyY* colourspace, array counterpart of
+    :func:`munsell_specification_to_xyY` definition.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hue.
+    value : ndarray
+        *Munsell* *Colorlab* specifications value.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications chroma.
+    code : ndarray
+        *Munsell* *Colorlab* specifications code.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE xyY* colourspace arrays, *nan* for specifications that can't be
+        converted.
+    """
+
+    with np.errstate(invalid='ignore'):
+        valid = np.logical_and.reduce((
+            hue >= 0, hue <= 10, value >= 0, value <= 10))
+
+    Y = luminance_ASTMD153508(value)
+
+    integer = np.abs(value - np.around(value)) <= INTEGER_THRESHOLD
+    value_minus = np.where(integer, np.around(value), np.floor(value))
+    value_plus = np.where(integer, np.around(value), value_minus + 1)
+
+    x_minus, y_minus = tsplit(_munsell_specification_to_xy_array(
+        hue, value_minus, chroma, code))
+
+    x_plus, y_plus = tsplit(np.where(
+        (value_plus == 10)[..., np.newaxis],
+        MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES,
+        _munsell_specification_to_xy_array(hue, value_plus, chroma, code)))
+
+    Y_minus = luminance_ASTMD153508(value_minus)
+    Y_plus = luminance_ASTMD153508(value_plus)
+
+    x = np.where(value_minus == value_plus,
+                 x_minus,
+                 _linear_interpolation(Y, Y_minus, Y_plus, x_minus, x_plus))
+    y = np.where(value_minus == value_plus,
+                 y_minus,
+                 _linear_interpolation(Y, Y_minus, Y_plus, y_minus, y_plus))
+
+    xyY = tstack((x, y, Y / 100))
+    xyY[~valid] = np.nan
+
+    return xyY
+
+
+def _LCHab_to_munsell_specification_array(LCHab):
+    """
+    Converts from *CIE LCHab* colourspace to approximate *Munsell* *Colorlab*
+    specifications components, array counterpart of
+    :func:`LCHab_to_munsell_specification` definition.
+
+    Parameters
+    ----------
+    LCHab : ndarray, (..., 3)
+        *CIE LCHab* colourspace arrays.
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specifications hue, value, chroma and code.
+    """
+
+    L, C, Hab = tsplit(LCHab)
+
+    code = np.array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8])[np.searchsorted(
+        (36, 72, 108, 144, 180, 216, 252, 288, 324), Hab)]
+    code = np.where(Hab == 0, 8, code)
+
+    hue = np.interp(Hab % 36, (0, 36), (0, 10))
+    hue = np.where(hue == 0, 10, hue)
+
+    return hue, L / 10, C / 5, code
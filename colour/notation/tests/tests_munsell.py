@@ -8,15 +8,22 @@ Defines unit tests for :mod:`colour.notation.munsell` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
+from itertools import permutations
 
 from colour.notation.munsell import (
     parse_munsell_colour,
     is_grey_munsell_colour,
     normalize_munsell_specification)
 from colour.notation.munsell import (
+    parse_munsell_colours,
     munsell_colour_to_munsell_specification,
-    munsell_specification_to_munsell_colour)
+    munsell_colours_to_munsell_specifications,
+    munsell_specification_to_munsell_colour,
+    munsell_specifications_to_munsell_colours)
 from colour.notation.munsell import (
     xyY_from_renotation,
     is_specification_in_renotation)
@@ -25,14 +32,25 @@ from colour.notation.munsell import hue_to_hue_angle, hue_angle_to_hue
 from colour.notation.munsell import hue_to_ASTM_hue
 from colour.notation.munsell import (
     interpolation_method_from_renotation_ovoid,
-    xy_from_renotation_ovoid)
+    interpolation_methods_from_renotation_ovoids,
+    xy_from_renotation_ovoid,
+    xy_from_renotation_ovoids)
 from colour.notation.munsell import LCHab_to_munsell_specification
 from colour.notation.munsell import maximum_chroma_from_renotation
-from colour.notation.munsell import munsell_specification_to_xy
+from colour.notation.munsell import (
+    munsell_specification_to_xy,
+    munsell_specifications_to_xy)
 from colour.notation.munsell import (
     munsell_specification_to_xyY,
-    xyY_to_munsell_specification)
+    munsell_specifications_to_xyY,
+    xyY_to_munsell_specification,
+    xyY_to_munsell_specifications)
+from colour.notation.munsell import (
+    MunsellInverseGrid,
+    munsell_inverse_grid,
+    xyY_to_munsell_colour)
 from colour.notation import (
+    MUNSELL_COLOURS_ALL,
     munsell_value_Priest1920,
     munsell_value_Munsell1933,
     munsell_value_Moon1943,
@@ -73,6 +91,7 @@ __all__ = ['MUNSELL_SPECIFICATIONS',
            'TestMunsellSpecification_to_xyY',
            'TestMunsellColour_to_xyY',
            'TestxyY_to_munsell_specification',
+           'TestxyY_to_munsell_specifications',
            'TestxyY_to_munsell_colour',
            'TestParseMunsellColour',
            'TestIsGreyMunsellColour',
@@ -4514,6 +4533,69 @@ class TestMunsellSpecification_to_xyY(unittest.TestCase):
                 decimal=7)
 
 
+class TestMunsellSpecifications_to_xyY(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.munsell_specifications_to_xyY`
+    definition unit tests methods.
+    """
+
+    def test_munsell_specifications_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.munsell_specifications_to_xyY`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            munsell_specifications_to_xyY(np.array(MUNSELL_SPECIFICATIONS)),
+            np.array(MUNSELL_COLOURS_TO_XYY),
+            decimal=7)
+
+        specification = np.array([(np.nan, value, 0, np.nan)
+                                  for value in MUNSELL_GREYS_SPECIFICATIONS])
+        np.testing.assert_almost_equal(
+            munsell_specifications_to_xyY(specification),
+            np.array(MUNSELL_GREYS_TO_XYY),
+            decimal=7)
+
+    def test_n_dimensional_munsell_specifications_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.munsell_specifications_to_xyY`
+        definition n-dimensional arrays support.
+        """
+
+        specification = np.array([2.1, 8.0, 17.9, 4])
+        xyY = munsell_specifications_to_xyY(specification)
+        np.testing.assert_almost_equal(
+            xyY,
+            munsell_specification_to_xyY(tuple(specification)),
+            decimal=7)
+
+        specification = np.tile(specification, (6, 1))
+        xyY = np.tile(xyY, (6, 1))
+        np.testing.assert_almost_equal(
+            munsell_specifications_to_xyY(specification),
+            xyY,
+            decimal=7)
+
+        specification = np.reshape(specification, (2, 3, 4))
+        xyY = np.reshape(xyY, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            munsell_specifications_to_xyY(specification),
+            xyY,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_munsell_specifications_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.munsell_specifications_to_xyY`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 4, r=4))))
+        munsell_specifications_to_xyY(cases)
+
+
 class TestMunsellColour_to_xyY(unittest.TestCase):
     """
     Defines :func:`colour.notation.munsell.munsell_colour_to_xyY` definition
@@ -4559,6 +4641,301 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
                 specification,
                 decimal=7)
 
+    def test_grid_xyY_to_munsell_specification(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition approximation with an inverse *Munsell* lookup grid.
+        """
+
+        grid = munsell_inverse_grid(0.05, 1)
+
+        xyY = np.array([0.38736945, 0.35751656, 0.59362000])
+        hue, value, chroma, code = xyY_to_munsell_specification(xyY, grid, 4)
+        np.testing.assert_almost_equal(
+            (hue, value, chroma),
+            xyY_to_munsell_specification(xyY)[0:3],
+            decimal=1)
+        self.assertEqual(code, 6)
+        self.assertIsInstance(code, int)
+
+        for xyY, specification in XYY_TO_MUNSELL_GREYS_SPECIFICATIONS:
+            np.testing.assert_almost_equal(
+                xyY_to_munsell_specification(xyY, grid),
+                specification,
+                decimal=7)
+
+        self.assertRaises(ValueError,
+                          xyY_to_munsell_specification,
+                          np.array([0.1, 0.8, 0.5]),
+                          grid)
+
+
+class TestxyY_to_munsell_specifications(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.xyY_to_munsell_specifications`
+    definition unit tests methods.
+    """
+
+    def test_xyY_to_munsell_specifications(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specifications`
+        definition.
+        """
+
+        xyY = np.array([xyY for xyY, _specification in
+                        XYY_TO_MUNSELL_SPECIFICATIONS])
+        specification, converged = xyY_to_munsell_specifications(xyY)
+        np.testing.assert_almost_equal(
+            specification,
+            np.array([specification for _xyY, specification in
+                      XYY_TO_MUNSELL_SPECIFICATIONS]),
+            decimal=7)
+        self.assertTrue(np.all(converged))
+
+        xyY = np.array([xyY for xyY, _specification in
+                        XYY_TO_MUNSELL_GREYS_SPECIFICATIONS])
+        specification, converged = xyY_to_munsell_specifications(xyY)
+        np.testing.assert_almost_equal(
+            specification[..., 1],
+            np.array([specification for _xyY, specification in
+                      XYY_TO_MUNSELL_GREYS_SPECIFICATIONS]),
+            decimal=7)
+        self.assertTrue(np.all(np.isnan(specification[..., 0])))
+        self.assertTrue(np.all(specification[..., 2] == 0))
+        self.assertTrue(np.all(converged))
+
+        specification, converged = xyY_to_munsell_specifications(
+            np.array(NON_CONVERGING_XYY))
+        self.assertTrue(np.all(np.isnan(specification)))
+        self.assertFalse(np.any(converged))
+
+    def test_n_dimensional_xyY_to_munsell_specifications(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specifications`
+        definition n-dimensional arrays support.
+        """
+
+        xyY = np.array([0.38736945, 0.35751656, 0.59362000])
+        specification, converged = xyY_to_munsell_specifications(xyY)
+        np.testing.assert_almost_equal(
+            specification,
+            np.array(xyY_to_munsell_specification(xyY)),
+            decimal=7)
+        self.assertTrue(converged)
+
+        xyY = np.tile(xyY, (6, 1))
+        specification = np.tile(specification, (6, 1))
+        np.testing.assert_almost_equal(
+            xyY_to_munsell_specifications(xyY)[0],
+            specification,
+            decimal=7)
+
+        xyY = np.reshape(xyY, (2, 3, 3))
+        specification = np.reshape(specification, (2, 3, 4))
+        np.testing.assert_almost_equal(
+            xyY_to_munsell_specifications(xyY)[0],
+            specification,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_xyY_to_munsell_specifications(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specifications`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        specification, converged = xyY_to_munsell_specifications(cases)
+        self.assertTupleEqual(specification.shape, (len(cases), 4))
+
+
+class TestMunsellInverseGrid(unittest.TestCase):
+    """
+    Defines :class:`colour.notation.munsell.MunsellInverseGrid` class unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__grid = munsell_inverse_grid(0.05, 1)
+
+        self.__xyY = np.array([xyY for xyY, _specification in
+                               XYY_TO_MUNSELL_SPECIFICATIONS])
+        self.__specification = np.array(
+            [specification for _xyY, specification in
+             XYY_TO_MUNSELL_SPECIFICATIONS])
+
+    def __assert_specifications_close(self, a, b, hue, chroma):
+        """
+        Asserts that given *Munsell* *Colorlab* specifications *ASTM* hue and
+        chroma are within given deviations.
+        """
+
+        ASTM_hue_a = 10 * ((7 - a[..., 3]) % 10) + a[..., 0]
+        ASTM_hue_b = 10 * ((7 - b[..., 3]) % 10) + b[..., 0]
+        self.assertLess(
+            np.max(np.abs((ASTM_hue_a - ASTM_hue_b + 50) % 100 - 50)), hue)
+        self.assertLess(np.max(np.abs(a[..., 2] - b[..., 2])), chroma)
+        np.testing.assert_almost_equal(a[..., 1], b[..., 1], decimal=7)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('xy_step',
+                               'value_step',
+                               'x',
+                               'y',
+                               'value',
+                               'nodes')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(MunsellInverseGrid))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('xyY_to_munsell_specification',)
+
+        for method in required_methods:
+            self.assertIn(method, dir(MunsellInverseGrid))
+
+    def test_read_only_attributes(self):
+        """
+        Tests :class:`colour.notation.munsell.MunsellInverseGrid` class
+        attributes are read only.
+        """
+
+        for attribute in ('xy_step', 'value_step', 'x', 'y', 'value',
+                          'nodes'):
+            self.assertRaises(AttributeError,
+                              setattr,
+                              self.__grid,
+                              attribute,
+                              None)
+
+    def test_nodes(self):
+        """
+        Tests :attr:`colour.notation.munsell.MunsellInverseGrid.nodes`
+        attribute.
+        """
+
+        self.assertTupleEqual(self.__grid.nodes.shape, (16, 18, 10, 2))
+        np.testing.assert_almost_equal(self.__grid.x[[0, -1]], (0, 0.75))
+        np.testing.assert_almost_equal(self.__grid.y[[0, -1]], (0, 0.85))
+        np.testing.assert_almost_equal(self.__grid.value[[0, -1]], (1, 10))
+
+        grid = MunsellInverseGrid(0.05, 1, self.__grid.nodes)
+        np.testing.assert_equal(grid.nodes, self.__grid.nodes)
+
+    def test_xyY_to_munsell_specification(self):
+        """
+        Tests :meth:`colour.notation.munsell.MunsellInverseGrid.\
+xyY_to_munsell_specification` method.
+        """
+
+        self.__assert_specifications_close(
+            self.__grid.xyY_to_munsell_specification(self.__xyY),
+            self.__specification,
+            5,
+            1.5)
+
+        self.__assert_specifications_close(
+            self.__grid.xyY_to_munsell_specification(self.__xyY, 4),
+            self.__specification,
+            0.25,
+            0.25)
+
+        xyY = np.array([xyY for xyY, _specification in
+                        XYY_TO_MUNSELL_GREYS_SPECIFICATIONS])
+        specification = self.__grid.xyY_to_munsell_specification(xyY)
+        np.testing.assert_almost_equal(
+            specification[..., 1],
+            np.array([specification for _xyY, specification in
+                      XYY_TO_MUNSELL_GREYS_SPECIFICATIONS]),
+            decimal=7)
+        self.assertTrue(np.all(np.isnan(specification[..., 0])))
+        self.assertTrue(np.all(specification[..., 2] == 0))
+
+    def test_n_dimensional_xyY_to_munsell_specification(self):
+        """
+        Tests :meth:`colour.notation.munsell.MunsellInverseGrid.\
+xyY_to_munsell_specification` method n-dimensional arrays support.
+        """
+
+        xyY = np.array([0.38736945, 0.35751656, 0.59362000])
+        specification = self.__grid.xyY_to_munsell_specification(xyY)
+        self.assertTupleEqual(specification.shape, (4,))
+
+        xyY = np.tile(xyY, (6, 1))
+        specification = np.tile(specification, (6, 1))
+        np.testing.assert_almost_equal(
+            self.__grid.xyY_to_munsell_specification(xyY),
+            specification,
+            decimal=7)
+
+        xyY = np.reshape(xyY, (2, 3, 3))
+        specification = np.reshape(specification, (2, 3, 4))
+        np.testing.assert_almost_equal(
+            self.__grid.xyY_to_munsell_specification(xyY),
+            specification,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_xyY_to_munsell_specification(self):
+        """
+        Tests :meth:`colour.notation.munsell.MunsellInverseGrid.\
+xyY_to_munsell_specification` method nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        specification = self.__grid.xyY_to_munsell_specification(cases)
+        self.assertTupleEqual(specification.shape, (len(cases), 4))
+
+
+class TestMunsellInverseGridDefinition(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.munsell_inverse_grid` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self.__temporary_directory)
+
+    def test_munsell_inverse_grid(self):
+        """
+        Tests :func:`colour.notation.munsell.munsell_inverse_grid` definition.
+        """
+
+        grid = munsell_inverse_grid(0.1, 2, self.__temporary_directory)
+        self.assertIsInstance(grid, MunsellInverseGrid)
+        self.assertIs(grid, munsell_inverse_grid(0.1, 2))
+        self.assertEqual(len(os.listdir(self.__temporary_directory)), 1)
+
+        path = os.path.join(self.__temporary_directory,
+                            os.listdir(self.__temporary_directory)[0])
+        with np.load(path) as data:
+            np.testing.assert_equal(data['nodes'], grid.nodes)
+
 
 class TestxyY_to_munsell_colour(unittest.TestCase):
     """
@@ -4598,6 +4975,81 @@ class TestParseMunsellColour(unittest.TestCase):
                               (4.2, 8.1, 5.3, 6))
 
 
+class TestParseMunsellColours(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.parse_munsell_colours` definition
+    unit tests methods.
+    """
+
+    def test_parse_munsell_colours(self):
+        """
+        Tests :func:`colour.notation.munsell.parse_munsell_colours`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            parse_munsell_colours(['N5.2',
+                                   '0YR 2.0/4.0',
+                                   '4.2yr 8.1/5.3',
+                                   '4.2YR8.1 / 5.3',
+                                   '',
+                                   'Invalid']),
+            np.array([[np.nan, 5.2, 0, np.nan],
+                      [0.0, 2.0, 4.0, 6],
+                      [4.2, 8.1, 5.3, 6],
+                      [4.2, 8.1, 5.3, 6],
+                      [np.nan, np.nan, np.nan, np.nan],
+                      [np.nan, np.nan, np.nan, np.nan]]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            parse_munsell_colours(['N5.2',
+                                   '4.2YR 8.1/5.3\nN5.2',
+                                   '0YR 2.0/4.0',
+                                   'N5.2\n',
+                                   '4.2yr 8.1/5.3']),
+            np.array([[np.nan, 5.2, 0, np.nan],
+                      [np.nan, np.nan, np.nan, np.nan],
+                      [0.0, 2.0, 4.0, 6],
+                      [np.nan, np.nan, np.nan, np.nan],
+                      [4.2, 8.1, 5.3, 6]]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            parse_munsell_colours(['N5.2\n', '\n']),
+            np.full((2, 4), np.nan),
+            decimal=7)
+
+    def test_n_dimensional_parse_munsell_colours(self):
+        """
+        Tests :func:`colour.notation.munsell.parse_munsell_colours`
+        definition n-dimensional arrays support.
+        """
+
+        munsell_colour = '4.2YR 8.1/5.3'
+        specification = parse_munsell_colours(munsell_colour)
+        np.testing.assert_almost_equal(
+            specification,
+            parse_munsell_colour(munsell_colour),
+            decimal=7)
+
+        munsell_colour = np.tile(munsell_colour, 6)
+        specification = np.tile(specification, (6, 1))
+        np.testing.assert_almost_equal(
+            parse_munsell_colours(munsell_colour),
+            specification,
+            decimal=7)
+
+        munsell_colour = np.reshape(munsell_colour, (2, 3))
+        specification = np.reshape(specification, (2, 3, 4))
+        np.testing.assert_almost_equal(
+            parse_munsell_colours(munsell_colour),
+            specification,
+            decimal=7)
+
+        self.assertTupleEqual(parse_munsell_colours([]).shape, (0, 4))
+
+
 class TestIsGreyMunsellColour(unittest.TestCase):
     """
     Defines :func:`colour.notation.munsell.is_grey_munsell_colour` definition
@@ -4677,6 +5129,40 @@ munsell_colour_to_munsell_specification` definition.
             2)
 
 
+class TestMunsellColoursToMunsellSpecifications(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.\
+munsell_colours_to_munsell_specifications` definition unit tests methods.
+    """
+
+    def test_munsell_colours_to_munsell_specifications(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_colours_to_munsell_specifications` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            munsell_colours_to_munsell_specifications(['0.0YR 2.0/4.0',
+                                                       '0.0RP 2.0/4.0',
+                                                       '10.0B 2.0/4.0',
+                                                       'N5.2',
+                                                       '0.0YR 2.0/0.0']),
+            np.array([[10.0, 2.0, 4.0, 7],
+                      [10.0, 2.0, 4.0, 9],
+                      [10.0, 2.0, 4.0, 1],
+                      [np.nan, 5.2, 0, np.nan],
+                      [np.nan, 2.0, 0, np.nan]]),
+            decimal=7)
+
+        munsell_colours = ['{0} {1}/{2}'.format(*colour[0])
+                           for colour in MUNSELL_COLOURS_ALL]
+        np.testing.assert_almost_equal(
+            munsell_colours_to_munsell_specifications(munsell_colours),
+            np.array([munsell_colour_to_munsell_specification(munsell_colour)
+                      for munsell_colour in munsell_colours]),
+            decimal=7)
+
+
 class TestMunsellSpecificationToMunsellColour(unittest.TestCase):
     """
     Defines :func:`colour.notation.munsell.\
@@ -4705,6 +5191,77 @@ munsell_specification_to_munsell_colour` definition.
                          'N5.2')
 
 
+class TestMunsellSpecificationsToMunsellColours(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.\
+munsell_specifications_to_munsell_colours` definition unit tests methods.
+    """
+
+    def test_munsell_specifications_to_munsell_colours(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_specifications_to_munsell_colours` definition.
+        """
+
+        self.assertListEqual(
+            munsell_specifications_to_munsell_colours(
+                np.array([[10, 2.0, 4.0, 7],
+                          [10.0, 2.0, 4.0, 9],
+                          [10.0, 2.0, 4.0, 1],
+                          [0.0, 2.0, 4.0, 6],
+                          [np.nan, 5.2, 0, np.nan],
+                          [12.0, 2.0, 4.0, 1]])).tolist(),
+            ['10.0R 2.0/4.0',
+             '10.0P 2.0/4.0',
+             '10.0B 2.0/4.0',
+             '10.0R 2.0/4.0',
+             'N5.2',
+             ''])
+
+        specification = np.array(MUNSELL_SPECIFICATIONS)
+        self.assertListEqual(
+            munsell_specifications_to_munsell_colours(
+                specification, 2, 3, 4).tolist(),
+            [munsell_specification_to_munsell_colour(
+                tuple(specification_s), 2, 3, 4)
+             for specification_s in specification])
+
+    def test_n_dimensional_munsell_specifications_to_munsell_colours(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_specifications_to_munsell_colours` definition n-dimensional arrays
+        support.
+        """
+
+        specification = np.array([10, 2.0, 4.0, 7])
+        munsell_colour = munsell_specifications_to_munsell_colours(
+            specification)
+        self.assertEqual(munsell_colour, '10.0R 2.0/4.0')
+
+        specification = np.tile(specification, (6, 1))
+        munsell_colour = np.tile(munsell_colour, 6)
+        np.testing.assert_equal(
+            munsell_specifications_to_munsell_colours(specification),
+            munsell_colour)
+
+        specification = np.reshape(specification, (2, 3, 4))
+        munsell_colour = np.reshape(munsell_colour, (2, 3))
+        np.testing.assert_equal(
+            munsell_specifications_to_munsell_colours(specification),
+            munsell_colour)
+
+    @ignore_numpy_errors
+    def test_nan_munsell_specifications_to_munsell_colours(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_specifications_to_munsell_colours` definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 4, r=4))))
+        munsell_specifications_to_munsell_colours(cases)
+
+
 class Test_xyY_fromRenotation(unittest.TestCase):
     """
     Defines :func:`colour.notation.munsell.xyY_from_renotation` definition
@@ -4726,6 +5283,14 @@ class Test_xyY_fromRenotation(unittest.TestCase):
         self.assertTupleEqual(xyY_from_renotation((7.5, 0.2, 2.0, 4)),
                               (0.262, 0.837, 0.237))
 
+        self.assertTupleEqual(
+            xyY_from_renotation(np.array([2.5, 0.2, 2.0, 4])),
+            (0.713, 1.414, 0.237))
+
+        self.assertRaises(ValueError,
+                          xyY_from_renotation,
+                          (25.0, 0.2, 2.0, 4))
+
 
 class TestIsSpecificationInRenotation(unittest.TestCase):
     """
@@ -4745,6 +5310,11 @@ class TestIsSpecificationInRenotation(unittest.TestCase):
 
         self.assertFalse(is_specification_in_renotation((25.0, 0.2, 2.0, 4)))
 
+        self.assertTrue(
+            is_specification_in_renotation(np.array([2.5, 0.2, 2.0, 4])))
+
+        self.assertFalse(is_specification_in_renotation(5.2))
+
 
 class TestBoundingHuesFromRenotation(unittest.TestCase):
     """
@@ -4827,6 +5397,67 @@ interpolation_method_from_renotation_ovoid` definition.
                 MUNSELL_INTERPOLATION_METHODS[i])
 
 
+class TestInterpolationMethodsFromRenotationOvoids(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.\
+interpolation_methods_from_renotation_ovoids` definition unit tests methods.
+    """
+
+    def test_interpolation_methods_from_renotation_ovoids(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+interpolation_methods_from_renotation_ovoids` definition.
+        """
+
+        self.assertListEqual(
+            list(interpolation_methods_from_renotation_ovoids(
+                np.array(MUNSELL_EVEN_SPECIFICATIONS))),
+            list(MUNSELL_INTERPOLATION_METHODS))
+
+        specification = np.array([(hue, value, chroma, code)
+                                  for hue in np.arange(0, 10.01, 1.25)
+                                  for value in range(0, 11)
+                                  for chroma in (2, 6, 16)
+                                  for code in range(1, 11)])
+        self.assertListEqual(
+            list(interpolation_methods_from_renotation_ovoids(specification)),
+            [interpolation_method_from_renotation_ovoid(tuple(x))
+             for x in specification])
+
+        self.assertIsNone(interpolation_methods_from_renotation_ovoids(
+            np.array([np.nan, 5, 0, np.nan])).item())
+
+    def test_n_dimensional_interpolation_methods_from_renotation_ovoids(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+interpolation_methods_from_renotation_ovoids` definition n-dimensional arrays
+        support.
+        """
+
+        specification = np.array([2.5, 5.0, 12.0, 4])
+        self.assertEqual(
+            interpolation_methods_from_renotation_ovoids(specification),
+            'Radial')
+
+        specification = np.reshape(np.tile(specification, (6, 1)),
+                                   (2, 3, 4))
+        self.assertTupleEqual(
+            interpolation_methods_from_renotation_ovoids(
+                specification).shape,
+            (2, 3))
+
+    @ignore_numpy_errors
+    def test_nan_interpolation_methods_from_renotation_ovoids(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+interpolation_methods_from_renotation_ovoids` definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 4, r=4))))
+        interpolation_methods_from_renotation_ovoids(cases)
+
+
 class Test_xy_fromRenotationOvoid(unittest.TestCase):
     """
     Defines :func:`colour.notation.munsell.xy_from_renotation_ovoid` definition
@@ -4845,6 +5476,71 @@ class Test_xy_fromRenotationOvoid(unittest.TestCase):
                                  MUNSELL_XY_FROM_RENOTATION_OVOID[i])
 
 
+class Test_xy_fromRenotationOvoids(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.xy_from_renotation_ovoids`
+    definition unit tests methods.
+    """
+
+    def test_xy_from_renotation_ovoids(self):
+        """
+        Tests :func:`colour.notation.munsell.xy_from_renotation_ovoids`
+        definition.
+        """
+
+        specification, xy = zip(*[
+            (specification, MUNSELL_XY_FROM_RENOTATION_OVOID[i])
+            for i, specification in enumerate(MUNSELL_EVEN_SPECIFICATIONS)
+            if is_specification_in_renotation(specification)])
+        np.testing.assert_almost_equal(
+            xy_from_renotation_ovoids(np.array(specification)),
+            np.array(xy),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            xy_from_renotation_ovoids(np.array([np.nan, 8, 0, np.nan])),
+            np.array([0.31006, 0.31616]),
+            decimal=7)
+
+    def test_n_dimensional_xy_from_renotation_ovoids(self):
+        """
+        Tests :func:`colour.notation.munsell.xy_from_renotation_ovoids`
+        definition n-dimensional arrays support.
+        """
+
+        specification = np.array([2.5, 5.0, 12.0, 4])
+        xy = xy_from_renotation_ovoids(specification)
+        np.testing.assert_almost_equal(
+            xy,
+            xy_from_renotation_ovoid(tuple(specification)),
+            decimal=7)
+
+        specification = np.tile(specification, (6, 1))
+        xy = np.tile(xy, (6, 1))
+        np.testing.assert_almost_equal(
+            xy_from_renotation_ovoids(specification),
+            xy,
+            decimal=7)
+
+        specification = np.reshape(specification, (2, 3, 4))
+        xy = np.reshape(xy, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            xy_from_renotation_ovoids(specification),
+            xy,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_xy_from_renotation_ovoids(self):
+        """
+        Tests :func:`colour.notation.munsell.xy_from_renotation_ovoids`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 4, r=4))))
+        xy_from_renotation_ovoids(cases)
+
+
 class TestLCHabToMunsellSpecification(unittest.TestCase):
     """
     Defines :func:`colour.notation.munsell.LCHab_to_munsell_specification`
@@ -4918,5 +5614,69 @@ class TestMunsellSpecification_to_xy(unittest.TestCase):
                              (0.31006, 0.31616))
 
 
+class TestMunsellSpecifications_to_xy(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.munsell_specifications_to_xy`
+    definition unit tests methods.
+    """
+
+    def test_munsell_specifications_to_xy(self):
+        """
+        Tests :func:`colour.notation.munsell.munsell_specifications_to_xy`
+        definition.
+        """
+
+        specification, xy = zip(*MUNSELL_SPECIFICATIONS_TO_XY)
+        np.testing.assert_almost_equal(
+            munsell_specifications_to_xy(np.array(specification)),
+            np.array(xy),
+            decimal=7)
+
+        specification = np.array([(np.nan, value, 0, np.nan)
+                                  for value in range(11)])
+        np.testing.assert_almost_equal(
+            munsell_specifications_to_xy(specification),
+            np.tile((0.31006, 0.31616), (11, 1)),
+            decimal=7)
+
+    def test_n_dimensional_munsell_specifications_to_xy(self):
+        """
+        Tests :func:`colour.notation.munsell.munsell_specifications_to_xy`
+        definition n-dimensional arrays support.
+        """
+
+        specification = np.array([2.1, 8.0, 17.9, 4])
+        xy = munsell_specifications_to_xy(specification)
+        np.testing.assert_almost_equal(
+            xy,
+            munsell_specification_to_xy(tuple(specification)),
+            decimal=7)
+
+        specification = np.tile(specification, (6, 1))
+        xy = np.tile(xy, (6, 1))
+        np.testing.assert_almost_equal(
+            munsell_specifications_to_xy(specification),
+            xy,
+            decimal=7)
+
+        specification = np.reshape(specification, (2, 3, 4))
+        xy = np.reshape(xy, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            munsell_specifications_to_xy(specification),
+            xy,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_munsell_specifications_to_xy(self):
+        """
+        Tests :func:`colour.notation.munsell.munsell_specifications_to_xy`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 4, r=4))))
+        munsell_specifications_to_xy(cases)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -34,6 +34,7 @@ from colour.colorimetry import (
     D_illuminant_relative_spd,
     ILLUMINANTS,
     STANDARD_OBSERVERS_CMFS,
+    SpectralArray,
     blackbody_spd,
     spectral_to_XYZ)
 from colour.quality.dataset.vs import VS_INDEXES_TO_NAMES, VS_SPDS
@@ -135,16 +136,23 @@ def colour_quality_scale(spd_test, additional_data=False):
 
     Parameters
     ----------
-    spd_test : SpectralPowerDistribution
-        Test spectral power distribution.
+    spd_test : SpectralPowerDistribution or SpectralArray
+        Test spectral power distribution or spectral array.
     additional_data : bool, optional
         Output additional data.
 
     Returns
     -------
-    numeric or CQS_Specification
+    numeric or ndarray or CQS_Specification or list
         Color quality scale.
 
+    Notes
+    -----
+    -   Given a :class:`SpectralArray` class instance, the color quality scale
+        of each spectral power distribution is returned as an *ndarray* or as
+        a *list* of :class:`CQS_Specification` class instances if
+        *additional_data* is *True*.
+
     Examples
     --------
     >>> from colour import ILLUMINANTS_RELATIVE_SPDS
@@ -153,6 +161,14 @@ def colour_quality_scale(spd_test, additional_data=False):
     64.6860580...
     """
 
+    if isinstance(spd_test, SpectralArray):
+        specifications = [colour_quality_scale(spd, additional_data)
+                          for spd in spd_test]
+
+        return (specifications
+                if additional_data else
+                np.array(specifications))
+
     cmfs = STANDARD_OBSERVERS_CMFS.get(
         'CIE 1931 2 Degree Standard Observer')
 
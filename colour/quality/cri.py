@@ -31,6 +31,7 @@ from colour.algebra import euclidean_distance
 from colour.colorimetry import (
     D_illuminant_relative_spd,
     STANDARD_OBSERVERS_CMFS,
+    SpectralArray,
     blackbody_spd,
     spectral_to_XYZ)
 from colour.quality.dataset.tcs import TCS_INDEXES_TO_NAMES, TCS_SPDS
@@ -95,16 +96,23 @@ def colour_rendering_index(spd_test, additional_data=False):
 
     Parameters
     ----------
-    spd_test : SpectralPowerDistribution
-        Test spectral power distribution.
+    spd_test : SpectralPowerDistribution or SpectralArray
+        Test spectral power distribution or spectral array.
     additional_data : bool, optional
         Output additional data.
 
     Returns
     -------
-    numeric or CRI_Specification
+    numeric or ndarray or CRI_Specification or list
         Colour rendering index.
 
+    Notes
+    -----
+    -   Given a :class:`SpectralArray` class instance, the colour rendering
+        index of each spectral power distribution is returned as an *ndarray*
+        or as a *list* of :class:`CRI_Specification` class instances if
+        *additional_data* is *True*.
+
     Examples
     --------
     >>> from colour import ILLUMINANTS_RELATIVE_SPDS
@@ -113,6 +121,14 @@ def colour_rendering_index(spd_test, additional_data=False):
     64.1507331...
     """
 
+    if isinstance(spd_test, SpectralArray):
+        specifications = [colour_rendering_index(spd, additional_data)
+                          for spd in spd_test]
+
+        return (specifications
+                if additional_data else
+                np.array(specifications))
+
     cmfs = STANDARD_OBSERVERS_CMFS.get('CIE 1931 2 Degree Standard Observer')
 
     shape = cmfs.shape
@@ -7,12 +7,14 @@ Defines unit tests for :mod:`colour.quality.cqs` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
 from colour.quality import colour_quality_scale
 from colour.colorimetry import (
     ILLUMINANTS_RELATIVE_SPDS,
-    LIGHT_SOURCES_RELATIVE_SPDS)
+    LIGHT_SOURCES_RELATIVE_SPDS,
+    spds_to_spectral_array)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -71,6 +73,27 @@ class TestColourQualityScale(unittest.TestCase):
             84.883777827678131,
             places=7)
 
+    def test_n_dimensional_colour_quality_scale(self):
+        """
+        Tests :func:`colour.quality.cqs.colour_quality_scale` definition
+        n-dimensional support.
+        """
+
+        spectral_array = spds_to_spectral_array(
+            [ILLUMINANTS_RELATIVE_SPDS.get('F1'),
+             ILLUMINANTS_RELATIVE_SPDS.get('F2')])
+
+        np.testing.assert_almost_equal(
+            colour_quality_scale(spectral_array),
+            np.array([75.342060410089019, 64.686058037115245]),
+            decimal=7)
+
+        specifications = colour_quality_scale(spectral_array, True)
+        self.assertEqual(len(specifications), 2)
+        self.assertAlmostEqual(specifications[1].Q_a,
+                               64.686058037115245,
+                               places=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -7,12 +7,14 @@ Defines unit tests for :mod:`colour.quality.cri` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
 from colour.quality import colour_rendering_index
 from colour.colorimetry import (
     ILLUMINANTS_RELATIVE_SPDS,
-    SpectralPowerDistribution)
+    SpectralPowerDistribution,
+    spds_to_spectral_array)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -135,6 +137,25 @@ class TestColourRenderingIndex(unittest.TestCase):
             70.805836753503698,
             places=7)
 
+    def test_n_dimensional_colour_rendering_index(self):
+        """
+        Tests :func:`colour.quality.cri.colour_rendering_index` definition
+        n-dimensional support.
+        """
+
+        spectral_array = spds_to_spectral_array(
+            [ILLUMINANTS_RELATIVE_SPDS.get('F2'),
+             ILLUMINANTS_RELATIVE_SPDS.get('F7')])
+
+        np.testing.assert_almost_equal(
+            colour_rendering_index(spectral_array),
+            np.array([64.1507331494, 90.183188538195211]),
+            decimal=7)
+
+        specifications = colour_rendering_index(spectral_array, True)
+        self.assertEqual(len(specifications), 2)
+        self.assertAlmostEqual(specifications[0].Q_a, 64.1507331494, places=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,13 +6,23 @@ from __future__ import absolute_import
 from .cct import CCT_TO_UV_METHODS, UV_TO_CCT_METHODS
 from .cct import CCT_to_uv, CCT_to_uv_Ohno2013, CCT_to_uv_Robertson1968
 from .cct import uv_to_CCT, uv_to_CCT_Ohno2013, uv_to_CCT_Robertson1968
+from .cct import PLANCKIAN_LOCUS_INDEX_ACCURACY, PlanckianLocusIndex
+from .cct import planckian_locus_index
+from .cct import CCT_to_uv_PlanckianLocusIndex, uv_to_CCT_PlanckianLocusIndex
 from .cct import CCT_TO_XY_METHODS, XY_TO_CCT_METHODS
 from .cct import CCT_to_xy, CCT_to_xy_Kang2002, CCT_to_xy_CIE_D
+from .cct import CCT_to_xy_Ohno2013
 from .cct import xy_to_CCT, xy_to_CCT_McCamy1992, xy_to_CCT_Hernandez1999
+from .cct import xy_to_CCT_PlanckianLocusIndex
 
 __all__ = ['CCT_TO_UV_METHODS', 'UV_TO_CCT_METHODS',
            'CCT_to_uv', 'CCT_to_uv_Ohno2013', 'CCT_to_uv_Robertson1968',
            'uv_to_CCT', 'uv_to_CCT_Ohno2013', 'uv_to_CCT_Robertson1968',
+           'PLANCKIAN_LOCUS_INDEX_ACCURACY', 'PlanckianLocusIndex',
+           'planckian_locus_index',
+           'CCT_to_uv_PlanckianLocusIndex', 'uv_to_CCT_PlanckianLocusIndex',
            'CCT_TO_XY_METHODS', 'XY_TO_CCT_METHODS',
            'CCT_to_xy', 'CCT_to_xy_Kang2002', 'CCT_to_xy_CIE_D',
-           'xy_to_CCT', 'xy_to_CCT_McCamy1992', 'xy_to_CCT_Hernandez1999']
+           'CCT_to_xy_Ohno2013',
+           'xy_to_CCT', 'xy_to_CCT_McCamy1992', 'xy_to_CCT_Hernandez1999',
+           'xy_to_CCT_PlanckianLocusIndex']
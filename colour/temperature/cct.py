@@ -19,6 +19,16 @@ Defines correlated colour temperature :math:`T_{cp}` computations objects:
 -   :func:`CCT_to_uv_Robertson1968`: *CIE UCS* colourspace *uv* chromaticity
     coordinates computation of given correlated colour temperature
     :math:`T_{cp}` and :math:`\Delta_{uv}` using Robertson (1968) method.
+-   :class:`PlanckianLocusIndex`: Index of the planckian locus performing
+    correlated colour temperature :math:`T_{cp}` and :math:`\Delta_{uv}`
+    lookups.
+-   :func:`uv_to_CCT_PlanckianLocusIndex`: Correlated colour temperature
+    :math:`T_{cp}` and :math:`\Delta_{uv}` computation of given *CIE UCS*
+    colourspace *uv* chromaticity coordinates using a planckian locus index.
+-   :func:`CCT_to_uv_PlanckianLocusIndex`: *CIE UCS* colourspace *uv*
+    chromaticity coordinates computation of given correlated colour
+    temperature :math:`T_{cp}` and :math:`\Delta_{uv}` using a planckian locus
+    index.
 -   :func:`xy_to_CCT_McCamy1992`: Correlated colour temperature :math:`T_{cp}`
     computation of given *CIE XYZ* tristimulus values *xy* chromaticity
     coordinates using McCamy (1992) method.
@@ -26,12 +36,18 @@ Defines correlated colour temperature :math:`T_{cp}` computations objects:
     :math:`T_{cp}` computation of given *CIE XYZ* tristimulus values *xy*
     chromaticity coordinates using Hernandez-Andres, Lee and Romero (1999)
     method.
+-   :func:`xy_to_CCT_PlanckianLocusIndex`: Correlated colour temperature
+    :math:`T_{cp}` computation of given *CIE XYZ* tristimulus values *xy*
+    chromaticity coordinates using a planckian locus index.
 -   :func:`CCT_to_xy_Kang2002`: *CIE XYZ* tristimulus values *xy* chromaticity
     coordinates computation of given correlated colour temperature
     :math:`T_{cp}` using Kang et al. (2002) method.
 -   :func:`CCT_to_xy_CIE_D`: *CIE XYZ* tristimulus values *xy* chromaticity
     coordinates computation of *CIE Illuminant D Series* from given correlated
     colour temperature :math:`T_{cp}` of that *CIE Illuminant D Series*.
+-   :func:`CCT_to_xy_Ohno2013`: *CIE XYZ* tristimulus values *xy* chromaticity
+    coordinates computation of given correlated colour temperature
+    :math:`T_{cp}`, :math:`\Delta_{uv}` using Ohno (2013) method.
 
 See Also
 --------
@@ -47,15 +63,25 @@ References
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
+import os
+import re
 from collections import namedtuple
+from scipy.spatial import cKDTree
 
 from colour.colorimetry import (
     STANDARD_OBSERVERS_CMFS,
-    blackbody_spd,
+    planck_law,
     spectral_to_XYZ)
-from colour.models import UCS_to_uv, XYZ_to_UCS
-from colour.utilities import CaseInsensitiveMapping, tsplit, tstack, warning
+from colour.colorimetry.blackbody import C2, N
+from colour.models import UCS_to_uv, UCS_uv_to_xy, XYZ_to_UCS, xy_to_XYZ
+from colour.utilities import (
+    CaseInsensitiveMapping,
+    LRUCache,
+    tsplit,
+    tstack,
+    warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -69,6 +95,9 @@ __all__ = ['PLANCKIAN_TABLE_TUVD',
            'CCT_MAXIMAL',
            'CCT_SAMPLES',
            'CCT_CALCULATION_ITERATIONS',
+           'PLANCKIAN_LOCI_CACHE_SIZE',
+           'PLANCKIAN_LOCUS_INDEX_ACCURACY',
+           'PLANCKIAN_LOCUS_INDEXES_CACHE_SIZE',
            'ROBERTSON_ISOTEMPERATURE_LINES_DATA',
            'ROBERTSON_ISOTEMPERATURE_LINES_RUVT',
            'ROBERTSON_ISOTEMPERATURE_LINES',
@@ -78,14 +107,20 @@ __all__ = ['PLANCKIAN_TABLE_TUVD',
            'CCT_to_uv_Ohno2013',
            'uv_to_CCT_Robertson1968',
            'CCT_to_uv_Robertson1968',
+           'PlanckianLocusIndex',
+           'planckian_locus_index',
+           'uv_to_CCT_PlanckianLocusIndex',
+           'CCT_to_uv_PlanckianLocusIndex',
            'UV_TO_CCT_METHODS',
            'uv_to_CCT',
            'CCT_TO_UV_METHODS',
            'CCT_to_uv',
            'xy_to_CCT_McCamy1992',
            'xy_to_CCT_Hernandez1999',
+           'xy_to_CCT_PlanckianLocusIndex',
            'CCT_to_xy_Kang2002',
            'CCT_to_xy_CIE_D',
+           'CCT_to_xy_Ohno2013',
            'XY_TO_CCT_METHODS',
            'xy_to_CCT',
            'CCT_TO_XY_METHODS',
@@ -159,6 +194,178 @@ ROBERTSON_ISOTEMPERATURE_LINES = [
     ROBERTSON_ISOTEMPERATURE_LINES_RUVT(*x)
     for x in ROBERTSON_ISOTEMPERATURE_LINES_DATA]
 
+PLANCKIAN_LOCI_CACHE_SIZE = 32
+"""
+Maximum number of planckian loci kept in cache.
+
+PLANCKIAN_LOCI_CACHE_SIZE : int
+"""
+
+_PLANCKIAN_LOCI_CACHE = LRUCache(PLANCKIAN_LOCI_CACHE_SIZE)
+
+_PLANCKIAN_UV_CHUNK_SIZE = 2 ** 20
+"""
+Maximum number of planckian radiators spectral values computed at once.
+
+_PLANCKIAN_UV_CHUNK_SIZE : int
+"""
+
+PLANCKIAN_LOCUS_INDEX_ACCURACY = 0.1
+"""
+Default maximum correlated colour temperature :math:`T_{cp}` error in kelvins
+of the planckian locus indexes.
+
+PLANCKIAN_LOCUS_INDEX_ACCURACY : numeric
+"""
+
+PLANCKIAN_LOCUS_INDEXES_CACHE_SIZE = 8
+"""
+Maximum number of planckian locus indexes kept in cache.
+
+PLANCKIAN_LOCUS_INDEXES_CACHE_SIZE : int
+"""
+
+_PLANCKIAN_LOCUS_INDEXES_CACHE = LRUCache(PLANCKIAN_LOCUS_INDEXES_CACHE_SIZE)
+
+_PLANCKIAN_LOCUS_INDEX_MINIMAL_COUNT = 17
+_PLANCKIAN_LOCUS_INDEX_MAXIMAL_COUNT = 2 ** 20
+_PLANCKIAN_LOCUS_INDEX_VALIDATION_D_UV = (-0.05, -0.025, 0, 0.025, 0.05)
+_PLANCKIAN_LOCUS_INDEX_ITERATIONS = 4
+
+
+def _planckian_uv(cmfs, T):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates of the
+    planckian radiators at given temperatures using given colour matching
+    functions.
+
+    The planckian radiators spectral data is computed on a (T, W) grid and
+    converted to *CIE XYZ* tristimulus values with a matrix product, by chunks
+    of temperatures bounding the grid size.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    T : array_like
+        Temperatures in kelvins.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        Planckian radiators *uv* chromaticity coordinates.
+    """
+
+    T = np.asarray(T)
+    wavelengths = cmfs.shape.range() * 1e-9
+
+    Ti = np.ravel(T)[..., np.newaxis]
+    chunk_size = max(1, _PLANCKIAN_UV_CHUNK_SIZE // len(wavelengths))
+
+    XYZ = np.vstack([spectral_to_XYZ(planck_law(wavelengths,
+                                                Ti[i:i + chunk_size]),
+                                     cmfs)
+                     for i in range(0, max(len(Ti), 1), chunk_size)])
+    XYZ *= 1 / np.max(XYZ, axis=-1)[..., np.newaxis]
+
+    return np.reshape(UCS_to_uv(XYZ_to_UCS(XYZ)), T.shape + (2,))
+
+
+def _planckian_uv_derivative(cmfs, T):
+    """
+    Returns the derivative with respect to the temperature of the *CIE UCS*
+    colourspace *uv* chromaticity coordinates of the planckian radiators at
+    given temperatures using given colour matching functions.
+
+    The planckian radiators spectral data derivative is computed analytically.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    T : array_like
+        Temperatures in kelvins.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        Planckian radiators *uv* chromaticity coordinates derivative.
+    """
+
+    T = np.asarray(T)[..., np.newaxis]
+    l = cmfs.shape.range() * 1e-9
+
+    spd = planck_law(l, T)
+    x = C2 / (N * l * T)
+    d_spd = spd * x / T * (1 + 1 / np.expm1(x))
+
+    X, Y, Z = tsplit(spectral_to_XYZ(spd, cmfs))
+    dX, dY, dZ = tsplit(spectral_to_XYZ(d_spd, cmfs))
+
+    D = X + 15 * Y + 3 * Z
+    dD = dX + 15 * dY + 3 * dZ
+
+    return tstack((4 * (dX * D - X * dD) / D ** 2,
+                   6 * (dY * D - Y * dD) / D ** 2))
+
+
+def _planckian_locus(cmfs, start, end, count, cache=True):
+    """
+    Returns the planckian locus *CIE UCS* colourspace *uv* chromaticity
+    coordinates sampled at given temperatures using given colour matching
+    functions and caches it if not existing.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    start : numeric or array_like
+        Temperature range start in kelvins.
+    end : numeric or array_like
+        Temperature range end in kelvins.
+    count : int
+        Temperatures count in the planckian locus.
+    cache : bool, optional
+        Whether to cache the planckian locus, the ranges generated by the
+        cascade expansion of :func:`uv_to_CCT_Ohno2013` definition are
+        specific to each chromaticity coordinates and are not cached.
+
+    Returns
+    -------
+    tuple
+        Temperatures :math:`T_i`, *CIE UCS* colourspace chromaticity
+        coordinates :math:`u_i` and :math:`v_i` read-only arrays of shape
+        (..., count) with the leading dimensions of given temperature ranges.
+    """
+
+    shape = cmfs.shape
+    key = (shape.start,
+           shape.end,
+           shape.steps,
+           cmfs.x_bar.content_hash,
+           cmfs.y_bar.content_hash,
+           cmfs.z_bar.content_hash,
+           start,
+           end,
+           count)
+
+    locus = _PLANCKIAN_LOCI_CACHE.get(key) if cache else None
+    if locus is None:
+        start, end = np.asarray(start), np.asarray(end)
+        Ti = (start[..., np.newaxis] +
+              (end - start)[..., np.newaxis] * np.linspace(0, 1, count))
+
+        ui, vi = tsplit(_planckian_uv(cmfs, Ti))
+
+        locus = (Ti, ui, vi)
+        for array in locus:
+            array.setflags(write=False)
+
+        if cache:
+            _PLANCKIAN_LOCI_CACHE[key] = locus
+
+    return locus
+
 
 def planckian_table(uv, cmfs, start, end, count):
     """
@@ -217,19 +424,10 @@ Ti=1010.0, ui=0.4456812..., vi=0.3548261..., di=0.2515196...)]
 
     ux, vx = uv
 
-    shape = cmfs.shape
-
-    table = []
-    for Ti in np.linspace(start, end, count):
-        spd = blackbody_spd(Ti, shape)
-        XYZ = spectral_to_XYZ(spd, cmfs)
-        XYZ *= 1 / np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        ui, vi = UCS_to_uv(UVW)
-        di = np.sqrt((ux - ui) ** 2 + (vx - vi) ** 2)
-        table.append(PLANCKIAN_TABLE_TUVD(Ti, ui, vi, di))
+    Ti, ui, vi = _planckian_locus(cmfs, start, end, count)
+    di = np.sqrt((ux - ui) ** 2 + (vx - vi) ** 2)
 
-    return table
+    return [PLANCKIAN_TABLE_TUVD(*x) for x in zip(Ti, ui, vi, di)]
 
 
 def planckian_table_minimal_distance_index(planckian_table_):
@@ -281,7 +479,7 @@ def uv_to_CCT_Ohno2013(uv,
 
     Parameters
     ----------
-    uv : array_like
+    uv : array_like, (..., 2)
         *CIE UCS* colourspace *uv* chromaticity coordinates.
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
@@ -296,9 +494,16 @@ def uv_to_CCT_Ohno2013(uv,
 
     Returns
     -------
-    ndarray
+    ndarray, (..., 2)
         Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`.
 
+    Notes
+    -----
+    -   Given an array of *uv* chromaticity coordinates, all of them are solved
+        together: The base planckian table is shared, the minimal distance
+        indexes are found per chromaticity coordinates and the triangular and
+        parabolic solutions are computed with masked array operations.
+
     References
     ----------
     .. [3]  Ohno, Y. (2014). Practical Use and Calculation of CCT and Duv.
@@ -312,36 +517,85 @@ def uv_to_CCT_Ohno2013(uv,
     >>> uv = np.array([0.1978, 0.3122])
     >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
     array([  6.5075470...e+03,   3.2236908...e-03])
+    >>> uv = np.array([[0.1978, 0.3122], [0.4328, 0.2883]])
+    >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
+    array([[  6.5075470...e+03,   3.2236908...e-03],
+           [  1.0418672...e+03,  -6.7377582...e-02]])
     """
 
+    uv = np.asarray(uv)
+
+    ux, vx = tsplit(np.reshape(uv, (-1, 2)))
+
     # Ensuring we do at least one iteration to initialise variables.
     if iterations <= 0:
         iterations = 1
 
-    # Planckian table creation through cascade expansion.
-    for _i in range(iterations):
-        table = planckian_table(uv, cmfs, start, end, count)
-        index = planckian_table_minimal_distance_index(table)
-        if index == 0:
+    return np.reshape(
+        _uv_to_CCT_Ohno2013(ux, vx, cmfs, start, end, count, iterations),
+        uv.shape)
+
+
+def _uv_to_CCT_Ohno2013(ux, vx, cmfs, start, end, count, iterations):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` from given *CIE UCS* colourspace *u* and *v*
+    chromaticity coordinates arrays using Ohno (2013) method.
+
+    Parameters
+    ----------
+    ux : ndarray, (N,)
+        *CIE UCS* colourspace *u* chromaticity coordinates.
+    vx : ndarray, (N,)
+        *CIE UCS* colourspace *v* chromaticity coordinates.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    start : numeric
+        Temperature range start in kelvins.
+    end : numeric
+        Temperature range end in kelvins.
+    count : int
+        Temperatures count in the planckian tables.
+    iterations : int
+        Number of planckian tables to generate.
+
+    Returns
+    -------
+    ndarray, (N, 2)
+        Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`.
+    """
+
+    ux, vx = ux[..., np.newaxis], vx[..., np.newaxis]
+    rows = np.arange(len(ux))
+
+    # Planckian table creation through cascade expansion, the base planckian
+    # table is shared and cached while the expanded ones are specific to each
+    # *uv* chromaticity coordinates.
+    for i in range(iterations):
+        Tt, ut, vt = [np.broadcast_to(x, (len(ux), count))
+                      for x in _planckian_locus(
+                          cmfs, start, end, count, cache=i == 0)]
+        dt = np.sqrt((ux - ut) ** 2 + (vx - vt) ** 2)
+        index = np.argmin(dt, axis=-1)
+        if np.any(index == 0):
             warning(
                 ('Minimal distance index is on lowest planckian table bound, '
                  'unpredictable results may occur!'))
-            index += 1
-        elif index == len(table) - 1:
+            index[index == 0] += 1
+        if np.any(index == count - 1):
             warning(
                 ('Minimal distance index is on highest planckian table bound, '
                  'unpredictable results may occur!'))
-            index -= 1
+            index[index == count - 1] -= 1
 
-        start = table[index - 1].Ti
-        end = table[index + 1].Ti
+        start = Tt[rows, index - 1]
+        end = Tt[rows, index + 1]
 
-    _ux, vx = uv
+    ux, vx = ux[..., 0], vx[..., 0]
 
-    Tuvdip, Tuvdi, Tuvdin = (table[index - 1], table[index], table[index + 1])
-    Tip, uip, vip, dip = Tuvdip.Ti, Tuvdip.ui, Tuvdip.vi, Tuvdip.di
-    Ti, di = Tuvdi.Ti, Tuvdi.di
-    Tin, uin, vin, din = Tuvdin.Ti, Tuvdin.ui, Tuvdin.vi, Tuvdin.di
+    Tip, uip, vip, dip = (x[rows, index - 1] for x in (Tt, ut, vt, dt))
+    Ti, di = (x[rows, index] for x in (Tt, dt))
+    Tin, uin, vin, din = (x[rows, index + 1] for x in (Tt, ut, vt, dt))
 
     # Triangular solution.
     l = np.sqrt((uin - uip) ** 2 + (vin - vip) ** 2)
@@ -349,23 +603,25 @@ def uv_to_CCT_Ohno2013(uv,
     T = Tip + (Tin - Tip) * (x / l)
 
     vtx = vip + (vin - vip) * (x / l)
-    sign = 1 if vx - vtx >= 0 else -1
+    sign = np.where(vx - vtx >= 0, 1, -1)
     D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
 
     # Parabolic solution.
-    if D_uv < 0.002:
-        X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
-        a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
-        b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
-               (di - dip)) * X ** -1)
-        c = (-(dip * (Tin - Ti) * Ti * Tin + di * (Tip - Tin) * Tip * Tin +
-               din * (Ti - Tip) * Tip * Ti) * X ** -1)
+    X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
+    a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
+    b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
+           (di - dip)) * X ** -1)
+    c = (-(dip * (Tin - Ti) * Ti * Tin + di * (Tip - Tin) * Tip * Tin +
+           din * (Ti - Tip) * Tip * Ti) * X ** -1)
 
-        T = -b / (2 * a)
+    T_p = -b / (2 * a)
+    D_uv_p = sign * (a * T_p ** 2 + b * T_p + c)
 
-        D_uv = sign * (a * T ** 2 + b * T + c)
+    parabolic = D_uv < 0.002
+    T = np.where(parabolic, T_p, T)
+    D_uv = np.where(parabolic, D_uv_p, D_uv)
 
-    return np.array([T, D_uv])
+    return tstack((T, D_uv))
 
 
 def CCT_to_uv_Ohno2013(CCT,
@@ -379,18 +635,24 @@ def CCT_to_uv_Ohno2013(CCT,
 
     Parameters
     ----------
-    CCT : numeric
+    CCT : numeric or array_like
         Correlated colour temperature :math:`T_{cp}`.
-    D_uv : numeric, optional
+    D_uv : numeric or array_like, optional
         :math:`\Delta_{uv}`.
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
 
     Returns
     -------
-    ndarray
+    ndarray, (..., 2)
         *CIE UCS* colourspace *uv* chromaticity coordinates.
 
+    Notes
+    -----
+    -   Given arrays of correlated colour temperatures and
+        :math:`\Delta_{uv}`, the planckian radiators and their finite
+        difference counterparts are computed together on a (T, W) grid.
+
     References
     ----------
     .. [4]  Ohno, Y. (2014). Practical Use and Calculation of CCT and Duv.
@@ -405,33 +667,31 @@ def CCT_to_uv_Ohno2013(CCT,
     >>> D_uv = 0.003223690901512735
     >>> CCT_to_uv_Ohno2013(CCT, D_uv, cmfs)  # doctest: +ELLIPSIS
     array([ 0.1978003...,  0.3122005...])
+    >>> CCT = np.array([6507.4342201047066, 1041.849524611546])
+    >>> D_uv = np.array([0.003223690901512735, -0.067377582728534946])
+    >>> CCT_to_uv_Ohno2013(CCT, D_uv, cmfs)  # doctest: +ELLIPSIS
+    array([[ 0.1978003...,  0.3122005...],
+           [ 0.4328025...,  0.2882997...]])
     """
 
-    shape = cmfs.shape
+    CCT, D_uv = np.broadcast_arrays(CCT, D_uv)
+
     delta = 0.01
 
-    spd = blackbody_spd(CCT, shape)
-    XYZ = spectral_to_XYZ(spd, cmfs)
-    XYZ *= 1 / np.max(XYZ)
-    UVW = XYZ_to_UCS(XYZ)
-    u0, v0 = UCS_to_uv(UVW)
+    u0, v0 = tsplit(_planckian_uv(cmfs, CCT))
 
-    if D_uv == 0:
-        return np.array([u0, v0])
-    else:
-        spd = blackbody_spd(CCT + delta, shape)
-        XYZ = spectral_to_XYZ(spd, cmfs)
-        XYZ *= 1 / np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        u1, v1 = UCS_to_uv(UVW)
+    if np.all(D_uv == 0):
+        return tstack((u0, v0))
 
-        du = u0 - u1
-        dv = v0 - v1
+    u1, v1 = tsplit(_planckian_uv(cmfs, CCT + delta))
 
-        u = u0 - D_uv * (dv / np.sqrt(du ** 2 + dv ** 2))
-        v = v0 + D_uv * (du / np.sqrt(du ** 2 + dv ** 2))
+    du = u0 - u1
+    dv = v0 - v1
 
-        return np.array([u, v])
+    u = u0 - D_uv * (dv / np.sqrt(du ** 2 + dv ** 2))
+    v = v0 + D_uv * (du / np.sqrt(du ** 2 + dv ** 2))
+
+    return tstack((np.where(D_uv == 0, u0, u), np.where(D_uv == 0, v0, v)))
 
 
 def uv_to_CCT_Robertson1968(uv):
@@ -442,14 +702,20 @@ def uv_to_CCT_Robertson1968(uv):
 
     Parameters
     ----------
-    uv : array_like
+    uv : array_like, (..., 2)
         *CIE UCS* colourspace *uv* chromaticity coordinates.
 
     Returns
     -------
-    ndarray
+    ndarray, (..., 2)
         Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`.
 
+    Notes
+    -----
+    -   The distances to all the isotemperature lines are computed at once and
+        the isotemperature lines bracketing each *uv* chromaticity coordinates
+        are located with the first distance sign change.
+
     References
     ----------
     .. [5]  Wyszecki, G., & Stiles, W. S. (2000). DISTRIBUTION TEMPERATURE,
@@ -466,62 +732,57 @@ def uv_to_CCT_Robertson1968(uv):
     >>> uv = np.array([0.19374137599822966, 0.31522104394059397])
     >>> uv_to_CCT_Robertson1968(uv)  # doctest: +ELLIPSIS
     array([  6.5000162...e+03,   8.3333289...e-03])
+    >>> uv = np.array([[0.19374137599822966, 0.31522104394059397],
+    ...                [0.3043169, 0.3673710]])
+    >>> uv_to_CCT_Robertson1968(uv)  # doctest: +ELLIPSIS
+    array([[  6.5000162...e+03,   8.3333289...e-03],
+           [  2.0000006...e+03,   8.3333096...e-03]])
     """
 
-    u, v = uv
+    uv = np.asarray(uv)
 
-    last_dt = last_dv = last_du = 0.0
+    u, v = tsplit(np.reshape(uv, (-1, 2)))
+    rows = np.arange(len(u))
 
-    for i in range(1, 31):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_previous = ROBERTSON_ISOTEMPERATURE_LINES[i - 1]
+    r_i, u_i, v_i, t_i = tsplit(ROBERTSON_ISOTEMPERATURE_LINES_DATA)
 
-        du = 1.0
-        dv = wr_ruvt.t
+    # Isotemperature lines unit direction vectors.
+    length = np.sqrt(1 + t_i * t_i)
+    du_i = 1 / length
+    dv_i = t_i / length
 
-        length = np.sqrt(1 + dv * dv)
+    # Distances to the isotemperature lines, the first line with a negative
+    # or null distance, or the last line, is the upper bracketing line.
+    dt_i = (-(u[..., np.newaxis] - u_i[1:]) * dv_i[1:] +
+            (v[..., np.newaxis] - v_i[1:]) * du_i[1:])
 
-        du /= length
-        dv /= length
+    bracket = dt_i <= 0
+    bracket[..., -1] = True
+    i = np.argmax(bracket, axis=-1) + 1
+    j = i - 1
 
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
+    dt = -np.minimum(dt_i[rows, i - 1], 0)
+    last_dt = dt_i[rows, np.maximum(i - 2, 0)]
 
-        dt = -uu * dv + vv * du
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = np.where(i == 1, 0, dt / (last_dt + dt))
 
-        if dt <= 0 or i == 30:
-            if dt > 0.0:
-                dt = 0.0
+    T = 1.0e6 / (r_i[j] * f + r_i[i] * (1 - f))
 
-            dt = -dt
+    uu = u - (u_i[j] * f + u_i[i] * (1 - f))
+    vv = v - (v_i[j] * f + v_i[i] * (1 - f))
 
-            if i == 1:
-                f = 0.0
-            else:
-                f = dt / (last_dt + dt)
+    du = du_i[i] * (1 - f) + du_i[j] * f
+    dv = dv_i[i] * (1 - f) + dv_i[j] * f
 
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
+    length = np.sqrt(du * du + dv * dv)
 
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
-
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
-
-            length = np.sqrt(du * du + dv * dv)
-
-            du /= length
-            dv /= length
-
-            D_uv = uu * du + vv * dv
-
-            break
+    du /= length
+    dv /= length
 
-        last_dt = dt
-        last_du = du
-        last_dv = dv
+    D_uv = uu * du + vv * dv
 
-    return np.array([T, -D_uv])
+    return np.reshape(tstack((T, -D_uv)), uv.shape)
 
 
 def CCT_to_uv_Robertson1968(CCT, D_uv=0):
@@ -532,14 +793,14 @@ def CCT_to_uv_Robertson1968(CCT, D_uv=0):
 
     Parameters
     ----------
-    CCT : numeric
+    CCT : numeric or array_like
         Correlated colour temperature :math:`T_{cp}`.
-    D_uv : numeric
+    D_uv : numeric or array_like
         :math:`\Delta_{uv}`.
 
     Returns
     -------
-    ndarray
+    ndarray, (..., 2)
         *CIE UCS* colourspace *uv* chromaticity coordinates.
 
     References
@@ -559,63 +820,811 @@ def CCT_to_uv_Robertson1968(CCT, D_uv=0):
     >>> D_uv = 0.0083333312442250979
     >>> CCT_to_uv_Robertson1968(CCT, D_uv)  # doctest: +ELLIPSIS
     array([ 0.1937413...,  0.3152210...])
+    >>> CCT = np.array([6500.0081378199056, 2000])
+    >>> CCT_to_uv_Robertson1968(CCT, D_uv)  # doctest: +ELLIPSIS
+    array([[ 0.1937413...,  0.3152210...],
+           [ 0.3043169...,  0.3673710...]])
     """
 
+    CCT, D_uv = np.broadcast_arrays(CCT, D_uv)
+
     r = 1.0e6 / CCT
 
-    for i in range(30):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_next = ROBERTSON_ISOTEMPERATURE_LINES[i + 1]
+    r_i, u_i, v_i, t_i = tsplit(ROBERTSON_ISOTEMPERATURE_LINES_DATA)
+
+    # The first isotemperature line whose next line reciprocal temperature
+    # is greater than the reciprocal temperature, or the penultimate line, is
+    # the lower bracketing line.
+    bracket = r[..., np.newaxis] < r_i[1:]
+    bracket[..., -1] = True
+    i = np.argmax(bracket, axis=-1)
+    j = i + 1
+
+    f = (r_i[j] - r) / (r_i[j] - r_i[i])
+
+    u = u_i[i] * f + u_i[j] * (1 - f)
+    v = v_i[i] * f + v_i[j] * (1 - f)
+
+    uu1 = uu2 = 1.0
+    vv1, vv2 = t_i[i], t_i[j]
+
+    length1 = np.sqrt(1 + vv1 * vv1)
+    length2 = np.sqrt(1 + vv2 * vv2)
+
+    uu1 /= length1
+    vv1 /= length1
+
+    uu2 /= length2
+    vv2 /= length2
+
+    uu3 = uu1 * f + uu2 * (1 - f)
+    vv3 = vv1 * f + vv2 * (1 - f)
+
+    len3 = np.sqrt(uu3 * uu3 + vv3 * vv3)
+
+    uu3 /= len3
+    vv3 /= len3
+
+    u += uu3 * -D_uv
+    v += vv3 * -D_uv
+
+    return tstack((u, v))
+
+
+def _planckian_locus_index_uv_to_CCT(uv_i, tree, start, end, uv):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
+    coordinates using given planckian locus samples.
+
+    The nearest planckian locus sample is found with given *k-d* tree and the
+    planckian locus is locally modeled by the quadratic polynomial passing
+    through the nearest sample and its neighbours, the *uv* chromaticity
+    coordinates are then projected onto the polynomial with Newton's method.
+
+    Parameters
+    ----------
+    uv_i : ndarray, (n, 2)
+        Planckian locus *uv* chromaticity coordinates sampled at temperatures
+        evenly spaced on a logarithmic scale.
+    tree : cKDTree
+        Planckian locus samples *k-d* tree.
+    start : numeric
+        Planckian locus samples temperature range start in kelvins.
+    end : numeric
+        Planckian locus samples temperature range end in kelvins.
+    uv : array_like, (..., 2)
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`.
+    """
+
+    uv = np.asarray(uv)
+    x = np.reshape(uv, (-1, 2))
+
+    count = len(uv_i)
+    h = np.log(end / start) / (count - 1)
+
+    _distance, index = tree.query(x)
+    index = np.clip(index, 1, count - 2)
 
-        if r < wr_ruvt_next.r or i == 29:
-            f = (wr_ruvt_next.r - r) / (wr_ruvt_next.r - wr_ruvt.r)
+    p = uv_i[index]
+    a = (uv_i[index + 1] - uv_i[index - 1]) / 2
+    b = (uv_i[index + 1] - 2 * p + uv_i[index - 1]) / 2
 
-            u = wr_ruvt.u * f + wr_ruvt_next.u * (1 - f)
-            v = wr_ruvt.v * f + wr_ruvt_next.v * (1 - f)
+    # Newton's method solving for the polynomial parameter at which the
+    # polynomial tangent is orthogonal to the *uv* chromaticity coordinates.
+    t = np.zeros(len(x))[..., np.newaxis]
+    for _i in range(_PLANCKIAN_LOCUS_INDEX_ITERATIONS):
+        r = p + t * a + t ** 2 * b - x
+        d = a + 2 * t * b
+        t -= (np.sum(r * d, axis=-1) /
+              np.sum(d * d + 2 * r * b, axis=-1))[..., np.newaxis]
 
-            uu1 = uu2 = 1.0
-            vv1, vv2 = wr_ruvt.t, wr_ruvt_next.t
+    r = x - (p + t * a + t ** 2 * b)
+    du, dv = tsplit(a + 2 * t * b)
+    ru, rv = tsplit(r)
 
-            length1 = np.sqrt(1 + vv1 * vv1)
-            length2 = np.sqrt(1 + vv2 * vv2)
+    T = start * np.exp((index + t[..., 0]) * h)
+    D_uv = (dv * ru - du * rv) / np.sqrt(du ** 2 + dv ** 2)
 
-            uu1 /= length1
-            vv1 /= length1
+    if np.any((T < start) | (T > end)):
+        warning(('Correlated colour temperature is outside the planckian '
+                 'locus index temperature range, unpredictable results may '
+                 'occur!'))
 
-            uu2 /= length2
-            vv2 /= length2
+    return np.reshape(tstack((T, D_uv)), uv.shape)
 
-            uu3 = uu1 * f + uu2 * (1 - f)
-            vv3 = vv1 * f + vv2 * (1 - f)
 
-            len3 = np.sqrt(uu3 * uu3 + vv3 * vv3)
+def _planckian_locus_index_CCT_to_uv(uv_i, start, end, CCT, D_uv):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates from given
+    correlated colour temperature :math:`T_{cp}` and :math:`\Delta_{uv}` using
+    given planckian locus samples.
 
-            uu3 /= len3
-            vv3 /= len3
+    The planckian locus is locally modeled by the quadratic polynomial passing
+    through the sample nearest to the correlated colour temperature and its
+    neighbours.
 
-            u += uu3 * -D_uv
-            v += vv3 * -D_uv
+    Parameters
+    ----------
+    uv_i : ndarray, (n, 2)
+        Planckian locus *uv* chromaticity coordinates sampled at temperatures
+        evenly spaced on a logarithmic scale.
+    start : numeric
+        Planckian locus samples temperature range start in kelvins.
+    end : numeric
+        Planckian locus samples temperature range end in kelvins.
+    CCT : array_like
+        Correlated colour temperature :math:`T_{cp}`.
+    D_uv : array_like
+        :math:`\Delta_{uv}`.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+    """
+
+    CCT, D_uv = np.broadcast_arrays(CCT, D_uv)
+
+    count = len(uv_i)
+    h = np.log(end / start) / (count - 1)
+
+    t = np.log(CCT / start) / h
+    index = np.clip(np.round(np.where(np.isfinite(t), t, 0)), 1, count - 2)
+    index = index.astype(np.int_)
+    t = (t - index)[..., np.newaxis]
+
+    p = uv_i[index]
+    a = (uv_i[index + 1] - uv_i[index - 1]) / 2
+    b = (uv_i[index + 1] - 2 * p + uv_i[index - 1]) / 2
+
+    du, dv = tsplit(a + 2 * t * b)
+    length = np.sqrt(du ** 2 + dv ** 2)
+
+    if np.any((CCT < start) | (CCT > end)):
+        warning(('Correlated colour temperature is outside the planckian '
+                 'locus index temperature range, unpredictable results may '
+                 'occur!'))
+
+    return (p + t * a + t ** 2 * b +
+            tstack((dv, -du)) / length[..., np.newaxis] *
+            D_uv[..., np.newaxis])
+
+
+def _planckian_locus_index_uv(cmfs, start, end, accuracy):
+    """
+    Returns the planckian locus *CIE UCS* colourspace *uv* chromaticity
+    coordinates sampled at temperatures evenly spaced on a logarithmic scale
+    densely enough for the correlated colour temperature lookups to reach
+    given accuracy.
+
+    The samples count is doubled until the lookups of the planckian locus
+    points in-between the samples, and of the points distant from them by
+    :attr:`_PLANCKIAN_LOCUS_INDEX_VALIDATION_D_UV` attribute values along the
+    isotemperature lines, are within given accuracy.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    start : numeric
+        Temperature range start in kelvins.
+    end : numeric
+        Temperature range end in kelvins.
+    accuracy : numeric
+        Maximum correlated colour temperature :math:`T_{cp}` error in kelvins.
+
+    Returns
+    -------
+    ndarray, (n, 2)
+        Planckian locus *uv* chromaticity coordinates.
+    """
 
-            return np.array([u, v])
+    count = _PLANCKIAN_LOCUS_INDEX_MINIMAL_COUNT
+    uv_i = _planckian_uv(
+        cmfs, start * (end / start) ** np.linspace(0, 1, count))
+
+    D_uv = np.reshape(_PLANCKIAN_LOCUS_INDEX_VALIDATION_D_UV, (-1, 1))
+    while True:
+        T = start * (end / start) ** (
+            (np.arange(count - 1) + 0.5) / (count - 1))
+        uv = _planckian_uv(cmfs, T)
+
+        # Isotemperature lines directions and planckian locus *uv* chromaticity
+        # coordinates variation per kelvin.
+        du, dv = tsplit(_planckian_uv_derivative(cmfs, T))
+        length = speed = np.sqrt(du ** 2 + dv ** 2)
+
+        uv_D_uv = (uv + tstack((dv, -du)) / length[..., np.newaxis] *
+                   D_uv[..., np.newaxis])
+
+        CCT, _D_uv = tsplit(_planckian_locus_index_uv_to_CCT(
+            uv_i, cKDTree(uv_i), start, end, uv_D_uv))
+        error_uv_to_CCT = np.abs(CCT - T)
+
+        error_CCT_to_uv = np.sqrt(np.sum((_planckian_locus_index_CCT_to_uv(
+            uv_i, start, end, T, D_uv) - uv_D_uv) ** 2, axis=-1)) / speed
+
+        if max(np.max(error_uv_to_CCT), np.max(error_CCT_to_uv)) <= accuracy:
+            break
+
+        if count >= _PLANCKIAN_LOCUS_INDEX_MAXIMAL_COUNT:
+            warning(('"{0}" accuracy could not be reached with "{1}" '
+                     'planckian locus samples!').format(accuracy, count))
+            break
+
+        # Inserting the validation samples in-between the current samples.
+        uv_i = np.insert(uv_i, np.arange(1, count), uv, axis=0)
+        count = len(uv_i)
+
+    return uv_i
+
+
+class PlanckianLocusIndex(object):
+    """
+    Defines an index of the planckian locus sampled at temperatures evenly
+    spaced on a logarithmic scale, densely enough to reach given correlated
+    colour temperature :math:`T_{cp}` accuracy.
+
+    Once built, the index converts *CIE UCS* colourspace *uv* chromaticity
+    coordinates to correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` without computing any planckian table: The nearest
+    planckian locus sample is found in :math:`O(log(n))` with a *k-d* tree and
+    the planckian locus is locally modeled by the quadratic polynomial passing
+    through the nearest sample and its neighbours.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    start : numeric, optional
+        Temperature range start in kelvins.
+    end : numeric, optional
+        Temperature range end in kelvins.
+    accuracy : numeric, optional
+        Maximum correlated colour temperature :math:`T_{cp}` error in kelvins
+        for :math:`\Delta_{uv}` in domain [-0.05, 0.05].
+    uv : array_like, optional
+        Planckian locus *uv* chromaticity coordinates sampled at temperatures
+        evenly spaced on a logarithmic scale from *start* to *end*, e.g. read
+        from a persisted index, they are computed if not given.
+
+    Attributes
+    ----------
+    cmfs
+    start
+    end
+    accuracy
+    temperatures
+    uv
+
+    Methods
+    -------
+    uv_to_CCT
+    CCT_to_uv
+
+    See Also
+    --------
+    planckian_locus_index
+
+    Examples
+    --------
+    >>> index = PlanckianLocusIndex()
+    >>> len(index.uv)
+    1025
+    >>> uv = np.array([0.1978, 0.3122])
+    >>> index.uv_to_CCT(uv)  # doctest: +ELLIPSIS
+    array([  6.5075031...e+03,   3.2236777...e-03])
+    """
+
+    def __init__(self,
+                 cmfs=STANDARD_OBSERVERS_CMFS.get(
+                     'CIE 1931 2 Degree Standard Observer'),
+                 start=CCT_MINIMAL,
+                 end=CCT_MAXIMAL,
+                 accuracy=PLANCKIAN_LOCUS_INDEX_ACCURACY,
+                 uv=None):
+        self.__cmfs = cmfs
+        self.__start = start
+        self.__end = end
+        self.__accuracy = accuracy
+
+        if uv is None:
+            uv = _planckian_locus_index_uv(cmfs, start, end, accuracy)
+
+        self.__uv = np.array(uv, dtype=np.float_)
+        self.__uv.setflags(write=False)
+
+        self.__tree = cKDTree(self.__uv)
+
+    @property
+    def cmfs(self):
+        """
+        Property for **self.cmfs** attribute.
+
+        Returns
+        -------
+        XYZ_ColourMatchingFunctions
+            self.cmfs.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusIndex.cmfs` is read only.
+        """
+
+        return self.__cmfs
+
+    @cmfs.setter
+    def cmfs(self, value):
+        """
+        Setter for **self.cmfs** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('cmfs'))
+
+    @property
+    def start(self):
+        """
+        Property for **self.start** attribute.
+
+        Returns
+        -------
+        numeric
+            self.start.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusIndex.start` is read only.
+        """
+
+        return self.__start
+
+    @start.setter
+    def start(self, value):
+        """
+        Setter for **self.start** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('start'))
+
+    @property
+    def end(self):
+        """
+        Property for **self.end** attribute.
+
+        Returns
+        -------
+        numeric
+            self.end.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusIndex.end` is read only.
+        """
+
+        return self.__end
+
+    @end.setter
+    def end(self, value):
+        """
+        Setter for **self.end** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('end'))
+
+    @property
+    def accuracy(self):
+        """
+        Property for **self.accuracy** attribute.
+
+        Returns
+        -------
+        numeric
+            self.accuracy.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusIndex.accuracy` is read only.
+        """
+
+        return self.__accuracy
+
+    @accuracy.setter
+    def accuracy(self, value):
+        """
+        Setter for **self.accuracy** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError(
+            '"{0}" attribute is read only!'.format('accuracy'))
+
+    @property
+    def temperatures(self):
+        """
+        Property for **self.temperatures** attribute.
+
+        Returns
+        -------
+        ndarray
+            Planckian locus samples temperatures in kelvins.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusIndex.temperatures` is read only.
+        """
+
+        return self.__start * (self.__end / self.__start) ** np.linspace(
+            0, 1, len(self.__uv))
+
+    @temperatures.setter
+    def temperatures(self, value):
+        """
+        Setter for **self.temperatures** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError(
+            '"{0}" attribute is read only!'.format('temperatures'))
+
+    @property
+    def uv(self):
+        """
+        Property for **self.uv** attribute.
+
+        Returns
+        -------
+        ndarray
+            Planckian locus samples *uv* chromaticity coordinates.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusIndex.uv` is read only.
+        """
+
+        return self.__uv
+
+    @uv.setter
+    def uv(self, value):
+        """
+        Setter for **self.uv** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('uv'))
+
+    def uv_to_CCT(self, uv):
+        """
+        Returns the correlated colour temperature :math:`T_{cp}` and
+        :math:`\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
+        coordinates.
+
+        Parameters
+        ----------
+        uv : array_like, (..., 2)
+            *CIE UCS* colourspace *uv* chromaticity coordinates.
+
+        Returns
+        -------
+        ndarray, (..., 2)
+            Correlated colour temperature :math:`T_{cp}`,
+            :math:`\Delta_{uv}`.
+
+        Examples
+        --------
+        >>> index = PlanckianLocusIndex()
+        >>> uv = np.array([[0.1978, 0.3122], [0.4328, 0.2883]])
+        >>> index.uv_to_CCT(uv)  # doctest: +ELLIPSIS
+        array([[  6.5075031...e+03,   3.2236777...e-03],
+               [  1.0418611...e+03,  -6.73775...e-02]])
+        """
+
+        return _planckian_locus_index_uv_to_CCT(
+            self.__uv, self.__tree, self.__start, self.__end, uv)
+
+    def CCT_to_uv(self, CCT, D_uv=0):
+        """
+        Returns the *CIE UCS* colourspace *uv* chromaticity coordinates from
+        given correlated colour temperature :math:`T_{cp}` and
+        :math:`\Delta_{uv}`.
+
+        Parameters
+        ----------
+        CCT : numeric or array_like
+            Correlated colour temperature :math:`T_{cp}`.
+        D_uv : numeric or array_like, optional
+            :math:`\Delta_{uv}`.
+
+        Returns
+        -------
+        ndarray, (..., 2)
+            *CIE UCS* colourspace *uv* chromaticity coordinates.
+
+        Examples
+        --------
+        >>> index = PlanckianLocusIndex()
+        >>> CCT = np.array([6507.4342201047066, 1041.8672179878763])
+        >>> D_uv = np.array([0.003223690901512735, -0.067377582642145384])
+        >>> index.CCT_to_uv(CCT, D_uv)  # doctest: +ELLIPSIS
+        array([[ 0.1978003...,  0.3122005...],
+               [ 0.4327986...,  0.2883000...]])
+        """
+
+        return _planckian_locus_index_CCT_to_uv(
+            self.__uv, self.__start, self.__end, CCT, D_uv)
+
+
+def _planckian_locus_index_path(directory, observer, start, end, accuracy):
+    """
+    Returns the path of the file persisting the planckian locus index for
+    given observer, temperature range and accuracy.
+
+    Parameters
+    ----------
+    directory : unicode
+        Directory the planckian locus indexes are persisted into.
+    observer : unicode
+        Standard observer colour matching functions name.
+    start : numeric
+        Temperature range start in kelvins.
+    end : numeric
+        Temperature range end in kelvins.
+    accuracy : numeric
+        Maximum correlated colour temperature :math:`T_{cp}` error in kelvins.
+
+    Returns
+    -------
+    unicode
+        Planckian locus index path.
+    """
+
+    name = re.sub(r'[^\w.]+', '_', '{0}_{1}_{2}_{3}'.format(
+        observer, start, end, accuracy))
+
+    return os.path.join(directory, '{0}.npz'.format(name))
+
+
+def _planckian_locus_index_digest(cmfs):
+    """
+    Returns the digest of given colour matching functions content identifying
+    the persisted planckian locus indexes built from them.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    unicode
+        Colour matching functions digest.
+
+    Notes
+    -----
+    -   :attr:`SpectralPowerDistribution.content_hash` attribute is not stable
+        across processes, thus cannot identify persisted data.
+    """
+
+    digest = hashlib.sha1()
+    for spd in (cmfs.x_bar, cmfs.y_bar, cmfs.z_bar):
+        digest.update(np.ascontiguousarray(spd.wavelengths, '<f8').tobytes())
+        digest.update(np.ascontiguousarray(spd.values, '<f8').tobytes())
+
+    return digest.hexdigest()
+
+
+def planckian_locus_index(cmfs=STANDARD_OBSERVERS_CMFS.get(
+                              'CIE 1931 2 Degree Standard Observer'),
+                          start=CCT_MINIMAL,
+                          end=CCT_MAXIMAL,
+                          accuracy=PLANCKIAN_LOCUS_INDEX_ACCURACY,
+                          directory=None):
+    """
+    Returns the planckian locus index for given colour matching functions,
+    temperature range and accuracy.
+
+    The indexes are kept in a least recently used cache and can optionally be
+    persisted on disk.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    start : numeric, optional
+        Temperature range start in kelvins.
+    end : numeric, optional
+        Temperature range end in kelvins.
+    accuracy : numeric, optional
+        Maximum correlated colour temperature :math:`T_{cp}` error in kelvins.
+    directory : unicode, optional
+        Directory the indexes are persisted into, an index existing in given
+        directory is loaded instead of being built.
+
+    Returns
+    -------
+    PlanckianLocusIndex
+        Planckian locus index.
+
+    Notes
+    -----
+    -   The maximum number of cached indexes is defined by
+        :attr:`PLANCKIAN_LOCUS_INDEXES_CACHE_SIZE` attribute.
+    -   Persisted indexes are named after the colour matching functions name
+        and store a digest of their content, an index whose digest does not
+        match given colour matching functions is rebuilt and persisted again.
+
+    Examples
+    --------
+    >>> index = planckian_locus_index()
+    >>> index is planckian_locus_index()
+    True
+    """
+
+    shape = cmfs.shape
+    key = (shape.start,
+           shape.end,
+           shape.steps,
+           cmfs.x_bar.content_hash,
+           cmfs.y_bar.content_hash,
+           cmfs.z_bar.content_hash,
+           start,
+           end,
+           accuracy)
+
+    index = _PLANCKIAN_LOCUS_INDEXES_CACHE.get(key)
+    if index is not None:
+        return index
+
+    path = (_planckian_locus_index_path(
+        directory, cmfs.name, start, end, accuracy)
+        if directory is not None else None)
+
+    digest = (_planckian_locus_index_digest(cmfs)
+              if path is not None else None)
+
+    if path is not None and os.path.exists(path):
+        with np.load(path) as data:
+            if 'digest' in data.files and str(data['digest']) == digest:
+                index = PlanckianLocusIndex(
+                    cmfs, start, end, accuracy, data['uv'])
+
+    if index is None:
+        index = PlanckianLocusIndex(cmfs, start, end, accuracy)
+
+        if path is not None:
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+
+            np.savez(path, uv=index.uv, digest=digest)
+
+    _PLANCKIAN_LOCUS_INDEXES_CACHE[key] = index
+
+    return index
+
+
+def uv_to_CCT_PlanckianLocusIndex(uv, index=None, **kwargs):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
+    coordinates using a planckian locus index.
+
+    Parameters
+    ----------
+    uv : array_like, (..., 2)
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+    index : PlanckianLocusIndex, optional
+        Planckian locus index, it is retrieved with
+        :func:`planckian_locus_index` definition if not given.
+    \**kwargs : dict, optional
+        Keywords arguments passed to :func:`planckian_locus_index` definition.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`.
+
+    Examples
+    --------
+    >>> uv = np.array([0.1978, 0.3122])
+    >>> uv_to_CCT_PlanckianLocusIndex(uv)  # doctest: +ELLIPSIS
+    array([  6.5075031...e+03,   3.2236777...e-03])
+    """
+
+    if index is None:
+        index = planckian_locus_index(**kwargs)
+
+    return index.uv_to_CCT(uv)
+
+
+def CCT_to_uv_PlanckianLocusIndex(CCT, D_uv=0, index=None, **kwargs):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates from given
+    correlated colour temperature :math:`T_{cp}` and :math:`\Delta_{uv}` using
+    a planckian locus index.
+
+    Parameters
+    ----------
+    CCT : numeric or array_like
+        Correlated colour temperature :math:`T_{cp}`.
+    D_uv : numeric or array_like, optional
+        :math:`\Delta_{uv}`.
+    index : PlanckianLocusIndex, optional
+        Planckian locus index, it is retrieved with
+        :func:`planckian_locus_index` definition if not given.
+    \**kwargs : dict, optional
+        Keywords arguments passed to :func:`planckian_locus_index` definition.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+
+    Examples
+    --------
+    >>> CCT = 6507.4342201047066
+    >>> D_uv = 0.003223690901512735
+    >>> CCT_to_uv_PlanckianLocusIndex(CCT, D_uv)  # doctest: +ELLIPSIS
+    array([ 0.1978003...,  0.3122005...])
+    """
+
+    if index is None:
+        index = planckian_locus_index(**kwargs)
+
+    return index.CCT_to_uv(CCT, D_uv)
 
 
 UV_TO_CCT_METHODS = CaseInsensitiveMapping(
     {'Ohno 2013': uv_to_CCT_Ohno2013,
-     'Robertson 1968': uv_to_CCT_Robertson1968})
+     'Robertson 1968': uv_to_CCT_Robertson1968,
+     'Planckian Locus Index': uv_to_CCT_PlanckianLocusIndex})
 """
 Supported *CIE UCS* colourspace *uv* chromaticity coordinates to correlated
 colour temperature :math:`T_{cp}` computation methods.
 
 UV_TO_CCT_METHODS : CaseInsensitiveMapping
-    **{'Ohno 2013', 'Robertson 1968'}**
+    **{'Ohno 2013', 'Robertson 1968', 'Planckian Locus Index'}**
 
 Aliases:
 
 -   'ohno2013': 'Ohno 2013'
 -   'robertson1968': 'Robertson 1968'
+-   'index': 'Planckian Locus Index'
 """
 UV_TO_CCT_METHODS['ohno2013'] = UV_TO_CCT_METHODS['Ohno 2013']
 UV_TO_CCT_METHODS['robertson1968'] = UV_TO_CCT_METHODS['Robertson 1968']
+UV_TO_CCT_METHODS['index'] = UV_TO_CCT_METHODS['Planckian Locus Index']
 
 
 def uv_to_CCT(uv, method='Ohno 2013', **kwargs):
@@ -629,7 +1638,7 @@ def uv_to_CCT(uv, method='Ohno 2013', **kwargs):
     uv : array_like
         *CIE UCS* colourspace *uv* chromaticity coordinates.
     method : unicode, optional
-        **{'Ohno 2013', 'Robertson 1968'}**,
+        **{'Ohno 2013', 'Robertson 1968', 'Planckian Locus Index'}**,
         Computation method.
     \**kwargs : dict, optional
         Keywords arguments.
@@ -654,8 +1663,10 @@ def uv_to_CCT(uv, method='Ohno 2013', **kwargs):
     array([  6.5075470...e+03,   3.2236908...e-03])
     """
 
-    if method == 'Ohno 2013':
-        return UV_TO_CCT_METHODS.get(method)(uv, **kwargs)
+    function = UV_TO_CCT_METHODS.get(method)
+
+    if function is not uv_to_CCT_Robertson1968:
+        return function(uv, **kwargs)
     else:
         if 'cmfs' in kwargs:
             if kwargs.get('cmfs').name != (
@@ -664,26 +1675,29 @@ def uv_to_CCT(uv, method='Ohno 2013', **kwargs):
                     ('Robertson (1968) method is only valid for '
                      '"CIE 1931 2 Degree Standard Observer"!'))
 
-        return UV_TO_CCT_METHODS.get(method)(uv)
+        return function(uv)
 
 
 CCT_TO_UV_METHODS = CaseInsensitiveMapping(
     {'Ohno 2013': CCT_to_uv_Ohno2013,
-     'Robertson 1968': CCT_to_uv_Robertson1968})
+     'Robertson 1968': CCT_to_uv_Robertson1968,
+     'Planckian Locus Index': CCT_to_uv_PlanckianLocusIndex})
 """
 Supported correlated colour temperature :math:`T_{cp}` to *CIE UCS* colourspace
 *uv* chromaticity coordinates computation methods.
 
 CCT_TO_UV_METHODS : CaseInsensitiveMapping
-    **{'Ohno 2013', 'Robertson 1968'}**
+    **{'Ohno 2013', 'Robertson 1968', 'Planckian Locus Index'}**
 
 Aliases:
 
 -   'ohno2013': 'Ohno 2013'
 -   'robertson1968': 'Robertson 1968'
+-   'index': 'Planckian Locus Index'
 """
 CCT_TO_UV_METHODS['ohno2013'] = CCT_TO_UV_METHODS['Ohno 2013']
 CCT_TO_UV_METHODS['robertson1968'] = CCT_TO_UV_METHODS['Robertson 1968']
+CCT_TO_UV_METHODS['index'] = CCT_TO_UV_METHODS['Planckian Locus Index']
 
 
 def CCT_to_uv(CCT, D_uv=0, method='Ohno 2013', **kwargs):
@@ -699,7 +1713,7 @@ def CCT_to_uv(CCT, D_uv=0, method='Ohno 2013', **kwargs):
     D_uv : numeric
         :math:`\Delta_{uv}`.
     method : unicode, optional
-        **{'Ohno 2013', 'Robertson 1968'}**,
+        **{'Ohno 2013', 'Robertson 1968', 'Planckian Locus Index'}**,
         Computation method.
     \**kwargs : dict, optional
         Keywords arguments.
@@ -725,8 +1739,10 @@ def CCT_to_uv(CCT, D_uv=0, method='Ohno 2013', **kwargs):
     array([ 0.1978003...,  0.3122005...])
     """
 
-    if method == 'Ohno 2013':
-        return CCT_TO_UV_METHODS.get(method)(CCT, D_uv, **kwargs)
+    function = CCT_TO_UV_METHODS.get(method)
+
+    if function is not CCT_to_uv_Robertson1968:
+        return function(CCT, D_uv, **kwargs)
     else:
         if 'cmfs' in kwargs:
             if kwargs.get('cmfs').name != (
@@ -735,7 +1751,7 @@ def CCT_to_uv(CCT, D_uv=0, method='Ohno 2013', **kwargs):
                     ('Robertson (1968) method is only valid for '
                      '"CIE 1931 2 Degree Standard Observer"!'))
 
-        return CCT_TO_UV_METHODS.get(method)(CCT, D_uv)
+        return function(CCT, D_uv)
 
 
 def xy_to_CCT_McCamy1992(xy):
@@ -824,6 +1840,40 @@ def xy_to_CCT_Hernandez1999(xy):
     return CCT
 
 
+def xy_to_CCT_PlanckianLocusIndex(xy, index=None, **kwargs):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` from given
+    *CIE XYZ* tristimulus values *xy* chromaticity coordinates using a
+    planckian locus index.
+
+    Parameters
+    ----------
+    xy : array_like
+        *xy* chromaticity coordinates.
+    index : PlanckianLocusIndex, optional
+        Planckian locus index, it is retrieved with
+        :func:`planckian_locus_index` definition if not given.
+    \**kwargs : dict, optional
+        Keywords arguments passed to :func:`planckian_locus_index` definition.
+
+    Returns
+    -------
+    numeric or ndarray
+        Correlated colour temperature :math:`T_{cp}`.
+
+    Examples
+    --------
+    >>> xy_to_CCT_PlanckianLocusIndex(  # doctest: +ELLIPSIS
+    ...     np.array([0.31271, 0.32902]))
+    6503.6524001...
+    """
+
+    CCT, _D_uv = tsplit(uv_to_CCT_PlanckianLocusIndex(
+        UCS_to_uv(XYZ_to_UCS(xy_to_XYZ(xy))), index, **kwargs))
+
+    return CCT
+
+
 def CCT_to_xy_Kang2002(CCT):
     """
     Returns the *CIE XYZ* tristimulus values *xy* chromaticity coordinates from
@@ -954,21 +2004,24 @@ def CCT_to_xy_CIE_D(CCT):
 
 XY_TO_CCT_METHODS = CaseInsensitiveMapping(
     {'McCamy 1992': xy_to_CCT_McCamy1992,
-     'Hernandez 1999': xy_to_CCT_Hernandez1999})
+     'Hernandez 1999': xy_to_CCT_Hernandez1999,
+     'Planckian Locus Index': xy_to_CCT_PlanckianLocusIndex})
 """
 Supported *CIE XYZ* tristimulus values *xy* chromaticity coordinates to
 correlated colour temperature :math:`T_{cp}` computation methods.
 
 XY_TO_CCT_METHODS : CaseInsensitiveMapping
-    **{'McCamy 1992', 'Hernandez 1999'}**
+    **{'McCamy 1992', 'Hernandez 1999', 'Planckian Locus Index'}**
 
 Aliases:
 
 -   'mccamy1992': 'McCamy 1992'
 -   'hernandez1999': 'Hernandez 1999'
+-   'index': 'Planckian Locus Index'
 """
 XY_TO_CCT_METHODS['mccamy1992'] = XY_TO_CCT_METHODS['McCamy 1992']
 XY_TO_CCT_METHODS['hernandez1999'] = XY_TO_CCT_METHODS['Hernandez 1999']
+XY_TO_CCT_METHODS['index'] = XY_TO_CCT_METHODS['Planckian Locus Index']
 
 
 def xy_to_CCT(xy, method='McCamy 1992', **kwargs):
@@ -982,7 +2035,7 @@ def xy_to_CCT(xy, method='McCamy 1992', **kwargs):
     xy : array_like
         *xy* chromaticity coordinates.
     method : unicode, optional
-        **{'McCamy 1992', 'Hernandez 1999'}**,
+        **{'McCamy 1992', 'Hernandez 1999', 'Planckian Locus Index'}**,
         Computation method.
     \**kwargs : dict, optional
         Keywords arguments.
@@ -993,29 +2046,75 @@ def xy_to_CCT(xy, method='McCamy 1992', **kwargs):
         Correlated colour temperature :math:`T_{cp}`.
     """
 
-    return XY_TO_CCT_METHODS.get(method)(xy)
+    function = XY_TO_CCT_METHODS.get(method)
+
+    if function is xy_to_CCT_PlanckianLocusIndex:
+        return function(xy, **kwargs)
+    else:
+        return function(xy)
+
+
+def CCT_to_xy_Ohno2013(CCT,
+                       D_uv=0,
+                       cmfs=STANDARD_OBSERVERS_CMFS.get(
+                           'CIE 1931 2 Degree Standard Observer')):
+    """
+    Returns the *CIE XYZ* tristimulus values *xy* chromaticity coordinates from
+    given correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}` and
+    colour matching functions using Ohno (2013) method.
+
+    Parameters
+    ----------
+    CCT : numeric or array_like
+        Correlated colour temperature :math:`T_{cp}`.
+    D_uv : numeric or array_like, optional
+        :math:`\Delta_{uv}`.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        *xy* chromaticity coordinates.
+
+    See Also
+    --------
+    CCT_to_uv_Ohno2013
+
+    Examples
+    --------
+    >>> CCT = np.array([[5000, 6500], [5000, 6500]])
+    >>> D_uv = np.array([[0, 0], [0.01, 0.01]])
+    >>> CCT_to_xy_Ohno2013(CCT, D_uv)  # doctest: +ELLIPSIS
+    array([[[ 0.3451..., ...
+    """
+
+    return UCS_uv_to_xy(CCT_to_uv_Ohno2013(CCT, D_uv, cmfs))
 
 
 CCT_TO_XY_METHODS = CaseInsensitiveMapping(
     {'Kang 2002': CCT_to_xy_Kang2002,
-     'CIE Illuminant D Series': CCT_to_xy_CIE_D})
+     'CIE Illuminant D Series': CCT_to_xy_CIE_D,
+     'Ohno 2013': CCT_to_xy_Ohno2013})
 """
 Supported correlated colour temperature :math:`T_{cp}` to *CIE XYZ* tristimulus
 values *xy* chromaticity coordinates computation methods.
 
 CCT_TO_XY_METHODS : CaseInsensitiveMapping
-    **{'Kang 2002', 'CIE Illuminant D Series'}**
+    **{'Kang 2002', 'CIE Illuminant D Series', 'Ohno 2013'}**
 
 Aliases:
 
 -   'kang2002': 'Kang 2002'
 -   'cie_d': 'Hernandez 1999'
+-   'ohno2013': 'Ohno 2013'
 """
 CCT_TO_XY_METHODS['kang2002'] = CCT_TO_XY_METHODS['Kang 2002']
 CCT_TO_XY_METHODS['cie_d'] = CCT_TO_XY_METHODS['CIE Illuminant D Series']
+CCT_TO_XY_METHODS['ohno2013'] = CCT_TO_XY_METHODS['Ohno 2013']
 
 
-def CCT_to_xy(CCT, method='Kang 2002'):
+def CCT_to_xy(CCT, method='Kang 2002', **kwargs):
     """
     Returns the *CIE XYZ* tristimulus values *xy* chromaticity coordinates from
     given correlated colour temperature :math:`T_{cp}` using given method.
@@ -1025,13 +2124,28 @@ def CCT_to_xy(CCT, method='Kang 2002'):
     CCT : numeric or array_like
         Correlated colour temperature :math:`T_{cp}`.
     method : unicode, optional
-        **{'Kang 2002', 'CIE Illuminant D Series'}**,
+        **{'Kang 2002', 'CIE Illuminant D Series', 'Ohno 2013'}**,
         Computation method.
+    \**kwargs : dict, optional
+        Keywords arguments passed to :func:`CCT_to_xy_Ohno2013` definition.
 
     Returns
     -------
-    ndarray
+    ndarray, (..., 2)
         *xy* chromaticity coordinates.
+
+    Examples
+    --------
+    >>> CCT = np.array([5000, 6500])
+    >>> CCT_to_xy(CCT)  # doctest: +ELLIPSIS
+    array([[ 0.3449..., ...
+    >>> CCT_to_xy(CCT, 'Ohno 2013', D_uv=0.01)  # doctest: +ELLIPSIS
+    array([[ 0.3...
     """
 
-    return CCT_TO_XY_METHODS.get(method)(CCT)
+    function = CCT_TO_XY_METHODS.get(method)
+
+    if function is CCT_to_xy_Ohno2013:
+        return function(CCT, **kwargs)
+    else:
+        return function(CCT)
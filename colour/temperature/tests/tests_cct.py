@@ -8,23 +8,39 @@ Defines unit tests for :mod:`colour.temperature.cct` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 from itertools import permutations
 
-from colour.colorimetry import STANDARD_OBSERVERS_CMFS
+from colour.colorimetry import (
+    STANDARD_OBSERVERS_CMFS,
+    blackbody_spd,
+    spectral_to_XYZ)
+from colour.models import UCS_to_uv, XYZ_to_UCS
 from colour.temperature import (
     CCT_to_uv_Ohno2013,
     CCT_to_uv_Robertson1968,
     uv_to_CCT_Ohno2013,
     uv_to_CCT_Robertson1968,
+    PlanckianLocusIndex,
+    planckian_locus_index,
+    CCT_to_uv,
+    uv_to_CCT,
     CCT_to_xy_Kang2002,
     CCT_to_xy_CIE_D,
+    CCT_to_xy_Ohno2013,
+    CCT_to_xy,
     xy_to_CCT_McCamy1992,
-    xy_to_CCT_Hernandez1999)
+    xy_to_CCT_Hernandez1999,
+    xy_to_CCT_PlanckianLocusIndex,
+    xy_to_CCT)
 from colour.temperature.cct import (
+    _PLANCKIAN_LOCUS_INDEXES_CACHE,
     planckian_table,
     planckian_table_minimal_distance_index)
-from colour.utilities import ignore_numpy_errors
+from colour.utilities import ignore_numpy_errors, tsplit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -39,10 +55,15 @@ __all__ = ['TestPlanckianTable',
            'TestCCT_to_uv_Ohno2013',
            'Testuv_to_CCT_Robertson1968',
            'TestCCT_to_uv_Robertson1968',
+           'TestPlanckianLocusIndex',
+           'TestPlanckianLocusIndexDefinition',
+           'TestPlanckianLocusIndexMethods',
            'Testxy_to_CCT_McCamy1992',
            'Testxy_to_CCT_Hernandez1999',
            'TestCCT_to_xy_Kang2002',
-           'TestCCT_to_xy_CIE_D']
+           'TestCCT_to_xy_CIE_D',
+           'TestCCT_to_xy_Ohno2013',
+           'TestCCT_to_xy']
 
 PLANCKIAN_TABLE = (
     (1000.00000000, 0.44801089, 0.35462498, 0.25378213),
@@ -178,6 +199,24 @@ class TestPlanckianTable(unittest.TestCase):
                 np.array([0.1978, 0.3122]), cmfs, 1000, 1010, 10)],
             PLANCKIAN_TABLE)
 
+    def test_observers_planckian_table(self):
+        """
+        Tests :func:`colour.temperature.cct.planckian_table` definition with
+        different standard observers.
+        """
+
+        uv = np.array([0.1978, 0.3122])
+        for observer in ('CIE 1931 2 Degree Standard Observer',
+                         'CIE 1964 10 Degree Standard Observer'):
+            cmfs = STANDARD_OBSERVERS_CMFS.get(observer)
+            for x in planckian_table(uv, cmfs, 1000, 100000, 10):
+                np.testing.assert_almost_equal(
+                    (x.ui, x.vi),
+                    UCS_to_uv(XYZ_to_UCS(
+                        spectral_to_XYZ(blackbody_spd(x.Ti, cmfs.shape),
+                                        cmfs))),
+                    decimal=10)
+
 
 class TestPlanckianTableMinimalDistanceIndex(unittest.TestCase):
     """
@@ -228,6 +267,48 @@ class Testuv_to_CCT_Ohno2013(unittest.TestCase):
             np.array([2452.1932942782669, -0.084369982045528508]),
             decimal=7)
 
+    def test_n_dimensional_uv_to_CCT_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition
+        n-dimensional arrays support.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer')
+        uv = np.array([[0.1978, 0.3122],
+                       [0.4328, 0.2883],
+                       [0.2927, 0.2722]])
+        CCT_D_uv = np.array([uv_to_CCT_Ohno2013(x, cmfs) for x in uv])
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs),
+            CCT_D_uv,
+            decimal=7)
+
+        uv = np.tile(uv, (2, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (2, 1))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs),
+            CCT_D_uv,
+            decimal=7)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs),
+            CCT_D_uv,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_uv_to_CCT_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition
+        nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=2))))
+        uv_to_CCT_Ohno2013(cases)
+
 
 class TestCCT_to_uv_Ohno2013(unittest.TestCase):
     """
@@ -260,6 +341,57 @@ class TestCCT_to_uv_Ohno2013(unittest.TestCase):
             np.array([0.29256616302348853, 0.27221773141874955]),
             decimal=7)
 
+    def test_n_dimensional_CCT_to_uv_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Ohno2013` definition
+        n-dimensional arrays support.
+        """
+
+        CCT = 6507.4342201047066
+        D_uv = 0.003223690901512735
+        uv = np.array([0.19780034881616862, 0.31220050291046603])
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv),
+            uv,
+            decimal=7)
+
+        CCT = np.tile(CCT, 6)
+        D_uv = np.tile(D_uv, 6)
+        uv = np.tile(uv, (6, 1))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv),
+            uv,
+            decimal=7)
+
+        CCT = np.reshape(CCT, (2, 3))
+        D_uv = np.reshape(D_uv, (2, 3))
+        uv = np.reshape(uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv),
+            uv,
+            decimal=7)
+
+        CCT = np.array([6507.4342201047066, 1041.849524611546])
+        D_uv = np.array([0, -0.067377582728534946])
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv),
+            np.array([CCT_to_uv_Ohno2013(6507.4342201047066, 0),
+                      CCT_to_uv_Ohno2013(1041.849524611546,
+                                         -0.067377582728534946)]),
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_CCT_to_uv_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Ohno2013` definition
+        nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            CCT_to_uv_Ohno2013(case[0], case[1])
+
 
 class Testuv_to_CCT_Robertson1968(unittest.TestCase):
     """
@@ -279,6 +411,38 @@ class Testuv_to_CCT_Robertson1968(unittest.TestCase):
                 key,
                 atol=0.25)
 
+    def test_n_dimensional_uv_to_CCT_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Robertson1968`
+        definition n-dimensional arrays support.
+        """
+
+        uv = np.array(list(TEMPERATURE_DUV_TO_UV.values()))
+        CCT_D_uv = np.array([uv_to_CCT_Robertson1968(x) for x in uv])
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv),
+            CCT_D_uv,
+            decimal=7)
+
+        uv = np.reshape(uv, (5, -1, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (5, -1, 2))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv),
+            CCT_D_uv,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_uv_to_CCT_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Robertson1968`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            uv_to_CCT_Robertson1968(case)
+
 
 class TestCCT_to_uv_Robertson1968(unittest.TestCase):
     """
@@ -298,6 +462,378 @@ class TestCCT_to_uv_Robertson1968(unittest.TestCase):
                 value,
                 decimal=7)
 
+    def test_n_dimensional_CCT_to_uv_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Robertson1968`
+        definition n-dimensional arrays support.
+        """
+
+        CCT, D_uv = tsplit(list(TEMPERATURE_DUV_TO_UV.keys()))
+        uv = np.array(list(TEMPERATURE_DUV_TO_UV.values()))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Robertson1968(CCT, D_uv),
+            uv,
+            decimal=7)
+
+        CCT = np.reshape(CCT, (5, -1))
+        D_uv = np.reshape(D_uv, (5, -1))
+        uv = np.reshape(uv, (5, -1, 2))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Robertson1968(CCT, D_uv),
+            uv,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_CCT_to_uv_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Robertson1968`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            CCT_to_uv_Robertson1968(*case)
+
+
+class TestPlanckianLocusIndex(unittest.TestCase):
+    """
+    Defines :class:`colour.temperature.cct.PlanckianLocusIndex` class units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__index = planckian_locus_index()
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('cmfs',
+                               'start',
+                               'end',
+                               'accuracy',
+                               'temperatures',
+                               'uv')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(PlanckianLocusIndex))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('uv_to_CCT',
+                            'CCT_to_uv')
+
+        for method in required_methods:
+            self.assertIn(method, dir(PlanckianLocusIndex))
+
+    def test_temperatures(self):
+        """
+        Tests :attr:`colour.temperature.cct.PlanckianLocusIndex.temperatures`
+        attribute.
+        """
+
+        temperatures = self.__index.temperatures
+        self.assertEqual(len(temperatures), len(self.__index.uv))
+        self.assertAlmostEqual(temperatures[0], 1000, places=7)
+        self.assertAlmostEqual(temperatures[-1], 100000, places=7)
+        np.testing.assert_almost_equal(
+            temperatures[1:] / temperatures[:-1],
+            np.tile(temperatures[1] / temperatures[0], len(temperatures) - 1),
+            decimal=7)
+
+    def test_uv_to_CCT(self):
+        """
+        Tests :meth:`colour.temperature.cct.PlanckianLocusIndex.uv_to_CCT`
+        method.
+        """
+
+        np.testing.assert_almost_equal(
+            self.__index.uv_to_CCT(np.array([0.1978, 0.3122])),
+            np.array([6507.5031202413830, 0.0032236777930704772]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            self.__index.uv_to_CCT(np.array([0.4328, 0.2883])),
+            np.array([1041.8611622372316, -0.067377549952792060]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            self.__index.uv_to_CCT(np.array([0.2927, 0.2722])),
+            np.array([2445.0069746274330, -0.084369988624158900]),
+            decimal=7)
+
+    def test_CCT_to_uv(self):
+        """
+        Tests :meth:`colour.temperature.cct.PlanckianLocusIndex.CCT_to_uv`
+        method.
+        """
+
+        np.testing.assert_almost_equal(
+            self.__index.CCT_to_uv(6507.4342201047066, 0.003223690901512735),
+            np.array([0.19780035290770237, 0.31220050946506056]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            self.__index.CCT_to_uv(1041.849524611546, -0.067377582728534946),
+            np.array([0.43280254497668410, 0.28829975397184310]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            self.__index.CCT_to_uv(2448.9489053326438, -0.084324704634692743),
+            np.array([0.29256591561571943, 0.27221767862150750]),
+            decimal=7)
+
+    def test_accuracy(self):
+        """
+        Tests :class:`colour.temperature.cct.PlanckianLocusIndex` class
+        accuracy.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer')
+        index = PlanckianLocusIndex(cmfs, 2000, 20000, 1)
+        self.assertLess(len(index.uv), len(self.__index.uv))
+
+        CCT = np.linspace(2500, 15000, 7)
+        for D_uv in (-0.02, 0, 0.02):
+            uv = np.array([CCT_to_uv_Ohno2013(x, D_uv, cmfs) for x in CCT])
+            np.testing.assert_allclose(
+                index.uv_to_CCT(uv)[..., 0], CCT, atol=1)
+            np.testing.assert_allclose(
+                self.__index.uv_to_CCT(uv)[..., 0], CCT, atol=0.1)
+            np.testing.assert_allclose(
+                self.__index.CCT_to_uv(CCT, D_uv), uv, atol=1e-7)
+
+    def test_n_dimensional_uv_to_CCT(self):
+        """
+        Tests :meth:`colour.temperature.cct.PlanckianLocusIndex.uv_to_CCT`
+        method n-dimensional arrays support.
+        """
+
+        uv = np.array([0.1978, 0.3122])
+        CCT_D_uv = np.array([6507.5031202413830, 0.0032236777930704772])
+        np.testing.assert_almost_equal(
+            self.__index.uv_to_CCT(uv),
+            CCT_D_uv,
+            decimal=7)
+
+        uv = np.tile(uv, (6, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (6, 1))
+        np.testing.assert_almost_equal(
+            self.__index.uv_to_CCT(uv),
+            CCT_D_uv,
+            decimal=7)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            self.__index.uv_to_CCT(uv),
+            CCT_D_uv,
+            decimal=7)
+
+    def test_n_dimensional_CCT_to_uv(self):
+        """
+        Tests :meth:`colour.temperature.cct.PlanckianLocusIndex.CCT_to_uv`
+        method n-dimensional arrays support.
+        """
+
+        CCT = 6507.4342201047066
+        D_uv = 0.003223690901512735
+        uv = np.array([0.19780035290770237, 0.31220050946506056])
+        np.testing.assert_almost_equal(
+            self.__index.CCT_to_uv(CCT, D_uv),
+            uv,
+            decimal=7)
+
+        CCT = np.tile(CCT, 6)
+        D_uv = np.tile(D_uv, 6)
+        uv = np.tile(uv, (6, 1))
+        np.testing.assert_almost_equal(
+            self.__index.CCT_to_uv(CCT, D_uv),
+            uv,
+            decimal=7)
+
+        CCT = np.reshape(CCT, (2, 3))
+        D_uv = np.reshape(D_uv, (2, 3))
+        uv = np.reshape(uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            self.__index.CCT_to_uv(CCT, D_uv),
+            uv,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_uv_to_CCT(self):
+        """
+        Tests :meth:`colour.temperature.cct.PlanckianLocusIndex.uv_to_CCT`
+        method nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=2))))
+        self.__index.uv_to_CCT(cases)
+
+    @ignore_numpy_errors
+    def test_nan_CCT_to_uv(self):
+        """
+        Tests :meth:`colour.temperature.cct.PlanckianLocusIndex.CCT_to_uv`
+        method nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=2))))
+        self.__index.CCT_to_uv(*tsplit(cases))
+
+
+class TestPlanckianLocusIndexDefinition(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.cct.planckian_locus_index` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self.__temporary_directory)
+
+    def test_planckian_locus_index(self):
+        """
+        Tests :func:`colour.temperature.cct.planckian_locus_index`
+        definition.
+        """
+
+        self.assertIs(planckian_locus_index(), planckian_locus_index())
+        self.assertIsNot(planckian_locus_index(accuracy=1),
+                         planckian_locus_index())
+
+    def test_planckian_locus_index_persistence(self):
+        """
+        Tests :func:`colour.temperature.cct.planckian_locus_index` definition
+        persistence.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1964 10 Degree Standard Observer')
+        index = planckian_locus_index(
+            cmfs, 2000, 20000, 0.5, self.__temporary_directory)
+
+        files = os.listdir(self.__temporary_directory)
+        self.assertEqual(len(files), 1)
+
+        with np.load(os.path.join(self.__temporary_directory,
+                                  files[0])) as data:
+            np.testing.assert_almost_equal(data['uv'], index.uv)
+
+            np.testing.assert_almost_equal(
+                PlanckianLocusIndex(
+                    cmfs, 2000, 20000, 0.5, data['uv']).uv_to_CCT(
+                    np.array([0.1978, 0.3122])),
+                index.uv_to_CCT(np.array([0.1978, 0.3122])),
+                decimal=7)
+
+    def test_stale_planckian_locus_index_persistence(self):
+        """
+        Tests :func:`colour.temperature.cct.planckian_locus_index` definition
+        persisted indexes invalidation when the colour matching functions are
+        modified.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1964 10 Degree Standard Observer')
+        planckian_locus_index(
+            cmfs, 2000, 20000, 0.75, self.__temporary_directory)
+        path = os.path.join(self.__temporary_directory,
+                            os.listdir(self.__temporary_directory)[0])
+        with np.load(path) as data:
+            uv, digest = data['uv'], data['digest']
+
+        np.savez(path, uv=np.zeros(uv.shape), digest=digest)
+        _PLANCKIAN_LOCUS_INDEXES_CACHE.clear()
+        np.testing.assert_equal(
+            planckian_locus_index(
+                cmfs, 2000, 20000, 0.75, self.__temporary_directory).uv,
+            np.zeros(uv.shape))
+
+        modified_cmfs = cmfs.clone()
+        modified_cmfs[555] = modified_cmfs[555] * 1.5
+        _PLANCKIAN_LOCUS_INDEXES_CACHE.clear()
+        index = planckian_locus_index(
+            modified_cmfs, 2000, 20000, 0.75, self.__temporary_directory)
+        self.assertFalse(np.allclose(index.uv, 0))
+        self.assertEqual(len(os.listdir(self.__temporary_directory)), 1)
+        with np.load(path) as data:
+            np.testing.assert_almost_equal(data['uv'], index.uv)
+            self.assertNotEqual(str(data['digest']), str(digest))
+
+        np.savez(path, uv=np.zeros(uv.shape))
+        _PLANCKIAN_LOCUS_INDEXES_CACHE.clear()
+        np.testing.assert_almost_equal(
+            planckian_locus_index(
+                cmfs, 2000, 20000, 0.75, self.__temporary_directory).uv,
+            uv)
+
+
+class TestPlanckianLocusIndexMethods(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.cct.uv_to_CCT`,
+    :func:`colour.temperature.cct.CCT_to_uv` and
+    :func:`colour.temperature.cct.xy_to_CCT` definitions planckian locus index
+    method unit tests methods.
+    """
+
+    def test_planckian_locus_index_methods(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT`,
+        :func:`colour.temperature.cct.CCT_to_uv` and
+        :func:`colour.temperature.cct.xy_to_CCT` definitions planckian locus
+        index method.
+        """
+
+        index = planckian_locus_index()
+        uv = np.array([0.1978, 0.3122])
+
+        np.testing.assert_almost_equal(
+            uv_to_CCT(uv, method='Planckian Locus Index'),
+            index.uv_to_CCT(uv),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            uv_to_CCT(uv, method='index', index=index),
+            index.uv_to_CCT(uv),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            CCT_to_uv(6500, 0.01, method='Planckian Locus Index'),
+            index.CCT_to_uv(6500, 0.01),
+            decimal=7)
+
+        xy = np.array([0.31271, 0.32902])
+        self.assertAlmostEqual(
+            xy_to_CCT(xy, method='Planckian Locus Index'),
+            xy_to_CCT_PlanckianLocusIndex(xy),
+            places=7)
+        self.assertAlmostEqual(
+            xy_to_CCT_PlanckianLocusIndex(xy),
+            6503.6524001588623,
+            places=7)
+
 
 class Testxy_to_CCT_McCamy1992(unittest.TestCase):
     """
@@ -565,5 +1101,93 @@ class TestCCT_to_xy_CIE_D(unittest.TestCase):
             CCT_to_xy_CIE_D(case)
 
 
+class TestCCT_to_xy_Ohno2013(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.cct.CCT_to_xy_Ohno2013` definition
+    unit tests methods.
+    """
+
+    def test_CCT_to_xy_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_xy_Ohno2013` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            CCT_to_xy_Ohno2013(6507.4342201047066, 0.003223690901512735),
+            np.array([0.31264599, 0.32897898]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            CCT_to_xy_Ohno2013(5000, 0),
+            np.array([0.34510343, 0.35160985]),
+            decimal=7)
+
+    def test_n_dimensional_CCT_to_xy_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_xy_Ohno2013` definition
+        n-dimensional arrays support.
+        """
+
+        CCT = 6507.4342201047066
+        D_uv = 0.003223690901512735
+        xy = CCT_to_xy_Ohno2013(CCT, D_uv)
+
+        CCT = np.tile(CCT, 6)
+        D_uv = np.tile(D_uv, 6)
+        xy = np.tile(xy, (6, 1))
+        np.testing.assert_almost_equal(
+            CCT_to_xy_Ohno2013(CCT, D_uv),
+            xy,
+            decimal=7)
+
+        CCT = np.reshape(CCT, (2, 3))
+        D_uv = np.reshape(D_uv, (2, 3))
+        xy = np.reshape(xy, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            CCT_to_xy_Ohno2013(CCT, D_uv),
+            xy,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_CCT_to_xy_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_xy_Ohno2013` definition
+        nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            CCT_to_xy_Ohno2013(case[0], case[1])
+
+
+class TestCCT_to_xy(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.cct.CCT_to_xy` definition units tests
+    methods.
+    """
+
+    def test_CCT_to_xy(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_xy` definition.
+        """
+
+        CCT = np.array([4000, 7000])
+        np.testing.assert_almost_equal(
+            CCT_to_xy(CCT),
+            CCT_to_xy_Kang2002(CCT),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            CCT_to_xy(CCT, 'CIE Illuminant D Series'),
+            CCT_to_xy_CIE_D(CCT),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            CCT_to_xy(CCT, 'Ohno 2013', D_uv=0.01),
+            CCT_to_xy_Ohno2013(CCT, 0.01),
+            decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -32,8 +32,17 @@ from .data_structures import (
     ArbitraryPrecisionMapping,
     Lookup,
     Structure,
-    CaseInsensitiveMapping)
+    CaseInsensitiveMapping,
+    LazyCaseInsensitiveMapping,
+    LRUCache)
 from .verbose import message_box, warning
+from .archive import (
+    DATASETS_ARCHIVE_PATH,
+    write_datasets_archive,
+    read_datasets_archive,
+    dataset_table,
+    archived_dataset)
+from .profiling import import_time, colour_modules, import_times
 
 __all__ = ['handle_numpy_errors',
            'ignore_numpy_errors',
@@ -61,5 +70,13 @@ __all__ += ['as_numeric',
 __all__ += ['ArbitraryPrecisionMapping',
             'Lookup',
             'Structure',
-            'CaseInsensitiveMapping']
+            'CaseInsensitiveMapping',
+            'LazyCaseInsensitiveMapping',
+            'LRUCache']
 __all__ += ['message_box', 'warning']
+__all__ += ['DATASETS_ARCHIVE_PATH',
+            'write_datasets_archive',
+            'read_datasets_archive',
+            'dataset_table',
+            'archived_dataset']
+__all__ += ['import_time', 'colour_modules', 'import_times']
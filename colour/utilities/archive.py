@@ -0,0 +1,550 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Datasets Archive
+================
+
+Defines the objects serialising the tabulated datasets into a compact binary
+archive and memory-mapping it at runtime:
+
+-   :func:`write_datasets_archive`
+-   :func:`read_datasets_archive`
+-   :func:`dataset_table`
+-   :func:`archived_dataset`
+
+The archive is a single file made of a header, a *JSON* index and 64 bytes
+aligned *float64* little-endian blocks stored in column-major order so that
+each table column is a contiguous memory-mapped array. The pages of the file
+are shared through the operating system cache between the processes reading
+it.
+
+The *Python* literals defining the datasets remain the source of truth, they
+are defined in dedicated modules that are only imported when needed: the
+archive index stores the digest of the source module each dataset has been
+serialised from, the archive is only used when it exists, has the expected
+format version and the digest matches the source module file, otherwise the
+source module is imported and its literal is used as is. The source modules
+files are digested once per process and the literals are neither evaluated
+nor digested when the archive is used.
+
+See Also
+--------
+`utilities/build_datasets_archive.py` script building the archive.
+"""
+
+from __future__ import division, unicode_literals
+
+import hashlib
+import json
+import numpy as np
+import os
+import pkgutil
+import struct
+from importlib import import_module
+from collections import Mapping, namedtuple
+
+from colour.utilities import is_numeric
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['DATASETS_ARCHIVE_MAGIC',
+           'DATASETS_ARCHIVE_FORMAT_VERSION',
+           'DATASETS_ARCHIVE_PATH',
+           'DatasetsArchive',
+           'write_datasets_archive',
+           'read_datasets_archive',
+           'dataset_table',
+           'archived_dataset']
+
+DATASETS_ARCHIVE_MAGIC = b'CLRDSARC'
+"""
+Datasets archive magic number.
+
+DATASETS_ARCHIVE_MAGIC : bytes
+"""
+
+DATASETS_ARCHIVE_FORMAT_VERSION = 3
+"""
+Datasets archive format version, archives with a different version are
+ignored.
+
+DATASETS_ARCHIVE_FORMAT_VERSION : int
+"""
+
+DATASETS_ARCHIVE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), 'resources', 'datasets.bin')
+"""
+Default datasets archive path.
+
+DATASETS_ARCHIVE_PATH : unicode
+"""
+
+_DATASETS_ARCHIVE_HEADER = struct.Struct(str('<8sII'))
+_DATASETS_ARCHIVE_ALIGNMENT = 64
+
+_DATASETS_ARCHIVE_CACHE = {}
+_ARCHIVED_DATASETS_CACHE = {}
+_SOURCES_DIGESTS_CACHE = {}
+
+
+class DatasetsArchive(
+    namedtuple('DatasetsArchive', ('path', 'index', 'buffer'))):
+    """
+    Defines a memory-mapped datasets archive.
+
+    Parameters
+    ----------
+    path : unicode
+        Datasets archive path.
+    index : dict
+        Datasets archive index mapping the datasets names to their source
+        module digest and tables records.
+    buffer : memmap
+        Memory-mapped datasets archive content.
+    """
+
+
+def _is_table(data):
+    """
+    Returns if given data is a table, i.e. a mapping of numeric keys to
+    numeric values or a sequence of numeric rows.
+
+    Parameters
+    ----------
+    data : object
+        Data to test.
+
+    Returns
+    -------
+    bool
+        Is data a table.
+    """
+
+    if isinstance(data, Mapping):
+        rows = data.values()
+        if not data or not all(is_numeric(key) for key in data.keys()):
+            return False
+    elif isinstance(data, (tuple, list)):
+        rows = data
+        if not data or not all(isinstance(row, (tuple, list))
+                               for row in rows):
+            return False
+    else:
+        return False
+
+    return all(is_numeric(value) for row in rows
+               for value in (row if isinstance(row, (tuple, list)) else
+                             (row,)))
+
+
+def _source_digest(source):
+    """
+    Returns the digest of given source module file without importing the
+    module and caches it.
+
+    Parameters
+    ----------
+    source : unicode
+        Source module name, e.g. *colour.colorimetry.dataset.cmfs_data*.
+
+    Returns
+    -------
+    unicode or None
+        Source module file digest, *None* if the module file cannot be found.
+    """
+
+    if source in _SOURCES_DIGESTS_CACHE:
+        return _SOURCES_DIGESTS_CACHE[source]
+
+    digest = None
+    loader = pkgutil.get_loader(source)
+    filename = loader.get_filename() if loader is not None else None
+    if filename is not None and os.path.isfile(filename):
+        with open(filename, 'rb') as handle:
+            digest = hashlib.sha1(handle.read()).hexdigest()
+
+    _SOURCES_DIGESTS_CACHE[source] = digest
+
+    return digest
+
+
+def _is_source_digest(archive, dataset, source):
+    """
+    Returns if given archive dataset digest matches given source module file.
+
+    Parameters
+    ----------
+    archive : DatasetsArchive
+        Datasets archive.
+    dataset : unicode
+        Dataset name.
+    source : unicode
+        Source module name.
+
+    Returns
+    -------
+    bool
+        Does the dataset digest match the source module file.
+    """
+
+    digest = _source_digest(source)
+
+    return (digest is not None and
+            archive.index[dataset]['source'] == digest)
+
+
+def _tables(data, path=()):
+    """
+    Yields the tables of given nested data with their path.
+
+    Parameters
+    ----------
+    data : dict or tuple
+        Nested data.
+    path : tuple, optional
+        Path of the data.
+
+    Returns
+    -------
+    generator
+        Tables path, *ndarray* and whether the table is a mapping.
+
+    Raises
+    ------
+    ValueError
+        If the data contains values that are neither tables nor mappings.
+    """
+
+    if _is_table(data):
+        if isinstance(data, Mapping):
+            yield path, np.array(
+                [(key,) + tuple(np.ravel(data[key]))
+                 for key in sorted(data.keys())],
+                dtype=np.float_), True
+        else:
+            yield path, np.array(data, dtype=np.float_), False
+    elif isinstance(data, Mapping):
+        for key in sorted(data.keys()):
+            for table in _tables(data[key], path + (key,)):
+                yield table
+    else:
+        raise ValueError(
+            '"{0}" value is neither a table nor a mapping!'.format(path))
+
+
+def write_datasets_archive(datasets, path=None, sources=None):
+    """
+    Writes given datasets into a binary archive.
+
+    Parameters
+    ----------
+    datasets : dict
+        Datasets to write, the keys are the datasets names and the values are
+        the nested *dict* literals defining them. The tables, i.e. the
+        mappings of numeric keys to numeric values and the sequences of
+        numeric rows are stored as blocks, the other mappings are traversed.
+    path : unicode, optional
+        Datasets archive path, :attr:`DATASETS_ARCHIVE_PATH` attribute value
+        is used if not given.
+    sources : dict, optional
+        Names of the modules defining the literals the datasets are serialised
+        or derived from, indexed by the datasets names. The digest of the
+        source modules files is stored in the archive index, the datasets
+        without source module are only returned by :func:`dataset_table`
+        definition when it is not given a source module.
+
+    Returns
+    -------
+    unicode
+        Datasets archive path.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'datasets.bin')
+    >>> datasets = {'SPDS_DATA': {'Flat': {500: 1.0, 510: 1.0}}}
+    >>> write_datasets_archive(datasets, path) == path
+    True
+    """
+
+    if path is None:
+        path = DATASETS_ARCHIVE_PATH
+
+    if sources is None:
+        sources = {}
+
+    _SOURCES_DIGESTS_CACHE.clear()
+
+    index, blocks, offset = {}, [], 0
+    for name in sorted(datasets.keys()):
+        records = []
+        index[name] = {'source': (_source_digest(sources[name])
+                                  if name in sources else None),
+                       'tables': records}
+        for table_path, table, is_mapping in _tables(datasets[name]):
+            block = np.asfortranarray(table, dtype='<f8').tobytes(order='F')
+            records.append({'path': list(table_path),
+                            'offset': offset,
+                            'shape': list(table.shape),
+                            'mapping': is_mapping})
+            padding = -len(block) % _DATASETS_ARCHIVE_ALIGNMENT
+            blocks.append(block + b'\x00' * padding)
+            offset += len(block) + padding
+
+    index = json.dumps(index, sort_keys=True).encode('utf-8')
+    header = _DATASETS_ARCHIVE_HEADER.pack(DATASETS_ARCHIVE_MAGIC,
+                                           DATASETS_ARCHIVE_FORMAT_VERSION,
+                                           len(index))
+    padding = -(len(header) + len(index)) % _DATASETS_ARCHIVE_ALIGNMENT
+
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    with open(path, 'wb') as archive:
+        archive.write(header + index + b'\x00' * padding)
+        for block in blocks:
+            archive.write(block)
+
+    _DATASETS_ARCHIVE_CACHE.pop(path, None)
+    for key in list(_ARCHIVED_DATASETS_CACHE.keys()):
+        if key[0] == path:
+            del _ARCHIVED_DATASETS_CACHE[key]
+
+    return path
+
+
+def read_datasets_archive(path=None):
+    """
+    Reads and memory-maps given datasets archive and caches it.
+
+    Parameters
+    ----------
+    path : unicode, optional
+        Datasets archive path, :attr:`DATASETS_ARCHIVE_PATH` attribute value
+        is used if not given.
+
+    Returns
+    -------
+    DatasetsArchive or None
+        Datasets archive or *None* if it does not exist, is invalid or has a
+        different format version.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'datasets.bin')
+    >>> path = write_datasets_archive(
+    ...     {'SPDS_DATA': {'Flat': {500: 1.0, 510: 1.0}}}, path)
+    >>> sorted(read_datasets_archive(path).index.keys())
+    ['SPDS_DATA']
+    """
+
+    if path is None:
+        path = DATASETS_ARCHIVE_PATH
+
+    if path in _DATASETS_ARCHIVE_CACHE:
+        return _DATASETS_ARCHIVE_CACHE[path]
+
+    archive = None
+    if os.path.isfile(path):
+        with open(path, 'rb') as handle:
+            header = handle.read(_DATASETS_ARCHIVE_HEADER.size)
+            if len(header) == _DATASETS_ARCHIVE_HEADER.size:
+                magic, version, length = _DATASETS_ARCHIVE_HEADER.unpack(
+                    header)
+                if (magic == DATASETS_ARCHIVE_MAGIC and
+                        version == DATASETS_ARCHIVE_FORMAT_VERSION):
+                    index = json.loads(handle.read(length).decode('utf-8'))
+                    offset = _DATASETS_ARCHIVE_HEADER.size + length
+                    offset += -offset % _DATASETS_ARCHIVE_ALIGNMENT
+                    size = os.path.getsize(path) - offset
+                    buffer = (np.memmap(path, dtype=np.uint8, mode='r',
+                                        offset=offset, shape=(size,))
+                              if size else np.zeros(0, dtype=np.uint8))
+                    archive = DatasetsArchive(path, index, buffer)
+
+    _DATASETS_ARCHIVE_CACHE[path] = archive
+
+    return archive
+
+
+def dataset_table(dataset, table_path=(), path=None, source=None):
+    """
+    Returns the memory-mapped table at given path of given dataset.
+
+    Parameters
+    ----------
+    dataset : unicode
+        Dataset name.
+    table_path : tuple, optional
+        Table path in the dataset.
+    path : unicode, optional
+        Datasets archive path, :attr:`DATASETS_ARCHIVE_PATH` attribute value
+        is used if not given.
+    source : unicode, optional
+        Name of the module defining the literal the table has been serialised
+        or derived from, if given the table is only returned when the digest
+        stored in the archive index matches the source module file.
+
+    Returns
+    -------
+    ndarray or None
+        Read only table, *None* if the archive or the table does not exist or
+        if the table does not match given source module. Mapping tables have
+        their keys as first column.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'datasets.bin')
+    >>> path = write_datasets_archive(
+    ...     {'SPDS_DATA': {'Flat': {500: 1.0, 510: 1.0}}}, path)
+    >>> dataset_table('SPDS_DATA', ('Flat',), path)
+    array([[ 500.,    1.],
+           [ 510.,    1.]])
+    >>> dataset_table('SPDS_DATA', ('Sharp',), path)
+    >>> dataset_table('SPDS_DATA', ('Flat',), path, 'colour.utilities')
+    """
+
+    archive = read_datasets_archive(path)
+    if archive is None or dataset not in archive.index:
+        return None
+
+    if (source is not None and
+            not _is_source_digest(archive, dataset, source)):
+        return None
+
+    table_path = list(table_path)
+    for record in archive.index[dataset]['tables']:
+        if record['path'] == table_path:
+            return _record_table(archive, record)
+
+
+def _record_table(archive, record):
+    """
+    Returns the memory-mapped table of given archive record.
+
+    Parameters
+    ----------
+    archive : DatasetsArchive
+        Datasets archive.
+    record : dict
+        Table record.
+
+    Returns
+    -------
+    ndarray
+        Read only table.
+    """
+
+    shape = tuple(record['shape'])
+    table = np.ndarray(shape,
+                       dtype='<f8',
+                       buffer=archive.buffer,
+                       offset=record['offset'],
+                       order='F')
+    table.setflags(write=False)
+
+    return table
+
+
+def _dataset(archive, records):
+    """
+    Rebuilds the nested data of given archive tables records.
+
+    Parameters
+    ----------
+    archive : DatasetsArchive
+        Datasets archive.
+    records : list
+        Tables records.
+
+    Returns
+    -------
+    dict or tuple or ndarray
+        Nested data.
+    """
+
+    data = {}
+    for record in records:
+        table = _record_table(archive, record)
+        if record['mapping']:
+            table = tuple(table[:, i] for i in range(table.shape[1]))
+
+        if not record['path']:
+            return table
+
+        mapping = data
+        for key in record['path'][:-1]:
+            mapping = mapping.setdefault(key, {})
+        mapping[record['path'][-1]] = table
+
+    return data
+
+
+def archived_dataset(dataset, source, path=None):
+    """
+    Returns given dataset with its tables replaced by the memory-mapped tables
+    of the archive and caches it.
+
+    Parameters
+    ----------
+    dataset : unicode
+        Dataset name, i.e. the name of the *dict* literal defining the dataset
+        in the source module.
+    source : unicode
+        Name of the module defining the dataset literal. The module is only
+        imported and its literal returned as is if the archive does not exist
+        or the dataset digest does not match the module file.
+    path : unicode, optional
+        Datasets archive path, :attr:`DATASETS_ARCHIVE_PATH` attribute value
+        is used if not given.
+
+    Returns
+    -------
+    dict or tuple
+        Archived dataset. The mapping tables are replaced by a *tuple* of
+        columns, e.g. *(wavelengths, values)*, the sequence tables are
+        replaced by an *ndarray*.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'datasets.bin')
+    >>> source = 'colour.recovery.dataset.smits1999_data'
+    >>> data = archived_dataset('SMITS_1999_SPDS_DATA', source, path)
+    >>> data['white'][380]
+    1.0
+    >>> path = write_datasets_archive(
+    ...     {'SMITS_1999_SPDS_DATA': data},
+    ...     path,
+    ...     {'SMITS_1999_SPDS_DATA': source})
+    >>> archived_dataset(  # doctest: +ELLIPSIS
+    ...     'SMITS_1999_SPDS_DATA', source, path)['white']
+    (array([ 380.    ,  417.7778, ...]), array([ 1.    ,  1.    , ...]))
+    """
+
+    if path is None:
+        path = DATASETS_ARCHIVE_PATH
+
+    key = (path, dataset, source)
+    archived = _ARCHIVED_DATASETS_CACHE.get(key)
+    if key not in _ARCHIVED_DATASETS_CACHE:
+        archive = read_datasets_archive(path)
+        if (archive is not None and dataset in archive.index and
+                _is_source_digest(archive, dataset, source)):
+            archived = _dataset(archive, archive.index[dataset]['tables'])
+
+        _ARCHIVED_DATASETS_CACHE[key] = archived
+
+    if archived is None:
+        return getattr(import_module(source), dataset)
+
+    return archived
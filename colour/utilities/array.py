@@ -163,10 +163,7 @@ def steps(distribution):
     array([1, 4])
     """
 
-    distribution = sorted(distribution)
-
-    return np.unique([distribution[i + 1] - distribution[i]
-                      for i in range(len(distribution) - 1)])
+    return np.unique(np.diff(np.sort(np.ravel(distribution))))
 
 
 def is_uniform(distribution):
@@ -14,11 +14,16 @@ Defines various data structures classes:
     values.
 -   :class:`CaseInsensitiveMapping`: A case insensitive mapping allowing values
     retrieving from keys while ignoring the key case.
+-   :class:`LazyCaseInsensitiveMapping`: A case insensitive mapping building
+    its values on first retrieval.
+-   :class:`LRUCache`: A mapping discarding the least recently used items when
+    its maximum size is reached.
 """
 
 from __future__ import division, unicode_literals
 
-from collections import Mapping, MutableMapping
+from collections import Mapping, MutableMapping, OrderedDict
+from functools import partial
 
 from colour.utilities import is_numeric
 
@@ -32,7 +37,9 @@ __status__ = 'Production'
 __all__ = ['ArbitraryPrecisionMapping',
            'Structure',
            'Lookup',
-           'CaseInsensitiveMapping']
+           'CaseInsensitiveMapping',
+           'LazyCaseInsensitiveMapping',
+           'LRUCache']
 
 
 class ArbitraryPrecisionMapping(MutableMapping):
@@ -708,3 +715,345 @@ blob/v1.2.3/requests/structures.py#L37
         """
 
         return ((item, value[1]) for (item, value) in self.__data.items())
+
+
+class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
+    """
+    Implements a lazy case-insensitive mutable mapping / *dict* object by
+    inheriting from :class:`CaseInsensitiveMapping` class.
+
+    Allows lazy values retrieving from keys while ignoring the key case.
+    :class:`functools.partial` class instances values are the factories
+    building the values: they are called on first retrieval and their return
+    value is memoised in place of the factory.
+
+    Parameters
+    ----------
+    data : dict
+        *dict* of data to store into the mapping at initialisation.
+    \**kwargs : dict, optional
+        Key / Value pairs to store into the mapping at initialisation.
+
+    Methods
+    -------
+    __getitem__
+    update
+    copy
+    lower_items
+
+    Notes
+    -----
+    -   Updating the mapping from another :class:`LazyCaseInsensitiveMapping`
+        class instance does not build its values: the values are retrieved
+        from the other mapping on first retrieval thus both mappings share
+        the same value objects.
+    -   The callable values that are not :class:`functools.partial` class
+        instances, e.g. functions, are stored and returned as is.
+
+    Examples
+    --------
+    >>> def factory(value):
+    ...     print('Building...')
+    ...     return value
+    >>> mapping = LazyCaseInsensitiveMapping({'McCamy': partial(factory, 1)})
+    >>> mapping['mccamy']
+    Building...
+    1
+    >>> mapping['McCamy']
+    1
+    """
+
+    def __getitem__(self, item):
+        """
+        Returns the value of given item, building and memoising it if it is
+        the first retrieval.
+
+        Parameters
+        ----------
+        item : unicode
+            Item name.
+
+        Returns
+        -------
+        object
+            Item value.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`CaseInsensitiveMapping.__getitem__`
+            method.
+        """
+
+        value = super(LazyCaseInsensitiveMapping, self).__getitem__(item)
+
+        if isinstance(value, partial):
+            value = value()
+
+            # Memoising the value using the original item name.
+            name = [name for name in self if name.lower() == item.lower()][0]
+            super(LazyCaseInsensitiveMapping, self).__setitem__(name, value)
+
+        return value
+
+    def update(self, data=(), **kwargs):
+        """
+        Updates the mapping with given data without building the lazy values
+        of a given :class:`LazyCaseInsensitiveMapping` class instance.
+
+        Parameters
+        ----------
+        data : dict or iterable, optional
+            *dict* or iterable of key / value pairs to update the mapping
+            with.
+        \**kwargs : dict, optional
+            Key / Value pairs to update the mapping with.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.update` method.
+        """
+
+        if isinstance(data, LazyCaseInsensitiveMapping):
+            data = [(name, partial(data.__getitem__, name)) for name in data]
+
+        super(LazyCaseInsensitiveMapping, self).update(data, **kwargs)
+
+    def copy(self):
+        """
+        Returns a copy of the mapping.
+
+        Returns
+        -------
+        LazyCaseInsensitiveMapping
+            Mapping copy.
+
+        Notes
+        -----
+        -   The :class:`LazyCaseInsensitiveMapping` class copy returned is a
+            simple *copy* not a *deepcopy* and shares the values of the
+            mapping.
+        """
+
+        return LazyCaseInsensitiveMapping(self)
+
+    def lower_items(self):
+        """
+        Iterates over the lower items names, building the lazy values.
+
+        Returns
+        -------
+        generator
+            Lower item names.
+        """
+
+        return ((item.lower(), self[item]) for item in self)
+
+
+class LRUCache(MutableMapping):
+    """
+    Implements a mutable mapping / *dict* object discarding the least recently
+    used items when its maximum size is reached.
+
+    Parameters
+    ----------
+    maximum_size : int, optional
+        Maximum items count stored into the mapping.
+    data : dict, optional
+        *dict* of data to store into the mapping at initialisation.
+
+    Attributes
+    ----------
+    maximum_size
+
+    Methods
+    -------
+    __setitem__
+    __getitem__
+    __delitem__
+    __contains__
+    __iter__
+    __len__
+
+    Notes
+    -----
+    -   Retrieving or setting an item marks it as the most recently used.
+
+    Examples
+    --------
+    >>> cache = LRUCache(2)
+    >>> cache['A'] = 1
+    >>> cache['B'] = 2
+    >>> cache['A']
+    1
+    >>> cache['C'] = 3
+    >>> sorted(cache.keys())
+    ['A', 'C']
+    """
+
+    def __init__(self, maximum_size=128, data=None):
+        self.__data = OrderedDict()
+
+        self.__maximum_size = None
+        self.maximum_size = maximum_size
+
+        if data is None:
+            data = {}
+
+        self.update(data)
+
+    @property
+    def maximum_size(self):
+        """
+        Property for **self.__maximum_size** private attribute.
+
+        Returns
+        -------
+        int
+            self.__maximum_size.
+        """
+
+        return self.__maximum_size
+
+    @maximum_size.setter
+    def maximum_size(self, value):
+        """
+        Setter for **self.__maximum_size** private attribute.
+
+        Parameters
+        ----------
+        value : int
+            Attribute value.
+        """
+
+        assert value > 0, (
+            '"{0}" attribute must be greater than zero!'.format(
+                'maximum_size'))
+
+        self.__maximum_size = value
+
+        self.__discard()
+
+    def __discard(self):
+        """
+        Discards the least recently used items exceeding the maximum size.
+        """
+
+        while len(self.__data) > self.__maximum_size:
+            self.__data.popitem(last=False)
+
+    def __setitem__(self, item, value):
+        """
+        Sets given item with given value.
+
+        Parameters
+        ----------
+        item : object
+            Attribute.
+        value : object
+            Value.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__setitem__` method.
+        """
+
+        if item in self.__data:
+            del self.__data[item]
+
+        self.__data[item] = value
+
+        self.__discard()
+
+    def __getitem__(self, item):
+        """
+        Returns the value of given item.
+
+        Parameters
+        ----------
+        item : object
+            Item.
+
+        Returns
+        -------
+        object
+            Item value.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__getitem__` method.
+        """
+
+        value = self.__data.pop(item)
+        self.__data[item] = value
+
+        return value
+
+    def __delitem__(self, item):
+        """
+        Deletes given item.
+
+        Parameters
+        ----------
+        item : object
+            Item.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__delitem__` method.
+        """
+
+        del self.__data[item]
+
+    def __contains__(self, item):
+        """
+        Returns if the mapping contains given item without marking it as the
+        most recently used.
+
+        Parameters
+        ----------
+        item : object
+            Item.
+
+        Returns
+        -------
+        bool
+            Is item in mapping.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__contains__` method.
+        """
+
+        return item in self.__data
+
+    def __iter__(self):
+        """
+        Iterates over the items from the least to the most recently used.
+
+        Returns
+        -------
+        generator
+            Items.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__iter__` method.
+        """
+
+        return iter(list(self.__data.keys()))
+
+    def __len__(self):
+        """
+        Returns the items count.
+
+        Returns
+        -------
+        int
+            Items count.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__len__` method.
+        """
+
+        return len(self.__data)
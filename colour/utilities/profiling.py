@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Profiling Utilities
+===================
+
+Defines profiling utilities objects:
+
+-   :func:`import_time`
+-   :func:`colour_modules`
+-   :func:`import_times`
+"""
+
+from __future__ import division, unicode_literals
+
+import os
+import subprocess
+import sys
+from collections import OrderedDict
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['import_time',
+           'colour_modules',
+           'import_times']
+
+_IMPORT_TIME_SNIPPET = """
+import importlib
+import timeit
+
+for module in {0!r}:
+    importlib.import_module(module)
+
+start = timeit.default_timer()
+importlib.import_module({1!r})
+print(timeit.default_timer() - start)
+"""
+
+_COLOUR_DIRECTORY = os.path.dirname(os.path.dirname(__file__))
+
+
+def import_time(module, preloaded_modules=('numpy',)):
+    """
+    Returns the time in seconds to import given module in a new interpreter.
+
+    Parameters
+    ----------
+    module : unicode
+        Module to import.
+    preloaded_modules : array_like, optional
+        Modules imported before measuring the time, e.g. the third party
+        dependencies whose import time is not to be accounted for.
+
+    Returns
+    -------
+    numeric
+        Module import time in seconds, including the time to import the
+        modules it depends on and that are not preloaded.
+
+    Raises
+    ------
+    RuntimeError
+        If the module cannot be imported.
+
+    Examples
+    --------
+    >>> import_time('colour.constants')  # doctest: +SKIP
+    0.0012...
+    """
+
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [os.path.dirname(_COLOUR_DIRECTORY)] +
+        [path for path in [environment.get('PYTHONPATH')] if path])
+
+    process = subprocess.Popen(
+        [sys.executable,
+         '-c',
+         _IMPORT_TIME_SNIPPET.format(
+             [str(preloaded) for preloaded in preloaded_modules],
+             str(module))],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=environment)
+    output, error = process.communicate()
+
+    if process.returncode != 0:
+        raise RuntimeError('"{0}" module cannot be imported: {1}'.format(
+            module, error.decode('utf-8', 'replace').strip()))
+
+    return float(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def colour_modules():
+    """
+    Returns the *Colour* subpackages and datasets modules names.
+
+    Returns
+    -------
+    list
+        *Colour* subpackages and datasets modules names.
+
+    Examples
+    --------
+    >>> colour_modules()[:3]  # doctest: +SKIP
+    ['colour', 'colour.adaptation', 'colour.algebra']
+    """
+
+    from colour import SUBPACKAGES
+
+    modules = ['colour']
+    modules += ['colour.{0}'.format(subpackage) for subpackage in SUBPACKAGES]
+
+    for subpackage in SUBPACKAGES:
+        for root, directories, files in os.walk(
+                os.path.join(_COLOUR_DIRECTORY, subpackage)):
+            directories[:] = sorted(directory for directory in directories
+                                    if directory != 'tests')
+
+            package = os.path.relpath(
+                root, os.path.dirname(_COLOUR_DIRECTORY)).split(os.sep)
+            if 'dataset' not in package:
+                continue
+
+            package = '.'.join(package)
+            modules.append(package)
+            modules += ['{0}.{1}'.format(package, os.path.splitext(name)[0])
+                        for name in sorted(files)
+                        if name.endswith('.py') and name != '__init__.py']
+
+    return modules
+
+
+def import_times(modules=None, preloaded_modules=('numpy',)):
+    """
+    Returns the import time in seconds of given modules, each module is
+    imported in a new interpreter.
+
+    Parameters
+    ----------
+    modules : array_like, optional
+        Modules to import, the *Colour* subpackages and datasets modules
+        returned by :func:`colour_modules` definition are used if not given.
+    preloaded_modules : array_like, optional
+        Modules imported before measuring the time, e.g. the third party
+        dependencies whose import time is not to be accounted for.
+
+    Returns
+    -------
+    OrderedDict
+        Modules import time in seconds.
+
+    Examples
+    --------
+    >>> import_times(['colour', 'colour.models'])  # doctest: +SKIP
+    OrderedDict([('colour', 0.0123...), ('colour.models', 0.3456...)])
+    """
+
+    if modules is None:
+        modules = colour_modules()
+
+    return OrderedDict((module, import_time(module, preloaded_modules))
+                       for module in modules)
+
+
+if __name__ == '__main__':
+    for module, time in import_times().items():
+        print('{0:<72}{1:>7.1f}ms'.format(module, time * 1000))
@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.utilities.archive` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from colour.utilities import (
+    write_datasets_archive,
+    read_datasets_archive,
+    dataset_table,
+    archived_dataset)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['DATASETS',
+           'DATASETS_SOURCE',
+           'TestWriteDatasetsArchive',
+           'TestReadDatasetsArchive',
+           'TestDatasetTable',
+           'TestArchivedDataset']
+
+DATASETS = {
+    'SPDS_DATA': {
+        'Sample': {530: 0.0641, 500: 0.0, 510: 0.0014, 520: 0.0064},
+        'Tristimulus': {
+            'x_bar': {500: 0.0049, 510: 0.0093},
+            'y_bar': {500: 0.3230, 510: 0.5030},
+            'z_bar': {500: 0.2720, 510: 0.1582}}},
+    'STIMULI': {
+        'A': ((0.7347, 0.2653, 0.0),
+              (0.4247, 0.5753, 0.1),
+              (0.1665, 0.0089, 0.2))}}
+
+DATASETS_SOURCE = """
+SPDS_DATA = {
+    'Sample': {530: 0.0641, 500: 0.0, 510: 0.0014, 520: 0.0064},
+    'Tristimulus': {
+        'x_bar': {500: 0.0049, 510: 0.0093},
+        'y_bar': {500: 0.3230, 510: 0.5030},
+        'z_bar': {500: 0.2720, 510: 0.1582}}}
+
+STIMULI = {
+    'A': ((0.7347, 0.2653, 0.0),
+          (0.4247, 0.5753, 0.1),
+          (0.1665, 0.0089, 0.2))}
+"""
+
+
+class _TestArchive(unittest.TestCase):
+    """
+    Defines the common datasets archive tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+        self._path = os.path.join(self._temporary_directory, 'datasets.bin')
+        self._sources = []
+
+        sys.path.insert(0, self._temporary_directory)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        sys.path.remove(self._temporary_directory)
+        for source in self._sources:
+            sys.modules.pop(source, None)
+
+        shutil.rmtree(self._temporary_directory)
+
+    def _write_source(self, content=DATASETS_SOURCE):
+        """
+        Writes given datasets literals into a new source module.
+
+        Parameters
+        ----------
+        content : unicode, optional
+            Source module content.
+
+        Returns
+        -------
+        unicode
+            Source module name.
+        """
+
+        source = 'datasets_{0}_{1}'.format(
+            os.path.basename(self._temporary_directory), len(self._sources))
+        with open(os.path.join(self._temporary_directory,
+                               '{0}.py'.format(source)), 'w') as module:
+            module.write(content)
+
+        self._sources.append(source)
+
+        return source
+
+
+class TestWriteDatasetsArchive(_TestArchive):
+    """
+    Defines :func:`colour.utilities.archive.write_datasets_archive` definition
+    units tests methods.
+    """
+
+    def test_write_datasets_archive(self):
+        """
+        Tests :func:`colour.utilities.archive.write_datasets_archive`
+        definition.
+        """
+
+        self.assertEqual(write_datasets_archive(DATASETS, self._path),
+                         self._path)
+        self.assertTrue(os.path.isfile(self._path))
+
+        archive = read_datasets_archive(self._path)
+        self.assertListEqual(
+            sorted(tuple(record['path'])
+                   for record in archive.index['SPDS_DATA']['tables']),
+            [('Sample',),
+             ('Tristimulus', 'x_bar'),
+             ('Tristimulus', 'y_bar'),
+             ('Tristimulus', 'z_bar')])
+        for dataset in archive.index.values():
+            self.assertIsNone(dataset['source'])
+            for record in dataset['tables']:
+                self.assertEqual(record['offset'] % 64, 0)
+
+        source = self._write_source()
+        write_datasets_archive(DATASETS, self._path, {'STIMULI': source})
+        archive = read_datasets_archive(self._path)
+        self.assertIsNone(archive.index['SPDS_DATA']['source'])
+        self.assertEqual(len(archive.index['STIMULI']['source']), 40)
+        self.assertNotIn(source, sys.modules)
+
+    def test_raise_exception_write_datasets_archive(self):
+        """
+        Tests :func:`colour.utilities.archive.write_datasets_archive`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError,
+            write_datasets_archive,
+            {'SPDS_DATA': {'Sample': {500: 0.0}, 'Name': 'Sample'}},
+            self._path)
+
+
+class TestReadDatasetsArchive(_TestArchive):
+    """
+    Defines :func:`colour.utilities.archive.read_datasets_archive` definition
+    units tests methods.
+    """
+
+    def test_read_datasets_archive(self):
+        """
+        Tests :func:`colour.utilities.archive.read_datasets_archive`
+        definition.
+        """
+
+        self.assertIsNone(read_datasets_archive(self._path))
+
+        write_datasets_archive(DATASETS, self._path)
+        archive = read_datasets_archive(self._path)
+        self.assertListEqual(sorted(archive.index.keys()),
+                             ['SPDS_DATA', 'STIMULI'])
+        self.assertIs(read_datasets_archive(self._path), archive)
+
+    def test_raise_exception_read_datasets_archive(self):
+        """
+        Tests :func:`colour.utilities.archive.read_datasets_archive`
+        definition unsupported archives handling.
+        """
+
+        with open(self._path, 'wb') as archive:
+            archive.write(b'CLRDSARC\x01\x00\x00\x00\x02\x00\x00\x00{}')
+
+        self.assertIsNone(read_datasets_archive(self._path))
+
+
+class TestDatasetTable(_TestArchive):
+    """
+    Defines :func:`colour.utilities.archive.dataset_table` definition units
+    tests methods.
+    """
+
+    def test_dataset_table(self):
+        """
+        Tests :func:`colour.utilities.archive.dataset_table` definition.
+        """
+
+        write_datasets_archive(DATASETS, self._path)
+
+        table = dataset_table('SPDS_DATA', ('Sample',), self._path)
+        np.testing.assert_equal(
+            table,
+            np.array([[500, 0.0],
+                      [510, 0.0014],
+                      [520, 0.0064],
+                      [530, 0.0641]]))
+        self.assertFalse(table.flags.writeable)
+        self.assertTrue(table[:, 1].flags.contiguous)
+
+        np.testing.assert_equal(
+            dataset_table('STIMULI', ('A',), self._path),
+            np.array(DATASETS['STIMULI']['A']))
+
+        self.assertIsNone(dataset_table('SPDS_DATA', ('Tristimulus',),
+                                        self._path))
+        self.assertIsNone(dataset_table('Undefined', (), self._path))
+        self.assertIsNone(dataset_table('STIMULI', ('A',), self._path,
+                                        'undefined_datasets_module'))
+
+    def test_source_dataset_table(self):
+        """
+        Tests :func:`colour.utilities.archive.dataset_table` definition
+        tables derived from source modules.
+        """
+
+        source = self._write_source(
+            "MUNSELL = (('2.5GY', 0.2, 2.0), ('5GY', 0.2, 2.0))\n")
+        write_datasets_archive({'MUNSELL': ((2.5, 0.2, 2.0, 4),
+                                            (5.0, 0.2, 2.0, 4))},
+                               self._path,
+                               {'MUNSELL': source})
+
+        self.assertIsNotNone(
+            dataset_table('MUNSELL', (), self._path, source))
+        self.assertIsNone(
+            dataset_table('MUNSELL', (), self._path, self._write_source(
+                "MUNSELL = (('2.5GY', 0.2, 2.0), ('7.5GY', 0.2, 2.0))\n")))
+        self.assertNotIn(source, sys.modules)
+
+
+class TestArchivedDataset(_TestArchive):
+    """
+    Defines :func:`colour.utilities.archive.archived_dataset` definition units
+    tests methods.
+    """
+
+    def test_archived_dataset(self):
+        """
+        Tests :func:`colour.utilities.archive.archived_dataset` definition.
+        """
+
+        source = self._write_source()
+        write_datasets_archive(DATASETS,
+                               self._path,
+                               {'SPDS_DATA': source, 'STIMULI': source})
+
+        archived = archived_dataset('SPDS_DATA', source, self._path)
+        wavelengths, values = archived['Sample']
+        np.testing.assert_equal(wavelengths, [500, 510, 520, 530])
+        np.testing.assert_equal(values, [0.0, 0.0014, 0.0064, 0.0641])
+        self.assertListEqual(sorted(archived['Tristimulus'].keys()),
+                             ['x_bar', 'y_bar', 'z_bar'])
+        self.assertIs(archived_dataset('SPDS_DATA', source, self._path),
+                      archived)
+
+        np.testing.assert_equal(
+            archived_dataset('STIMULI', source, self._path)['A'],
+            np.array(DATASETS['STIMULI']['A']))
+
+        self.assertNotIn(source, sys.modules)
+
+        # Identical source modules share the same digest.
+        self.assertIsInstance(
+            archived_dataset('SPDS_DATA', self._write_source(), self._path)[
+                'Sample'], tuple)
+
+    def test_fallback_archived_dataset(self):
+        """
+        Tests :func:`colour.utilities.archive.archived_dataset` definition
+        fallback on the datasets source modules literals.
+        """
+
+        source = self._write_source()
+        self.assertDictEqual(
+            archived_dataset('SPDS_DATA', source, self._path),
+            DATASETS['SPDS_DATA'])
+
+        write_datasets_archive(DATASETS, self._path)
+        self.assertDictEqual(
+            archived_dataset('STIMULI', source, self._path),
+            DATASETS['STIMULI'])
+
+        write_datasets_archive(DATASETS, self._path, {'STIMULI': source})
+        self.assertDictEqual(
+            archived_dataset('SPDS_DATA', source, self._path),
+            DATASETS['SPDS_DATA'])
+
+    def test_modified_source_archived_dataset(self):
+        """
+        Tests :func:`colour.utilities.archive.archived_dataset` definition
+        fallback on the datasets source modules modified after writing the
+        archive.
+        """
+
+        source = self._write_source()
+        write_datasets_archive(DATASETS, self._path, {'SPDS_DATA': source})
+
+        modified = self._write_source(DATASETS_SOURCE.replace(
+            "'Sample': {530: 0.0641,", "'Sample': {530: 0.0642,"))
+        self.assertDictEqual(
+            archived_dataset('SPDS_DATA', modified, self._path)['Sample'],
+            {500: 0.0, 510: 0.0014, 520: 0.0064, 530: 0.0642})
+
+        modified = self._write_source(DATASETS_SOURCE + '\n# Comment.\n')
+        self.assertDictEqual(
+            archived_dataset('SPDS_DATA', modified, self._path),
+            DATASETS['SPDS_DATA'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,12 +9,15 @@ from __future__ import division, unicode_literals
 
 import pickle
 import unittest
+from functools import partial
 
 from colour.utilities import (
     ArbitraryPrecisionMapping,
     Structure,
     Lookup,
-    CaseInsensitiveMapping)
+    CaseInsensitiveMapping,
+    LazyCaseInsensitiveMapping,
+    LRUCache)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2008 - 2014 - Colour Developers'
@@ -26,7 +29,9 @@ __status__ = 'Production'
 __all__ = ['TestArbitraryPrecisionMapping',
            'TestStructure',
            'TestLookup',
-           'TestCaseInsensitiveMapping']
+           'TestCaseInsensitiveMapping',
+           'TestLazyCaseInsensitiveMapping',
+           'TestLRUCache']
 
 
 class TestArbitraryPrecisionMapping(unittest.TestCase):
@@ -432,5 +437,221 @@ CaseInsensitiveMapping.lower_items` method.
                              [('jane', 'Doe'), ('john', 'Doe')])
 
 
+class TestLazyCaseInsensitiveMapping(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping` class unit tests methods.
+    """
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__getitem__',
+                            'update',
+                            'copy',
+                            'lower_items')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LazyCaseInsensitiveMapping))
+
+    def test__getitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.__getitem__` method.
+        """
+
+        calls = []
+
+        def factory():
+            calls.append(None)
+            return ['Doe']
+
+        mapping = LazyCaseInsensitiveMapping(John=partial(factory),
+                                             Jane='Doe',
+                                             Luke=factory)
+        self.assertEqual(len(calls), 0)
+
+        self.assertEqual(mapping['john'], ['Doe'])
+        self.assertIs(mapping['John'], mapping['JOHN'])
+        self.assertEqual(len(calls), 1)
+        self.assertListEqual(sorted(mapping), ['Jane', 'John', 'Luke'])
+
+        self.assertEqual(mapping['Jane'], 'Doe')
+
+        self.assertIs(mapping['Luke'], factory)
+        self.assertEqual(len(calls), 1)
+
+    def test_update(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.update` method.
+        """
+
+        calls = []
+
+        def factory():
+            calls.append(None)
+            return ['Doe']
+
+        mapping1 = LazyCaseInsensitiveMapping(John=partial(factory))
+        mapping2 = LazyCaseInsensitiveMapping()
+        mapping2.update(mapping1)
+        self.assertEqual(len(calls), 0)
+
+        self.assertIs(mapping2['john'], mapping1['John'])
+        self.assertEqual(len(calls), 1)
+
+    def test_copy(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.copy` method.
+        """
+
+        mapping1 = LazyCaseInsensitiveMapping(John=partial(list, ['Doe']))
+        mapping2 = mapping1.copy()
+
+        self.assertIsInstance(mapping2, LazyCaseInsensitiveMapping)
+        self.assertIsNot(mapping1, mapping2)
+        self.assertIs(mapping1['John'], mapping2['John'])
+
+    def test_lower_items(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.lower_items` method.
+        """
+
+        mapping = LazyCaseInsensitiveMapping(John=partial(str, 'Doe'))
+
+        self.assertListEqual(
+            sorted([item for item in mapping.lower_items()]),
+            [('john', 'Doe')])
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.LRUCache` class unit
+    tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('maximum_size',)
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LRUCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__setitem__',
+                            '__getitem__',
+                            '__delitem__',
+                            '__contains__',
+                            '__iter__',
+                            '__len__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LRUCache))
+
+    def test_maximum_size(self):
+        """
+        Tests :attr:`colour.utilities.data_structures.LRUCache.maximum_size`
+        attribute.
+        """
+
+        cache = LRUCache(3, {'John': 'Doe', 'Jane': 'Doe', 'Luke': 'Doe'})
+        cache.maximum_size = 1
+        self.assertEqual(len(cache), 1)
+
+        self.assertRaises(AssertionError, lambda: LRUCache(0))
+
+    def test__setitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__setitem__`
+        method.
+        """
+
+        cache = LRUCache(2)
+
+        cache['John'] = 'Doe'
+        cache['Jane'] = 'Doe'
+        cache['John'] = 'Smith'
+        cache['Luke'] = 'Doe'
+        self.assertListEqual(list(cache), ['John', 'Luke'])
+        self.assertEqual(cache['John'], 'Smith')
+
+    def test__getitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__getitem__`
+        method.
+        """
+
+        cache = LRUCache(2)
+
+        cache['John'] = 'Doe'
+        cache['Jane'] = 'Doe'
+        self.assertEqual(cache['John'], 'Doe')
+        cache['Luke'] = 'Doe'
+        self.assertListEqual(list(cache), ['John', 'Luke'])
+
+        self.assertRaises(KeyError, lambda: cache['Jane'])
+        self.assertIsNone(cache.get('Jane'))
+
+    def test__delitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__delitem__`
+        method.
+        """
+
+        cache = LRUCache(2, {'John': 'Doe'})
+
+        del cache['John']
+        self.assertNotIn('John', cache)
+        self.assertEqual(len(cache), 0)
+
+    def test__contains__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__contains__`
+        method.
+        """
+
+        cache = LRUCache(2)
+
+        cache['John'] = 'Doe'
+        cache['Jane'] = 'Doe'
+        self.assertIn('John', cache)
+        cache['Luke'] = 'Doe'
+        self.assertNotIn('John', cache)
+
+    def test__iter__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__iter__`
+        method.
+        """
+
+        cache = LRUCache(3)
+
+        cache['John'] = 'Doe'
+        cache['Jane'] = 'Doe'
+        cache['Luke'] = 'Doe'
+        cache.get('John')
+        self.assertListEqual([item for item in cache],
+                             ['Jane', 'Luke', 'John'])
+
+    def test__len__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__len__`
+        method.
+        """
+
+        self.assertEqual(len(LRUCache(2, {'John': 'Doe', 'Jane': 'Doe'})), 2)
+
 if __name__ == '__main__':
     unittest.main()
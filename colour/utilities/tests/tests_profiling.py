@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.utilities.profiling` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import unittest
+
+from colour.utilities import import_time, colour_modules, import_times
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestImportTime',
+           'TestColourModules',
+           'TestImportTimes']
+
+
+class TestImportTime(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.profiling.import_time` definition units
+    tests methods.
+    """
+
+    def test_import_time(self):
+        """
+        Tests :func:`colour.utilities.profiling.import_time` definition.
+        """
+
+        self.assertGreater(import_time('colour.constants'), 0)
+
+    def test_raise_exception_import_time(self):
+        """
+        Tests :func:`colour.utilities.profiling.import_time` definition raised
+        exception.
+        """
+
+        self.assertRaises(RuntimeError, import_time, 'colour.undefined')
+
+
+class TestColourModules(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.profiling.colour_modules` definition units
+    tests methods.
+    """
+
+    def test_colour_modules(self):
+        """
+        Tests :func:`colour.utilities.profiling.colour_modules` definition.
+        """
+
+        modules = colour_modules()
+
+        self.assertEqual(modules[0], 'colour')
+        self.assertIn('colour.models', modules)
+        self.assertIn('colour.colorimetry.dataset.cmfs', modules)
+        self.assertIn('colour.notation.dataset.munsell.all', modules)
+        self.assertFalse([module for module in modules if 'tests' in module])
+
+
+class TestImportTimes(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.profiling.import_times` definition units
+    tests methods.
+    """
+
+    def test_import_times(self):
+        """
+        Tests :func:`colour.utilities.profiling.import_times` definition.
+        """
+
+        times = import_times(['colour', 'colour.constants'])
+
+        self.assertListEqual(list(times.keys()),
+                             ['colour', 'colour.constants'])
+        self.assertTrue(all(time > 0 for time in times.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
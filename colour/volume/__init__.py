@@ -10,6 +10,8 @@ from .mesh import is_within_mesh_volume
 from .pointer_gamut import is_within_pointer_gamut
 from .spectrum import is_within_visible_spectrum
 from .rgb import (
+    MONTE_CARLO_CHUNK_SIZE,
+    MonteCarlo_Specification,
     RGB_colourspace_limits,
     RGB_colourspace_volume_MonteCarlo,
     RGB_colourspace_volume_coverage_MonteCarlo,
@@ -22,7 +24,9 @@ __all__ += ['is_within_macadam_limits']
 __all__ += ['is_within_mesh_volume']
 __all__ += ['is_within_pointer_gamut']
 __all__ += ['is_within_visible_spectrum']
-__all__ += ['RGB_colourspace_limits',
+__all__ += ['MONTE_CARLO_CHUNK_SIZE',
+            'MonteCarlo_Specification',
+            'RGB_colourspace_limits',
             'RGB_colourspace_volume_MonteCarlo',
             'RGB_colourspace_volume_coverage_MonteCarlo',
             'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
@@ -21,17 +21,21 @@ blob/master/notebooks/volume/rgb.ipynb>`_
 
 from __future__ import division, unicode_literals
 
+import atexit
 import itertools
+import math
 import multiprocessing
 import numpy as np
+from collections import namedtuple
 
-from colour.algebra import random_triplet_generator
+from colour.algebra import random_triplet_chunk_generator
 from colour.colorimetry import ILLUMINANTS
 from colour.models import (
     Lab_to_XYZ,
     RGB_to_XYZ,
     XYZ_to_Lab,
     XYZ_to_RGB)
+from colour.utilities import warning
 from colour.volume import is_within_pointer_gamut, is_within_visible_spectrum
 
 __author__ = 'Colour Developers'
@@ -41,31 +45,334 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['sample_RGB_colourspace_volume_MonteCarlo',
+__all__ = ['MONTE_CARLO_CHUNK_SIZE',
+           'MonteCarlo_Specification',
+           'sample_RGB_colourspace_volume_MonteCarlo',
            'RGB_colourspace_limits',
            'RGB_colourspace_volume_MonteCarlo',
+           'RGB_colourspace_volume_coverage_MonteCarlo',
            'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
            'RGB_colourspace_visible_spectrum_coverage_MonteCarlo']
 
+MONTE_CARLO_CHUNK_SIZE = 2 ** 18
+"""
+Default samples count of each *Monte Carlo* work chunk, each chunk is sampled
+by a single worker with its own seed.
+
+MONTE_CARLO_CHUNK_SIZE : int
+"""
+
+_MONTE_CARLO_POOLS = {}
+
+
+class MonteCarlo_Specification(
+    namedtuple('MonteCarlo_Specification',
+               ('value', 'standard_error', 'confidence_interval',
+                'samples'))):
+    """
+    Defines the specification of a *Monte Carlo* estimate.
+
+    Parameters
+    ----------
+    value : numeric
+        Estimated value.
+    standard_error : numeric
+        Estimated value standard error.
+    confidence_interval : ndarray
+        Estimated value lower and upper confidence interval bounds.
+    samples : integer
+        Samples count the estimate is based on.
+    """
+
+
+def _close_MonteCarlo_pools():
+    """
+    Terminates the reused *Monte Carlo* processes pools.
+    """
+
+    for pool in _MONTE_CARLO_POOLS.values():
+        pool.terminate()
+
+    _MONTE_CARLO_POOLS.clear()
 
-def _wrapper_RGB_colourspace_volume_MonteCarlo(args):
+
+atexit.register(_close_MonteCarlo_pools)
+
+
+def _MonteCarlo_pool(processes):
     """
-    Convenient wrapper to be able to call
-    :func:`sample_RGB_colourspace_volume_MonteCarlo`: definition with multiple
-    arguments.
+    Returns a processes pool with given processes count, the pool is created
+    on first request and reused by subsequent calls.
 
     Parameters
     ----------
-    \*args : list, optional
-        Arguments.
+    processes : integer
+        Processes count.
 
     Returns
     -------
-    integer
-        Inside *RGB* colourspace volume samples count.
+    Pool
+        Processes pool.
+    """
+
+    pool = _MONTE_CARLO_POOLS.get(processes)
+    if pool is None:
+        pool = _MONTE_CARLO_POOLS[processes] = multiprocessing.Pool(
+            processes=processes)
+
+    return pool
+
+
+def _normal_distribution_quantile(probability):
+    """
+    Returns the standard normal distribution quantile for given two-sided
+    probability, i.e. the :math:`z` value such as
+    :math:`P(-z \\leq Z \\leq z) = probability`.
+
+    Parameters
+    ----------
+    probability : numeric
+        Two-sided probability in domain ]0, 1[.
+
+    Returns
+    -------
+    numeric
+        Standard normal distribution quantile.
+    """
+
+    z_minus, z_plus = 0, 40
+    for _ in range(64):
+        z = (z_minus + z_plus) / 2
+        if math.erf(z / math.sqrt(2)) < probability:
+            z_minus = z
+        else:
+            z_plus = z
+
+    return (z_minus + z_plus) / 2
+
+
+def _Wilson_interval(successes, trials, z):
+    """
+    Returns the *Wilson* score interval of a binomial proportion and its
+    standard error.
+
+    Parameters
+    ----------
+    successes : integer
+        Successful trials count.
+    trials : integer
+        Total trials count.
+    z : numeric
+        Standard normal distribution quantile of the interval confidence
+        level.
+
+    Returns
+    -------
+    tuple
+        Standard error, lower and upper interval bounds.
+
+    Notes
+    -----
+    -   Contrary to the normal approximation interval, the *Wilson* score
+        interval does not collapse when the observed proportion is 0 or 1 and
+        stays within domain [0, 1].
+    -   The standard error is the interval half-width divided by :math:`z`.
+
+    References
+    ----------
+    .. [1]  Wilson, E. B. (1927). Probable Inference, the Law of Succession,
+            and Statistical Inference. Journal of the American Statistical
+            Association, 22(158), 209–212. doi:10.2307/2276774
+    """
+
+    ratio = successes / trials
+    z_n = z ** 2 / trials
+    centre = (ratio + z_n / 2) / (1 + z_n)
+    error = math.sqrt(
+        ratio * (1 - ratio) / trials + z_n / (4 * trials)) / (1 + z_n)
+
+    return (error,
+            max(centre - z * error, 0),
+            min(centre + z * error, 1))
+
+
+def _MonteCarlo_task(arguments):
+    """
+    Samples a *Monte Carlo* work chunk, this definition is called by the
+    workers.
+
+    Parameters
+    ----------
+    arguments : tuple
+        Sampling definition, its positional arguments, the chunk samples count
+        and the chunk random number generator seed.
+
+    Returns
+    -------
+    tuple
+        Sampling definition successful and total trials counts.
+    """
+
+    sampler, sampler_arguments, samples, seed = arguments
+
+    return sampler(*(tuple(sampler_arguments) +
+                     (samples, np.random.RandomState(seed))))
+
+
+def _MonteCarlo_ratio(sampler,
+                      sampler_arguments,
+                      samples,
+                      scale=1,
+                      random_state=None,
+                      processes=None,
+                      executor=None,
+                      chunk_size=MONTE_CARLO_CHUNK_SIZE,
+                      standard_error=None,
+                      confidence=0.95):
+    """
+    Estimates a ratio of successful trials using *Monte Carlo* method by
+    distributing chunks of samples to given executor workers.
+
+    Parameters
+    ----------
+    sampler : callable
+        Module level sampling definition called with given positional
+        arguments followed by the chunk samples count and random number
+        generator, returning the successful and total trials counts.
+    sampler_arguments : tuple
+        Sampling definition positional arguments.
+    samples : numeric
+        Maximum samples count.
+    scale : numeric, optional
+        Scale applied to the estimated ratio.
+    random_state : RandomState, optional
+        Mersenne Twister pseudo-random number generator drawing the seeds of
+        the chunks random number generators.
+    processes : integer, optional
+        Processes count, default to :func:`multiprocessing.cpu_count`
+        definition.
+    executor : object, optional
+        Executor providing a `map` method, e.g. :class:`multiprocessing.Pool`
+        or :class:`concurrent.futures.Executor` class instance. If not given, a
+        processes pool with given processes count is created and reused by
+        subsequent calls, the chunks are sampled in the current process if the
+        processes count is 1.
+    chunk_size : integer, optional
+        Samples count of each chunk.
+    standard_error : numeric, optional
+        Target standard error of the scaled ratio, the sampling stops once it
+        is reached.
+    confidence : numeric, optional
+        Confidence level of the returned confidence interval.
+
+    Returns
+    -------
+    MonteCarlo_Specification
+        Scaled ratio estimate, *nan* if there is no trial.
+
+    Raises
+    ------
+    ValueError
+        If the samples count is lower than 1.
+
+    Warning
+    -------
+    A warning is issued if there is no trial, e.g. no sample is within the
+    volume the ratio is computed against.
+    """
+
+    samples = int(samples)
+    if samples < 1:
+        raise ValueError(
+            '"{0}" samples count must be greater than 0!'.format(samples))
+
+    random_state = (random_state
+                    if random_state is not None else
+                    np.random.RandomState())
+
+    processes = processes if processes else multiprocessing.cpu_count()
+
+    if executor is not None:
+        map_ = executor.map
+    elif processes == 1:
+        map_ = map
+    else:
+        map_ = _MonteCarlo_pool(processes).map
+
+    chunks = [chunk_size] * (samples // chunk_size)
+    if samples % chunk_size:
+        chunks.append(samples % chunk_size)
+
+    # Each chunk has its own seed so that the estimate does not depend on the
+    # workers count nor on the chunks scheduling.
+    seeds = random_state.randint(0, np.iinfo(np.int32).max, len(chunks))
+
+    # The chunks are distributed all at once unless a target standard error
+    # is given, in which case they are distributed in rounds of one chunk per
+    # process.
+    round_size = (max(len(chunks), 1)
+                  if standard_error is None else
+                  processes)
+
+    z = _normal_distribution_quantile(confidence)
+
+    successes = trials = 0
+    for i in range(0, len(chunks), round_size):
+        for successes_c, trials_c in map_(
+                _MonteCarlo_task,
+                [(sampler, sampler_arguments, chunk, seed)
+                 for chunk, seed in zip(chunks[i:i + round_size],
+                                        seeds[i:i + round_size])]):
+            successes += successes_c
+            trials += trials_c
+
+        if standard_error is not None and trials > 0:
+            if scale * _Wilson_interval(successes, trials, z)[0] <= (
+                    standard_error):
+                break
+
+    if trials == 0:
+        warning('No trial has been sampled, e.g. no sample is within the '
+                'coverage volume, the estimate is undefined!')
+
+        return MonteCarlo_Specification(
+            np.nan, np.nan, np.array([np.nan, np.nan]), trials)
+
+    error, lower, upper = _Wilson_interval(successes, trials, z)
+
+    return MonteCarlo_Specification(
+        scale * successes / trials,
+        scale * error,
+        np.array([scale * lower, scale * upper]),
+        trials)
+
+
+def _sample_RGB_colourspace_volume_MonteCarlo(colourspace,
+                                              limits,
+                                              illuminant_Lab,
+                                              chromatic_adaptation_method,
+                                              random_generator,
+                                              samples,
+                                              random_state):
     """
+    Sampling definition of :func:`RGB_colourspace_volume_MonteCarlo`
+    definition.
 
-    return sample_RGB_colourspace_volume_MonteCarlo(*args)
+    Returns
+    -------
+    tuple
+        Within *RGB* colourspace volume and total samples counts.
+    """
+
+    return (sample_RGB_colourspace_volume_MonteCarlo(
+        colourspace,
+        samples,
+        limits,
+        illuminant_Lab,
+        chromatic_adaptation_method,
+        random_generator,
+        random_state),
+        samples)
 
 
 def sample_RGB_colourspace_volume_MonteCarlo(
@@ -75,7 +382,7 @@ def sample_RGB_colourspace_volume_MonteCarlo(
         illuminant_Lab=ILLUMINANTS.get(
             'CIE 1931 2 Degree Standard Observer').get('D50'),
         chromatic_adaptation_method='CAT02',
-        random_generator=random_triplet_generator,
+        random_generator=random_triplet_chunk_generator,
         random_state=None):
     """
     Randomly samples the *Lab* colourspace volume and returns the ratio of
@@ -98,7 +405,8 @@ def sample_RGB_colourspace_volume_MonteCarlo(
         *Chromatic adaptation* method.
     random_generator : generator, optional
         Random triplet generator providing the random samples within the *Lab*
-        colourspace volume.
+        colourspace volume, either one at a time or in chunks of shape
+        (chunk, 3).
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
@@ -110,6 +418,9 @@ def sample_RGB_colourspace_volume_MonteCarlo(
 
     Notes
     -----
+    The samples are processed as they are yielded by the random generator,
+    memory usage only depends on the chunks size and not on the samples count.
+
     The doctest is assuming that :func:`np.random.RandomState` definition will
     return the same sequence no matter which *OS* or *Python* version is used.
     There is however no formal promise about the *prng* sequence
@@ -132,16 +443,19 @@ across-systems-and-versions
                     if random_state is not None else
                     np.random.RandomState())
 
-    Lab = np.asarray(list(random_generator(samples, limits, random_state)))
-    RGB = XYZ_to_RGB(Lab_to_XYZ(Lab, illuminant_Lab),
-                     illuminant_Lab,
-                     colourspace.whitepoint,
-                     colourspace.XYZ_to_RGB_matrix,
-                     chromatic_adaptation_transform=(
-                         chromatic_adaptation_method))
-    RGB_w = RGB[np.logical_and(np.min(RGB, axis=-1) >= 0,
-                               np.max(RGB, axis=-1) <= 1)]
-    return len(RGB_w)
+    within = 0
+    for Lab in random_generator(samples, limits, random_state):
+        Lab = np.reshape(Lab, (-1, 3))
+        RGB = XYZ_to_RGB(Lab_to_XYZ(Lab, illuminant_Lab),
+                         illuminant_Lab,
+                         colourspace.whitepoint,
+                         colourspace.XYZ_to_RGB_matrix,
+                         chromatic_adaptation_transform=(
+                             chromatic_adaptation_method))
+        within += np.count_nonzero(np.logical_and(np.min(RGB, axis=-1) >= 0,
+                                                  np.max(RGB, axis=-1) <= 1))
+
+    return within
 
 
 def RGB_colourspace_limits(colourspace,
@@ -194,9 +508,13 @@ def RGB_colourspace_volume_MonteCarlo(
         illuminant_Lab=ILLUMINANTS.get(
             'CIE 1931 2 Degree Standard Observer').get('D50'),
         chromatic_adaptation_method='CAT02',
-        random_generator=random_triplet_generator,
+        random_generator=random_triplet_chunk_generator,
         random_state=None,
-        processes=None):
+        processes=None,
+        executor=None,
+        chunk_size=MONTE_CARLO_CHUNK_SIZE,
+        standard_error=None,
+        confidence=0.95):
     """
     Performs given *RGB* colourspace volume computation using *Monte Carlo*
     method and multiprocessing.
@@ -218,21 +536,48 @@ def RGB_colourspace_volume_MonteCarlo(
         *Chromatic adaptation* method.
     random_generator : generator, optional
         Random triplet generator providing the random samples within the *Lab*
-        colourspace volume.
+        colourspace volume, either one at a time or in chunks of shape
+        (chunk, 3).
     random_state : RandomState, optional
-        Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        Mersenne Twister pseudo-random number generator drawing the seeds of
+        the work chunks random number generators.
     processes : integer, optional
         Processes count, default to :func:`multiprocessing.cpu_count`
         definition.
+    executor : object, optional
+        Executor providing a `map` method, e.g. :class:`multiprocessing.Pool`
+        or :class:`concurrent.futures.Executor` class instance. If not given, a
+        processes pool with given processes count is created and reused by
+        subsequent calls, the samples are drawn in the current process if the
+        processes count is 1.
+    chunk_size : integer, optional
+        Samples count of each work chunk.
+    standard_error : numeric, optional
+        Target volume standard error, the sampling stops once it is reached
+        or all the samples are drawn.
+    confidence : numeric, optional
+        Confidence level of the volume confidence interval.
 
     Returns
     -------
-    float
-        *RGB* colourspace volume.
+    MonteCarlo_Specification
+        *RGB* colourspace volume estimate.
+
+    Raises
+    ------
+    ValueError
+        If the samples count is lower than 1.
 
     Notes
     -----
+    -   Each work chunk is sampled with its own random number generator seeded
+        from given random number generator, the estimate thus only depends on
+        the chunks size and not on the processes count or the executor.
+    -   The standard error and confidence interval are computed with the
+        *Wilson* score interval of the binomial proportion, they do not
+        collapse when all the samples or none of them are within the
+        *RGB* colourspace volume.
+
     The doctest is assuming that :func:`np.random.RandomState` definition will
     return the same sequence no matter which *OS* or *Python* version is used.
     There is however no formal promise about the *prng* sequence
@@ -247,38 +592,75 @@ across-systems-and-versions
     >>> from colour import sRGB_COLOURSPACE as sRGB
     >>> prng = np.random.RandomState(2)
     >>> processes = 1
-    >>> RGB_colourspace_volume_MonteCarlo(  # doctest: +ELLIPSIS
+    >>> volume = RGB_colourspace_volume_MonteCarlo(
     ...     sRGB, 10e3, random_state=prng, processes=processes)
-    859...
+    >>> volume.value  # doctest: +ELLIPSIS
+    8...
     """
 
-    cpu_count = processes if processes else multiprocessing.cpu_count()
-    pool = multiprocessing.Pool(processes=cpu_count)
+    Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
 
-    process_samples = int(np.round(samples / cpu_count))
+    return _MonteCarlo_ratio(_sample_RGB_colourspace_volume_MonteCarlo,
+                             (colourspace,
+                              limits,
+                              illuminant_Lab,
+                              chromatic_adaptation_method,
+                              random_generator),
+                             samples,
+                             Lab_volume,
+                             random_state,
+                             processes,
+                             executor,
+                             chunk_size,
+                             standard_error,
+                             confidence)
+
+
+def _sample_RGB_colourspace_volume_coverage_MonteCarlo(colourspace,
+                                                       coverage_sampler,
+                                                       random_generator,
+                                                       samples,
+                                                       random_state):
+    """
+    Sampling definition of :func:`RGB_colourspace_volume_coverage_MonteCarlo`
+    definition.
 
-    arguments = [colourspace,
-                 process_samples,
-                 limits,
-                 illuminant_Lab,
-                 chromatic_adaptation_method,
-                 random_generator,
-                 random_state]
+    Returns
+    -------
+    tuple
+        Within *RGB* colourspace volume and within arbitrary volume samples
+        counts.
+    """
 
-    results = pool.map(_wrapper_RGB_colourspace_volume_MonteCarlo,
-                       [arguments for _ in range(cpu_count)])
+    within_volume = within_colourspace = 0
+    for XYZ in random_generator(samples, random_state=random_state):
+        XYZ = np.reshape(XYZ, (-1, 3))
+        XYZ_vs = XYZ[coverage_sampler(XYZ)]
 
-    Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
+        RGB = XYZ_to_RGB(XYZ_vs,
+                         colourspace.whitepoint,
+                         colourspace.whitepoint,
+                         colourspace.XYZ_to_RGB_matrix)
 
-    return Lab_volume * np.sum(results) / (process_samples * cpu_count)
+        within_volume += len(XYZ_vs)
+        within_colourspace += np.count_nonzero(
+            np.logical_and(np.min(RGB, axis=-1) >= 0,
+                           np.max(RGB, axis=-1) <= 1))
+
+    return within_colourspace, within_volume
 
 
 def RGB_colourspace_volume_coverage_MonteCarlo(
         colourspace,
         coverage_sampler,
         samples=10e6,
-        random_generator=random_triplet_generator,
-        random_state=None):
+        random_generator=random_triplet_chunk_generator,
+        random_state=None,
+        processes=None,
+        executor=None,
+        chunk_size=MONTE_CARLO_CHUNK_SIZE,
+        standard_error=None,
+        confidence=0.95):
     """
     Returns given *RGB* colourspace percentage coverage of an arbitrary volume.
 
@@ -291,57 +673,80 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
     samples : numeric, optional
         Samples count.
     random_generator : generator, optional
-        Random triplet generator providing the random samples.
+        Random triplet generator providing the random samples, either one at a
+        time or in chunks of shape (chunk, 3).
     random_state : RandomState, optional
-        Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        Mersenne Twister pseudo-random number generator drawing the seeds of
+        the work chunks random number generators.
+    processes : integer, optional
+        Processes count, default to :func:`multiprocessing.cpu_count`
+        definition.
+    executor : object, optional
+        Executor providing a `map` method, e.g. :class:`multiprocessing.Pool`
+        or :class:`concurrent.futures.Executor` class instance. If not given, a
+        processes pool with given processes count is created and reused by
+        subsequent calls, the samples are drawn in the current process if the
+        processes count is 1.
+    chunk_size : integer, optional
+        Samples count of each work chunk.
+    standard_error : numeric, optional
+        Target percentage coverage standard error, the sampling stops once it
+        is reached or all the samples are drawn.
+    confidence : numeric, optional
+        Confidence level of the percentage coverage confidence interval.
 
     Returns
     -------
-    float
-        Percentage coverage of volume.
+    MonteCarlo_Specification
+        Percentage coverage of volume estimate, *nan* if no sample is within
+        the arbitrary volume.
+
+    Raises
+    ------
+    ValueError
+        If the samples count is lower than 1.
 
     Notes
     -----
     -   This definition requires *scipy* to be installed.
+    -   The samples are processed as they are yielded by the random generator,
+        memory usage only depends on the chunks size and not on the samples
+        count.
+    -   The work chunks are sampled as described in
+        :func:`RGB_colourspace_volume_MonteCarlo` definition.
 
     Examples
     --------
     >>> from colour import sRGB_COLOURSPACE as sRGB
     >>> prng = np.random.RandomState(2)
-    >>> RGB_colourspace_volume_coverage_MonteCarlo(  # doctest: +ELLIPSIS
+    >>> coverage = RGB_colourspace_volume_coverage_MonteCarlo(
     ...     sRGB,
     ...     is_within_pointer_gamut,
     ...     10e3,
     ...     random_state=prng)
-    83...
+    >>> coverage.value  # doctest: +ELLIPSIS
+    82...
     """
 
-    random_state = (random_state
-                    if random_state is not None else
-                    np.random.RandomState())
-
-    # TODO: Investigate for generator yielding directly a ndarray.
-    XYZ = np.asarray(list(random_generator(
-        samples, random_state=random_state)))
-    XYZ_vs = XYZ[coverage_sampler(XYZ)]
-
-    RGB = XYZ_to_RGB(XYZ_vs,
-                     colourspace.whitepoint,
-                     colourspace.whitepoint,
-                     colourspace.XYZ_to_RGB_matrix)
-
-    RGB_c = RGB[np.logical_and(np.min(RGB, axis=-1) >= 0,
-                               np.max(RGB, axis=-1) <= 1)]
-
-    return 100 * RGB_c.size / XYZ_vs.size
+    return _MonteCarlo_ratio(
+        _sample_RGB_colourspace_volume_coverage_MonteCarlo,
+        (colourspace, coverage_sampler, random_generator),
+        samples,
+        100,
+        random_state,
+        processes,
+        executor,
+        chunk_size,
+        standard_error,
+        confidence)
 
 
 def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
         colourspace,
         samples=10e6,
-        random_generator=random_triplet_generator,
-        random_state=None):
+        random_generator=random_triplet_chunk_generator,
+        random_state=None,
+        **kwargs):
     """
     Returns given *RGB* colourspace percentage coverage of Pointer's Gamut
     volume using *Monte Carlo* method.
@@ -353,15 +758,19 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
     samples : numeric, optional
         Samples count.
     random_generator : generator, optional
-        Random triplet generator providing the random samples.
+        Random triplet generator providing the random samples, either one at a
+        time or in chunks of shape (chunk, 3).
     random_state : RandomState, optional
-        Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        Mersenne Twister pseudo-random number generator drawing the seeds of
+        the work chunks random number generators.
+    \**kwargs : dict, optional
+        Keywords arguments passed to
+        :func:`RGB_colourspace_volume_coverage_MonteCarlo` definition.
 
     Returns
     -------
-    float
-        Percentage coverage of Pointer's Gamut volume.
+    MonteCarlo_Specification
+        Percentage coverage of Pointer's Gamut volume estimate.
 
     Notes
     -----
@@ -371,11 +780,12 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
     --------
     >>> from colour import sRGB_COLOURSPACE as sRGB
     >>> prng = np.random.RandomState(2)
-    >>> RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
+    >>> coverage = RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
     ...     sRGB,
     ...     10e3,
-    ...     random_state=prng)  # doctest: +ELLIPSIS
-    83...
+    ...     random_state=prng)
+    >>> coverage.value  # doctest: +ELLIPSIS
+    82...
     """
 
     return RGB_colourspace_volume_coverage_MonteCarlo(
@@ -383,14 +793,16 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
         is_within_pointer_gamut,
         samples,
         random_generator,
-        random_state)
+        random_state,
+        **kwargs)
 
 
 def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
         colourspace,
         samples=10e6,
-        random_generator=random_triplet_generator,
-        random_state=None):
+        random_generator=random_triplet_chunk_generator,
+        random_state=None,
+        **kwargs):
     """
     Returns given *RGB* colourspace percentage coverage of visible spectrum
     volume using *Monte Carlo* method.
@@ -402,15 +814,19 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
     samples : numeric, optional
         Samples count.
     random_generator : generator, optional
-        Random triplet generator providing the random samples.
+        Random triplet generator providing the random samples, either one at a
+        time or in chunks of shape (chunk, 3).
     random_state : RandomState, optional
-        Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        Mersenne Twister pseudo-random number generator drawing the seeds of
+        the work chunks random number generators.
+    \**kwargs : dict, optional
+        Keywords arguments passed to
+        :func:`RGB_colourspace_volume_coverage_MonteCarlo` definition.
 
     Returns
     -------
-    float
-        Percentage coverage of visible spectrum volume.
+    MonteCarlo_Specification
+        Percentage coverage of visible spectrum volume estimate.
 
     Notes
     -----
@@ -420,10 +836,11 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
     --------
     >>> from colour import sRGB_COLOURSPACE as sRGB
     >>> prng = np.random.RandomState(2)
-    >>> RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
+    >>> coverage = RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
     ...     sRGB,
     ...     10e3,
-    ...     random_state=prng)  # doctest: +ELLIPSIS
+    ...     random_state=prng)
+    >>> coverage.value  # doctest: +ELLIPSIS
     36...
     """
 
@@ -432,4 +849,5 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
         is_within_visible_spectrum,
         samples,
         random_generator,
-        random_state)
+        random_state,
+        **kwargs)
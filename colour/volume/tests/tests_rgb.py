@@ -24,7 +24,12 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 import unittest
+from functools import partial
+from multiprocessing.dummy import Pool
 
+from colour.algebra import (
+    random_triplet_generator,
+    random_triplet_chunk_generator)
 from colour.models import (
     ACES_2065_1_COLOURSPACE,
     REC_2020_COLOURSPACE,
@@ -36,6 +41,9 @@ from colour.volume import (
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
     is_within_pointer_gamut)
+from colour.volume.rgb import (
+    MonteCarlo_Specification,
+    sample_RGB_colourspace_volume_MonteCarlo)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2014 - Colour Developers'
@@ -44,13 +52,45 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestRGB_colourspaceLimits',
+__all__ = ['TestSample_RGB_colourspaceVolumeMonteCarlo',
+           'TestRGB_colourspaceLimits',
            'TestRGB_colourspaceVolumeMonteCarlo',
            'TestRGB_colourspace_volume_coverage_MonteCarlo',
            'TestRGB_colourspacePointerGamutCoverageMonteCarlo',
            'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo']
 
 
+class TestSample_RGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.sample_RGB_colourspace_volume_MonteCarlo`
+    definition unit tests methods.
+    """
+
+    def test_sample_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+sample_RGB_colourspace_volume_MonteCarlo` definition.
+        """
+
+        self.assertEqual(
+            sample_RGB_colourspace_volume_MonteCarlo(
+                REC_709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(2)),
+            955)
+
+        for random_generator in (
+                random_triplet_generator,
+                partial(random_triplet_chunk_generator, chunk_size=64)):
+            self.assertEqual(
+                sample_RGB_colourspace_volume_MonteCarlo(
+                    REC_709_COLOURSPACE,
+                    10e3,
+                    random_generator=random_generator,
+                    random_state=np.random.RandomState(2)),
+                955)
+
+
 class TestRGB_colourspaceLimits(unittest.TestCase):
     """
     Defines :func:`colour.volume.rgb.RGB_colourspace_limits` definition unit
@@ -96,13 +136,98 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
         definition.
         """
 
-        self.assertEquals(
-            RGB_colourspace_volume_MonteCarlo(
-                REC_709_COLOURSPACE,
-                10e3,
-                random_state=np.random.RandomState(2),
-                processes=1),
-            859500.0)
+        volume = RGB_colourspace_volume_MonteCarlo(
+            REC_709_COLOURSPACE,
+            10e3,
+            random_state=np.random.RandomState(2),
+            processes=1)
+        self.assertIsInstance(volume, MonteCarlo_Specification)
+        np.testing.assert_almost_equal(volume.value, 884700.0, decimal=7)
+        self.assertEqual(volume.samples, 10000)
+        np.testing.assert_almost_equal(
+            volume.standard_error,
+            26799.003779565097,
+            decimal=4)
+        np.testing.assert_almost_equal(
+            volume.confidence_interval,
+            np.array([833563.18708001, 938613.35153901]),
+            decimal=4)
+        self.assertAlmostEqual(
+            volume.confidence_interval[1] - volume.confidence_interval[0],
+            2 * 1.959964 * volume.standard_error,
+            delta=1)
+
+    def test_degenerate_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition standard error and confidence interval when all the
+        samples are within the *RGB* colourspace volume.
+        """
+
+        limits = np.array([[40, 60], [-5, 5], [-5, 5]])
+        volume = RGB_colourspace_volume_MonteCarlo(
+            REC_709_COLOURSPACE,
+            10e3,
+            limits,
+            random_state=np.random.RandomState(2),
+            processes=1,
+            chunk_size=1000,
+            standard_error=100)
+        self.assertEqual(volume.value, 10000)
+        self.assertGreater(volume.standard_error, 0)
+        self.assertLess(volume.confidence_interval[0], volume.value)
+        self.assertEqual(volume.confidence_interval[1], volume.value)
+
+    def test_raise_exception_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError,
+            lambda: RGB_colourspace_volume_MonteCarlo(
+                REC_709_COLOURSPACE, 0, processes=1))
+
+    def test_determinism_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition results independence from the workers count and executor.
+        """
+
+        pool = Pool(2)
+        try:
+            for kwargs in ({'processes': 1},
+                           {'processes': 2},
+                           {'executor': pool}):
+                np.testing.assert_almost_equal(
+                    RGB_colourspace_volume_MonteCarlo(
+                        REC_709_COLOURSPACE,
+                        10e3,
+                        random_state=np.random.RandomState(2),
+                        chunk_size=1000,
+                        **kwargs).value,
+                    861300.0,
+                    decimal=7)
+        finally:
+            pool.close()
+            pool.join()
+
+    def test_standard_error_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition early stopping on target standard error.
+        """
+
+        volume = RGB_colourspace_volume_MonteCarlo(
+            REC_709_COLOURSPACE,
+            10e6,
+            random_state=np.random.RandomState(2),
+            processes=1,
+            chunk_size=10000,
+            standard_error=5000)
+        self.assertLess(volume.samples, 10e6)
+        self.assertLessEqual(volume.standard_error, 5000)
 
 
 class TestRGB_colourspace_volume_coverage_MonteCarlo(unittest.TestCase):
@@ -122,10 +247,56 @@ RGB_colourspace_volume_coverage_MonteCarlo` definition.
                 REC_709_COLOURSPACE,
                 is_within_pointer_gamut,
                 10e3,
-                random_state=np.random.RandomState(2)),
-            83.02013422818791,
+                random_state=np.random.RandomState(2)).value,
+            82.05822613405552,
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_coverage_MonteCarlo(
+                REC_709_COLOURSPACE,
+                is_within_pointer_gamut,
+                10e3,
+                random_generator=partial(random_triplet_chunk_generator,
+                                         chunk_size=64),
+                random_state=np.random.RandomState(2)).value,
+            82.05822613405552,
+            decimal=7)
+
+    def test_degenerate_RGB_colourspace_volume_coverage_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_coverage_MonteCarlo` definition degenerate cases.
+        """
+
+        coverage = RGB_colourspace_volume_coverage_MonteCarlo(
+            ACES_2065_1_COLOURSPACE,
+            is_within_pointer_gamut,
+            10e6,
+            random_state=np.random.RandomState(2),
+            processes=1,
+            chunk_size=5000,
+            standard_error=0.5)
+        self.assertEqual(coverage.value, 100)
+        self.assertGreater(coverage.standard_error, 0)
+        self.assertLess(coverage.confidence_interval[0], 100)
+        self.assertEqual(coverage.confidence_interval[1], 100)
+
+        coverage = RGB_colourspace_volume_coverage_MonteCarlo(
+            REC_709_COLOURSPACE,
+            is_within_pointer_gamut,
+            3,
+            random_state=np.random.RandomState(0),
+            processes=1)
+        self.assertTrue(np.isnan(coverage.value))
+        self.assertTrue(np.isnan(coverage.standard_error))
+        self.assertEqual(coverage.samples, 0)
+
+        self.assertRaises(
+            ValueError,
+            lambda: RGB_colourspace_volume_coverage_MonteCarlo(
+                REC_709_COLOURSPACE, is_within_pointer_gamut, 0,
+                processes=1))
+
 
 class TestRGB_colourspacePointerGamutCoverageMonteCarlo(unittest.TestCase):
     """
@@ -144,8 +315,8 @@ RGB_colourspace_pointer_gamut_coverage_MonteCarlo` definition.
             RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
                 REC_709_COLOURSPACE,
                 10e3,
-                random_state=np.random.RandomState(2)),
-            83.02013422818791,
+                random_state=np.random.RandomState(2)).value,
+            82.05822613405552,
             decimal=7)
 
 
@@ -166,8 +337,8 @@ RGB_colourspace_visible_spectrum_coverage_MonteCarlo` definition.
             RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
                 REC_709_COLOURSPACE,
                 10e3,
-                random_state=np.random.RandomState(2)),
-            36.48383937316356,
+                random_state=np.random.RandomState(2)).value,
+            36.243580337490826,
             decimal=7)
 
 
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Inverse Munsell Lookup Grid Benchmarking Utility
+================================================
+
+Compares the inverse *Munsell* lookup grid approximations against the exact
+:func:`colour.notation.munsell.xyY_to_munsell_specifications` definition
+solver, both in computation time and deviation from the exact solver.
+
+The deviations are empirical, they should be measured on several sample sets,
+i.e. seeds, large enough for their 99th and 99.9th percentiles to be stable,
+the maximum deviations depend on the drawn samples.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import sys
+import timeit
+import warnings
+from collections import OrderedDict
+
+from colour.notation.munsell import (
+    munsell_inverse_grid,
+    xyY_to_munsell_specifications)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['benchmark_samples',
+           'benchmark_munsell_inverse_grid']
+
+
+def benchmark_samples(count=10000, seed=0):
+    """
+    Returns random *CIE xyY* colourspace arrays with *xy* chromaticity
+    coordinates in domain [0.1, 0.6] and *luminance* :math:`Y` in domain
+    [0.02, 0.9] that the exact solver converges for.
+
+    Parameters
+    ----------
+    count : int, optional
+        Drawn samples count.
+    seed : int, optional
+        Random number generator seed.
+
+    Returns
+    -------
+    ndarray, (n, 3)
+        *CIE xyY* colourspace arrays.
+    """
+
+    random_state = np.random.RandomState(seed)
+    xyY = np.transpose((random_state.uniform(0.1, 0.6, count),
+                        random_state.uniform(0.1, 0.6, count),
+                        random_state.uniform(0.02, 0.9, count)))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        _specification, converged = xyY_to_munsell_specifications(xyY)
+
+    return xyY[converged]
+
+
+def benchmark_munsell_inverse_grid(count=10000, directory=None, seed=0):
+    """
+    Benchmarks the inverse *Munsell* lookup grid against the exact solver.
+
+    Parameters
+    ----------
+    count : int, optional
+        Drawn samples count.
+    directory : unicode, optional
+        Directory the inverse *Munsell* lookup grid is persisted into.
+    seed : int, optional
+        Random number generator seed of the drawn samples.
+
+    Returns
+    -------
+    OrderedDict
+        Computation time in seconds, 99th percentile, 99.9th percentile and
+        maximum *ASTM* hue and chroma deviations from the exact solver for
+        each method, the grid building time is reported separately.
+    """
+
+    xyY = benchmark_samples(count, seed)
+
+    start = timeit.default_timer()
+    grid = munsell_inverse_grid(directory=directory)
+    build_time = timeit.default_timer() - start
+
+    methods = OrderedDict((
+        ('Exact', lambda x: xyY_to_munsell_specifications(x)[0]),
+        ('Grid', lambda x: grid.xyY_to_munsell_specification(x)),
+        ('Grid (1 Refinement Iteration)',
+         lambda x: grid.xyY_to_munsell_specification(x, 1)),
+        ('Grid (2 Refinement Iterations)',
+         lambda x: grid.xyY_to_munsell_specification(x, 2))))
+
+    results = OrderedDict()
+    reference = None
+    for method, function in methods.items():
+        start = timeit.default_timer()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            specification = function(xyY)
+        time = timeit.default_timer() - start
+
+        hue, _value, chroma, code = np.transpose(specification)
+        ASTM_hue = 10 * ((7 - code) % 10) + hue
+        if reference is None:
+            reference = ASTM_hue, chroma
+
+        chromatic = reference[1] > 0
+        hue_deviation = np.abs(
+            (ASTM_hue - reference[0] + 50) % 100 - 50)[chromatic]
+        chroma_deviation = np.abs(chroma - reference[1])
+
+        results[method] = (time,
+                           np.percentile(hue_deviation, 99),
+                           np.percentile(hue_deviation, 99.9),
+                           np.max(hue_deviation),
+                           np.percentile(chroma_deviation, 99),
+                           np.percentile(chroma_deviation, 99.9),
+                           np.max(chroma_deviation))
+
+    results['Grid (Building / Loading)'] = (build_time, 0, 0, 0, 0, 0, 0)
+
+    return results
+
+
+if __name__ == '__main__':
+    print(('{0:<32}{1:>14}{2:>14}{3:>14}{4:>14}{5:>14}{6:>14}'
+           '{7:>14}').format(
+        'Method', 'Time (ms)', 'Hue 99%', 'Hue 99.9%', 'Hue Max',
+        'Chroma 99%', 'Chroma 99.9%', 'Chroma Max'))
+    arguments = [argument if i == 1 else int(argument)
+                 for i, argument in enumerate(sys.argv[1:])]
+    if len(arguments) > 1 and arguments[1] in ('', 'None'):
+        arguments[1] = None
+    for method, (time, hue_99, hue_999, hue, chroma_99, chroma_999,
+                 chroma) in (
+            benchmark_munsell_inverse_grid(*arguments).items()):
+        print(('{0:<32}{1:>14.2f}{2:>14.4f}{3:>14.4f}{4:>14.4f}'
+               '{5:>14.4f}{6:>14.4f}{7:>14.4f}').format(
+            method, time * 1000, hue_99, hue_999, hue, chroma_99,
+            chroma_999, chroma))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Planckian Locus Index Benchmarking Utility
+==========================================
+
+Compares the planckian locus index correlated colour temperature
+:math:`T_{cp}` and :math:`\Delta_{uv}` lookups against Ohno (2013) and
+Robertson (1968) methods, both in computation time and deviation from
+Ohno (2013) method.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import sys
+import timeit
+import warnings
+from collections import OrderedDict
+
+from colour.temperature import (
+    CCT_to_uv_Ohno2013,
+    planckian_locus_index,
+    uv_to_CCT_Ohno2013,
+    uv_to_CCT_Robertson1968)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['benchmark_samples',
+           'benchmark_planckian_locus_index']
+
+
+def benchmark_samples(count=1000, seed=0):
+    """
+    Returns random *CIE UCS* colourspace *uv* chromaticity coordinates of
+    correlated colour temperature :math:`T_{cp}` in domain [2000, 20000] and
+    :math:`\Delta_{uv}` in domain [-0.02, 0.02].
+
+    Parameters
+    ----------
+    count : int, optional
+        Samples count.
+    seed : int, optional
+        Random number generator seed.
+
+    Returns
+    -------
+    ndarray, (count, 2)
+        *uv* chromaticity coordinates.
+    """
+
+    random_state = np.random.RandomState(seed)
+    CCT = np.exp(random_state.uniform(np.log(2000), np.log(20000), count))
+    D_uv = random_state.uniform(-0.02, 0.02, count)
+
+    return CCT_to_uv_Ohno2013(CCT, D_uv)
+
+
+def benchmark_planckian_locus_index(count=1000, accuracy=None):
+    """
+    Benchmarks the planckian locus index against Ohno (2013) and
+    Robertson (1968) methods.
+
+    Parameters
+    ----------
+    count : int, optional
+        Chromaticity coordinates count.
+    accuracy : numeric, optional
+        Planckian locus index accuracy,
+        :attr:`colour.PLANCKIAN_LOCUS_INDEX_ACCURACY` attribute value is used
+        if not given.
+
+    Returns
+    -------
+    OrderedDict
+        Computation time in seconds, maximum correlated colour temperature
+        :math:`T_{cp}` and :math:`\Delta_{uv}` deviations from Ohno (2013)
+        method for each method, the planckian locus index building time is
+        reported separately.
+    """
+
+    uv = benchmark_samples(count)
+
+    kwargs = {} if accuracy is None else {'accuracy': accuracy}
+
+    start = timeit.default_timer()
+    index = planckian_locus_index(**kwargs)
+    build_time = timeit.default_timer() - start
+
+    methods = OrderedDict((
+        ('Ohno 2013', uv_to_CCT_Ohno2013),
+        ('Robertson 1968', uv_to_CCT_Robertson1968),
+        ('Planckian Locus Index', index.uv_to_CCT)))
+
+    results = OrderedDict()
+    reference = None
+    for method, function in methods.items():
+        start = timeit.default_timer()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            CCT_D_uv = function(uv)
+        time = timeit.default_timer() - start
+
+        if reference is None:
+            reference = CCT_D_uv
+
+        results[method] = (time,) + tuple(
+            np.max(np.abs(CCT_D_uv - reference), axis=0))
+
+    results['Planckian Locus Index (Building)'] = (build_time, 0, 0)
+
+    return results
+
+
+if __name__ == '__main__':
+    print('{0:<40}{1:>12}{2:>12}{3:>12}'.format(
+        'Method', 'Time (ms)', 'CCT', 'D_uv'))
+    arguments = [int(argument) if i == 0 else float(argument)
+                 for i, argument in enumerate(sys.argv[1:])]
+    for method, (time, CCT, D_uv) in benchmark_planckian_locus_index(
+            *arguments).items():
+        print('{0:<40}{1:>12.2f}{2:>12.4f}{3:>12.2e}'.format(
+            method, time * 1000, CCT, D_uv))
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Datasets Archive Building Utility
+=================================
+
+Serialises the tabulated datasets into the binary archive memory-mapped at
+runtime by :mod:`colour.utilities.archive` module.
+
+The archive must be rebuilt whenever a dataset source module is modified, the
+datasets whose digest does not match their source module file anymore are
+ignored at runtime.
+"""
+
+from __future__ import division, unicode_literals
+
+import sys
+from importlib import import_module
+
+from colour.notation.munsell import (
+    MUNSELL_COLOUR_FORMAT,
+    munsell_colour_to_munsell_specification)
+from colour.utilities import write_datasets_archive
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['munsell_colours_table',
+           'DATASETS_SOURCES',
+           'DERIVED_DATASETS',
+           'datasets',
+           'build_datasets_archive']
+
+
+def munsell_colours_table(munsell_colours):
+    """
+    Converts given *Munsell Renotation System* data to a numeric table whose
+    rows are the *Munsell* specifications followed by the *CIE xyY*
+    colourspace values.
+
+    Parameters
+    ----------
+    munsell_colours : tuple
+        *Munsell Renotation System* data.
+
+    Returns
+    -------
+    tuple
+        *Munsell Renotation System* numeric table.
+    """
+
+    return tuple(
+        tuple(munsell_colour_to_munsell_specification(
+            MUNSELL_COLOUR_FORMAT.format(*munsell_colour[0]))) +
+        tuple(munsell_colour[1])
+        for munsell_colour in munsell_colours)
+
+
+DATASETS_SOURCES = {
+    'ILLUMINANTS_RELATIVE_SPDS_DATA': (
+        'colour.colorimetry.dataset.illuminants.spds_data'),
+    'D_ILLUMINANTS_S_SPDS_DATA': (
+        'colour.colorimetry.dataset.illuminants.d_illuminants_s_spds_data'),
+    'LIGHT_SOURCES_RIT_RELATIVE_SPDS_DATA': (
+        'colour.colorimetry.dataset.light_sources.spds_data'),
+    'LIGHT_SOURCES_NIST_TRADITIONAL_RELATIVE_SPDS_DATA': (
+        'colour.colorimetry.dataset.light_sources.spds_data'),
+    'LIGHT_SOURCES_NIST_LED_RELATIVE_SPDS_DATA': (
+        'colour.colorimetry.dataset.light_sources.spds_data'),
+    'LIGHT_SOURCES_NIST_PHILIPS_RELATIVE_SPDS_DATA': (
+        'colour.colorimetry.dataset.light_sources.spds_data'),
+    'LIGHT_SOURCES_PROJECTORS_RELATIVE_SPDS_DATA': (
+        'colour.colorimetry.dataset.light_sources.spds_data'),
+    'LMS_CMFS_DATA': 'colour.colorimetry.dataset.cmfs_data',
+    'RGB_CMFS_DATA': 'colour.colorimetry.dataset.cmfs_data',
+    'STANDARD_OBSERVERS_CMFS_DATA': 'colour.colorimetry.dataset.cmfs_data',
+    'PHOTOPIC_LEFS_DATA': 'colour.colorimetry.dataset.lefs_data',
+    'SCOTOPIC_LEFS_DATA': 'colour.colorimetry.dataset.lefs_data',
+    'COLORCHECKER_N_OHTA_SPDS_DATA': (
+        'colour.characterisation.dataset.colour_checkers.spds_data'),
+    'BABELCOLOR_AVERAGE_SPDS_DATA': (
+        'colour.characterisation.dataset.colour_checkers.spds_data'),
+    'TCS_SPDS_DATA': 'colour.quality.dataset.tcs_data',
+    'VS_SPDS_DATA': 'colour.quality.dataset.vs_data',
+    'SMITS_1999_SPDS_DATA': 'colour.recovery.dataset.smits1999_data',
+    'ILLUMINANTS_OPTIMAL_COLOUR_STIMULI_DATA': (
+        'colour.volume.dataset.optimal_colour_stimuli_data'),
+    'MUNSELL_COLOURS_ALL': 'colour.notation.dataset.munsell.all',
+    'MUNSELL_COLOURS_1929': 'colour.notation.dataset.munsell.experimental',
+    'MUNSELL_COLOURS_REAL': 'colour.notation.dataset.munsell.real'}
+"""
+Names of the modules defining the literals the tabulated datasets are
+serialised or derived from.
+
+DATASETS_SOURCES : dict
+"""
+
+DERIVED_DATASETS = {
+    'MUNSELL_COLOURS_ALL': munsell_colours_table,
+    'MUNSELL_COLOURS_1929': munsell_colours_table,
+    'MUNSELL_COLOURS_REAL': munsell_colours_table}
+"""
+Definitions deriving the tabulated datasets from their source literal.
+
+DERIVED_DATASETS : dict
+"""
+
+
+def datasets():
+    """
+    Returns the tabulated datasets to serialise.
+
+    Returns
+    -------
+    dict
+        Tabulated datasets.
+    """
+
+    datasets = {}
+    for name, source in DATASETS_SOURCES.items():
+        data = getattr(import_module(source), name)
+        if name in DERIVED_DATASETS:
+            data = DERIVED_DATASETS[name](data)
+
+        datasets[name] = data
+
+    return datasets
+
+
+def build_datasets_archive(path=None):
+    """
+    Builds the datasets archive.
+
+    Parameters
+    ----------
+    path : unicode, optional
+        Datasets archive path, :attr:`colour.DATASETS_ARCHIVE_PATH` attribute
+        value is used if not given.
+
+    Returns
+    -------
+    unicode
+        Datasets archive path.
+    """
+
+    return write_datasets_archive(datasets(), path, DATASETS_SOURCES)
+
+
+if __name__ == '__main__':
+    print(build_datasets_archive(*sys.argv[1:]))